@@ -1,18 +1,82 @@
+import importlib
 import importlib.metadata
 import sys
+from typing import Any
 
+import click
 import typer
+from typer.core import TyperGroup
+from typer.main import get_group_from_info
+from typer.models import TyperInfo
 
-from remote.ami import app as ami_app
-from remote.config import app as config_app
-from remote.ecs import app as ecs_app
-from remote.instance import app as instance_app
+from remote.cli_output import handle_cli_errors
 from remote.logo import print_logo
-from remote.schedule import app as schedule_app
-from remote.sg import app as sg_app
-from remote.snapshot import app as snapshot_app
-from remote.utils import handle_cli_errors
-from remote.volume import app as volume_app
+
+# Registry of service subcommands: name -> (module path, help text).
+# Modules are only imported when their subcommand is actually invoked, so
+# `remote instance exec` does not pay for importing the ECS, AMI, snapshot,
+# volume, security group or schedule modules (and their dependencies).
+# A help value of None means the sub-app's own Typer(help=...) is used.
+LAZY_SUBCOMMANDS: dict[str, tuple[str, str | None]] = {
+    "instance": ("remote.instance", "Manage EC2 instances"),
+    "ami": ("remote.ami", "Manage Amazon Machine Images"),
+    "config": ("remote.config", "Manage configuration"),
+    "snapshot": ("remote.snapshot", "Manage EBS snapshots"),
+    "volume": ("remote.volume", "Manage EBS volumes"),
+    "ecs": ("remote.ecs", "Manage ECS clusters and services"),
+    "sg": ("remote.sg", None),
+    "schedule": ("remote.schedule", "Manage scheduled wake/sleep"),
+    "pricing": ("remote.pricing", None),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root command group that imports service sub-apps on first use.
+
+    Eagerly registered commands (e.g. ``version``) behave as normal. Names in
+    LAZY_SUBCOMMANDS are resolved by importing the module and converting its
+    ``app`` into a Click group only when Click asks for that subcommand.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager commands followed by lazy subcommands, in registration order."""
+        eager = super().list_commands(ctx)
+        return eager + [name for name in LAZY_SUBCOMMANDS if name not in eager]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a command, importing its module if it is a lazy subcommand."""
+        if cmd_name not in self.commands and cmd_name in LAZY_SUBCOMMANDS:
+            self.add_command(load_subcommand(cmd_name, self.rich_markup_mode), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+def load_subcommand(name: str, rich_markup_mode: Any = None) -> click.Command:
+    """Import a registered sub-app and build its Click group.
+
+    Args:
+        name: Subcommand name as registered in LAZY_SUBCOMMANDS
+        rich_markup_mode: Markup mode inherited from the root group
+
+    Returns:
+        Click group equivalent to ``app.add_typer(module.app, name=name, help=help)``
+
+    Raises:
+        KeyError: If name is not a registered subcommand
+    """
+    module_path, help_text = LAZY_SUBCOMMANDS[name]
+    sub_app = importlib.import_module(module_path).app
+    # Only pass help when set, so the sub-app's own Typer(help=...) is kept otherwise
+    info = (
+        TyperInfo(sub_app, name=name, help=help_text)
+        if help_text
+        else TyperInfo(sub_app, name=name)
+    )
+    return get_group_from_info(
+        info,
+        pretty_exceptions_short=sub_app.pretty_exceptions_short,
+        rich_markup_mode=rich_markup_mode,
+    )
+
 
 # Create main app
 app = typer.Typer(
@@ -20,9 +84,17 @@ app = typer.Typer(
     help="AWS EC2 instance management CLI",
     epilog="Run 'remote COMMAND --help' for more information on a command.",
     no_args_is_help=True,
+    cls=LazyTyperGroup,
 )
 
 
+@app.callback()
+def _root() -> None:
+    # A root callback forces Typer to build a group (and therefore use
+    # LazyTyperGroup) even though only one command is registered eagerly.
+    pass
+
+
 def _should_show_logo() -> bool:
     """Determine if the logo should be displayed.
 
@@ -49,17 +121,6 @@ def version() -> None:
     typer.echo(importlib.metadata.version("remotepy"))
 
 
-# Register service subcommands
-app.add_typer(instance_app, name="instance", help="Manage EC2 instances")
-app.add_typer(ami_app, name="ami", help="Manage Amazon Machine Images")
-app.add_typer(config_app, name="config", help="Manage configuration")
-app.add_typer(snapshot_app, name="snapshot", help="Manage EBS snapshots")
-app.add_typer(volume_app, name="volume", help="Manage EBS volumes")
-app.add_typer(ecs_app, name="ecs", help="Manage ECS clusters and services")
-app.add_typer(sg_app, name="sg")
-app.add_typer(schedule_app, name="schedule", help="Manage scheduled wake/sleep")
-
-
 def main() -> None:
     """Entry point that displays logo before help."""
     if _should_show_logo():
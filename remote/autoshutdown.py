@@ -18,11 +18,11 @@ if TYPE_CHECKING:
 
 from remote.exceptions import InvalidInputError
 from remote.instance_resolver import resolve_instance_or_exit
-from remote.pricing import get_current_region
 from remote.utils import (
     confirm_action,
     console,
     get_cloudwatch_client,
+    get_current_region,
     get_status_style,
     handle_aws_errors,
     handle_cli_errors,
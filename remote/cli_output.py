@@ -0,0 +1,157 @@
+"""Console output helpers and CLI error handling.
+
+Kept free of AWS SDK imports so lightweight commands such as
+``remote version`` can use them without loading boto3. They are
+re-exported from remote.utils, which is where commands import them from.
+"""
+
+from collections.abc import Callable
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+import typer
+
+from .exceptions import (
+    AWSServiceError,
+    InstanceNotFoundError,
+    InvalidInputError,
+    MultipleInstancesFoundError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+
+# Type variables for the decorator
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def print_error(message: str) -> None:
+    """Print an error message in red.
+
+    Use this for error conditions that indicate something went wrong.
+    For AWS-specific errors, prefix with "AWS Error:" instead of "Error:".
+
+    Args:
+        message: The error message to display
+
+    Examples:
+        >>> print_error("Instance not found")
+        Error: Instance not found
+
+        >>> print_error("AWS Error: Access denied")
+        AWS Error: Access denied
+    """
+    typer.secho(message, fg=typer.colors.RED)
+
+
+def print_success(message: str) -> None:
+    """Print a success message in green.
+
+    Use this to confirm successful completion of operations.
+
+    Args:
+        message: The success message to display
+
+    Examples:
+        >>> print_success("Instance started")
+        Instance started
+
+        >>> print_success("Config saved to ~/.config/remote.py/config.ini")
+        Config saved to ~/.config/remote.py/config.ini
+    """
+    typer.secho(message, fg=typer.colors.GREEN)
+
+
+def print_warning(message: str) -> None:
+    """Print a warning message in yellow.
+
+    Use this for non-critical issues, cancellation notices, or informational
+    warnings that don't prevent operation completion.
+
+    Args:
+        message: The warning message to display
+
+    Examples:
+        >>> print_warning("Instance is already running")
+        Instance is already running
+
+        >>> print_warning("Cancelled.")
+        Cancelled.
+    """
+    typer.secho(message, fg=typer.colors.YELLOW)
+
+
+def print_info(message: str) -> None:
+    """Print an informational message in blue.
+
+    Use this for status updates, progress information, or neutral notifications.
+
+    Args:
+        message: The informational message to display
+
+    Examples:
+        >>> print_info("Using instance: my-server")
+        Using instance: my-server
+
+        >>> print_info("Waiting for SSH to be ready...")
+        Waiting for SSH to be ready...
+    """
+    typer.secho(message, fg=typer.colors.BLUE)
+
+
+def handle_cli_errors(func: Callable[P, R]) -> Callable[P, R]:
+    """Decorator to standardize CLI error handling.
+
+    Catches common RemotePy exceptions and converts them to user-friendly
+    error messages with consistent formatting, then exits with code 1.
+
+    This decorator consolidates the repeated try-except pattern:
+        try:
+            # command logic
+        except (InstanceNotFoundError, InvalidInputError, MultipleInstancesFoundError, ResourceNotFoundError) as e:
+            print_error(f"Error: {e}")
+            raise typer.Exit(1)
+        except AWSServiceError as e:
+            print_error(f"AWS Error: {e}")
+            raise typer.Exit(1)
+        except ValidationError as e:
+            print_error(f"Error: {e}")
+            raise typer.Exit(1)
+
+    Use this decorator on CLI command functions:
+        @app.command()
+        @handle_cli_errors
+        def my_command():
+            # command logic - exceptions are handled automatically
+
+    Args:
+        func: The CLI command function to wrap
+
+    Returns:
+        Wrapped function with standardized error handling
+
+    Note:
+        The decorator should be placed BELOW the @app.command() decorator
+        so it wraps the actual function, not the Typer command registration.
+    """
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            return func(*args, **kwargs)
+        except (
+            InstanceNotFoundError,
+            InvalidInputError,
+            MultipleInstancesFoundError,
+            ResourceNotFoundError,
+        ) as e:
+            print_error(f"Error: {e}")
+            raise typer.Exit(1) from e
+        except AWSServiceError as e:
+            print_error(f"AWS Error: {e}")
+            raise typer.Exit(1) from e
+        except ValidationError as e:
+            print_error(f"Error: {e}")
+            raise typer.Exit(1) from e
+
+    return wrapper
@@ -5,12 +5,18 @@ from pathlib import Path
 from typing import Any
 
 import typer
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from rich.panel import Panel
 
 from remote.exceptions import ValidationError
-from remote.settings import DEFAULT_SSH_USER, Settings
+from remote.settings import (
+    DEFAULT_SSH_USER,
+    INVENTORY_CACHE_TTL_SECONDS,
+    PUBLIC_IP_CACHE_TTL_SECONDS,
+    SSH_CONTROL_PERSIST_SECONDS,
+    Settings,
+)
 from remote.utils import (
     console,
     create_table,
@@ -36,6 +42,16 @@ VALID_KEYS: dict[str, str] = {
     "connection_method": "Default connection method (ssh or ssm)",
     "ssm_profile": "AWS profile for SSM connections",
     "scheduler_timezone": "Timezone for scheduled wake/stop (e.g., America/New_York)",
+    "inventory_cache_ttl": "Seconds to cache EC2 instance inventory (0 disables, default: 60)",
+    "ssh_control_persist": "Seconds to keep idle SSH master connections open (0 disables, default: 600)",
+    "public_ip_cache_ttl": "Seconds to reuse a discovered public IP (0 disables, default: 300)",
+}
+
+# Keys holding a duration in seconds (0 disables the feature), with their defaults
+SECONDS_KEY_DEFAULTS: dict[str, int] = {
+    "inventory_cache_ttl": INVENTORY_CACHE_TTL_SECONDS,
+    "ssh_control_persist": SSH_CONTROL_PERSIST_SECONDS,
+    "public_ip_cache_ttl": PUBLIC_IP_CACHE_TTL_SECONDS,
 }
 
 
@@ -85,6 +101,18 @@ class RemoteConfig(BaseSettings):
     scheduler_timezone: str | None = Field(
         default=None, description="Timezone for scheduled wake/stop (e.g., America/New_York)"
     )
+    inventory_cache_ttl: int = Field(
+        default=INVENTORY_CACHE_TTL_SECONDS,
+        description="Seconds to cache EC2 instance inventory (0 disables)",
+    )
+    ssh_control_persist: int = Field(
+        default=SSH_CONTROL_PERSIST_SECONDS,
+        description="Seconds to keep idle SSH master connections open (0 disables)",
+    )
+    public_ip_cache_ttl: int = Field(
+        default=PUBLIC_IP_CACHE_TTL_SECONDS,
+        description="Seconds to reuse a discovered public IP (0 disables)",
+    )
 
     @field_validator("instance_name", mode="before")
     @classmethod
@@ -180,6 +208,23 @@ class RemoteConfig(BaseSettings):
             )
         return v
 
+    @field_validator(
+        "inventory_cache_ttl", "ssh_control_persist", "public_ip_cache_ttl", mode="before"
+    )
+    @classmethod
+    def validate_seconds(cls, v: str | int | None, info: ValidationInfo) -> int:
+        """Validate a duration setting is a non-negative number of seconds."""
+        key = info.field_name or ""
+        if v is None or v == "":
+            return SECONDS_KEY_DEFAULTS[key]
+        try:
+            seconds = int(v)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {key} '{v}': must be a whole number of seconds") from None
+        if seconds < 0:
+            raise ValueError(f"Invalid {key} '{v}': must be 0 or greater")
+        return seconds
+
     def validate_ssh_key_exists(self) -> None:
         """
         Validate that SSH key file exists.
@@ -442,6 +487,27 @@ class ConfigManager:
 # Global config manager instance
 config_manager = ConfigManager()
 
+
+def get_seconds_value(key: str) -> int:
+    """Get a duration setting from SECONDS_KEY_DEFAULTS in seconds.
+
+    Args:
+        key: The config key to read
+
+    Returns:
+        The configured number of seconds, or the key's default if unset or
+        invalid. 0 means the feature is disabled.
+    """
+    default = SECONDS_KEY_DEFAULTS[key]
+    value = config_manager.get_value(key)
+    if value is None:
+        return default
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return default
+
+
 # Default config path for CLI commands
 CONFIG_PATH = str(Settings.get_config_path())
 
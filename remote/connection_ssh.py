@@ -4,14 +4,217 @@ This module provides SSH-based connection functionality extracted from instance.
 implementing the ConnectionProvider protocol for SSH connections.
 """
 
+import logging
 import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
 
+from remote.config import get_seconds_value
 from remote.settings import (
     DEFAULT_SSH_USER,
+    SSH_OPERATION_TIMEOUT_SECONDS,
     SSH_SERVER_ALIVE_COUNT_MAX,
     SSH_SERVER_ALIVE_INTERVAL,
+    Settings,
 )
 
+logger = logging.getLogger(__name__)
+
+# Directory holding ControlMaster sockets, one per user@instance-id
+SSH_CONTROL_DIR_NAME = "ssh-control"
+
+
+@dataclass(frozen=True)
+class ControlMaster:
+    """An SSH ControlMaster socket managed by remote.py."""
+
+    path: Path
+    user: str
+    instance_id: str
+    active: bool
+
+
+def get_ssh_control_dir() -> Path:
+    """Get the directory holding SSH ControlMaster sockets.
+
+    Returns:
+        Path to ~/.config/remote.py/ssh-control
+    """
+    return Settings.get_config_path().parent / SSH_CONTROL_DIR_NAME
+
+
+def get_ssh_control_persist() -> int:
+    """Get the configured ControlPersist idle time in seconds.
+
+    Returns:
+        Seconds from the ``ssh_control_persist`` config key, or the default
+        if unset or invalid. 0 means multiplexing is disabled.
+    """
+    return get_seconds_value("ssh_control_persist")
+
+
+def get_control_path(instance_id: str, user: str) -> Path | None:
+    """Get the ControlMaster socket path for connections to an instance.
+
+    Sockets are keyed by user and instance ID (not DNS, which changes on
+    every start) and kept short to stay under the Unix socket path limit.
+
+    Args:
+        instance_id: AWS instance ID
+        user: SSH username
+
+    Returns:
+        Socket path, or None if multiplexing is disabled or unsupported
+        (the Windows OpenSSH client has no ControlMaster support)
+    """
+    if sys.platform == "win32" or not instance_id or get_ssh_control_persist() <= 0:
+        return None
+    control_dir = get_ssh_control_dir()
+    try:
+        control_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError as e:
+        logger.debug(f"SSH multiplexing disabled, cannot create {control_dir}: {e}")
+        return None
+    return control_dir / f"{user}@{instance_id}"
+
+
+def build_multiplex_options(control_path: Path) -> list[str]:
+    """Build SSH options that send a command through an existing master.
+
+    ControlMaster=no means a client never becomes a master itself; if the
+    socket has gone away it simply connects directly.
+
+    Args:
+        control_path: Socket path from get_control_path()
+
+    Returns:
+        List of SSH -o arguments
+    """
+    return ["-o", "ControlMaster=no", "-o", f"ControlPath={control_path}"]
+
+
+def _run_control_command(control_path: Path, operation: str) -> int:
+    """Send a control command (check, exit) to a master and return ssh's exit code."""
+    # The destination is required by ssh but ignored when -S names a master
+    try:
+        result = subprocess.run(
+            ["ssh", "-S", str(control_path), "-O", operation, "remotepy-master"],
+            capture_output=True,
+            text=True,
+            timeout=SSH_OPERATION_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"ssh -O {operation} failed for {control_path}: {e}")
+        return 255
+    return result.returncode
+
+
+def list_control_masters() -> list[ControlMaster]:
+    """List ControlMaster sockets and whether their master is still running.
+
+    Returns:
+        Masters sorted by socket name
+    """
+    control_dir = get_ssh_control_dir()
+    if not control_dir.is_dir():
+        return []
+
+    masters = []
+    for path in sorted(control_dir.iterdir()):
+        user, sep, instance_id = path.name.rpartition("@")
+        if not sep or not path.is_socket():
+            continue
+        active = _run_control_command(path, "check") == 0
+        masters.append(ControlMaster(path=path, user=user, instance_id=instance_id, active=active))
+    return masters
+
+
+def close_control_master(master: ControlMaster) -> bool:
+    """Close a master connection and remove its socket.
+
+    Args:
+        master: Master returned by list_control_masters()
+
+    Returns:
+        True if a running master was told to exit, False if the socket was stale
+    """
+    closed = master.active and _run_control_command(master.path, "exit") == 0
+    # A master that died without cleaning up leaves a stale socket behind
+    master.path.unlink(missing_ok=True)
+    return closed
+
+
+def start_control_master(instance_id: str, user: str, ssh_args: list[str]) -> Path | None:
+    """Make sure a ControlMaster is running for an instance, starting one if needed.
+
+    The master is started explicitly with -f and no pipes attached. Letting
+    a captured command become the master (ControlMaster=auto) would make
+    subprocess.run() wait on the backgrounded master's stderr until
+    ControlPersist expires.
+
+    Args:
+        instance_id: AWS instance ID
+        user: SSH username
+        ssh_args: Base SSH command for the instance, ending with user@host
+
+    Returns:
+        Socket path to pass to build_multiplex_options(), or None if
+        multiplexing is disabled or the master could not be started
+    """
+    control_path = get_control_path(instance_id, user)
+    if control_path is None:
+        return None
+    if control_path.exists() and _run_control_command(control_path, "check") == 0:
+        return control_path
+
+    control_path.unlink(missing_ok=True)
+    master_args = [
+        ssh_args[0],
+        "-M",
+        "-N",
+        "-f",
+        "-o",
+        f"ControlPath={control_path}",
+        "-o",
+        f"ControlPersist={get_ssh_control_persist()}",
+        *ssh_args[1:],
+    ]
+    try:
+        result = subprocess.run(
+            master_args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=SSH_OPERATION_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"Could not start SSH master for {instance_id}: {e}")
+        return None
+    if result.returncode != 0:
+        # Fall back to a direct connection, which reports the real error
+        logger.debug(f"SSH master for {instance_id} exited with {result.returncode}")
+        return None
+    return control_path
+
+
+def with_control_master(ssh_args: list[str], instance_id: str, user: str) -> list[str]:
+    """Route an SSH command through the instance's ControlMaster.
+
+    Args:
+        ssh_args: Base SSH command for the instance, ending with user@host
+        instance_id: AWS instance ID
+        user: SSH username
+
+    Returns:
+        ssh_args with multiplexing options added, or unchanged if no master
+        is available
+    """
+    control_path = start_control_master(instance_id, user, ssh_args)
+    if control_path is None:
+        return ssh_args
+    return [ssh_args[0], *build_multiplex_options(control_path), *ssh_args[1:]]
+
 
 class SSHConnectionProvider:
     """SSH-based connection provider.
@@ -127,6 +330,9 @@ class SSHConnectionProvider:
     ) -> tuple[int, str, str]:
         """Execute a command on the remote instance via SSH.
 
+        Commands reuse a per-instance ControlMaster connection when
+        multiplexing is enabled, so repeated calls skip the SSH handshake.
+
         Args:
             instance_id: AWS instance ID (not used for SSH, included for protocol)
             dns: DNS hostname or IP address
@@ -147,6 +353,7 @@ class SSHConnectionProvider:
             no_strict_host_key=no_strict_host_key,
             verbose=verbose,
         )
+        ssh_args = with_control_master(ssh_args, instance_id, user)
 
         # Append the remote command
         ssh_args.extend(command)
@@ -7,17 +7,128 @@ or open inbound ports, using IAM for authentication.
 
 import json
 import subprocess
+import threading
 import time
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 
 from remote.exceptions import SSMError
 from remote.settings import (
+    SSH_PROBE_INITIAL_DELAY_SECONDS,
+    SSH_PROBE_MAX_DELAY_SECONDS,
     SSM_COMMAND_TIMEOUT_SECONDS,
     SSM_DEFAULT_SHELL_USER,
-    SSM_MAX_POLL_ATTEMPTS,
-    SSM_POLL_INTERVAL_SECONDS,
+    SSM_DELIVERY_TIMEOUT_SECONDS,
+    SSM_POLL_INITIAL_DELAY_SECONDS,
+    SSM_POLL_MAX_DELAY_SECONDS,
+    SSM_READY_TIMEOUT_SECONDS,
+    SSM_SEND_COMMAND_MAX_TARGETS,
 )
 from remote.utils import print_warning
 
+# Statuses of a command invocation that has not finished yet
+SSM_PENDING_STATUSES = ("Pending", "InProgress", "Delayed", "Cancelling")
+
+# Separator the SSM agent puts between stdout and stderr in a plugin's Output
+SSM_OUTPUT_ERROR_MARKER = "\n----------ERROR-------\n"
+
+# Serializes boto3 client creation, which is not thread-safe, for fan-out exec
+_client_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def get_ssm_client(profile: str | None = None) -> Any:
+    """Get or create the SSM client used to run commands.
+
+    Clients are cached per profile so every command (and every poll) in a
+    process reuses the same connection pool.
+
+    Args:
+        profile: Optional AWS profile name; None uses the default session
+
+    Returns:
+        boto3 SSM client instance
+    """
+    with _client_lock:
+        if profile:
+            return boto3.session.Session(profile_name=profile).client("ssm")
+        return boto3.client("ssm")
+
+
+def clear_ssm_client_cache() -> None:
+    """Clear the SSM client cache.
+
+    Useful for testing or when you need to reset the client state.
+    """
+    get_ssm_client.cache_clear()
+
+
+def is_ssm_agent_online(instance_id: str, profile: str | None = None) -> bool:
+    """Check whether an instance's SSM agent has registered and is online.
+
+    Args:
+        instance_id: AWS instance ID
+        profile: Optional AWS profile name; None uses the default session
+
+    Returns:
+        True if describe_instance_information reports PingStatus Online
+
+    Raises:
+        SSMError: If no AWS credentials are available
+        ClientError: If the describe call fails
+    """
+    try:
+        response = get_ssm_client(profile).describe_instance_information(
+            Filters=[{"Key": "InstanceIds", "Values": [instance_id]}]
+        )
+    except NoCredentialsError:
+        raise SSMError("describe-instance-information", "AWS credentials not found.")
+    return any(
+        info.get("PingStatus") == "Online" for info in response.get("InstanceInformationList", [])
+    )
+
+
+def wait_for_ssm_ready(
+    instance_id: str, profile: str | None = None, timeout: int = SSM_READY_TIMEOUT_SECONDS
+) -> bool:
+    """Wait until a started instance's SSM agent reports Online.
+
+    A freshly started instance is running before its agent has registered,
+    and send-command/start-session fail with TargetNotConnected until it
+    has. Polls with the same exponential backoff as the SSH readiness probe,
+    so an instance whose agent is already online returns on the first check.
+
+    Args:
+        instance_id: AWS instance ID
+        profile: Optional AWS profile name; None uses the default session
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the agent came online before the timeout. False on timeout,
+        or straight away if the status cannot be read (e.g. missing
+        ssm:DescribeInstanceInformation permission)
+
+    Raises:
+        SSMError: If no AWS credentials are available
+    """
+    deadline = time.monotonic() + timeout
+    delay = SSH_PROBE_INITIAL_DELAY_SECONDS
+    while True:
+        try:
+            if is_ssm_agent_online(instance_id, profile):
+                return True
+        except (ClientError, BotoCoreError):
+            return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, SSH_PROBE_MAX_DELAY_SECONDS)
+
 
 class SSMConnectionProvider:
     """SSM-based connection provider.
@@ -131,8 +242,9 @@ class SSMConnectionProvider:
     ) -> tuple[int, str, str]:
         """Execute a command on the instance via SSM send-command.
 
-        Uses AWS SSM send-command with AWS-RunShellScript document,
-        then polls for completion and retrieves output.
+        Uses the AWS-RunShellScript document through a cached boto3 SSM
+        client, then polls get-command-invocation with exponential backoff
+        until the command finishes. No AWS CLI processes are started.
 
         Args:
             instance_id: AWS instance ID
@@ -146,138 +258,185 @@ class SSMConnectionProvider:
 
         Returns:
             Tuple of (exit_code, stdout, stderr)
+
+        Raises:
+            SSMError: If no AWS credentials are available
         """
         # Join command list into a single command string
         command_str = " ".join(command)
-
-        # Send the command
-        send_args = [
-            "aws",
-            "ssm",
-            "send-command",
-            "--instance-ids",
-            instance_id,
-            "--document-name",
-            "AWS-RunShellScript",
-            "--parameters",
-            json.dumps({"commands": [command_str]}),
-            "--timeout-seconds",
-            str(timeout),
-            "--output",
-            "json",
-        ]
-        send_args.extend(self._get_profile_args())
+        client = get_ssm_client(self.ssm_profile)
 
         if verbose:
-            print_warning(f"SSM send-command: {' '.join(send_args)}")
+            print_warning(f"SSM send-command to {instance_id}: {command_str}")
 
         try:
-            send_result = subprocess.run(
-                send_args,
-                capture_output=True,
-                text=True,
-                timeout=timeout + 10,  # Extra buffer for API call
+            response = client.send_command(
+                InstanceIds=[instance_id],
+                DocumentName="AWS-RunShellScript",
+                Parameters={"commands": [command_str], "executionTimeout": [str(timeout)]},
+                # Delivery timeout; the API rejects values below 30 seconds
+                TimeoutSeconds=max(timeout, SSM_DELIVERY_TIMEOUT_SECONDS),
             )
-        except FileNotFoundError:
-            raise SSMError(
-                "send-command",
-                "AWS CLI not found. Please install the AWS CLI.",
-            )
-        except subprocess.TimeoutExpired:
-            return 1, "", "Command timed out waiting for send-command"
-
-        if send_result.returncode != 0:
-            return send_result.returncode, "", send_result.stderr
-
-        # Parse response to get command ID
-        try:
-            response = json.loads(send_result.stdout)
-            command_id = response["Command"]["CommandId"]
-        except (json.JSONDecodeError, KeyError) as e:
-            return 1, "", f"Failed to parse send-command response: {e}"
+        except NoCredentialsError:
+            raise SSMError("send-command", "AWS credentials not found.")
+        except (ClientError, BotoCoreError) as e:
+            return 1, "", f"send-command failed: {e}"
 
+        command_id = response["Command"]["CommandId"]
         if verbose:
             print_warning(f"SSM command ID: {command_id}")
 
         # Poll for command completion
-        return self._wait_for_command(instance_id, command_id, timeout, verbose)
+        return self._wait_for_command(client, instance_id, command_id, timeout, verbose)
 
     def _wait_for_command(
         self,
+        client: Any,
         instance_id: str,
         command_id: str,
         timeout: int,
         verbose: bool,
     ) -> tuple[int, str, str]:
-        """Wait for SSM command to complete and retrieve output.
+        """Wait for an SSM command to complete and retrieve its output.
+
+        Polls start after SSM_POLL_INITIAL_DELAY_SECONDS and the delay doubles
+        up to SSM_POLL_MAX_DELAY_SECONDS, so short commands return quickly
+        while long ones cost only a few API calls.
 
         Args:
+            client: SSM client the command was sent with
             instance_id: AWS instance ID
             command_id: SSM command ID to wait for
-            timeout: Maximum time to wait
+            timeout: Maximum time to wait in seconds
             verbose: Enable verbose output
 
         Returns:
             Tuple of (exit_code, stdout, stderr)
         """
-        get_output_args = [
-            "aws",
-            "ssm",
-            "get-command-invocation",
-            "--command-id",
-            command_id,
-            "--instance-id",
-            instance_id,
-            "--output",
-            "json",
-        ]
-        get_output_args.extend(self._get_profile_args())
+        deadline = time.monotonic() + timeout
+        delay = SSM_POLL_INITIAL_DELAY_SECONDS
+        attempt = 0
 
-        max_attempts = min(SSM_MAX_POLL_ATTEMPTS, timeout // SSM_POLL_INTERVAL_SECONDS)
-
-        for attempt in range(max_attempts):
-            time.sleep(SSM_POLL_INTERVAL_SECONDS)
+        while True:
+            time.sleep(delay)
+            attempt += 1
 
             try:
-                result = subprocess.run(
-                    get_output_args,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
+                invocation = client.get_command_invocation(
+                    CommandId=command_id, InstanceId=instance_id
+                )
+                status = invocation.get("Status", "")
+            except ClientError as e:
+                # The invocation is not visible for a moment after send-command
+                if e.response.get("Error", {}).get("Code") != "InvocationDoesNotExist":
+                    return 1, "", f"get-command-invocation failed: {e}"
+                status = "Pending"
+            except BotoCoreError as e:
+                return 1, "", f"get-command-invocation failed: {e}"
+
+            if status not in SSM_PENDING_STATUSES:
+                stdout = invocation.get("StandardOutputContent", "")
+                stderr = invocation.get("StandardErrorContent", "")
+                if status == "Success":
+                    return 0, stdout, stderr
+                # Failed, Cancelled, TimedOut, etc. ResponseCode is the script's
+                # exit status, or -1 if it never ran
+                response_code = invocation.get("ResponseCode", -1)
+                exit_code = response_code if response_code > 0 else 1
+                status_details = invocation.get("StatusDetails", status)
+                return (
+                    exit_code,
+                    stdout,
+                    stderr or f"Command failed with status: {status_details}",
                 )
-            except subprocess.TimeoutExpired:
-                continue
 
-            if result.returncode != 0:
-                # Command may not be ready yet
-                if verbose:
-                    print_warning(f"Poll attempt {attempt + 1}: waiting for command...")
-                continue
+            if verbose:
+                print_warning(f"Poll attempt {attempt}: status={status}")
+            if time.monotonic() >= deadline:
+                return 1, "", f"Command timed out after {timeout} seconds"
+            delay = min(delay * 2, SSM_POLL_MAX_DELAY_SECONDS)
 
-            try:
-                response = json.loads(result.stdout)
-                status = response.get("Status", "")
+    def execute_command_batch(
+        self,
+        instance_ids: list[str],
+        command: list[str],
+        verbose: bool = False,
+        timeout: int = SSM_COMMAND_TIMEOUT_SECONDS,
+    ) -> Iterator[tuple[str, tuple[int, str, str]]]:
+        """Execute a command on many instances with batched SSM calls.
 
-                if status in ("Pending", "InProgress", "Delayed"):
-                    if verbose:
-                        print_warning(f"Poll attempt {attempt + 1}: status={status}")
-                    continue
+        Sends one send-command per SSM_SEND_COMMAND_MAX_TARGETS instances and
+        collects every invocation with paginated list-command-invocations
+        (Details=True) polls, instead of a send and a poll loop per instance.
+        Polls back off the same way as execute_command.
 
-                # Command completed
-                stdout = response.get("StandardOutputContent", "")
-                stderr = response.get("StandardErrorContent", "")
+        Output comes from the command plugin's Output field, which SSM
+        truncates to the first 2500 characters.
 
-                if status == "Success":
-                    return 0, stdout, stderr
-                else:
-                    # Failed, Cancelled, TimedOut, etc.
-                    status_details = response.get("StatusDetails", status)
-                    return 1, stdout, stderr or f"Command failed with status: {status_details}"
+        Args:
+            instance_ids: AWS instance IDs to run the command on
+            command: Command to execute as list of arguments
+            verbose: Enable verbose output
+            timeout: Command timeout in seconds, shared by all instances
 
-            except (json.JSONDecodeError, KeyError):
-                continue
+        Yields:
+            Tuples of (instance_id, (exit_code, stdout, stderr)) as each
+            instance finishes; every instance ID is yielded exactly once
 
-        return 1, "", f"Command timed out after {timeout} seconds"
+        Raises:
+            SSMError: If no AWS credentials are available
+        """
+        command_str = " ".join(command)
+        client = get_ssm_client(self.ssm_profile)
+        deadline = time.monotonic() + timeout
+
+        # Command ID -> instances whose invocation has not finished yet
+        outstanding: dict[str, set[str]] = {}
+        for start in range(0, len(instance_ids), SSM_SEND_COMMAND_MAX_TARGETS):
+            chunk = instance_ids[start : start + SSM_SEND_COMMAND_MAX_TARGETS]
+            if verbose:
+                print_warning(f"SSM send-command to {len(chunk)} instance(s): {command_str}")
+            try:
+                response = client.send_command(
+                    InstanceIds=chunk,
+                    DocumentName="AWS-RunShellScript",
+                    Parameters={"commands": [command_str], "executionTimeout": [str(timeout)]},
+                    TimeoutSeconds=max(timeout, SSM_DELIVERY_TIMEOUT_SECONDS),
+                )
+            except NoCredentialsError:
+                raise SSMError("send-command", "AWS credentials not found.")
+            except (ClientError, BotoCoreError) as e:
+                for instance_id in chunk:
+                    yield instance_id, (1, "", f"send-command failed: {e}")
+                continue
+            outstanding[response["Command"]["CommandId"]] = set(chunk)
+
+        paginator = client.get_paginator("list_command_invocations")
+        delay = SSM_POLL_INITIAL_DELAY_SECONDS
+        while outstanding:
+            time.sleep(delay)
+            for command_id, pending in list(outstanding.items()):
+                try:
+                    for page in paginator.paginate(CommandId=command_id, Details=True):
+                        for invocation in page.get("CommandInvocations", []):
+                            instance_id = invocation.get("InstanceId", "")
+                            status = invocation.get("Status", "")
+                            if instance_id in pending and status not in SSM_PENDING_STATUSES:
+                                pending.discard(instance_id)
+                                yield instance_id, _invocation_result(invocation)
+                except (ClientError, BotoCoreError) as e:
+                    for instance_id in sorted(pending):
+                        yield instance_id, (1, "", f"list-command-invocations failed: {e}")
+                    pending.clear()
+                if not pending:
+                    del outstanding[command_id]
+
+            if outstanding and time.monotonic() >= deadline:
+                for pending in outstanding.values():
+                    for instance_id in sorted(pending):
+                        yield instance_id, (1, "", f"Command timed out after {timeout} seconds")
+                return
+            delay = min(delay * 2, SSM_POLL_MAX_DELAY_SECONDS)
 
     def port_forward(
         self,
@@ -345,3 +504,26 @@ class SSMConnectionProvider:
             False - SSM cannot use rsync or similar tools
         """
         return False
+
+
+def _invocation_result(invocation: dict[str, Any]) -> tuple[int, str, str]:
+    """Convert a detailed list-command-invocations entry into a command result.
+
+    Args:
+        invocation: One CommandInvocations entry returned with Details=True
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr)
+    """
+    plugins = invocation.get("CommandPlugins") or [{}]
+    plugin = plugins[0]
+    output = plugin.get("Output", "")
+    stdout, _, stderr = output.partition(SSM_OUTPUT_ERROR_MARKER)
+
+    status = invocation.get("Status", "")
+    if status == "Success":
+        return 0, stdout, stderr
+    response_code = plugin.get("ResponseCode", -1)
+    exit_code = response_code if response_code > 0 else 1
+    status_details = invocation.get("StatusDetails", status)
+    return exit_code, stdout, stderr or f"Command failed with status: {status_details}"
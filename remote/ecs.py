@@ -1,9 +1,19 @@
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import boto3
 import typer
 
+from remote.exceptions import AWSServiceError
+from remote.settings import (
+    ECS_DESCRIBE_SERVICES_BATCH_SIZE,
+    ECS_SCALE_MAX_WORKERS,
+    ECS_STABLE_POLL_INTERVAL_SECONDS,
+    ECS_STABLE_WAIT_TIMEOUT_SECONDS,
+)
 from remote.utils import (
     confirm_action,
     console,
@@ -11,6 +21,7 @@ from remote.utils import (
     extract_resource_name_from_arn,
     handle_aws_errors,
     handle_cli_errors,
+    print_error,
     print_success,
     print_warning,
     prompt_for_selection,
@@ -20,6 +31,7 @@ from remote.validation import sanitize_input, validate_positive_integer
 
 if TYPE_CHECKING:
     from mypy_boto3_ecs.client import ECSClient
+    from mypy_boto3_ecs.type_defs import ServiceTypeDef
 
 
 @lru_cache(maxsize=1)
@@ -107,6 +119,131 @@ def scale_service(cluster_name: str, service_name: str, desired_count: int) -> N
         )
 
 
+def describe_services(cluster_name: str, services: Iterable[str]) -> dict[str, "ServiceTypeDef"]:
+    """Describe ECS services in batches of 10 per describe_services call.
+
+    Services that ECS reports as failures (e.g. missing) are left out of
+    the result.
+
+    Args:
+        cluster_name: The name of the cluster
+        services: Service names or ARNs
+
+    Returns:
+        Mapping of service name to its describe_services entry
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    service_list = list(services)
+    described: dict[str, ServiceTypeDef] = {}
+    with handle_aws_errors("ECS", "describe_services"):
+        for start in range(0, len(service_list), ECS_DESCRIBE_SERVICES_BATCH_SIZE):
+            batch = service_list[start : start + ECS_DESCRIBE_SERVICES_BATCH_SIZE]
+            response = get_ecs_client().describe_services(cluster=cluster_name, services=batch)
+            for service in response.get("services", []):
+                described[service["serviceName"]] = service
+    return described
+
+
+def is_service_stable(service: "ServiceTypeDef") -> bool:
+    """Check whether a described service has reached a steady state.
+
+    Uses the same rule as the ECS ``services_stable`` waiter: a single
+    deployment, no pending tasks and as many running tasks as desired.
+
+    Args:
+        service: A describe_services entry
+
+    Returns:
+        True if the service is stable
+    """
+    return (
+        len(service.get("deployments", [])) == 1
+        and service.get("pendingCount", 0) == 0
+        and service.get("runningCount", 0) == service.get("desiredCount", 0)
+    )
+
+
+def scale_services(
+    cluster_name: str,
+    services: list[str],
+    desired_count: int,
+    max_workers: int = ECS_SCALE_MAX_WORKERS,
+) -> dict[str, AWSServiceError | None]:
+    """Scale many ECS services with concurrent update_service calls.
+
+    Args:
+        cluster_name: The name of the cluster
+        services: Service names or ARNs
+        desired_count: The desired count of tasks
+        max_workers: Maximum concurrent update_service calls
+
+    Returns:
+        Mapping of each service to None on success or the error it raised
+    """
+
+    def scale_one(service: str) -> AWSServiceError | None:
+        try:
+            scale_service(cluster_name, service, desired_count)
+        except AWSServiceError as e:
+            return e
+        return None
+
+    if not services:
+        return {}
+    workers = max(1, min(max_workers, len(services)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(scale_one, services))
+    return dict(zip(services, results, strict=True))
+
+
+def wait_for_services_stable(
+    cluster_name: str,
+    services: list[str],
+    timeout: int = ECS_STABLE_WAIT_TIMEOUT_SECONDS,
+    on_poll: Callable[[dict[str, "ServiceTypeDef"]], None] | None = None,
+) -> dict[str, "ServiceTypeDef"]:
+    """Wait for many services to become stable, sharing one describe poll.
+
+    Every poll describes all still-unstable services together (10 per
+    call), so waiting on several services costs the same number of API
+    calls as waiting on one. Missing and inactive services stop being
+    waited on.
+
+    Args:
+        cluster_name: The name of the cluster
+        services: Service names or ARNs
+        timeout: Maximum time to wait in seconds
+        on_poll: Optional callback given the latest descriptions after each poll
+
+    Returns:
+        Mapping of service name to its last describe_services entry
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    deadline = time.monotonic() + timeout
+    latest: dict[str, ServiceTypeDef] = {}
+    pending = list(services)
+    while pending:
+        described = describe_services(cluster_name, pending)
+        latest.update(described)
+        if on_poll:
+            on_poll(dict(latest))
+        pending = [
+            service
+            for service in pending
+            if (entry := described.get(extract_resource_name_from_arn(service))) is not None
+            and entry.get("status") != "INACTIVE"
+            and not is_service_stable(entry)
+        ]
+        if not pending or time.monotonic() >= deadline:
+            break
+        time.sleep(ECS_STABLE_POLL_INTERVAL_SECONDS)
+    return latest
+
+
 def prompt_for_cluster_name() -> str:
     """Prompt the user to select a cluster.
 
@@ -194,9 +331,11 @@ def list_clusters() -> None:
 @app.command("list-services")
 @handle_cli_errors
 def list_services(cluster_name: str | None = typer.Argument(None, help="Cluster name")) -> None:
-    """List ECS services in a cluster.
+    """List ECS services in a cluster with their task counts.
 
-    If no cluster is specified, prompts for selection.
+    If no cluster is specified, prompts for selection. Desired, running
+    and pending task counts are loaded with one describe_services call
+    per 10 services.
 
     Examples:
         remote ecs ls-services                # List services (prompts for cluster)
@@ -212,14 +351,65 @@ def list_services(cluster_name: str | None = typer.Argument(None, help="Cluster
         print_warning("No services found")
         return
 
+    described = describe_services(cluster_name, services)
+
     columns = [
         styled_column("Service", "name"),
+        styled_column("Status"),
+        styled_column("Desired", "numeric", justify="right"),
+        styled_column("Running", "numeric", justify="right"),
+        styled_column("Pending", "numeric", justify="right"),
         styled_column("ARN", "arn"),
     ]
-    rows = [[extract_resource_name_from_arn(service), service] for service in services]
+    rows = []
+    for service in services:
+        name = extract_resource_name_from_arn(service)
+        entry = described.get(name)
+        if entry is None:
+            rows.append([name, "MISSING", "-", "-", "-", service])
+            continue
+        rows.append(
+            [
+                name,
+                entry.get("status", "UNKNOWN"),
+                str(entry.get("desiredCount", 0)),
+                str(entry.get("runningCount", 0)),
+                str(entry.get("pendingCount", 0)),
+                service,
+            ]
+        )
     console.print(create_table("ECS Services", columns, rows))
 
 
+def _wait_for_services(cluster_name: str, services: list[str]) -> int:
+    """Wait for scaled services to become stable with one shared poll per tick.
+
+    Returns:
+        0 if every service is stable, otherwise 1
+    """
+    progress = {"done": -1}
+
+    def report(described: dict[str, "ServiceTypeDef"]) -> None:
+        done = sum(1 for entry in described.values() if is_service_stable(entry))
+        if done != progress["done"]:
+            progress["done"] = done
+            print_warning(f"  {done}/{len(services)} stable")
+
+    print_warning(f"Waiting for {len(services)} service(s) to become stable...")
+    described = wait_for_services_stable(cluster_name, services, on_poll=report)
+    lagging = []
+    for service in services:
+        name = extract_resource_name_from_arn(service)
+        entry = described.get(name)
+        if entry is None or not is_service_stable(entry):
+            lagging.append(name)
+    if lagging:
+        print_error(f"Not stable yet: {', '.join(lagging)}")
+        return 1
+    print_success(f"All {len(services)} service(s) stable")
+    return 0
+
+
 @app.command()
 @handle_cli_errors
 def scale(
@@ -232,17 +422,26 @@ def scale(
         "-y",
         help="Skip confirmation prompt (for scripting)",
     ),
+    wait: bool = typer.Option(
+        False,
+        "--wait",
+        "-w",
+        help="Wait until every scaled service is stable",
+    ),
 ) -> None:
     """Scale ECS service task count.
 
     If no cluster or service is specified, prompts for selection.
-    Prompts for confirmation before scaling.
+    Prompts for confirmation before scaling. Confirmed services are
+    scaled concurrently; with --wait, all of them are polled together
+    until they reach a steady state.
 
     Examples:
         remote ecs scale                              # Interactive mode (prompts for cluster/service)
         remote ecs scale my-cluster my-service -n 3  # Scale to 3 tasks
         remote ecs scale my-cluster my-service -n 0  # Scale down to 0 tasks
         remote ecs scale my-cluster my-service -n 5 -y  # Skip confirmation prompt
+        remote ecs scale my-cluster -n 2 --wait     # Wait for selected services to stabilize
     """
     if not cluster_name:
         cluster_name = prompt_for_cluster_name()
@@ -261,10 +460,25 @@ def scale(
         # Validate the CLI-provided value
         desired_count = validate_positive_integer(desired_count, "desired count")
 
-    for service in services:
-        if not yes:
-            if not confirm_action("scale", "service", service, details=f"to {desired_count} tasks"):
-                continue
+    confirmed = [
+        service
+        for service in services
+        if yes or confirm_action("scale", "service", service, details=f"to {desired_count} tasks")
+    ]
+    if not confirmed:
+        return
 
-        scale_service(cluster_name, service, desired_count)
-        print_success(f"Scaled {service} to {desired_count} tasks")
+    results = scale_services(cluster_name, confirmed, desired_count)
+    scaled = []
+    for service, error in results.items():
+        if error is None:
+            scaled.append(service)
+            print_success(f"Scaled {service} to {desired_count} tasks")
+        else:
+            print_error(f"Failed to scale {service}: {error}")
+
+    exit_code = 0 if len(scaled) == len(confirmed) else 1
+    if wait and scaled:
+        exit_code = _wait_for_services(cluster_name, scaled) or exit_code
+    if exit_code:
+        raise typer.Exit(exit_code)
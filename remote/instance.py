@@ -1,20 +1,31 @@
 import contextlib
+import shlex
 import subprocess
 import sys
 import time
 import webbrowser
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.live import Live
 from rich.panel import Panel
+from rich.table import Table
 
 from remote.autoshutdown import app as autoshutdown_app
 from remote.autoshutdown import delete_auto_shutdown_alarm
 from remote.config import config_manager
+from remote.connection_ssh import (
+    build_multiplex_options,
+    close_control_master,
+    list_control_masters,
+    start_control_master,
+    with_control_master,
+)
 from remote.exceptions import (
     AWSServiceError,
     InstanceNotFoundError,
@@ -24,57 +35,62 @@ from remote.exceptions import (
     ValidationError,
 )
 from remote.instance_resolver import (
+    IndexedInstance,
+    get_cached_instance_id,
+    get_cached_instances,
     get_instance_name,
+    invalidate_inventory_cache,
     launch_instance_from_template,
     resolve_instance_or_exit,
+    select_instances,
 )
-from remote.pricing import (
-    format_price,
-    get_instance_price_with_fallback,
-)
-from remote.scheduler import delete_all_schedules_for_instance
 from remote.settings import (
-    CONNECTION_RETRY_SLEEP_SECONDS,
     DEFAULT_EXEC_TIMEOUT_SECONDS,
     DEFAULT_SSH_CONNECT_TIMEOUT_SECONDS,
     DEFAULT_SSH_USER,
+    EXEC_FANOUT_MAX_WORKERS,
     MAX_CONNECTION_ATTEMPTS,
-    MAX_STARTUP_WAIT_SECONDS,
+    PRICE_CATALOG_MIN_TYPES,
+    PRICE_PREFETCH_MAX_WORKERS,
     SECONDS_PER_HOUR,
     SSH_OPERATION_TIMEOUT_SECONDS,
-    SSH_READINESS_WAIT_SECONDS,
     SSH_SERVER_ALIVE_COUNT_MAX,
     SSH_SERVER_ALIVE_INTERVAL,
-    STARTUP_POLL_INTERVAL_SECONDS,
+    STATS_RECENT_SESSIONS,
+    STATUS_WATCH_MAX_INTERVAL_SECONDS,
     TYPE_CHANGE_MAX_POLL_ATTEMPTS,
     TYPE_CHANGE_POLL_INTERVAL_SECONDS,
 )
-from remote.tracking import tracking_manager
 from remote.utils import (
     confirm_action,
     console,
     create_table,
     extract_tags_dict,
     format_duration,
+    get_all_instance_statuses,
+    get_current_region,
     get_ec2_client,
     get_instance_dns,
-    get_instance_id,
     get_instance_ids,
     get_instance_info,
     get_instance_status,
     get_instance_type,
-    get_instances,
     get_status_style,
     handle_aws_errors,
     handle_cli_errors,
     is_instance_running,
     parse_duration_to_minutes,
     print_error,
+    print_info,
     print_success,
     print_warning,
     styled_column,
+    wait_for_instance_running,
+    wait_for_instance_states,
+    wait_for_ssh_ready,
 )
 from remote.validation import (
+    parse_tag_filter,
     safe_get_array_item,
     safe_get_nested_value,
     sanitize_input,
@@ -83,6 +99,10 @@ from remote.validation import (
     validate_ssh_username,
 )
 
+if TYPE_CHECKING:
+    from remote.connection import ConnectionProvider
+    from remote.connection_ssm import SSMConnectionProvider
+
 app = typer.Typer()
 
 
@@ -170,6 +190,33 @@ def _get_raw_launch_times(instances: list[dict[str, Any]]) -> list[Any]:
     return launch_times
 
 
+def _prefetch_instance_prices(
+    instance_types: Iterable[str | None], region: str
+) -> dict[str, tuple[float | None, bool]]:
+    """Look up hourly prices for the distinct instance types concurrently.
+
+    Each uncached lookup is an HTTPS round trip to the Pricing API, so the
+    distinct types are priced in a bounded thread pool rather than serially.
+
+    Args:
+        instance_types: Instance types to price (duplicates and blanks are skipped)
+        region: AWS region code to price in
+
+    Returns:
+        Mapping of instance type to (price, used_fallback) as returned by
+        get_instance_price_with_fallback()
+    """
+    distinct = sorted({it for it in instance_types if it})
+    if not distinct:
+        return {}
+    from remote.pricing import get_instance_price_with_fallback
+
+    workers = min(PRICE_PREFETCH_MAX_WORKERS, len(distinct))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda it: get_instance_price_with_fallback(it, region), distinct)
+        return dict(zip(distinct, results, strict=True))
+
+
 @app.command("ls")
 @app.command("list")
 @handle_cli_errors
@@ -184,13 +231,20 @@ def list_instances(
         help="Show lifetime cumulative costs instead of current session (requires --cost)",
     ),
     all_instances: bool = typer.Option(False, "--all", "-a", help="Include terminated instances"),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Bypass the local inventory cache and query EC2 directly"
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Show timing for price lookups (with --cost)"
+    ),
 ) -> None:
     """
     List all EC2 instances with summary info.
 
     Shows a summary table of all instances. Use 'instance status' for detailed
     health information about a specific instance. Terminated instances are
-    excluded by default; use --all to include them.
+    excluded by default; use --all to include them. Results are served from
+    the local inventory cache when fresh; use --refresh to query EC2 directly.
 
     Columns: Name, ID, DNS, Status, Type, Launch Time
     With --cost: adds Uptime, Hourly Rate, Estimated Cost
@@ -201,8 +255,13 @@ def list_instances(
         remote instance ls --all        # Include terminated instances
         remote instance ls --cost       # Include cost information
         remote instance ls --cost --lifetime  # Show lifetime cumulative costs
+        remote instance ls --refresh    # Ignore cached inventory
+        remote instance ls --cost -v    # Show price lookup timing
     """
-    instances = get_instances(exclude_terminated=not all_instances)
+    from remote.pricing import format_price, load_region_prices
+    from remote.tracking import tracking_manager
+
+    instances = get_cached_instances(exclude_terminated=not all_instances, refresh=refresh)
     ids = get_instance_ids(instances)
 
     names, public_dnss, statuses, instance_types, launch_times = get_instance_info(instances)
@@ -210,6 +269,18 @@ def list_instances(
     # Get raw launch times for uptime calculation if cost is requested
     raw_launch_times = _get_raw_launch_times(instances) if cost else []
 
+    prices: dict[str, tuple[float | None, bool]] = {}
+    if cost:
+        started = time.perf_counter()
+        region = get_current_region()
+        # For many distinct types, one region catalog sweep beats a Pricing API call per type
+        if len({it for it in instance_types if it}) >= PRICE_CATALOG_MIN_TYPES:
+            load_region_prices(region)
+        prices = _prefetch_instance_prices(instance_types, region)
+        if verbose:
+            elapsed = time.perf_counter() - started
+            print_info(f"Priced {len(prices)} instance type(s) in {elapsed:.2f}s")
+
     # Build column definitions
     columns: list[dict[str, Any]] = [
         styled_column("Name", "name"),
@@ -260,7 +331,7 @@ def list_instances(
 
             # Get hourly price for this instance type
             if it:
-                hourly_price, used_fallback = get_instance_price_with_fallback(it)
+                hourly_price, used_fallback = prices[it]
                 if used_fallback:
                     any_fallback_used = True
 
@@ -306,56 +377,71 @@ def list_instances(
         console.print("[dim]Lifetime costs tracked from CLI start/stop operations[/dim]")
 
 
-def _build_status_table(instance_name: str, instance_id: str) -> Panel:
-    """Build a Rich Panel with detailed instance status information.
+# States an instance passes through on its way to running/stopped/terminated;
+# status --watch keeps polling at the base interval while in one of these
+_TRANSITIONAL_STATES = ("pending", "stopping", "shutting-down")
 
-    Shows both health status and instance details.
+
+def _fetch_status_fields(
+    instance_name: str, instance_id: str, expect_running: bool = True
+) -> dict[str, Any]:
+    """Fetch the values shown by `instance status` in one request cycle.
+
+    When the instance is expected to be running, describe_instance_status is
+    issued concurrently with describe_instances. Otherwise health is only
+    fetched if describe_instances reports the instance running, so a stopped
+    instance costs a single call.
+
+    Args:
+        instance_name: Name of the instance for display
+        instance_id: AWS instance ID
+        expect_running: Fetch health concurrently with the instance details
+
+    Returns:
+        Display values keyed by field name; tags are a tuple of (key, value)
 
     Raises:
         InstanceNotFoundError: If the instance is not found
         AWSServiceError: If there's an error calling AWS APIs
         ResourceNotFoundError: If required resources are missing
     """
-    # Get instance health status
-    status = get_instance_status(instance_id)
-    instance_statuses = status.get("InstanceStatuses", [])
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        health = executor.submit(get_instance_status, instance_id) if expect_running else None
 
-    # Get detailed instance info
-    ec2 = get_ec2_client()
-    instance_info = ec2.describe_instances(InstanceIds=[instance_id])
-    reservations = instance_info.get("Reservations", [])
+        # Get detailed instance info
+        ec2 = get_ec2_client()
+        instance_info = ec2.describe_instances(InstanceIds=[instance_id])
+        reservations = instance_info.get("Reservations", [])
 
-    if not reservations:
-        raise InstanceNotFoundError(instance_name)
-
-    reservation = safe_get_array_item(reservations, 0, "instance reservations")
-    instances = reservation.get("Instances", [])
-    if not instances:
-        raise InstanceNotFoundError(instance_name)
-
-    instance = safe_get_array_item(instances, 0, "instances")
-
-    # Extract instance details
-    state_info = instance.get("State", {})
-    state_name = state_info.get("Name", "unknown")
-    instance_type = instance.get("InstanceType", "unknown")
-    public_ip = instance.get("PublicIpAddress", "-")
-    private_ip = instance.get("PrivateIpAddress", "-")
-    public_dns = instance.get("PublicDnsName", "-") or "-"
-    key_name = instance.get("KeyName", "-")
-    launch_time = instance.get("LaunchTime")
-    az = instance.get("Placement", {}).get("AvailabilityZone", "-")
+        if not reservations:
+            raise InstanceNotFoundError(instance_name)
+
+        reservation = safe_get_array_item(reservations, 0, "instance reservations")
+        instances = reservation.get("Instances", [])
+        if not instances:
+            raise InstanceNotFoundError(instance_name)
+
+        instance = safe_get_array_item(instances, 0, "instances")
+        state_name = instance.get("State", {}).get("Name", "unknown")
+
+        # Get instance health status
+        if health is not None:
+            status = health.result()
+        elif state_name == "running":
+            status = get_instance_status(instance_id)
+        else:
+            status = {}
+    instance_statuses = status.get("InstanceStatuses", [])
 
     # Get security groups
     security_groups = instance.get("SecurityGroups", [])
     sg_names = [sg.get("GroupName", "") for sg in security_groups]
-    sg_display = ", ".join(sg_names) if sg_names else "-"
 
     # Get tags (excluding Name)
     tag_dict = extract_tags_dict(instance.get("Tags"))
-    other_tags = {k: v for k, v in tag_dict.items() if k != "Name"}
 
     # Format launch time
+    launch_time = instance.get("LaunchTime")
     launch_time_str = "-"
     if launch_time:
         launch_time_str = launch_time.strftime("%Y-%m-%d %H:%M:%S UTC")
@@ -374,43 +460,76 @@ def _build_status_table(instance_name: str, instance_id: str) -> Panel:
             first_detail = safe_get_array_item(details, 0, "status details", {"Status": "-"})
             reachability = first_detail.get("Status", "-")
 
+    return {
+        "instance_id": instance_id,
+        "name": instance_name,
+        "state": state_name,
+        "type": instance.get("InstanceType", "unknown"),
+        "az": instance.get("Placement", {}).get("AvailabilityZone", "-"),
+        "public_ip": instance.get("PublicIpAddress", "-"),
+        "private_ip": instance.get("PrivateIpAddress", "-"),
+        "public_dns": instance.get("PublicDnsName", "-") or "-",
+        "key_name": instance.get("KeyName", "-"),
+        "security_groups": ", ".join(sg_names) if sg_names else "-",
+        "launch_time": launch_time_str,
+        "system_status": system_status,
+        "instance_status": instance_status_str,
+        "reachability": reachability,
+        "tags": tuple((k, v) for k, v in tag_dict.items() if k != "Name"),
+    }
+
+
+def _render_status_panel(fields: dict[str, Any], changed: frozenset[str] = frozenset()) -> Panel:
+    """Render status fields as a Rich Panel, highlighting fields that changed.
+
+    Args:
+        fields: Values returned by _fetch_status_fields()
+        changed: Field names whose value differs from the previous render
+    """
+
+    def value(key: str) -> str:
+        text = str(fields[key])
+        if key == "state":
+            state_style = get_status_style(text)
+            text = f"[{state_style}]{text}[/{state_style}]"
+        return f"[bold reverse]{text}[/bold reverse]" if key in changed else text
+
     # Build output lines
-    state_style = get_status_style(state_name)
     lines = [
-        f"[cyan]Instance ID:[/cyan]    {instance_id}",
-        f"[cyan]Name:[/cyan]           {instance_name}",
-        f"[cyan]State:[/cyan]          [{state_style}]{state_name}[/{state_style}]",
-        f"[cyan]Type:[/cyan]           {instance_type}",
-        f"[cyan]AZ:[/cyan]             {az}",
+        f"[cyan]Instance ID:[/cyan]    {value('instance_id')}",
+        f"[cyan]Name:[/cyan]           {value('name')}",
+        f"[cyan]State:[/cyan]          {value('state')}",
+        f"[cyan]Type:[/cyan]           {value('type')}",
+        f"[cyan]AZ:[/cyan]             {value('az')}",
         "",
         "[bold]Network[/bold]",
-        f"[cyan]Public IP:[/cyan]      {public_ip}",
-        f"[cyan]Private IP:[/cyan]     {private_ip}",
-        f"[cyan]Public DNS:[/cyan]     {public_dns}",
+        f"[cyan]Public IP:[/cyan]      {value('public_ip')}",
+        f"[cyan]Private IP:[/cyan]     {value('private_ip')}",
+        f"[cyan]Public DNS:[/cyan]     {value('public_dns')}",
         "",
         "[bold]Configuration[/bold]",
-        f"[cyan]Key Pair:[/cyan]       {key_name}",
-        f"[cyan]Security Groups:[/cyan] {sg_display}",
-        f"[cyan]Launch Time:[/cyan]    {launch_time_str}",
+        f"[cyan]Key Pair:[/cyan]       {value('key_name')}",
+        f"[cyan]Security Groups:[/cyan] {value('security_groups')}",
+        f"[cyan]Launch Time:[/cyan]    {value('launch_time')}",
     ]
 
     # Add health section if instance is running
-    if state_name == "running":
+    if fields["state"] == "running":
         lines.extend(
             [
                 "",
                 "[bold]Health Status[/bold]",
-                f"[cyan]System Status:[/cyan]   {system_status}",
-                f"[cyan]Instance Status:[/cyan] {instance_status_str}",
-                f"[cyan]Reachability:[/cyan]   {reachability}",
+                f"[cyan]System Status:[/cyan]   {value('system_status')}",
+                f"[cyan]Instance Status:[/cyan] {value('instance_status')}",
+                f"[cyan]Reachability:[/cyan]   {value('reachability')}",
             ]
         )
 
     # Add tags if present
-    if other_tags:
+    if fields["tags"]:
         lines.extend(["", "[bold]Tags[/bold]"])
-        for key, value in other_tags.items():
-            lines.append(f"[cyan]{key}:[/cyan] {value}")
+        for key, tag_value in fields["tags"]:
+            lines.append(f"[cyan]{key}:[/cyan] {tag_value}")
 
     return Panel(
         "\n".join(lines),
@@ -420,18 +539,51 @@ def _build_status_table(instance_name: str, instance_id: str) -> Panel:
     )
 
 
+def _build_status_table(instance_name: str, instance_id: str) -> Panel:
+    """Build a Rich Panel with detailed instance status information.
+
+    Shows both health status and instance details.
+
+    Raises:
+        InstanceNotFoundError: If the instance is not found
+        AWSServiceError: If there's an error calling AWS APIs
+        ResourceNotFoundError: If required resources are missing
+    """
+    return _render_status_panel(_fetch_status_fields(instance_name, instance_id))
+
+
+def _next_watch_delay(delay: float, interval: int, changed: bool, state: str) -> float:
+    """Compute the delay before the next status --watch poll.
+
+    Polls at the requested interval while something is changing or the
+    instance is in a transitional state, and doubles the delay (up to
+    STATUS_WATCH_MAX_INTERVAL_SECONDS) for as long as nothing changes.
+    """
+    if changed or state in _TRANSITIONAL_STATES:
+        return interval
+    return min(delay * 2, max(interval, STATUS_WATCH_MAX_INTERVAL_SECONDS))
+
+
 def _watch_status(instance_name: str, instance_id: str, interval: int) -> None:
     """Watch instance status with live updates.
 
+    Each poll fetches the status fields in one request cycle and the panel is
+    only redrawn when a field changed, with the changed values highlighted
+    until the next poll. While nothing changes the poll interval backs off, so long watches of an
+    idle instance make few API calls and do not flicker.
+
     Handles errors gracefully by displaying error messages in the live view
     and re-raising the exception to be handled by the CLI error handler.
     """
+    previous: dict[str, Any] | None = None
+    highlighted = False
+    delay: float = interval
     try:
-        with Live(console=console, refresh_per_second=1, screen=True) as live:
+        with Live(console=console, auto_refresh=False, screen=True) as live:
             while True:
                 try:
-                    result = _build_status_table(instance_name, instance_id)
-                    live.update(result)
+                    expect_running = previous is None or previous["state"] == "running"
+                    fields = _fetch_status_fields(instance_name, instance_id, expect_running)
                 except (
                     InstanceNotFoundError,
                     MultipleInstancesFoundError,
@@ -446,9 +598,176 @@ def _watch_status(instance_name: str, instance_id: str, interval: int) -> None:
                         border_style="red",
                         expand=False,
                     )
-                    live.update(error_panel)
+                    live.update(error_panel, refresh=True)
+                    raise
+
+                changed = frozenset(
+                    key for key in fields if previous is not None and previous[key] != fields[key]
+                )
+                redraw = previous is None or bool(changed)
+                if redraw or highlighted:
+                    # An unchanged poll after a change redraws once to clear the highlight
+                    live.update(_render_status_panel(fields, changed), refresh=True)
+                    highlighted = bool(changed)
+                delay = _next_watch_delay(delay, interval, redraw, fields["state"])
+                previous = fields
+                time.sleep(delay)
+    except KeyboardInterrupt:
+        console.print("\nWatch mode stopped.")
+
+
+# Columns of the multi-instance status dashboard, in row tuple order
+_DASHBOARD_COLUMNS = [
+    styled_column("Name", "name"),
+    styled_column("InstanceId", "id"),
+    styled_column("State"),
+    styled_column("Type"),
+    styled_column("Public IP"),
+    styled_column("System"),
+    styled_column("Instance"),
+    styled_column("Reachability"),
+]
+
+
+def _fetch_dashboard_rows(
+    patterns: list[str], tag_filters: dict[str, str]
+) -> dict[str, tuple[str, ...]]:
+    """Fetch one row per instance for the status dashboard.
+
+    Targets are chosen with select_instances(), so --target and --tag match
+    exactly as in `instance exec/start/stop`. Costs one live paginated
+    describe_instances sweep and one paginated
+    describe_instance_status(IncludeAllInstances=True), however many
+    instances are shown.
+
+    Args:
+        patterns: Instance names or globs to show; empty shows all
+        tag_filters: Tag key to value (or value glob) filters
+
+    Returns:
+        Mapping of instance ID to its row values, in _DASHBOARD_COLUMNS order
+
+    Raises:
+        InstanceNotFoundError: If an exact (non-glob) name matches no instance
+        AWSServiceError: If AWS API call fails
+    """
+    # Polls are live but only refresh the in-memory index, not inventory.json
+    selected = select_instances(patterns, tag_filters, refresh=True, store=False)
+    statuses = get_all_instance_statuses()
+
+    rows: dict[str, tuple[str, ...]] = {}
+    for instance in selected:
+        system_status = instance_status = reachability = "-"
+        entry = statuses.get(instance.instance_id)
+        if instance.state == "running" and entry:
+            system_status = safe_get_nested_value(entry, ["SystemStatus", "Status"], "-")
+            instance_status = safe_get_nested_value(entry, ["InstanceStatus", "Status"], "-")
+            details = safe_get_nested_value(entry, ["InstanceStatus", "Details"], [])
+            if details:
+                reachability = details[0].get("Status", "-")
+
+        rows[instance.instance_id] = (
+            instance.name,
+            instance.instance_id,
+            instance.state,
+            instance.instance_type,
+            instance.public_ip or "-",
+            system_status,
+            instance_status,
+            reachability,
+        )
+    return rows
+
+
+def _render_dashboard(
+    rows: dict[str, tuple[str, ...]],
+    changed: dict[str, frozenset[int]] | None = None,
+) -> Table:
+    """Render dashboard rows as a table, highlighting cells that changed.
+
+    Args:
+        rows: Rows from _fetch_dashboard_rows()
+        changed: Instance ID to the column indexes that changed in that row
+    """
+    changed = changed or {}
+    table_rows = []
+    for instance_id, row in sorted(rows.items(), key=lambda item: (item[1][0], item[0])):
+        cells = list(row)
+        state_style = get_status_style(cells[2])
+        cells[2] = f"[{state_style}]{cells[2]}[/{state_style}]"
+        for index in changed.get(instance_id, frozenset()):
+            cells[index] = f"[bold reverse]{cells[index]}[/bold reverse]"
+        table_rows.append(cells)
+    return create_table(f"Instances ({len(rows)})", _DASHBOARD_COLUMNS, table_rows)
+
+
+def _diff_dashboard_rows(
+    table: dict[str, tuple[str, ...]], rows: dict[str, tuple[str, ...]]
+) -> dict[str, frozenset[int]]:
+    """Apply a fresh poll to the in-memory dashboard table in place.
+
+    Only rows that were added, removed or changed are touched.
+
+    Returns:
+        Instance ID to changed column indexes for added and changed rows;
+        removed rows map to an empty set
+    """
+    changed: dict[str, frozenset[int]] = {}
+    for instance_id in table.keys() - rows.keys():
+        del table[instance_id]
+        changed[instance_id] = frozenset()
+    for instance_id, row in rows.items():
+        old = table.get(instance_id)
+        if old == row:
+            continue
+        changed[instance_id] = frozenset(
+            i for i, value in enumerate(row) if old is None or old[i] != value
+        )
+        table[instance_id] = row
+    return changed
+
+
+def _watch_dashboard(patterns: list[str], tag_filters: dict[str, str], interval: int) -> None:
+    """Watch many instances in one live table.
+
+    Each tick costs one describe_instances and one describe_instance_status
+    sweep for all instances. The in-memory table is updated row by row and
+    only redrawn when a row changed; the poll interval backs off while
+    nothing changes, as in single-instance watch mode.
+    """
+    table: dict[str, tuple[str, ...]] = {}
+    delay: float = interval
+    first = True
+    highlighted = False
+    try:
+        with Live(console=console, auto_refresh=False, screen=True) as live:
+            while True:
+                try:
+                    rows = _fetch_dashboard_rows(patterns, tag_filters)
+                except AWSServiceError as e:
+                    live.update(
+                        Panel(
+                            f"[red]{e}[/red]",
+                            title="[bold red]Error[/bold red]",
+                            border_style="red",
+                            expand=False,
+                        ),
+                        refresh=True,
+                    )
                     raise
-                time.sleep(interval)
+
+                changed = _diff_dashboard_rows(table, rows)
+                redraw = first or bool(changed)
+                if redraw or highlighted:
+                    # Highlight changes only after the first render, and only until the next poll
+                    live.update(_render_dashboard(table, None if first else changed), refresh=True)
+                    highlighted = not first and bool(changed)
+                transitional = any(row[2] in _TRANSITIONAL_STATES for row in table.values())
+                delay = _next_watch_delay(
+                    delay, interval, redraw, "pending" if transitional else "stable"
+                )
+                first = False
+                time.sleep(delay)
     except KeyboardInterrupt:
         console.print("\nWatch mode stopped.")
 
@@ -458,7 +777,29 @@ def _watch_status(instance_name: str, instance_id: str, interval: int) -> None:
 def status(
     instance_name: str | None = typer.Argument(None, help="Instance name"),
     watch: bool = typer.Option(False, "--watch", "-w", help="Watch mode - refresh continuously"),
-    interval: int = typer.Option(2, "--interval", "-i", help="Refresh interval in seconds"),
+    interval: int = typer.Option(
+        2,
+        "--interval",
+        "-i",
+        help="Refresh interval in seconds (backs off while nothing changes)",
+    ),
+    show_all: bool = typer.Option(
+        False,
+        "--all",
+        "-a",
+        help="Show a dashboard of all instances instead of one instance's details",
+    ),
+    targets: list[str] | None = typer.Option(
+        None,
+        "--target",
+        "-T",
+        help="Dashboard of instances matching this name or glob (repeatable)",
+    ),
+    tags: list[str] | None = typer.Option(
+        None,
+        "--tag",
+        help="Dashboard of instances with this KEY=VALUE tag (repeatable, value may use *)",
+    ),
 ) -> None:
     """
     Show detailed information about a specific instance.
@@ -467,17 +808,33 @@ def status(
     security groups, key pair, tags, and health status. Use 'instance ls'
     for a summary of all instances.
 
+    With --all, --target or --tag, shows a dashboard table of many instances
+    with their state and health checks instead. Combined with --watch it
+    replaces running one watch per instance: every refresh costs two API
+    calls in total.
+
     Examples:
         remote instance status                  # Show default instance details
         remote instance status my-server        # Show specific instance details
         remote instance status --watch          # Watch status continuously
         remote instance status -w -i 5          # Watch with 5 second interval
+        remote instance status --all --watch    # Live dashboard of all instances
+        remote instance status --tag team=ml -w # Live dashboard of tagged instances
     """
     # Validate interval
     if interval < 1:
         print_error("Error: Interval must be at least 1 second")
         raise typer.Exit(1)
 
+    if show_all or targets or tags:
+        patterns = ([instance_name] if instance_name else []) + (targets or [])
+        tag_filters = dict(parse_tag_filter(tag) for tag in tags or [])
+        if watch:
+            _watch_dashboard(patterns, tag_filters, interval)
+        else:
+            console.print(_render_dashboard(_fetch_dashboard_rows(patterns, tag_filters)))
+        return
+
     instance_name, instance_id = resolve_instance_or_exit(instance_name)
 
     if watch:
@@ -493,7 +850,9 @@ def _start_instance(instance_name: str, stop_in_minutes: int | None = None) -> N
         instance_name: Name of the instance to start
         stop_in_minutes: Optional number of minutes after which to schedule shutdown
     """
-    instance_id = get_instance_id(instance_name)
+    from remote.tracking import tracking_manager
+
+    instance_id = get_cached_instance_id(instance_name)
 
     if is_instance_running(instance_id):
         print_warning(f"Instance {instance_name} is already running")
@@ -505,6 +864,7 @@ def _start_instance(instance_name: str, stop_in_minutes: int | None = None) -> N
 
     with handle_aws_errors("EC2", "start_instances"):
         get_ec2_client().start_instances(InstanceIds=[instance_id])
+    invalidate_inventory_cache()
 
     # Record start event for tracking
     tracking_manager.record_start(instance_id, instance_name)
@@ -514,32 +874,150 @@ def _start_instance(instance_name: str, stop_in_minutes: int | None = None) -> N
     # If stop_in was requested, wait for instance and schedule shutdown
     if stop_in_minutes:
         print_warning("Waiting for instance to be ready before scheduling shutdown...")
-        # Wait for instance to be running and reachable
-        max_wait = MAX_STARTUP_WAIT_SECONDS
-        wait_interval = STARTUP_POLL_INTERVAL_SECONDS
-        waited = 0
-        while waited < max_wait:
-            time.sleep(wait_interval)
-            waited += wait_interval
-            if is_instance_running(instance_id):
-                # Check if DNS is available
-                dns = get_instance_dns(instance_id)
-                if dns:
-                    break
-            print_warning(f"  Waiting for instance... ({waited}s)")
-
-        if waited >= max_wait:
+        # Shutdown is scheduled over SSH, so wait for sshd rather than a fixed delay
+        if not (wait_for_instance_running(instance_id) and wait_for_ssh_ready(instance_id)):
             print_warning(
                 "Warning: Instance may not be ready. Attempting to schedule shutdown anyway."
             )
 
-        # Give a bit more time for SSH to be ready
-        print_warning("Waiting for SSH to be ready...")
-        time.sleep(SSH_READINESS_WAIT_SECONDS)
-
         _schedule_shutdown(instance_name, instance_id, stop_in_minutes)
 
 
+def _select_fleet(
+    instance_name: str | None, targets: list[str] | None, tags: list[str] | None
+) -> list[IndexedInstance]:
+    """Select the instances for a fleet start/stop from fresh instance states.
+
+    The positional instance name, if given, is treated as one more target.
+    """
+    patterns = [instance_name] if instance_name else []
+    patterns.extend(targets or [])
+    tag_filters = dict(parse_tag_filter(tag) for tag in tags or [])
+    selected = select_instances(patterns, tag_filters, refresh=True)
+    if not selected:
+        print_error("Error: No instances match the given targets and tags")
+        raise typer.Exit(1)
+    return selected
+
+
+def _wait_for_fleet(instances: list[IndexedInstance], target_state: str) -> int:
+    """Wait for instances to reach a state with one shared describe poll per tick.
+
+    Returns:
+        0 if every instance reached the state, otherwise 1
+    """
+    ids = [instance.instance_id for instance in instances]
+    progress = {"done": -1}
+
+    def report(states: dict[str, str]) -> None:
+        done = sum(1 for state in states.values() if state == target_state)
+        if done != progress["done"]:
+            progress["done"] = done
+            print_warning(f"  {done}/{len(ids)} {target_state}")
+
+    print_warning(f"Waiting for {len(ids)} instance(s) to be {target_state}...")
+    states = wait_for_instance_states(ids, target_state, on_poll=report)
+    lagging = [i.name for i in instances if states.get(i.instance_id) != target_state]
+    if lagging:
+        print_error(f"Not {target_state} yet: {', '.join(lagging)}")
+        return 1
+    print_success(f"All {len(ids)} instance(s) {target_state}")
+    return 0
+
+
+def _start_instances(instances: list[IndexedInstance], wait: bool) -> int:
+    """Start many instances with a single StartInstances call.
+
+    Only stopped instances are started; others are reported and skipped.
+    Tracking records for the started instances are written in one batch.
+
+    Args:
+        instances: Instances selected by _select_fleet()
+        wait: Wait until every started instance is running
+
+    Returns:
+        0 on success, 1 if waiting timed out before all were running
+    """
+    from remote.tracking import tracking_manager
+
+    to_start = [instance for instance in instances if instance.state == "stopped"]
+    for instance in instances:
+        if instance.state != "stopped":
+            print_warning(f"Skipping {instance.name}: instance is {instance.state}")
+    if not to_start:
+        print_warning("No stopped instances to start")
+        return 0
+
+    with handle_aws_errors("EC2", "start_instances"):
+        response = get_ec2_client().start_instances(
+            InstanceIds=[instance.instance_id for instance in to_start]
+        )
+    invalidate_inventory_cache()
+
+    # Only record instances this call actually started, not ones already starting
+    names = {instance.instance_id: instance.name for instance in to_start}
+    started = [
+        item["InstanceId"]
+        for item in response.get("StartingInstances", [])
+        if item.get("PreviousState", {}).get("Name") == "stopped"
+    ]
+    tracking_manager.record_starts((instance_id, names[instance_id]) for instance_id in started)
+
+    print_success(f"Starting {len(to_start)} instance(s): {', '.join(names.values())}")
+    if wait:
+        return _wait_for_fleet(to_start, "running")
+    return 0
+
+
+def _stop_instances(instances: list[IndexedInstance], yes: bool, wait: bool) -> int:
+    """Stop many instances with a single StopInstances call.
+
+    Only running instances are stopped; others are reported and skipped.
+    Prices for the distinct instance types are looked up concurrently and the
+    tracking records are written in one batch.
+
+    Args:
+        instances: Instances selected by _select_fleet()
+        yes: Skip the confirmation prompt
+        wait: Wait until every instance is stopped
+
+    Returns:
+        0 on success, 1 if waiting timed out before all were stopped
+    """
+    from remote.tracking import tracking_manager
+
+    to_stop = [instance for instance in instances if instance.state == "running"]
+    for instance in instances:
+        if instance.state != "running":
+            print_warning(f"Skipping {instance.name}: instance is {instance.state}")
+    if not to_stop:
+        print_warning("No running instances to stop")
+        return 0
+
+    names = ", ".join(instance.name for instance in to_stop)
+    if not yes and not confirm_action("stop", f"{len(to_stop)} instances", names):
+        print_warning("Instances are still running")
+        return 0
+
+    prices = _prefetch_instance_prices(
+        (instance.instance_type for instance in to_stop), get_current_region()
+    )
+
+    with handle_aws_errors("EC2", "stop_instances"):
+        get_ec2_client().stop_instances(InstanceIds=[instance.instance_id for instance in to_stop])
+    invalidate_inventory_cache()
+
+    tracking_manager.record_stops(
+        (instance.instance_id, prices.get(instance.instance_type, (None, False))[0], instance.name)
+        for instance in to_stop
+    )
+
+    print_success(f"Stopping {len(to_stop)} instance(s): {names}")
+    if wait:
+        return _wait_for_fleet(to_stop, "stopped")
+    return 0
+
+
 @app.command()
 @handle_cli_errors
 def start(
@@ -549,17 +1027,48 @@ def start(
         "--stop-in",
         help="Automatically stop instance after duration (e.g., 2h, 30m). Schedules shutdown via SSH.",
     ),
+    targets: list[str] | None = typer.Option(
+        None,
+        "--target",
+        "-T",
+        help="Also start this instance name or glob (repeatable, e.g. -T 'test-*')",
+    ),
+    tags: list[str] | None = typer.Option(
+        None,
+        "--tag",
+        help="Start instances with this KEY=VALUE tag (repeatable, value may be a glob)",
+    ),
+    wait: bool = typer.Option(
+        False,
+        "--wait",
+        "-w",
+        help="With --target/--tag, wait until all instances are running",
+    ),
 ) -> None:
     """
     Start an EC2 instance.
 
     Uses the default instance from config if no name is provided.
 
+    With --target and/or --tag, every matching stopped instance is started
+    with a single API call.
+
     Examples:
         remote instance start                   # Start instance
         remote instance start --stop-in 2h      # Start and auto-stop in 2 hours
         remote instance start --stop-in 30m     # Start and auto-stop in 30 minutes
+        remote instance start -T 'test-*' --wait  # Start all test-* instances
+        remote instance start --tag cluster=ci  # Start tagged instances
     """
+    if targets or tags:
+        if stop_in:
+            print_error("--stop-in cannot be combined with --target/--tag")
+            raise typer.Exit(1)
+        exit_code = _start_instances(_select_fleet(instance_name, targets, tags), wait)
+        if exit_code != 0:
+            raise typer.Exit(exit_code)
+        return
+
     # Resolve instance name using consistent pattern with other commands
     instance_name, _ = resolve_instance_or_exit(instance_name)
 
@@ -730,7 +1239,9 @@ def _build_ssh_command(
     return ssh_args
 
 
-def _cancel_existing_shutdown_silently(dns: str, ssh_config: SSHConfig, instance_name: str) -> bool:
+def _cancel_existing_shutdown_silently(
+    dns: str, ssh_config: SSHConfig, instance_name: str, instance_id: str = ""
+) -> bool:
     """Cancel any existing scheduled shutdown silently.
 
     This is used internally by _schedule_shutdown to ensure only one shutdown
@@ -741,11 +1252,16 @@ def _cancel_existing_shutdown_silently(dns: str, ssh_config: SSHConfig, instance
         dns: The DNS hostname or IP address of the instance
         ssh_config: SSH configuration with user and key_path
         instance_name: Name of the instance for display
+        instance_id: AWS instance ID, used to reuse its SSH master connection
 
     Returns:
         True if an existing shutdown was cancelled, False otherwise
     """
-    ssh_args = _build_ssh_command(dns, ssh_config.key_path, ssh_config.user)
+    ssh_args = with_control_master(
+        _build_ssh_command(dns, ssh_config.key_path, ssh_config.user),
+        instance_id,
+        ssh_config.user,
+    )
     ssh_args.append("sudo shutdown -c 2>/dev/null || true")
 
     with handle_ssh_errors("Shutdown check"):
@@ -784,10 +1300,14 @@ def _schedule_shutdown(instance_name: str, instance_id: str, minutes: int) -> No
     ssh_config = get_ssh_config()
 
     # Cancel any existing scheduled shutdown first to prevent overlapping shutdowns
-    _cancel_existing_shutdown_silently(dns, ssh_config, instance_name)
+    _cancel_existing_shutdown_silently(dns, ssh_config, instance_name, instance_id)
 
-    # Build SSH command to run shutdown
-    ssh_args = _build_ssh_command(dns, ssh_config.key_path, ssh_config.user)
+    # Build SSH command to run shutdown, reusing the master opened by the check
+    ssh_args = with_control_master(
+        _build_ssh_command(dns, ssh_config.key_path, ssh_config.user),
+        instance_id,
+        ssh_config.user,
+    )
     ssh_args.append(f"sudo shutdown -h +{minutes}")
 
     print_warning(f"Scheduling shutdown for {instance_name}...")
@@ -828,7 +1348,11 @@ def _cancel_scheduled_shutdown(instance_name: str, instance_id: str) -> None:
     ssh_config = get_ssh_config()
 
     # Build SSH command to cancel shutdown
-    ssh_args = _build_ssh_command(dns, ssh_config.key_path, ssh_config.user)
+    ssh_args = with_control_master(
+        _build_ssh_command(dns, ssh_config.key_path, ssh_config.user),
+        instance_id,
+        ssh_config.user,
+    )
     ssh_args.append("sudo shutdown -c")
 
     print_warning(f"Cancelling scheduled shutdown for {instance_name}...")
@@ -870,6 +1394,23 @@ def stop(
         "-y",
         help="Skip confirmation prompt (for scripting)",
     ),
+    targets: list[str] | None = typer.Option(
+        None,
+        "--target",
+        "-T",
+        help="Also stop this instance name or glob (repeatable, e.g. -T 'test-*')",
+    ),
+    tags: list[str] | None = typer.Option(
+        None,
+        "--tag",
+        help="Stop instances with this KEY=VALUE tag (repeatable, value may be a glob)",
+    ),
+    wait: bool = typer.Option(
+        False,
+        "--wait",
+        "-w",
+        help="With --target/--tag, wait until all instances are stopped",
+    ),
 ) -> None:
     """
     Stop an EC2 instance.
@@ -877,13 +1418,29 @@ def stop(
     Prompts for confirmation before stopping.
     Uses the default instance from config if no name is provided.
 
+    With --target and/or --tag, every matching running instance is stopped
+    with a single API call after one confirmation.
+
     Examples:
         remote instance stop                    # Stop instance immediately
         remote instance stop --stop-in 3h       # Schedule stop in 3 hours
         remote instance stop --stop-in 30m      # Schedule stop in 30 minutes
         remote instance stop --stop-in 1h30m    # Schedule stop in 1 hour 30 minutes
         remote instance stop --cancel           # Cancel scheduled shutdown
+        remote instance stop --tag cluster=ci -y  # Stop tagged instances
     """
+    from remote.pricing import get_instance_price_with_fallback
+    from remote.tracking import tracking_manager
+
+    if targets or tags:
+        if stop_in or cancel:
+            print_error("--stop-in and --cancel cannot be combined with --target/--tag")
+            raise typer.Exit(1)
+        exit_code = _stop_instances(_select_fleet(instance_name, targets, tags), yes, wait)
+        if exit_code != 0:
+            raise typer.Exit(exit_code)
+        return
+
     instance_name, instance_id = resolve_instance_or_exit(instance_name)
 
     # Handle cancel option
@@ -921,6 +1478,7 @@ def stop(
 
     with handle_aws_errors("EC2", "stop_instances"):
         get_ec2_client().stop_instances(InstanceIds=[instance_id])
+    invalidate_inventory_cache()
 
     # Record stop event for tracking
     tracking_manager.record_stop(instance_id, hourly_price, instance_name)
@@ -935,11 +1493,16 @@ def _ensure_instance_running(
     no_start: bool,
     allow_interactive: bool = True,
     quiet: bool = False,
+    wait_for_ssh: bool = True,
+    ssm_profile: str | None = None,
 ) -> None:
     """Ensure instance is running, starting it if necessary.
 
     Handles the logic for checking instance state and optionally starting it
-    based on flags and interactivity.
+    based on flags and interactivity. After a start it waits for the EC2
+    running state and then, for SSH connections, until sshd answers on port
+    22, or for SSM connections, until the SSM agent reports Online, so
+    callers can connect as soon as the instance is reachable.
 
     Args:
         instance_name: Name of the instance for display
@@ -948,6 +1511,9 @@ def _ensure_instance_running(
         no_start: If True, fail immediately if not running
         allow_interactive: If True, prompt user when running in TTY
         quiet: If True, suppress status messages
+        wait_for_ssh: If True, wait for sshd after starting; if False (SSM),
+            wait for the SSM agent instead
+        ssm_profile: AWS profile used to check the SSM agent when wait_for_ssh is False
 
     Raises:
         typer.Exit: If instance cannot be started or user declines
@@ -999,14 +1565,20 @@ def _ensure_instance_running(
                 print_error(f"Instance {instance_name} could not be started")
                 raise typer.Exit(1)
 
-            time.sleep(SSH_READINESS_WAIT_SECONDS)
+            wait_for_instance_running(instance_id)
 
-        # Wait for instance to initialize
-        if not quiet:
-            print_warning(
-                f"Waiting {CONNECTION_RETRY_SLEEP_SECONDS} seconds to allow instance to initialize"
-            )
-        time.sleep(CONNECTION_RETRY_SLEEP_SECONDS)
+        if wait_for_ssh:
+            if not quiet:
+                print_warning(f"Waiting for SSH on {instance_name} to accept connections...")
+            if not wait_for_ssh_ready(instance_id) and not quiet:
+                print_warning(f"SSH on {instance_name} is not answering yet; connecting anyway")
+        else:
+            from remote.connection_ssm import wait_for_ssm_ready
+
+            if not quiet:
+                print_warning(f"Waiting for the SSM agent on {instance_name} to come online...")
+            if not wait_for_ssm_ready(instance_id, ssm_profile) and not quiet:
+                print_warning(f"SSM agent on {instance_name} is not online yet; connecting anyway")
 
 
 @app.command()
@@ -1122,7 +1694,13 @@ def connect(
 
     # Ensure instance is running (may start it if needed)
     _ensure_instance_running(
-        instance_name, instance_id, auto_start, no_start, allow_interactive=True
+        instance_name,
+        instance_id,
+        auto_start,
+        no_start,
+        allow_interactive=True,
+        wait_for_ssh=conn_method == ConnectionMethod.SSH,
+        ssm_profile=ssm_profile,
     )
 
     # Handle IP whitelisting before connecting (SSH only)
@@ -1289,7 +1867,13 @@ def forward(
 
     # Ensure instance is running (may start it if needed)
     _ensure_instance_running(
-        instance_name, instance_id, auto_start, no_start, allow_interactive=True
+        instance_name,
+        instance_id,
+        auto_start,
+        no_start,
+        allow_interactive=True,
+        wait_for_ssh=conn_method == ConnectionMethod.SSH,
+        ssm_profile=ssm_profile,
     )
 
     # Get connection provider
@@ -1340,6 +1924,235 @@ def forward(
             raise typer.Exit(exit_code)
 
 
+@dataclass
+class _HostResult:
+    """Outcome of running a command on one instance in a fan-out exec."""
+
+    label: str
+    instance_id: str
+    exit_code: int | None  # None when the command was not run
+    stdout: str = ""
+    stderr: str = ""
+    note: str = ""
+
+
+def _run_on_instance(
+    instance: IndexedInstance,
+    label: str,
+    command: list[str],
+    provider: "ConnectionProvider",
+    use_dns: bool,
+    user: str,
+    key: str | None,
+    verbose: bool,
+    timeout: int,
+    no_strict_host_key: bool,
+) -> _HostResult:
+    """Run a command on one instance, turning any failure into that host's result."""
+    if instance.state != "running":
+        return _HostResult(label, instance.instance_id, None, note=f"skipped ({instance.state})")
+    if use_dns and not instance.public_dns:
+        return _HostResult(label, instance.instance_id, 255, note="no public DNS")
+    try:
+        exit_code, stdout, stderr = provider.execute_command(
+            instance_id=instance.instance_id,
+            dns=instance.public_dns,
+            command=command,
+            user=user,
+            key_path=key,
+            verbose=verbose,
+            timeout=timeout,
+            no_strict_host_key=no_strict_host_key,
+        )
+    except subprocess.TimeoutExpired:
+        return _HostResult(label, instance.instance_id, 124, note=f"timed out after {timeout}s")
+    except Exception as e:
+        # Any failure is this host's result; it must not abort the other hosts
+        return _HostResult(label, instance.instance_id, 255, note=str(e) or type(e).__name__)
+    return _HostResult(label, instance.instance_id, exit_code, stdout, stderr)
+
+
+def _run_ssm_batch(
+    instances: list[IndexedInstance],
+    labels: list[str],
+    command: list[str],
+    provider: "SSMConnectionProvider",
+    verbose: bool,
+    timeout: int,
+) -> Iterator[_HostResult]:
+    """Run a command on many instances with batched SSM send-command calls."""
+    by_id: dict[str, str] = {}
+    for instance, label in zip(instances, labels, strict=True):
+        if instance.state != "running":
+            yield _HostResult(label, instance.instance_id, None, note=f"skipped ({instance.state})")
+        else:
+            by_id[instance.instance_id] = label
+    if not by_id:
+        return
+    for instance_id, (exit_code, stdout, stderr) in provider.execute_command_batch(
+        list(by_id), command, verbose=verbose, timeout=timeout
+    ):
+        yield _HostResult(by_id[instance_id], instance_id, exit_code, stdout, stderr)
+
+
+def _run_threaded(
+    instances: list[IndexedInstance],
+    labels: list[str],
+    command: list[str],
+    provider: "ConnectionProvider",
+    use_dns: bool,
+    user: str,
+    key: str | None,
+    verbose: bool,
+    timeout: int,
+    no_strict_host_key: bool,
+    max_workers: int,
+) -> Iterator[_HostResult]:
+    """Run a command on many instances from a thread pool, yielding as hosts finish."""
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(instances))) as executor:
+        futures = [
+            executor.submit(
+                _run_on_instance,
+                instance,
+                label,
+                command,
+                provider,
+                use_dns,
+                user,
+                key,
+                verbose,
+                timeout,
+                no_strict_host_key,
+            )
+            for instance, label in zip(instances, labels, strict=True)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _echo_prefixed(text: str, prefix: str, err: bool = False) -> None:
+    """Print each line of text with a host prefix."""
+    for line in text.splitlines():
+        typer.echo(f"{prefix}{line}", err=err)
+
+
+def _exec_on_instances(
+    instances: list[IndexedInstance],
+    command: list[str],
+    provider: "ConnectionProvider",
+    use_dns: bool,
+    user: str,
+    key: str | None,
+    verbose: bool,
+    timeout: int,
+    no_strict_host_key: bool,
+    max_workers: int,
+    quiet: bool = False,
+) -> int:
+    """Run a command on many instances concurrently and summarize the results.
+
+    Each host's output is printed, prefixed with its name, as soon as that
+    host finishes, so fast hosts are not held back by slow ones. Instances
+    that are not running are skipped.
+
+    With an SSM provider the command is sent to up to 50 instances per
+    send-command call and results are collected with batched
+    list-command-invocations polls, so max_workers does not apply.
+
+    Args:
+        instances: Target instances from select_instances()
+        command: Command to execute as list of arguments
+        provider: Connection provider used for every host
+        use_dns: Whether the provider needs the instance's public DNS (SSH)
+        user: Username for the connection
+        key: Path to SSH private key (SSH only)
+        verbose: Enable verbose mode
+        timeout: Per-host command timeout in seconds
+        no_strict_host_key: Disable strict host key checking (SSH only)
+        max_workers: Maximum number of hosts to run on at once
+        quiet: Suppress status messages and the summary table
+
+    Returns:
+        0 if the command succeeded on every host it ran on, otherwise 1
+    """
+    # Disambiguate instances sharing a name by appending the instance ID
+    name_counts: dict[str, int] = {}
+    for instance in instances:
+        name_counts[instance.name] = name_counts.get(instance.name, 0) + 1
+    labels = [
+        instance.name
+        if name_counts[instance.name] == 1
+        else f"{instance.name}/{instance.instance_id}"
+        for instance in instances
+    ]
+    width = max(len(label) for label in labels)
+
+    if not quiet:
+        print_warning(f"Executing on {len(instances)} instance(s): {' '.join(command)}")
+
+    from remote.connection_ssm import SSMConnectionProvider
+
+    completed: Iterator[_HostResult]
+    if isinstance(provider, SSMConnectionProvider):
+        completed = _run_ssm_batch(instances, labels, command, provider, verbose, timeout)
+    else:
+        completed = _run_threaded(
+            instances,
+            labels,
+            command,
+            provider,
+            use_dns,
+            user,
+            key,
+            verbose,
+            timeout,
+            no_strict_host_key,
+            max_workers,
+        )
+
+    results: list[_HostResult] = []
+    # Printing happens on this thread only, so lines from hosts never interleave
+    for result in completed:
+        results.append(result)
+        prefix = f"[{result.label.ljust(width)}] "
+        _echo_prefixed(result.stdout, prefix)
+        _echo_prefixed(result.stderr, prefix, err=True)
+        if result.note:
+            _echo_prefixed(result.note, prefix, err=True)
+
+    ran = [r for r in results if r.exit_code is not None]
+    failed = [r for r in ran if r.exit_code != 0]
+    skipped = len(results) - len(ran)
+
+    if not quiet:
+        order = {label: i for i, label in enumerate(labels)}
+        rows = []
+        for result in sorted(results, key=lambda r: order[r.label]):
+            if result.exit_code is None:
+                status = f"[dim]{result.note}[/dim]"
+            elif result.exit_code == 0:
+                status = "[green]0[/green]"
+            else:
+                status = f"[red]{result.exit_code}[/red]"
+            rows.append([result.label, result.instance_id, status])
+        columns = [
+            styled_column("Instance", "name"),
+            styled_column("InstanceId", "id"),
+            styled_column("Exit"),
+        ]
+        console.print(create_table("Exec Summary", columns, rows))
+
+    summary = f"{len(ran) - len(failed)}/{len(ran)} succeeded"
+    if skipped:
+        summary += f", {skipped} skipped"
+    if failed:
+        print_error(f"{summary}; failed on: {', '.join(r.label for r in failed)}")
+        return 1
+    if not quiet:
+        print_success(summary)
+    return 0
+
+
 @app.command(
     "exec",
     context_settings={"allow_extra_args": True, "allow_interspersed_args": False},
@@ -1403,6 +2216,24 @@ def exec_command(
         "--ssm-profile",
         help="AWS profile to use for SSM connections",
     ),
+    targets: list[str] | None = typer.Option(
+        None,
+        "--target",
+        "-T",
+        help="Run on this instance name or glob (repeatable, e.g. -T 'dev-*')",
+    ),
+    tags: list[str] | None = typer.Option(
+        None,
+        "--tag",
+        help="Run on instances with this KEY=VALUE tag (repeatable, value may be a glob)",
+    ),
+    parallel: int = typer.Option(
+        EXEC_FANOUT_MAX_WORKERS,
+        "--parallel",
+        "-P",
+        min=1,
+        help="Maximum instances to run on at once with --target/--tag",
+    ),
 ) -> None:
     """
     Execute a command on a remote EC2 instance via SSH or SSM.
@@ -1411,10 +2242,16 @@ def exec_command(
     Unlike 'connect' which opens an interactive session, 'exec' runs
     a command and exits.
 
+    With --target and/or --tag the command runs on every matching running
+    instance in parallel. Output lines are prefixed with the instance name
+    and a summary of exit codes is printed at the end.
+
     Examples:
         remote instance exec my-instance ls -la
         remote instance exec ls                       # Run on default instance
         remote instance exec --connection ssm whoami  # Execute via SSM
+        remote instance exec -T 'dev-*' uptime        # Run on all dev-* instances
+        remote instance exec --tag team=ml -P 8 df -h # Run on tagged instances
     """
     from remote.connection import (
         ConnectionMethod,
@@ -1428,19 +2265,57 @@ def exec_command(
     # Resolve connection method (CLI > env > config > default)
     conn_method = resolve_connection_method(connection)
 
+    if targets or tags:
+        # Fan-out mode: every positional argument is part of the command
+        if instance_name:
+            command.insert(0, instance_name)
+        if not command:
+            print_error("Error: No command specified")
+            raise typer.Exit(1)
+        tag_filters = dict(parse_tag_filter(tag) for tag in tags or [])
+        selected = select_instances(targets or [], tag_filters)
+        if not selected:
+            print_error("Error: No instances match the given targets and tags")
+            raise typer.Exit(1)
+
+        provider = get_connection_provider(conn_method)
+        if conn_method == ConnectionMethod.SSM and ssm_profile:
+            from remote.connection_ssm import SSMConnectionProvider
+
+            provider = SSMConnectionProvider(ssm_profile=ssm_profile)
+        if conn_method == ConnectionMethod.SSH:
+            key = _ensure_ssh_key(key)
+
+        exit_code = _exec_on_instances(
+            selected,
+            command,
+            provider,
+            use_dns=conn_method == ConnectionMethod.SSH,
+            user=user,
+            key=key,
+            verbose=verbose,
+            timeout=timeout,
+            no_strict_host_key=no_strict_host_key,
+            max_workers=parallel,
+            quiet=quiet,
+        )
+        if exit_code != 0:
+            raise typer.Exit(exit_code)
+        return
+
     # Resolve instance name and command
     # Handle the case where user runs "exec ls" meaning "use default instance, run ls"
     if instance_name and not command:
         # First arg provided with no additional args - could be instance name OR a command
         try:
-            instance_id = get_instance_id(instance_name)
+            instance_id = get_cached_instance_id(instance_name)
         except (InstanceNotFoundError, InvalidInputError):
             # instance_name doesn't resolve or is invalid format - treat it as command,
             # use default instance
             original_arg = instance_name
             command = [instance_name]
             instance_name = get_instance_name()
-            instance_id = get_instance_id(instance_name)
+            instance_id = get_cached_instance_id(instance_name)
             if not quiet:
                 print_warning(
                     f"'{original_arg}' not found as instance, "
@@ -1450,7 +2325,7 @@ def exec_command(
         # Standard case: resolve instance (uses default if instance_name is None)
         if not instance_name:
             instance_name = get_instance_name()
-        instance_id = get_instance_id(instance_name)
+        instance_id = get_cached_instance_id(instance_name)
 
     # Check if command is provided
     if not command:
@@ -1460,7 +2335,14 @@ def exec_command(
     # Ensure instance is running (may start it if needed)
     # exec doesn't support interactive prompts, so allow_interactive=False
     _ensure_instance_running(
-        instance_name, instance_id, auto_start, no_start, allow_interactive=False, quiet=quiet
+        instance_name,
+        instance_id,
+        auto_start,
+        no_start,
+        allow_interactive=False,
+        quiet=quiet,
+        wait_for_ssh=conn_method == ConnectionMethod.SSH,
+        ssm_profile=ssm_profile,
     )
 
     # Get connection provider
@@ -1587,6 +2469,7 @@ def instance_type(
                         "Value": new_type,
                     },
                 )
+            invalidate_inventory_cache()
 
             print_warning(f"Changing {instance_name} to {new_type}")
 
@@ -1676,6 +2559,8 @@ def terminate(
     Requires confirmation by re-entering the instance name.
     Uses the default instance from config if no name is provided.
     """
+    from remote.scheduler import delete_all_schedules_for_instance
+
     instance_name, instance_id = resolve_instance_or_exit(instance_name)
 
     # Check if instance is managed by Terraform
@@ -1734,6 +2619,7 @@ def terminate(
 
     with handle_aws_errors("EC2", "terminate_instances"):
         get_ec2_client().terminate_instances(InstanceIds=[instance_id])
+    invalidate_inventory_cache()
     print_success(f"Instance {instance_name} is being terminated")
 
 
@@ -1770,6 +2656,7 @@ def _build_rsync_command(
     dry_run: bool = False,
     verbose: bool = False,
     exclude: list[str] | None = None,
+    control_path: Path | None = None,
 ) -> list[str]:
     """Build rsync command with appropriate SSH options.
 
@@ -1782,6 +2669,7 @@ def _build_rsync_command(
         dry_run: If True, perform a trial run with no changes made
         verbose: If True, increase verbosity
         exclude: List of patterns to exclude
+        control_path: Optional SSH master socket (from start_control_master) to reuse
 
     Returns:
         List of rsync command arguments
@@ -1790,6 +2678,8 @@ def _build_rsync_command(
     ssh_cmd = "ssh -o StrictHostKeyChecking=accept-new"
     if ssh_key:
         ssh_cmd += f" -i {ssh_key}"
+    if control_path:
+        ssh_cmd += " " + shlex.join(build_multiplex_options(control_path))
 
     rsync_args = [
         "rsync",
@@ -1954,7 +2844,7 @@ def copy(
     instance_name, src_path, dst_path, is_upload = _resolve_transfer_paths(source, destination)
 
     # Get instance ID and ensure running
-    instance_id = get_instance_id(instance_name)
+    instance_id = get_cached_instance_id(instance_name)
     _ensure_instance_running(
         instance_name, instance_id, auto_start, no_start, allow_interactive=True
     )
@@ -1978,6 +2868,13 @@ def copy(
         rsync_destination = dst_path
         direction = f"{instance_name} -> local"
 
+    # A dry run is a single listing, so don't leave a master connection behind for it
+    control_path = (
+        None
+        if dry_run
+        else start_control_master(instance_id, user, _build_ssh_command(dns, key, user))
+    )
+
     # Build and execute rsync command
     rsync_cmd = _build_rsync_command(
         rsync_source,
@@ -1988,6 +2885,7 @@ def copy(
         dry_run=dry_run,
         verbose=verbose,
         exclude=exclude,
+        control_path=control_path,
     )
 
     action = "Would copy" if dry_run else "Copying"
@@ -2121,7 +3019,7 @@ def sync(
     instance_name, src_path, dst_path, is_upload = _resolve_transfer_paths(source, destination)
 
     # Get instance ID and ensure running
-    instance_id = get_instance_id(instance_name)
+    instance_id = get_cached_instance_id(instance_name)
     _ensure_instance_running(
         instance_name, instance_id, auto_start, no_start, allow_interactive=True
     )
@@ -2154,6 +3052,13 @@ def sync(
         rsync_destination = dst_path
         direction = f"{instance_name} -> local"
 
+    # A dry run is a single listing, so don't leave a master connection behind for it
+    control_path = (
+        None
+        if dry_run
+        else start_control_master(instance_id, user, _build_ssh_command(dns, key, user))
+    )
+
     # Build and execute rsync command
     rsync_cmd = _build_rsync_command(
         rsync_source,
@@ -2164,6 +3069,7 @@ def sync(
         dry_run=dry_run,
         verbose=verbose,
         exclude=exclude,
+        control_path=control_path,
     )
 
     action = "Would sync" if dry_run else "Syncing"
@@ -2181,6 +3087,68 @@ def sync(
         print_success("File sync complete")
 
 
+@app.command("ssh-masters")
+@handle_cli_errors
+def ssh_masters(
+    instance_name: str | None = typer.Argument(
+        None, help="Only show masters for this instance (default: all)"
+    ),
+    close: bool = typer.Option(
+        False,
+        "--close",
+        "-c",
+        help="Close the listed master connections",
+    ),
+) -> None:
+    """
+    List or close multiplexed SSH master connections.
+
+    exec, copy, sync and scheduled shutdowns reuse one authenticated SSH
+    connection per instance, kept open for ssh_control_persist seconds
+    (default 600, 0 disables). Close them to drop idle connections early or
+    after changing keys.
+
+    Examples:
+        remote instance ssh-masters                   # List open masters
+        remote instance ssh-masters --close           # Close all masters
+        remote instance ssh-masters my-server -c      # Close masters for one instance
+    """
+    masters = list_control_masters()
+    if instance_name is not None:
+        instance_id = get_cached_instance_id(instance_name)
+        masters = [m for m in masters if m.instance_id == instance_id]
+
+    if not masters:
+        print_warning("No SSH master connections open")
+        return
+
+    if close:
+        closed = sum(1 for master in masters if close_control_master(master))
+        stale = len(masters) - closed
+        message = f"Closed {closed} SSH master connection(s)"
+        if stale:
+            message += f", removed {stale} stale socket(s)"
+        print_success(message)
+        return
+
+    columns = [
+        styled_column("InstanceId", "id"),
+        styled_column("User"),
+        styled_column("Status"),
+        styled_column("Socket"),
+    ]
+    rows = [
+        [
+            master.instance_id,
+            master.user,
+            "[green]open[/green]" if master.active else "[dim]stale[/dim]",
+            str(master.path),
+        ]
+        for master in masters
+    ]
+    console.print(create_table("SSH Master Connections", columns, rows))
+
+
 @app.command()
 @handle_cli_errors
 def stats(
@@ -2201,11 +3169,18 @@ def stats(
         remote instance stats                   # Show stats for default instance
         remote instance stats my-server         # Show stats for specific instance
     """
+    from remote.pricing import format_price, get_instance_price_with_fallback
+    from remote.tracking import tracking_manager
+
     instance_name, instance_id = resolve_instance_or_exit(instance_name)
 
-    tracking = tracking_manager.get_instance_tracking(instance_id)
+    # Totals come from get_lifetime_stats so only the displayed sessions are loaded
+    tracking = tracking_manager.get_instance_tracking(
+        instance_id, recent_sessions=STATS_RECENT_SESSIONS
+    )
+    lifetime_stats = tracking_manager.get_lifetime_stats(instance_id)
 
-    if not tracking:
+    if not tracking or not lifetime_stats:
         print_warning(f"No tracking data found for instance '{instance_name}'")
         print_warning("Usage is tracked automatically when using 'remote instance start/stop'")
         return
@@ -2216,6 +3191,8 @@ def stats(
     if instance_type:
         hourly_price, _ = get_instance_price_with_fallback(instance_type)
 
+    total_hours, total_cost, session_count = lifetime_stats
+
     # Build output panel
     lines = [
         f"[cyan]Instance ID:[/cyan]      {instance_id}",
@@ -2224,27 +3201,28 @@ def stats(
         f"[cyan]Hourly Rate:[/cyan]      {format_price(hourly_price)}",
         "",
         "[bold]Lifetime Usage[/bold]",
-        f"[cyan]Total Hours:[/cyan]      {tracking.total_hours:.2f}",
-        f"[cyan]Total Cost:[/cyan]       {format_price(tracking.total_cost)}",
-        f"[cyan]Total Sessions:[/cyan]   {len(tracking.sessions)}",
+        f"[cyan]Total Hours:[/cyan]      {total_hours:.2f}",
+        f"[cyan]Total Cost:[/cyan]       {format_price(total_cost)}",
+        f"[cyan]Total Sessions:[/cyan]   {session_count}",
     ]
 
     if tracking.last_updated:
         lines.append(f"[cyan]Last Updated:[/cyan]    {tracking.last_updated}")
 
-    # Show recent sessions (last 5)
+    # Show recent sessions
     if tracking.sessions:
         lines.extend(["", "[bold]Recent Sessions[/bold]"])
-        recent_sessions = tracking.sessions[-5:]
-        for session in reversed(recent_sessions):
+        for session in reversed(tracking.sessions):
             start_str = session.start[:19] if session.start else "-"
             stop_str = session.stop[:19] if session.stop else "running"
             cost_str = format_price(session.cost) if session.cost > 0 else "-"
             hours_str = f"{session.hours:.2f}h" if session.hours > 0 else "-"
             lines.append(f"  {start_str} → {stop_str}  ({hours_str}, {cost_str})")
 
-        if len(tracking.sessions) > 5:
-            lines.append(f"  [dim]... and {len(tracking.sessions) - 5} more sessions[/dim]")
+        if session_count > len(tracking.sessions):
+            lines.append(
+                f"  [dim]... and {session_count - len(tracking.sessions)} more sessions[/dim]"
+            )
 
     panel = Panel(
         "\n".join(lines),
@@ -2283,6 +3261,8 @@ def tracking_reset(
         remote instance tracking-reset --all         # Reset all tracking data
         remote instance tracking-reset --all --yes   # Reset all without confirmation
     """
+    from remote.tracking import tracking_manager
+
     if all_tracking:
         if not yes:
             if not confirm_action("reset all", "tracking data", "all instances"):
@@ -2319,3 +3299,28 @@ app.add_typer(
     name="auto-shutdown",
     help="Manage automatic shutdown based on CPU idle",
 )
+
+
+@app.command("tracking-migrate")
+@handle_cli_errors
+def tracking_migrate() -> None:
+    """
+    Migrate usage tracking from JSON to the SQLite backend.
+
+    Copies all sessions from tracking.json into an indexed SQLite database
+    (tracking.db) with per-instance running totals, which keeps 'stats' and
+    'ls --cost --lifetime' fast with long session histories. Once tracking.db
+    exists it is used automatically. The JSON file is kept as a backup.
+
+    Examples:
+        remote instance tracking-migrate
+    """
+    from remote.tracking_sqlite import migrate_json_to_sqlite
+
+    try:
+        instance_count, session_count = migrate_json_to_sqlite()
+    except FileExistsError as e:
+        print_warning(f"Tracking database already exists: {e}")
+        return
+
+    print_success(f"Migrated {session_count} session(s) for {instance_count} instance(s) to SQLite")
@@ -8,26 +8,38 @@ Functions in this module:
 - get_instance_name: Get the configured default instance name
 - resolve_instance: Resolve instance name to (name, id) tuple
 - resolve_instance_or_exit: Same as above with CLI error handling
+- get_cached_instances: get_instances() backed by the on-disk inventory cache
+- get_cached_instance_id: get_instance_id() backed by the on-disk inventory cache
+- get_instance_index: Per-process name -> instance index from one describe sweep
+- select_instances: Select instances by name, glob pattern and tags from one sweep
+- invalidate_inventory_cache: Drop cached inventory after a mutating command
 - launch_instance_from_template: Launch an EC2 instance from a template
 """
 
 import random
 import string
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any
 
 import typer
 from rich.panel import Panel
 
-from remote.config import config_manager
+from remote.config import config_manager, get_seconds_value
 from remote.exceptions import (
     InstanceNotFoundError,
     MultipleInstancesFoundError,
     ValidationError,
 )
+from remote.inventory import filter_reservations_by_state, inventory_cache
 from remote.utils import (
     console,
     create_table,
+    extract_tags_dict,
     get_ec2_client,
     get_instance_id,
+    get_instances,
     get_launch_template_id,
     get_launch_templates,
     handle_aws_errors,
@@ -38,8 +50,33 @@ from remote.validation import (
     safe_get_array_item,
     sanitize_input,
     validate_array_index,
+    validate_instance_name,
 )
 
+# Instance states matched by get_instances(exclude_terminated=True)
+ACTIVE_INSTANCE_STATES = ["pending", "running", "shutting-down", "stopping", "stopped"]
+
+# Instance states matched by get_instance_id()
+RESOLVABLE_INSTANCE_STATES = ["pending", "stopping", "stopped", "running"]
+
+
+@dataclass(frozen=True)
+class IndexedInstance:
+    """Summary of a named instance held in the per-process instance index."""
+
+    name: str
+    instance_id: str
+    state: str
+    public_dns: str
+    instance_type: str
+    # Excluded from equality and hashing; used to select instances by tag
+    tags: Mapping[str, str] = field(default_factory=dict, compare=False)
+    public_ip: str = ""
+
+
+# Module-level cached name -> instances index
+_instance_index: dict[str, tuple[IndexedInstance, ...]] | None = None
+
 
 def get_instance_name() -> str:
     """Returns the name of the instance as defined in the config file.
@@ -78,10 +115,268 @@ def resolve_instance(instance_name: str | None = None) -> tuple[str, str]:
     """
     if not instance_name:
         instance_name = get_instance_name()
-    instance_id = get_instance_id(instance_name)
+    instance_id = get_cached_instance_id(instance_name)
     return instance_name, instance_id
 
 
+def get_inventory_cache_ttl() -> int:
+    """Get the configured inventory cache TTL in seconds.
+
+    Returns:
+        TTL in seconds from the ``inventory_cache_ttl`` config key, or the
+        default if unset or invalid. 0 means the cache is disabled.
+    """
+    return get_seconds_value("inventory_cache_ttl")
+
+
+def _inventory_scope() -> str:
+    """Identify the AWS profile and region the inventory belongs to."""
+    import boto3
+
+    session = boto3.session.Session()
+    return f"{session.profile_name or 'default'}:{session.region_name or 'us-east-1'}"
+
+
+def get_cached_instances(
+    exclude_terminated: bool = False, refresh: bool = False, store: bool = True
+) -> list[dict[str, Any]]:
+    """Get all instances, served from the inventory cache when fresh.
+
+    The cache always holds a full, unfiltered sweep; terminated instances are
+    filtered client-side so both variants share one describe_instances call.
+
+    Args:
+        exclude_terminated: Whether to exclude terminated instances
+        refresh: If True, ignore any cached data and fetch from the EC2 API
+        store: If False, a sweep fetched from the EC2 API is not written to
+            the inventory cache (e.g. for repeated polls)
+
+    Returns:
+        List of reservation dictionaries
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    ttl = get_inventory_cache_ttl()
+    if ttl <= 0:
+        return get_instances(exclude_terminated=exclude_terminated)
+
+    scope = _inventory_scope()
+    reservations = None if refresh else inventory_cache.get(scope, ttl)
+    if reservations is None:
+        reservations = get_instances()
+        if store:
+            inventory_cache.store(scope, reservations)
+
+    if exclude_terminated:
+        return filter_reservations_by_state(reservations, ACTIVE_INSTANCE_STATES)
+    return reservations
+
+
+def get_cached_instance_id(instance_name: str) -> str:
+    """Returns the id of the instance, using the inventory cache when fresh.
+
+    Matches the semantics of get_instance_id(). Lookups go through the
+    per-process instance index, seeded from the inventory cache. A name that
+    is missing from a cached snapshot falls back to a live lookup, since the
+    instance may have been created after the snapshot was taken.
+
+    Args:
+        instance_name: The name of the instance to find
+
+    Returns:
+        The instance ID
+
+    Raises:
+        InstanceNotFoundError: If no instance found with the given name
+        MultipleInstancesFoundError: If multiple instances found with the same name
+        AWSServiceError: If AWS API call fails
+    """
+    global _instance_index
+    instance_name = validate_instance_name(instance_name)
+
+    fetched = False
+    if _instance_index is None:
+        ttl = get_inventory_cache_ttl()
+        if ttl <= 0:
+            # Without a persistent cache, a filtered describe is the cheapest single lookup
+            return get_instance_id(instance_name)
+        scope = _inventory_scope()
+        reservations = inventory_cache.get(scope, ttl)
+        if reservations is None:
+            reservations = get_instances()
+            inventory_cache.store(scope, reservations)
+            fetched = True
+        _instance_index = _build_instance_index(reservations)
+
+    indexed = _lookup_indexed_instance(_instance_index, instance_name)
+    if indexed is not None:
+        return indexed.instance_id
+    if fetched:
+        raise InstanceNotFoundError(instance_name)
+    return get_instance_id(instance_name)
+
+
+def _build_instance_index(
+    reservations: list[dict[str, Any]],
+) -> dict[str, tuple[IndexedInstance, ...]]:
+    """Group named instances from describe_instances reservations by Name tag."""
+    index: dict[str, list[IndexedInstance]] = {}
+    for reservation in reservations:
+        for instance in reservation.get("Instances", []):
+            tags = extract_tags_dict(instance.get("Tags"))
+            name = tags.get("Name")
+            if not name:
+                continue
+            index.setdefault(name, []).append(
+                IndexedInstance(
+                    name=name,
+                    instance_id=instance["InstanceId"],
+                    state=instance.get("State", {}).get("Name", "unknown"),
+                    public_dns=instance.get("PublicDnsName", ""),
+                    instance_type=instance.get("InstanceType", "unknown"),
+                    tags=tags,
+                    public_ip=instance.get("PublicIpAddress", ""),
+                )
+            )
+    return {name: tuple(entries) for name, entries in index.items()}
+
+
+def get_instance_index(
+    refresh: bool = False, store: bool = True
+) -> dict[str, tuple[IndexedInstance, ...]]:
+    """Get the name -> instances index, building it from one describe sweep.
+
+    The index is built on first use and reused for the rest of the process,
+    so later lookups cost no API calls. It is built from get_cached_instances(),
+    so a fresh on-disk inventory is used when available.
+
+    Args:
+        refresh: If True, rebuild the index from a live describe_instances sweep
+        store: If False, a live sweep only rebuilds the in-memory index and
+            is not written to the inventory cache
+
+    Returns:
+        Mapping of Name tag to all instances (in any state) carrying that name
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    global _instance_index
+    if _instance_index is None or refresh:
+        _instance_index = _build_instance_index(get_cached_instances(refresh=refresh, store=store))
+    return _instance_index
+
+
+def reset_instance_index() -> None:
+    """Reset the cached name -> instances index.
+
+    The next lookup rebuilds it. Called whenever the inventory is invalidated,
+    and useful in tests where EC2 responses are mocked per test.
+    """
+    global _instance_index
+    _instance_index = None
+
+
+def _lookup_indexed_instance(
+    index: dict[str, tuple[IndexedInstance, ...]], instance_name: str
+) -> IndexedInstance | None:
+    """Find the single resolvable instance for a name, as get_instance_id() would."""
+    matches = [
+        entry for entry in index.get(instance_name, ()) if entry.state in RESOLVABLE_INSTANCE_STATES
+    ]
+    if len(matches) > 1:
+        raise MultipleInstancesFoundError(instance_name, len(matches))
+    return matches[0] if matches else None
+
+
+def _has_glob(pattern: str) -> bool:
+    """Check whether a name pattern contains shell-style wildcards."""
+    return any(char in pattern for char in "*?[")
+
+
+def _missing_names(index: dict[str, tuple[IndexedInstance, ...]], names: list[str]) -> list[str]:
+    """Return the names that have no resolvable instance in the index."""
+    return [
+        name
+        for name in names
+        if not any(entry.state in RESOLVABLE_INSTANCE_STATES for entry in index.get(name, ()))
+    ]
+
+
+def _select_from_index(
+    index: dict[str, tuple[IndexedInstance, ...]],
+    patterns: list[str],
+    tags: Mapping[str, str],
+) -> list[IndexedInstance]:
+    """Select resolvable instances matching any pattern and all tag filters."""
+    selected = []
+    for name in sorted(index):
+        if patterns and not any(fnmatchcase(name, pattern) for pattern in patterns):
+            continue
+        for entry in index[name]:
+            if entry.state not in RESOLVABLE_INSTANCE_STATES:
+                continue
+            if all(
+                key in entry.tags and fnmatchcase(entry.tags[key], value)
+                for key, value in tags.items()
+            ):
+                selected.append(entry)
+    return selected
+
+
+def select_instances(
+    patterns: Iterable[str] = (),
+    tags: Mapping[str, str] | None = None,
+    refresh: bool = False,
+    store: bool = True,
+) -> list[IndexedInstance]:
+    """Select many instances by name, glob pattern and/or tags.
+
+    All targets are selected from the per-process instance index, so any
+    number of names, patterns and tag filters costs one describe_instances
+    sweep. An instance is selected if its name matches any of the patterns
+    (or no patterns were given) and it carries every tag filter. Tag values
+    may also be glob patterns. Terminated instances are never selected.
+
+    Args:
+        patterns: Exact instance names or shell-style globs (e.g. "dev-*")
+        tags: Tag key to value (or value glob) filters
+        refresh: If True, select from a live describe_instances sweep so
+            instance states are current (e.g. before starting or stopping)
+        store: If False, a live sweep is not written to the inventory cache
+
+    Returns:
+        Matching instances sorted by name
+
+    Raises:
+        InstanceNotFoundError: If an exact (non-glob) name matches no instance
+        AWSServiceError: If AWS API call fails
+    """
+    pattern_list = list(dict.fromkeys(patterns))
+    tag_filters = dict(tags or {})
+    exact_names = [pattern for pattern in pattern_list if not _has_glob(pattern)]
+
+    index = get_instance_index(refresh=refresh, store=store)
+    missing = _missing_names(index, exact_names)
+    if missing and not refresh:
+        # The index may predate a launch; rebuild it from a live sweep once
+        index = get_instance_index(refresh=True, store=store)
+        missing = _missing_names(index, exact_names)
+    if missing:
+        raise InstanceNotFoundError(missing[0])
+    return _select_from_index(index, pattern_list, tag_filters)
+
+
+def invalidate_inventory_cache() -> None:
+    """Drop the cached inventory so the next lookup fetches fresh data.
+
+    Call after any command that changes instance state, type or existence.
+    """
+    inventory_cache.invalidate()
+    reset_instance_index()
+
+
 def resolve_instance_or_exit(instance_name: str | None = None) -> tuple[str, str]:
     """Resolve an optional instance name to both name and instance ID, with CLI error handling.
 
@@ -240,6 +535,8 @@ def launch_instance_from_template(
             ],
         )
 
+    invalidate_inventory_cache()
+
     # Safely access the launched instance ID
     try:
         instances = instance.get("Instances", [])
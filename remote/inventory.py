@@ -0,0 +1,194 @@
+"""Local inventory cache for EC2 describe_instances results.
+
+This module persists the reservations returned by a full describe_instances
+sweep so that repeated listings and name-to-ID lookups within the TTL can be
+served from disk instead of the EC2 API. It has no knowledge of the config
+or AWS clients; callers decide the TTL and when to refresh or invalidate.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from remote.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Default inventory cache file path
+INVENTORY_FILE_NAME = "inventory.json"
+
+# Bump when the on-disk layout changes so stale files are ignored
+INVENTORY_CACHE_VERSION = 1
+
+# Marker key used to round-trip datetime values (e.g. LaunchTime) through JSON
+_DATETIME_KEY = "__datetime__"
+
+
+def get_inventory_file_path() -> Path:
+    """Get the path to the inventory cache JSON file.
+
+    Returns:
+        Path to ~/.config/remote.py/inventory.json
+    """
+    config_dir = Settings.get_config_path().parent
+    return config_dir / INVENTORY_FILE_NAME
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON encoder hook for values boto3 returns that json cannot handle."""
+    if isinstance(value, datetime):
+        return {_DATETIME_KEY: value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_object(obj: dict[str, Any]) -> Any:
+    """JSON object hook that restores values written by _encode_value."""
+    if len(obj) == 1 and _DATETIME_KEY in obj:
+        return datetime.fromisoformat(obj[_DATETIME_KEY])
+    return obj
+
+
+def filter_reservations_by_state(
+    reservations: list[dict[str, Any]], states: list[str]
+) -> list[dict[str, Any]]:
+    """Filter reservations to instances in the given states.
+
+    Mirrors the server-side ``instance-state-name`` filter so cached results
+    match what a filtered describe_instances call would return.
+
+    Args:
+        reservations: List of reservation dictionaries from describe_instances()
+        states: Instance state names to keep
+
+    Returns:
+        List of reservations containing only matching instances. Reservations
+        left with no instances are dropped.
+    """
+    filtered = []
+    for reservation in reservations:
+        instances = [
+            instance
+            for instance in reservation.get("Instances", [])
+            if instance.get("State", {}).get("Name") in states
+        ]
+        if instances:
+            filtered.append({**reservation, "Instances": instances})
+    return filtered
+
+
+class InventoryCache:
+    """Manager for the on-disk EC2 inventory cache.
+
+    The cache holds a single snapshot of reservations tagged with a scope
+    (typically the AWS profile and region) so that switching accounts or
+    regions never serves another scope's instances.
+    """
+
+    def __init__(self, cache_file: Path | None = None) -> None:
+        """Initialize the inventory cache.
+
+        Args:
+            cache_file: Path to the cache file. Defaults to
+                ~/.config/remote.py/inventory.json
+        """
+        self._cache_file = cache_file or get_inventory_file_path()
+
+    @property
+    def cache_file(self) -> Path:
+        """Get the cache file path."""
+        return self._cache_file
+
+    def _read(self) -> dict[str, Any] | None:
+        """Read the raw cache payload, or None if missing or unreadable."""
+        if not self._cache_file.exists():
+            return None
+        try:
+            with open(self._cache_file) as f:
+                data = json.load(f, object_hook=_decode_object)
+        except (json.JSONDecodeError, OSError, ValueError) as e:
+            logger.warning(f"Could not load inventory cache: {e}")
+            return None
+        if not isinstance(data, dict) or data.get("version") != INVENTORY_CACHE_VERSION:
+            return None
+        return data
+
+    def get(self, scope: str, ttl_seconds: int) -> list[dict[str, Any]] | None:
+        """Get cached reservations if they are fresh and for the given scope.
+
+        Args:
+            scope: Identifier for the account/region the data belongs to
+            ttl_seconds: Maximum age in seconds; 0 or less always misses
+
+        Returns:
+            List of reservation dictionaries, or None on a cache miss
+        """
+        if ttl_seconds <= 0:
+            return None
+        data = self._read()
+        if data is None or data.get("scope") != scope:
+            return None
+        fetched_at = data.get("fetched_at")
+        if not isinstance(fetched_at, int | float):
+            return None
+        age = time.time() - fetched_at
+        if age < 0 or age > ttl_seconds:
+            logger.debug(f"Inventory cache expired ({age:.0f}s old)")
+            return None
+        reservations = data.get("reservations")
+        if not isinstance(reservations, list):
+            return None
+        logger.debug(f"Using inventory cache ({age:.0f}s old, {len(reservations)} reservations)")
+        return reservations
+
+    def store(self, scope: str, reservations: list[dict[str, Any]]) -> None:
+        """Write reservations to the cache, replacing any previous snapshot.
+
+        The file is written to a temporary path and renamed into place so a
+        concurrent reader never sees a partially written cache.
+
+        Args:
+            scope: Identifier for the account/region the data belongs to
+            reservations: List of reservation dictionaries from describe_instances()
+        """
+        data = {
+            "version": INVENTORY_CACHE_VERSION,
+            "scope": scope,
+            "fetched_at": time.time(),
+            "reservations": reservations,
+        }
+        tmp_path = None
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._cache_file.parent, prefix=f".{INVENTORY_FILE_NAME}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, default=_encode_value)
+            os.replace(tmp_path, self._cache_file)
+            tmp_path = None
+            logger.debug(f"Saved inventory cache with {len(reservations)} reservations")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not save inventory cache: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def invalidate(self) -> None:
+        """Remove the cached snapshot so the next lookup hits the EC2 API."""
+        try:
+            self._cache_file.unlink(missing_ok=True)
+            logger.debug("Invalidated inventory cache")
+        except OSError as e:
+            logger.warning(f"Could not invalidate inventory cache: {e}")
+
+
+# Global inventory cache instance
+inventory_cache = InventoryCache()
@@ -2,18 +2,61 @@
 
 This module provides functions to retrieve EC2 instance pricing information
 using the AWS Pricing API.
+
+Prices can also be served from an on-disk catalog holding every Linux/shared
+on-demand price for a region, fetched in one paginated sweep. While the
+catalog is fresh, price lookups for that region are local dictionary reads.
+
+The catalog can be exported to and imported from a versioned snapshot file
+(`remote pricing export/import`), so machines without Pricing API access can
+still compute costs with no network calls.
 """
 
+import gzip
 import json
 import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
 from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+import typer
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+
+from remote.exceptions import ValidationError
+from remote.settings import PRICE_CATALOG_TTL_SECONDS, Settings
+from remote.utils import (
+    console,
+    create_table,
+    handle_cli_errors,
+    print_success,
+    print_warning,
+    styled_column,
+)
 
 logger = logging.getLogger(__name__)
 
+# Default price catalog file path
+PRICE_CATALOG_FILE_NAME = "prices.json"
+
+# Bump when the on-disk layout changes so stale files are ignored
+PRICE_CATALOG_VERSION = 1
+
+# Identifier and version written to exported price snapshot files
+PRICE_SNAPSHOT_FORMAT = "remotepy-prices"
+PRICE_SNAPSHOT_VERSION = 1
+
+app = typer.Typer(help="Manage offline EC2 pricing data")
+
+# boto3's default session is not thread-safe; serialize client creation so
+# concurrent price lookups can share the cached clients safely
+_client_lock = threading.Lock()
+
 # Static fallback mapping of AWS region codes to Pricing API location names.
 #
 # IMPORTANT: The Pricing API uses human-readable location names, NOT region codes.
@@ -62,7 +105,8 @@ def get_pricing_client() -> Any:
     Returns:
         boto3 Pricing client instance
     """
-    return boto3.client("pricing", region_name="us-east-1")
+    with _client_lock:
+        return boto3.client("pricing", region_name="us-east-1")
 
 
 @lru_cache(maxsize=1)
@@ -74,7 +118,8 @@ def get_ssm_client() -> Any:
     Returns:
         boto3 SSM client instance
     """
-    return boto3.client("ssm", region_name="us-east-1")
+    with _client_lock:
+        return boto3.client("ssm", region_name="us-east-1")
 
 
 @lru_cache(maxsize=256)
@@ -146,6 +191,249 @@ def get_current_region() -> str:
     return session.region_name or "us-east-1"
 
 
+def _product_filters(location: str) -> list[dict[str, str]]:
+    """Pricing API filters for Linux, shared-tenancy, on-demand EC2 usage."""
+    return [
+        {"Type": "TERM_MATCH", "Field": "location", "Value": location},
+        {"Type": "TERM_MATCH", "Field": "operatingSystem", "Value": "Linux"},
+        {"Type": "TERM_MATCH", "Field": "tenancy", "Value": "Shared"},
+        {"Type": "TERM_MATCH", "Field": "preInstalledSw", "Value": "NA"},
+        {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
+    ]
+
+
+def _parse_on_demand_price(price_data: dict[str, Any]) -> float | None:
+    """Extract the hourly USD on-demand price from a Pricing API product."""
+    terms = price_data.get("terms", {}).get("OnDemand", {})
+    for term in terms.values():
+        price_dimensions = term.get("priceDimensions", {})
+        for dimension in price_dimensions.values():
+            price_per_unit = dimension.get("pricePerUnit", {}).get("USD")
+            if price_per_unit:
+                return float(price_per_unit)
+    return None
+
+
+def get_price_catalog_path() -> Path:
+    """Get the path to the price catalog JSON file.
+
+    Returns:
+        Path to ~/.config/remote.py/prices.json
+    """
+    return Settings.get_config_path().parent / PRICE_CATALOG_FILE_NAME
+
+
+class PriceCatalog:
+    """On-disk table of hourly on-demand prices, keyed by region and instance type.
+
+    Each region is stored with the time it was fetched so it can expire
+    independently. Regions imported from a snapshot are pinned and never
+    expire until refetched. The file is loaded once per process.
+    """
+
+    def __init__(self, catalog_file: Path | None = None) -> None:
+        """Initialize the price catalog.
+
+        Args:
+            catalog_file: Path to the catalog file. Defaults to
+                ~/.config/remote.py/prices.json
+        """
+        self._catalog_file = catalog_file or get_price_catalog_path()
+        self._regions: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+
+    @property
+    def catalog_file(self) -> Path:
+        """Get the catalog file path."""
+        return self._catalog_file
+
+    def _load(self) -> None:
+        """Load catalog data from file."""
+        if self._loaded:
+            return
+
+        self._regions = {}
+        if self._catalog_file.exists():
+            try:
+                with open(self._catalog_file) as f:
+                    raw_data = json.load(f)
+                if raw_data.get("version") == PRICE_CATALOG_VERSION:
+                    self._regions = raw_data.get("regions", {})
+            except (json.JSONDecodeError, OSError, AttributeError) as e:
+                logger.warning(f"Could not load price catalog: {e}")
+                self._regions = {}
+
+        self._loaded = True
+
+    def _save(self) -> None:
+        """Save catalog data to file atomically."""
+        data = {"version": PRICE_CATALOG_VERSION, "regions": self._regions}
+        tmp_path = None
+        try:
+            self._catalog_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._catalog_file.parent, prefix=f".{PRICE_CATALOG_FILE_NAME}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"), sort_keys=True)
+            os.replace(tmp_path, self._catalog_file)
+            tmp_path = None
+        except OSError as e:
+            logger.warning(f"Could not save price catalog: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def get_region_prices(
+        self, region: str, ttl_seconds: int = PRICE_CATALOG_TTL_SECONDS
+    ) -> dict[str, float] | None:
+        """Get all cached prices for a region if they have not expired.
+
+        Args:
+            region: AWS region code
+            ttl_seconds: Maximum age in seconds; 0 or less always misses
+
+        Returns:
+            Mapping of instance type to hourly USD price, or None on a miss
+        """
+        if ttl_seconds <= 0:
+            return None
+        self._load()
+        entry = self._regions.get(region)
+        if not isinstance(entry, dict):
+            return None
+        if not entry.get("pinned"):
+            fetched_at = entry.get("fetched_at")
+            if not isinstance(fetched_at, int | float):
+                return None
+            age = time.time() - fetched_at
+            if age < 0 or age > ttl_seconds:
+                return None
+        prices = entry.get("prices")
+        return prices if isinstance(prices, dict) else None
+
+    def store_region_prices(self, region: str, prices: dict[str, float]) -> None:
+        """Replace the cached prices for a region and write the catalog to disk.
+
+        Args:
+            region: AWS region code
+            prices: Mapping of instance type to hourly USD price
+        """
+        self._load()
+        self._regions[region] = {"fetched_at": time.time(), "prices": dict(prices)}
+        self._save()
+
+    def get_regions(self) -> dict[str, dict[str, Any]]:
+        """Get all stored region entries, regardless of age.
+
+        Returns:
+            Mapping of region code to its entry (fetched_at, prices, pinned)
+        """
+        self._load()
+        return {region: dict(entry) for region, entry in self._regions.items()}
+
+    def import_regions(self, regions: dict[str, dict[str, Any]]) -> None:
+        """Merge region entries into the catalog as pinned data and save.
+
+        Args:
+            regions: Mapping of region code to an entry with fetched_at and prices
+        """
+        self._load()
+        for region, entry in regions.items():
+            self._regions[region] = {
+                "fetched_at": entry.get("fetched_at"),
+                "prices": dict(entry["prices"]),
+                "pinned": True,
+            }
+        self._save()
+
+    def reload(self) -> None:
+        """Force reload catalog data from file."""
+        self._loaded = False
+        self._load()
+
+
+# Global price catalog instance
+price_catalog = PriceCatalog()
+
+
+def fetch_region_prices(region: str) -> dict[str, float] | None:
+    """Fetch every Linux/shared on-demand price for a region in one paginated sweep.
+
+    Args:
+        region: AWS region code
+
+    Returns:
+        Mapping of instance type to hourly USD price, or None if the region
+        is unknown or the Pricing API is unavailable.
+    """
+    location = get_region_location(region)
+    if not location:
+        return None
+
+    prices: dict[str, float] = {}
+    try:
+        paginator = get_pricing_client().get_paginator("get_products")
+        for page in paginator.paginate(
+            ServiceCode="AmazonEC2", Filters=_product_filters(location), MaxResults=100
+        ):
+            for item in page.get("PriceList", []):
+                price_data = json.loads(item)
+                instance_type = (
+                    price_data.get("product", {}).get("attributes", {}).get("instanceType")
+                )
+                if not instance_type or instance_type in prices:
+                    continue
+                price = _parse_on_demand_price(price_data)
+                if price is not None:
+                    prices[instance_type] = price
+    except ClientError as e:
+        error_code = e.response.get("Error", {}).get("Code", "Unknown")
+        logger.debug(f"Pricing API error fetching catalog for {region}: {error_code}")
+        return None
+    except (NoCredentialsError, BotoCoreError) as e:
+        logger.debug(f"Could not fetch price catalog for {region}: {e}")
+        return None
+    except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+        logger.debug(f"Could not parse price catalog for {region}: {e}")
+        return None
+
+    logger.debug(f"Fetched {len(prices)} prices for {region}")
+    return prices
+
+
+def load_region_prices(region: str | None = None, refresh: bool = False) -> dict[str, float] | None:
+    """Get the price catalog for a region, fetching it if missing or expired.
+
+    Call this before pricing many instance types: one paginated sweep
+    replaces a Pricing API call per type, and the result is saved on disk so
+    later lookups (in this and future processes) are local reads.
+
+    Args:
+        region: AWS region code. If None, uses the current session region.
+        refresh: If True, fetch from the Pricing API even if the catalog is fresh
+
+    Returns:
+        Mapping of instance type to hourly USD price, or None if unavailable
+    """
+    if region is None:
+        region = get_current_region()
+
+    if not refresh:
+        prices = price_catalog.get_region_prices(region)
+        if prices is not None:
+            return prices
+
+    prices = fetch_region_prices(region)
+    if prices:
+        price_catalog.store_region_prices(region, prices)
+        get_instance_price.cache_clear()
+    return prices
+
+
 @lru_cache(maxsize=256)
 def get_instance_price(instance_type: str, region: str | None = None) -> float | None:
     """Get the hourly on-demand price for an EC2 instance type.
@@ -158,12 +446,17 @@ def get_instance_price(instance_type: str, region: str | None = None) -> float |
         The hourly price in USD, or None if pricing is unavailable.
 
     Note:
-        This function caches results to reduce API calls.
+        This function caches results to reduce API calls, and reads from the
+        on-disk price catalog when the region has a fresh one.
         Prices are for Linux on-demand instances with shared tenancy.
     """
     if region is None:
         region = get_current_region()
 
+    catalog_prices = price_catalog.get_region_prices(region)
+    if catalog_prices is not None and instance_type in catalog_prices:
+        return float(catalog_prices[instance_type])
+
     # Get location name for region (uses dynamic lookup with static fallback)
     location = get_region_location(region)
     if not location:
@@ -176,11 +469,7 @@ def get_instance_price(instance_type: str, region: str | None = None) -> float |
             ServiceCode="AmazonEC2",
             Filters=[
                 {"Type": "TERM_MATCH", "Field": "instanceType", "Value": instance_type},
-                {"Type": "TERM_MATCH", "Field": "location", "Value": location},
-                {"Type": "TERM_MATCH", "Field": "operatingSystem", "Value": "Linux"},
-                {"Type": "TERM_MATCH", "Field": "tenancy", "Value": "Shared"},
-                {"Type": "TERM_MATCH", "Field": "preInstalledSw", "Value": "NA"},
-                {"Type": "TERM_MATCH", "Field": "capacitystatus", "Value": "Used"},
+                *_product_filters(location),
             ],
             MaxResults=1,
         )
@@ -191,20 +480,7 @@ def get_instance_price(instance_type: str, region: str | None = None) -> float |
 
         # Parse the price from the response
         price_data = json.loads(price_list[0])
-        terms = price_data.get("terms", {}).get("OnDemand", {})
-
-        if not terms:
-            return None
-
-        # Get the first term and its price dimension
-        for term in terms.values():
-            price_dimensions = term.get("priceDimensions", {})
-            for dimension in price_dimensions.values():
-                price_per_unit = dimension.get("pricePerUnit", {}).get("USD")
-                if price_per_unit:
-                    return float(price_per_unit)
-
-        return None
+        return _parse_on_demand_price(price_data)
 
     except ClientError as e:
         # Don't raise an exception for pricing errors - just return None
@@ -240,6 +516,11 @@ def get_instance_price_with_fallback(
     if region is None:
         region = get_current_region()
 
+    # A catalog price needs no location lookup, so imported snapshots work offline
+    catalog_prices = price_catalog.get_region_prices(region)
+    if catalog_prices is not None and instance_type in catalog_prices:
+        return (float(catalog_prices[instance_type]), False)
+
     # Check if region has a valid location mapping (static or dynamic)
     location = get_region_location(region)
     if not location:
@@ -276,3 +557,156 @@ def clear_price_cache() -> None:
     """
     get_instance_price.cache_clear()
     clear_region_location_cache()
+
+
+def _open_snapshot(path: Path, mode: str) -> Any:
+    """Open a snapshot file, transparently gzip-compressed when named *.gz."""
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def export_price_snapshot(path: Path, regions: list[str] | None = None) -> dict[str, int]:
+    """Write catalog prices to a versioned snapshot file.
+
+    Args:
+        path: Destination file. A ``.gz`` suffix writes gzip-compressed JSON.
+        regions: Regions to export. If None, exports every region in the catalog.
+
+    Returns:
+        Mapping of exported region code to its number of prices
+
+    Raises:
+        ValidationError: If there are no prices to export or the file cannot be written
+    """
+    stored = price_catalog.get_regions()
+    selected = {
+        region: entry
+        for region, entry in stored.items()
+        if (regions is None or region in regions) and isinstance(entry.get("prices"), dict)
+    }
+    if not selected:
+        raise ValidationError(
+            "No cached prices to export",
+            "Run 'remote pricing export --fetch --region <region>' to fetch prices first",
+        )
+
+    snapshot = {
+        "format": PRICE_SNAPSHOT_FORMAT,
+        "version": PRICE_SNAPSHOT_VERSION,
+        "exported_at": datetime.now(timezone.utc).isoformat(),
+        "regions": {
+            region: {"fetched_at": entry.get("fetched_at"), "prices": entry["prices"]}
+            for region, entry in sorted(selected.items())
+        },
+    }
+    try:
+        with _open_snapshot(path, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"), sort_keys=True)
+    except OSError as e:
+        raise ValidationError(f"Could not write price snapshot: {path}", str(e)) from e
+
+    return {region: len(entry["prices"]) for region, entry in selected.items()}
+
+
+def import_price_snapshot(path: Path) -> dict[str, int]:
+    """Load a snapshot file into the price catalog.
+
+    Imported regions are pinned: they are used without expiry until
+    refetched, so cost lookups for them need no network access.
+
+    Args:
+        path: Snapshot file written by export_price_snapshot()
+
+    Returns:
+        Mapping of imported region code to its number of prices
+
+    Raises:
+        ValidationError: If the file is missing, unreadable or not a valid snapshot
+    """
+    try:
+        with _open_snapshot(path, "r") as f:
+            snapshot = json.load(f)
+    except (OSError, EOFError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValidationError(f"Could not read price snapshot: {path}", str(e)) from e
+
+    if not isinstance(snapshot, dict) or snapshot.get("format") != PRICE_SNAPSHOT_FORMAT:
+        raise ValidationError(f"Not a price snapshot file: {path}")
+    version = snapshot.get("version")
+    if not isinstance(version, int) or version > PRICE_SNAPSHOT_VERSION:
+        raise ValidationError(
+            f"Unsupported price snapshot version: {version}",
+            f"This version of remote.py reads snapshots up to version {PRICE_SNAPSHOT_VERSION}",
+        )
+
+    regions: dict[str, dict[str, Any]] = {}
+    for region, entry in (snapshot.get("regions") or {}).items():
+        prices = entry.get("prices") if isinstance(entry, dict) else None
+        if not isinstance(prices, dict):
+            raise ValidationError(f"Invalid prices for region '{region}' in {path}")
+        try:
+            parsed = {str(it): float(price) for it, price in prices.items()}
+        except (TypeError, ValueError) as e:
+            raise ValidationError(f"Invalid prices for region '{region}' in {path}") from e
+        regions[region] = {"fetched_at": entry.get("fetched_at"), "prices": parsed}
+
+    if not regions:
+        raise ValidationError(f"Price snapshot contains no regions: {path}")
+
+    price_catalog.import_regions(regions)
+    get_instance_price.cache_clear()
+    return {region: len(entry["prices"]) for region, entry in regions.items()}
+
+
+def _print_region_summary(title: str, counts: dict[str, int]) -> None:
+    """Print a table of region codes and price counts."""
+    columns = [styled_column("Region", "name"), styled_column("Prices", "numeric", justify="right")]
+    rows = [[region, str(count)] for region, count in sorted(counts.items())]
+    console.print(create_table(title, columns, rows))
+
+
+@app.command("export")
+@handle_cli_errors
+def export_snapshot(
+    path: Path = typer.Argument(..., help="Snapshot file to write (use .json.gz to compress)"),
+    regions: list[str] | None = typer.Option(
+        None, "--region", "-r", help="Region to export (repeatable, default: all cached)"
+    ),
+    fetch: bool = typer.Option(
+        False, "--fetch", help="Fetch current prices from the Pricing API before exporting"
+    ),
+) -> None:
+    """
+    Export cached prices to an offline snapshot file.
+
+    Examples:
+        remote pricing export prices.json.gz
+        remote pricing export prices.json.gz --fetch -r us-east-1 -r eu-west-1
+    """
+    if fetch:
+        for region in regions or [get_current_region()]:
+            if load_region_prices(region, refresh=True) is None:
+                print_warning(f"Could not fetch prices for {region}")
+
+    counts = export_price_snapshot(path, regions)
+    _print_region_summary("Exported Prices", counts)
+    print_success(f"Wrote price snapshot to {path}")
+
+
+@app.command("import")
+@handle_cli_errors
+def import_snapshot(
+    path: Path = typer.Argument(..., help="Snapshot file to import"),
+) -> None:
+    """
+    Import prices from an offline snapshot file.
+
+    Imported regions are used for cost columns without any Pricing API calls
+    until they are refetched (e.g. with 'remote pricing export --fetch').
+
+    Examples:
+        remote pricing import prices.json.gz
+    """
+    counts = import_price_snapshot(path)
+    _print_region_summary("Imported Prices", counts)
+    print_success(f"Imported {sum(counts.values())} prices for {len(counts)} region(s)")
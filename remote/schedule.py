@@ -3,6 +3,8 @@
 This module provides CLI commands for managing scheduled start/stop of EC2 instances.
 """
 
+from typing import Literal, cast
+
 import typer
 
 from .config import config_manager
@@ -485,7 +487,7 @@ def clear(
 @handle_cli_errors
 def list_cmd() -> None:
     """List all remotepy schedules."""
-    from .scheduler import _get_schedule_by_name
+    from .scheduler import _get_schedule_name, get_schedule_details
     from .utils import get_instance_names_by_ids
 
     schedules = list_schedules()
@@ -496,7 +498,7 @@ def list_cmd() -> None:
 
     # First pass: collect all instance IDs and parse names
     parsed_schedules: list[
-        tuple[str, str | None, str, str]
+        tuple[Literal["wake", "sleep"], str | None, str, str]
     ] = []  # (action, name, instance_id, state)
     all_instance_ids: set[str] = set()
 
@@ -509,14 +511,22 @@ def list_cmd() -> None:
             continue
 
         action = parsed["action"]
-        name = parsed["name"]
         instance_id = parsed["instance_id"]
-        parsed_schedules.append((action, name, instance_id, state))  # type: ignore[arg-type]
-        all_instance_ids.add(instance_id)  # type: ignore[arg-type]
+        if action not in ("wake", "sleep") or instance_id is None:
+            continue
+        action = cast(Literal["wake", "sleep"], action)
+        parsed_schedules.append((action, parsed["name"], instance_id, state))
+        all_instance_ids.add(instance_id)
 
     # Batch lookup instance names
     instance_names = get_instance_names_by_ids(list(all_instance_ids)) if all_instance_ids else {}
 
+    # Fetch expressions and timezones for all schedules concurrently
+    details = get_schedule_details(
+        _get_schedule_name(instance_id, action, name)
+        for action, name, instance_id, _ in parsed_schedules
+    )
+
     columns = [
         {"name": "Instance", "style": "cyan"},
         {"name": "Action", "style": "green"},
@@ -528,13 +538,7 @@ def list_cmd() -> None:
 
     rows: list[list[str]] = []
     for action, name, instance_id, state in parsed_schedules:
-        # Get full schedule details for expression and timezone
-        full_sched_name = (
-            f"remotepy-{action}-{name}-{instance_id}"
-            if name
-            else f"remotepy-{action}-{instance_id}"
-        )
-        full_sched = _get_schedule_by_name(full_sched_name)
+        full_sched = details[_get_schedule_name(instance_id, action, name)]
         if full_sched:
             expr = full_sched.get("ScheduleExpression", "")
             tz = full_sched.get("ScheduleExpressionTimezone", "UTC")
@@ -6,11 +6,15 @@ schedules to automatically start and stop EC2 instances on a recurring basis.
 
 import json
 import re
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal, cast
 
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from .exceptions import AWSServiceError
+from .settings import SCHEDULE_DETAIL_MAX_WORKERS
 from .utils import get_iam_client, get_scheduler_client
 
 # Constants
@@ -18,6 +22,11 @@ SCHEDULER_ROLE_NAME = "remotepy-scheduler-role"
 SCHEDULER_POLICY_NAME = "remotepy-scheduler-ec2-policy"
 SCHEDULE_NAME_PREFIX = "remotepy-"
 
+# Per-process cache of get_schedule responses (None for missing schedules),
+# keyed by full schedule name
+_schedule_details: dict[str, dict[str, Any] | None] = {}
+_schedule_details_lock = threading.Lock()
+
 
 def _build_trust_policy() -> str:
     """Build the trust policy document for the scheduler role."""
@@ -260,6 +269,7 @@ def create_schedule(
     if not is_one_time:
         schedule_params["ScheduleExpressionTimezone"] = timezone or "UTC"
 
+    _forget_schedule_details(schedule_name)
     try:
         scheduler.create_schedule(**schedule_params)
     except ClientError as e:
@@ -342,6 +352,7 @@ def delete_schedule(
     scheduler = get_scheduler_client()
     schedule_name = _get_schedule_name(instance_id, action, name)
 
+    _forget_schedule_details(schedule_name)
     try:
         scheduler.delete_schedule(Name=schedule_name)
         return True
@@ -366,14 +377,20 @@ def delete_schedule(
 def list_schedules() -> list[dict[str, Any]]:
     """List all remotepy schedules.
 
+    Follows NextToken through every page, so accounts with more schedules
+    than fit in one list_schedules response are listed completely.
+
     Returns:
         List of schedule summary dicts
     """
     scheduler = get_scheduler_client()
 
     try:
-        response = scheduler.list_schedules(NamePrefix=SCHEDULE_NAME_PREFIX)
-        return cast(list[dict[str, Any]], response.get("Schedules", []))
+        schedules: list[dict[str, Any]] = []
+        paginator = scheduler.get_paginator("list_schedules")
+        for page in paginator.paginate(NamePrefix=SCHEDULE_NAME_PREFIX):
+            schedules.extend(cast(list[dict[str, Any]], page.get("Schedules", [])))
+        return schedules
     except ClientError as e:
         raise AWSServiceError(
             service="EventBridge Scheduler",
@@ -421,11 +438,62 @@ def _get_schedule_by_name(schedule_name: str) -> dict[str, Any] | None:
         )
 
 
+def get_schedule_details(
+    schedule_names: Iterable[str], max_workers: int = SCHEDULE_DETAIL_MAX_WORKERS
+) -> dict[str, dict[str, Any] | None]:
+    """Get full details for many schedules, fetching them concurrently.
+
+    list_schedules() only returns summaries, so expressions and timezones
+    need one get_schedule call per schedule. Those calls run on a bounded
+    thread pool, and responses are cached for the rest of the process so
+    repeated lookups cost no API calls. Creating or deleting a schedule
+    through this module drops its cached entry.
+
+    Args:
+        schedule_names: Full schedule names
+        max_workers: Maximum concurrent get_schedule calls
+
+    Returns:
+        Mapping of schedule name to its details, or None if it does not exist
+
+    Raises:
+        AWSServiceError: If a get_schedule call fails
+    """
+    names = list(dict.fromkeys(schedule_names))
+    with _schedule_details_lock:
+        missing = [name for name in names if name not in _schedule_details]
+
+    if missing:
+        workers = max(1, min(max_workers, len(missing)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = dict(zip(missing, executor.map(_get_schedule_by_name, missing), strict=True))
+        with _schedule_details_lock:
+            _schedule_details.update(fetched)
+
+    with _schedule_details_lock:
+        return {name: _schedule_details[name] for name in names}
+
+
+def _forget_schedule_details(schedule_name: str) -> None:
+    """Drop a schedule's cached details after it is created, updated or deleted."""
+    with _schedule_details_lock:
+        _schedule_details.pop(schedule_name, None)
+
+
+def reset_schedule_details_cache() -> None:
+    """Reset the per-process schedule details cache.
+
+    Primarily used for testing to ensure clean state between tests.
+    """
+    with _schedule_details_lock:
+        _schedule_details.clear()
+
+
 def get_schedules_for_instance(instance_id: str) -> list[dict[str, Any]]:
     """Get all schedules for an instance (named and unnamed).
 
     Uses list_schedules() with prefix filter, then fetches full details
-    for each matching schedule.
+    for the matching schedules concurrently via get_schedule_details().
 
     Args:
         instance_id: EC2 instance ID
@@ -434,18 +502,21 @@ def get_schedules_for_instance(instance_id: str) -> list[dict[str, Any]]:
         List of schedule dicts, each with full details plus parsed
         "schedule_name", "action", and "name" keys.
     """
-    all_schedules = list_schedules()
-
-    results: list[dict[str, Any]] = []
-    for sched in all_schedules:
+    matching: list[tuple[str, dict[str, str | None]]] = []
+    for sched in list_schedules():
         sched_name = sched.get("Name", "")
         parsed = parse_schedule_name(sched_name)
-        if not parsed or parsed["instance_id"] != instance_id:
-            continue
+        if parsed and parsed["instance_id"] == instance_id:
+            matching.append((sched_name, parsed))
+
+    details = get_schedule_details(name for name, _ in matching)
 
-        # Fetch full details
-        full = _get_schedule_by_name(sched_name)
-        if full:
+    results: list[dict[str, Any]] = []
+    for sched_name, parsed in matching:
+        cached = details[sched_name]
+        if cached:
+            # Copy so the annotations below don't leak into the shared cache
+            full = dict(cached)
             full["schedule_name"] = sched_name
             full["action"] = parsed["action"]
             full["parsed_name"] = parsed["name"]
@@ -475,6 +546,7 @@ def delete_all_schedules_for_instance(instance_id: str) -> int:
         if not parsed or parsed["instance_id"] != instance_id:
             continue
 
+        _forget_schedule_details(sched_name)
         try:
             scheduler.delete_schedule(Name=sched_name)
             deleted += 1
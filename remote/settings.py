@@ -12,18 +12,57 @@ SSH_PORT = 22
 SECONDS_PER_HOUR = 3600
 
 # Instance startup/connection constants
-MAX_STARTUP_WAIT_SECONDS = 60
-STARTUP_POLL_INTERVAL_SECONDS = 5
-CONNECTION_RETRY_SLEEP_SECONDS = 20
+MAX_STARTUP_WAIT_SECONDS = 60  # Budget for the EC2 instance_running waiter
+STARTUP_POLL_INTERVAL_SECONDS = 5  # instance_running waiter delay between checks
 MAX_CONNECTION_ATTEMPTS = 5
-SSH_READINESS_WAIT_SECONDS = 10
+# Budget for `start`/`stop --target/--tag --wait` to reach the target state
+FLEET_WAIT_TIMEOUT_SECONDS = 300
+
+# SSH readiness probe after start: wait for a public DNS name, then for sshd
+# to send its banner on port 22, retrying with exponential backoff
+SSH_READY_TIMEOUT_SECONDS = 90
+SSH_PROBE_INITIAL_DELAY_SECONDS = 0.5
+SSH_PROBE_MAX_DELAY_SECONDS = 4.0
+SSH_PROBE_CONNECT_TIMEOUT_SECONDS = 3
+
+# `instance status --watch` backs off to this poll interval while nothing changes
+STATUS_WATCH_MAX_INTERVAL_SECONDS = 30
 
 # Instance type change polling constants
 TYPE_CHANGE_MAX_POLL_ATTEMPTS = 5
 TYPE_CHANGE_POLL_INTERVAL_SECONDS = 5
 
+# EC2 inventory cache constants
+# Seconds a cached describe_instances sweep is reused for listings and
+# name-to-ID lookups. 0 disables the cache.
+INVENTORY_CACHE_TTL_SECONDS = 60
+
+# Price catalog constants
+# Seconds a region's on-disk price catalog is used before being refetched.
+# On-demand prices change rarely, so a week keeps lookups local.
+PRICE_CATALOG_TTL_SECONDS = 7 * 24 * SECONDS_PER_HOUR
+# Minimum distinct instance types before `ls --cost` fetches the whole
+# region catalog instead of pricing each type individually
+PRICE_CATALOG_MIN_TYPES = 5
+# Maximum concurrent Pricing API lookups when pricing many instance types
+PRICE_PREFETCH_MAX_WORKERS = 8
+
+# Public IP discovery constants
+# Default seconds a discovered public IP is reused from ~/.config/remote.py/public_ip.json
+# by `sg add`, `sg remove`, `sg my-ip` and `sg audit` (config key: public_ip_cache_ttl).
+# 0 disables the cache.
+PUBLIC_IP_CACHE_TTL_SECONDS = 300
+
+# Usage tracking constants
+# Journal events recorded before they are compacted into the tracking snapshot
+TRACKING_JOURNAL_COMPACT_EVENTS = 200
+# Number of most recent sessions shown by `instance stats`
+STATS_RECENT_SESSIONS = 5
+
 # Exec command constants
 DEFAULT_EXEC_TIMEOUT_SECONDS = 30
+# Default number of instances `exec --target/--tag` runs on concurrently
+EXEC_FANOUT_MAX_WORKERS = 16
 
 # SSH operation timeout (for shutdown/cancel commands)
 SSH_OPERATION_TIMEOUT_SECONDS = 30
@@ -39,11 +78,31 @@ DEFAULT_SSH_CONNECT_TIMEOUT_SECONDS = 0
 SSH_SERVER_ALIVE_INTERVAL = 60  # Send keepalive every 60 seconds
 SSH_SERVER_ALIVE_COUNT_MAX = 3  # Disconnect after 3 missed keepalives (3 minutes)
 
+# SSH connection multiplexing (ControlMaster) for non-interactive commands
+# Seconds an idle master connection is kept open for reuse. 0 disables.
+SSH_CONTROL_PERSIST_SECONDS = 600
+
 # SSM (AWS Systems Manager) constants
 SSM_COMMAND_TIMEOUT_SECONDS = 60  # Default timeout for SSM send-command
-SSM_POLL_INTERVAL_SECONDS = 2  # Polling interval for command status
-SSM_MAX_POLL_ATTEMPTS = 30  # Max polling attempts (2s * 30 = 60s timeout)
+SSM_POLL_INITIAL_DELAY_SECONDS = 0.5  # First get-command-invocation poll delay
+SSM_POLL_MAX_DELAY_SECONDS = 5.0  # Poll delay doubles up to this cap
+SSM_DELIVERY_TIMEOUT_SECONDS = 30  # Minimum send-command delivery timeout allowed by AWS
+SSM_SEND_COMMAND_MAX_TARGETS = 50  # Instance IDs accepted by one send-command call
 SSM_DEFAULT_SHELL_USER = "ubuntu"  # Default user for interactive shell
+# SSM agent readiness after start: poll describe_instance_information until the
+# agent reports Online, with the same budget and backoff as the SSH probe
+SSM_READY_TIMEOUT_SECONDS = SSH_READY_TIMEOUT_SECONDS
+
+# EventBridge Scheduler constants
+# Maximum concurrent get_schedule calls when loading many schedule details
+SCHEDULE_DETAIL_MAX_WORKERS = 8
+
+# ECS constants
+ECS_DESCRIBE_SERVICES_BATCH_SIZE = 10  # Services accepted by one describe_services call
+ECS_SCALE_MAX_WORKERS = 8  # Maximum concurrent update_service calls in `ecs scale`
+# Budget for `ecs scale --wait` to see every service reach a steady state
+ECS_STABLE_WAIT_TIMEOUT_SECONDS = 600
+ECS_STABLE_POLL_INTERVAL_SECONDS = 10
 
 
 @dataclass
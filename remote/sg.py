@@ -5,14 +5,27 @@ security groups, including adding/removing IP addresses, listing current rules,
 and creating/deleting per-instance security groups.
 """
 
+import bisect
+import ipaddress
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
 import urllib.request
-from typing import Any
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
 
+from remote.config import get_seconds_value
 from remote.exceptions import AWSServiceError, ValidationError
 from remote.instance_resolver import resolve_instance_or_exit
-from remote.settings import SSH_PORT
+from remote.settings import SSH_PORT, Settings
 from remote.utils import (
     confirm_action,
     console,
@@ -28,6 +41,9 @@ from remote.utils import (
 )
 from remote.validation import sanitize_input, validate_port
 
+if TYPE_CHECKING:
+    from mypy_boto3_ec2.type_defs import IpPermissionTypeDef, IpRangeTypeDef
+
 app = typer.Typer(
     help="Manage security groups and IP access rules",
     epilog="""Typical workflows:
@@ -50,6 +66,9 @@ app = typer.Typer(
   Detach a security group (deletes if empty):
     remote sg detach my-instance --sg sg-12345
 
+  Audit every security group for open ports and stale IPs:
+    remote sg audit
+
 How it works:
 
   remotepy manages a dedicated security group per instance (remotepy-{name}).
@@ -59,9 +78,27 @@ How it works:
   Use --sg to target a specific security group for any command.""",
 )
 
+# Description given to rules added by remote.py; used to spot our stale rules
+REMOTEPY_RULE_DESCRIPTION = "Added by remote.py"
+# CIDR blocks open to the whole internet
+WORLD_CIDR = "0.0.0.0/0"
+WORLD_CIDR_V6 = "::/0"
+# Port range covered by all-traffic rules
+ALL_PORTS = (0, 65535)
+
 # URL to retrieve public IP address
 PUBLIC_IP_SERVICE_URL = "https://checkip.amazonaws.com"
+# IP echo services queried concurrently; the first valid answer wins
+PUBLIC_IP_SERVICE_URLS = (
+    PUBLIC_IP_SERVICE_URL,
+    "https://api.ipify.org",
+    "https://icanhazip.com",
+)
 PUBLIC_IP_TIMEOUT_SECONDS = 10
+# Last discovered public IP, shared across invocations for public_ip_cache_ttl seconds
+PUBLIC_IP_CACHE_FILE_NAME = "public_ip.json"
+
+logger = logging.getLogger(__name__)
 
 
 def resolve_port(port_str: str) -> int:
@@ -83,32 +120,158 @@ def resolve_port(port_str: str) -> int:
         raise ValidationError(f"Invalid port: '{port_str}'. Use a port number (1-65535).")
 
 
-def get_public_ip() -> str:
-    """Get the current user's public IP address.
-
-    Uses AWS's checkip service to retrieve the public IP address.
-
-    Returns:
-        The public IP address as a string (e.g., "203.0.113.1")
+def _fetch_public_ip(url: str) -> str:
+    """Ask one IP echo service for the caller's public IP address.
 
     Raises:
-        ValidationError: If unable to retrieve the public IP address
+        ValidationError: If the request fails or the answer is not an IPv4 address
     """
     try:
         with urllib.request.urlopen(  # nosec B310
-            PUBLIC_IP_SERVICE_URL, timeout=PUBLIC_IP_TIMEOUT_SECONDS
+            url, timeout=PUBLIC_IP_TIMEOUT_SECONDS
         ) as response:
             ip: str = response.read().decode("utf-8").strip()
-            # Validate it looks like an IP address
-            parts = ip.split(".")
-            if len(parts) != 4 or not all(p.isdigit() and 0 <= int(p) <= 255 for p in parts):
-                raise ValidationError(f"Invalid IP address received: {ip}")
-            return ip
     except urllib.error.URLError as e:
         raise ValidationError(f"Failed to retrieve public IP address: {e}")
     except TimeoutError:
         raise ValidationError("Timeout while retrieving public IP address")
 
+    # Validate it looks like an IP address
+    parts = ip.split(".")
+    if len(parts) != 4 or not all(p.isdigit() and 0 <= int(p) <= 255 for p in parts):
+        raise ValidationError(f"Invalid IP address received: {ip}")
+    return ip
+
+
+def _race_public_ip(urls: tuple[str, ...] = PUBLIC_IP_SERVICE_URLS) -> str:
+    """Query several IP echo services concurrently and return the first valid answer.
+
+    Each service is queried in a daemon thread that reports to a queue, so
+    once one has answered, slower or hung services delay neither this call
+    nor interpreter exit. The wait is capped at PUBLIC_IP_TIMEOUT_SECONDS.
+
+    Raises:
+        ValidationError: The first service's error, if every service fails
+    """
+    results: queue.Queue[tuple[str, str | None, ValidationError | None]] = queue.Queue()
+
+    def fetch(url: str) -> None:
+        try:
+            results.put((url, _fetch_public_ip(url), None))
+        except ValidationError as e:
+            results.put((url, None, e))
+        except Exception as e:
+            results.put((url, None, ValidationError(f"Failed to retrieve public IP address: {e}")))
+
+    for url in urls:
+        threading.Thread(target=fetch, args=(url,), name="public-ip", daemon=True).start()
+
+    errors: dict[str, ValidationError] = {}
+    deadline = time.monotonic() + PUBLIC_IP_TIMEOUT_SECONDS
+    while len(errors) < len(urls):
+        try:
+            url, ip, error = results.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            raise ValidationError("Timeout while retrieving public IP address")
+        if ip is not None:
+            return ip
+        if error is not None:
+            errors[url] = error
+    raise next(errors[url] for url in urls if url in errors)
+
+
+def get_public_ip_cache_path() -> Path:
+    """Get the path to the public IP cache file.
+
+    Returns:
+        Path to ~/.config/remote.py/public_ip.json
+    """
+    return Settings.get_config_path().parent / PUBLIC_IP_CACHE_FILE_NAME
+
+
+def get_public_ip_cache_ttl() -> int:
+    """Get the configured public IP cache TTL in seconds.
+
+    Returns:
+        TTL in seconds from the ``public_ip_cache_ttl`` config key, or the
+        default if unset or invalid. 0 means the cache is disabled.
+    """
+    return get_seconds_value("public_ip_cache_ttl")
+
+
+def _read_cached_public_ip() -> str | None:
+    """Return the cached public IP if it is younger than the cache TTL."""
+    ttl = get_public_ip_cache_ttl()
+    if ttl <= 0:
+        return None
+    try:
+        with open(get_public_ip_cache_path()) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    ip, fetched_at = data.get("ip"), data.get("fetched_at")
+    if not isinstance(ip, str) or not isinstance(fetched_at, int | float):
+        return None
+    age = time.time() - fetched_at
+    if age < 0 or age > ttl:
+        return None
+    logger.debug(f"Using cached public IP ({age:.0f}s old)")
+    return ip
+
+
+def _store_cached_public_ip(ip: str) -> None:
+    """Write the public IP cache atomically; failures only disable caching."""
+    if get_public_ip_cache_ttl() <= 0:
+        return
+    cache_path = get_public_ip_cache_path()
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump({"ip": ip, "fetched_at": time.time()}, f)
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+    except OSError as e:
+        logger.warning(f"Could not save public IP cache: {e}")
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def get_public_ip(refresh: bool = False) -> str:
+    """Get the current user's public IP address.
+
+    A recently discovered IP is reused from an on-disk cache (for
+    public_ip_cache_ttl seconds), so repeated sg commands don't each make
+    an HTTP request. Otherwise several IP echo services (AWS checkip first)
+    are queried concurrently and the first valid answer wins.
+
+    Args:
+        refresh: If True, ignore the cache and query the services
+
+    Returns:
+        The public IP address as a string (e.g., "203.0.113.1")
+
+    Raises:
+        ValidationError: If unable to retrieve the public IP address
+    """
+    if not refresh:
+        cached = _read_cached_public_ip()
+        if cached:
+            return cached
+
+    ip = _race_public_ip()
+    _store_cached_public_ip(ip)
+    return ip
+
 
 def get_instance_security_groups(instance_id: str) -> list[dict[str, Any]]:
     """Get the security groups attached to an instance.
@@ -183,11 +346,269 @@ def get_security_group_rules(security_group_id: str) -> list[dict[str, Any]]:
     return [dict(p) for p in permissions]
 
 
+@dataclass(frozen=True)
+class CidrRule:
+    """One CIDR block of an inbound rule, attributed to its security group."""
+
+    group_id: str
+    group_name: str
+    protocol: str
+    from_port: int
+    to_port: int
+    cidr: str
+    description: str
+
+    @property
+    def port_display(self) -> str:
+        """Port or port range as shown in tables (e.g. "22", "8000-8100" or "all")."""
+        if self.protocol == "-1":
+            return "all"
+        if self.from_port == self.to_port:
+            return str(self.from_port)
+        return f"{self.from_port}-{self.to_port}"
+
+
+@dataclass
+class SecurityGroupRuleIndex:
+    """In-memory index of the inbound CIDR rules of one or more security groups.
+
+    Single-port TCP (and all-protocol) rules are indexed by port and by
+    (port, CIDR), so port filters and rule existence checks are dictionary
+    lookups. Port-range rules are kept aside and checked separately; groups
+    rarely have more than a handful of them.
+    """
+
+    rules: list[CidrRule] = field(default_factory=list)
+    _by_port: dict[int, list[CidrRule]] = field(default_factory=dict, repr=False)
+    _by_port_cidr: dict[tuple[int, str], CidrRule] = field(default_factory=dict, repr=False)
+    _ranges: list[CidrRule] = field(default_factory=list, repr=False)
+
+    def add(self, rule: CidrRule) -> None:
+        """Add a rule, keeping rules in insertion order."""
+        self.rules.append(rule)
+        if rule.protocol not in ("tcp", "-1"):
+            return
+        if rule.from_port == rule.to_port:
+            self._by_port.setdefault(rule.from_port, []).append(rule)
+            # The first group (in attachment order) wins, as in a sequential scan
+            self._by_port_cidr.setdefault((rule.from_port, rule.cidr), rule)
+        else:
+            self._ranges.append(rule)
+
+    def rules_for_port(self, port: int) -> list[CidrRule]:
+        """Get the TCP rules that allow traffic on a port."""
+        return self._by_port.get(port, []) + [
+            rule for rule in self._ranges if rule.from_port <= port <= rule.to_port
+        ]
+
+    def find(self, cidr: str, port: int) -> CidrRule | None:
+        """Find the rule allowing exactly this CIDR on a port, if any."""
+        rule = self._by_port_cidr.get((port, cidr))
+        if rule:
+            return rule
+        for rule in self._ranges:
+            if rule.cidr == cidr and rule.from_port <= port <= rule.to_port:
+                return rule
+        return None
+
+
+def load_security_group_rules(security_groups: list[dict[str, Any]]) -> SecurityGroupRuleIndex:
+    """Load the inbound rules of several security groups with one API call.
+
+    All groups are described in a single describe_security_groups request,
+    and their CIDR rules are indexed in the order the groups are given.
+
+    Args:
+        security_groups: Dicts with 'GroupId' and 'GroupName' keys, as returned
+            by get_instance_security_groups()
+
+    Returns:
+        An index of the groups' inbound CIDR rules
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    details = {
+        sg["GroupId"]: sg
+        for sg in get_security_group_details([sg["GroupId"] for sg in security_groups])
+    }
+    index = SecurityGroupRuleIndex()
+    for sg in security_groups:
+        permissions = details.get(sg["GroupId"], {}).get("IpPermissions", [])
+        for rule in _cidr_rules(sg["GroupId"], sg["GroupName"], permissions):
+            index.add(rule)
+    return index
+
+
+def _cidr_rules(
+    group_id: str, group_name: str, permissions: list[dict[str, Any]]
+) -> Iterator[CidrRule]:
+    """Flatten a group's IpPermissions into one CidrRule per IPv4 or IPv6 range.
+
+    All-traffic ("-1") permissions and permissions without ports cover every
+    port, so they get the ALL_PORTS range.
+    """
+    for permission in permissions:
+        protocol = permission.get("IpProtocol", "tcp")
+        if protocol == "-1" or "FromPort" not in permission:
+            from_port, to_port = ALL_PORTS
+        else:
+            from_port, to_port = permission["FromPort"], permission.get("ToPort", 0)
+        ranges = [(r.get("CidrIp", ""), r) for r in permission.get("IpRanges", [])]
+        ranges += [(r.get("CidrIpv6", ""), r) for r in permission.get("Ipv6Ranges", [])]
+        for cidr, ip_range in ranges:
+            if cidr:
+                yield CidrRule(
+                    group_id=group_id,
+                    group_name=group_name,
+                    protocol=protocol,
+                    from_port=from_port,
+                    to_port=to_port,
+                    cidr=cidr,
+                    description=ip_range.get("Description", "-"),
+                )
+
+
+def describe_all_security_groups() -> list[dict[str, Any]]:
+    """Describe every security group in the region with one paginated sweep.
+
+    Returns:
+        All security group dictionaries, including their IpPermissions
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    groups: list[dict[str, Any]] = []
+    with handle_aws_errors("EC2", "describe_security_groups"):
+        paginator = get_ec2_client().get_paginator("describe_security_groups")
+        for page in paginator.paginate():
+            groups.extend(dict(sg) for sg in page.get("SecurityGroups", []))
+    return groups
+
+
+def _port_range(rule: CidrRule) -> tuple[int, int]:
+    """Ports a rule applies to; all-traffic ("-1") rules cover every port."""
+    if rule.protocol == "-1":
+        return ALL_PORTS
+    return rule.from_port, rule.to_port
+
+
+class PortIntervalIndex:
+    """Sorted interval index over rule port ranges.
+
+    Rules are sorted by their first port. A query for one port bisects to
+    the rules starting no more than the widest range below it, so lookups
+    touch only the rules that could cover the port.
+    """
+
+    def __init__(self, rules: list[CidrRule]) -> None:
+        entries = sorted(((*_port_range(rule), rule) for rule in rules), key=lambda e: e[:2])
+        self._entries = entries
+        self._starts = [start for start, _, _ in entries]
+        self._max_span = max((end - start for start, end, _ in entries), default=0)
+
+    def covering(self, port: int) -> list[CidrRule]:
+        """Get the rules whose port range includes a port."""
+        lo = bisect.bisect_left(self._starts, port - self._max_span)
+        hi = bisect.bisect_right(self._starts, port)
+        return [rule for _, end, rule in self._entries[lo:hi] if end >= port]
+
+
+@dataclass
+class AuditReport:
+    """Findings of a security group audit."""
+
+    group_count: int = 0
+    rule_count: int = 0
+    world_open: list[CidrRule] = field(default_factory=list)
+    stale: list[CidrRule] = field(default_factory=list)
+    overlaps: list[tuple[CidrRule, CidrRule]] = field(default_factory=list)
+
+    @property
+    def issue_count(self) -> int:
+        """Total number of findings."""
+        return len(self.world_open) + len(self.stale) + len(self.overlaps)
+
+
+def _find_overlaps(rules: list[CidrRule]) -> list[tuple[CidrRule, CidrRule]]:
+    """Find pairs of rules in one group whose ports and CIDR blocks overlap.
+
+    Rules are swept in port order, comparing each rule only with the rules
+    whose port range is still open at its first port.
+    """
+    overlaps = []
+    active: list[tuple[int, CidrRule, ipaddress.IPv4Network | ipaddress.IPv6Network]] = []
+    for rule in sorted(rules, key=_port_range):
+        start, end = _port_range(rule)
+        try:
+            network = ipaddress.ip_network(rule.cidr, strict=False)
+        except ValueError:
+            continue
+        active = [entry for entry in active if entry[0] >= start]
+        for _, other, other_network in active:
+            same_protocol = rule.protocol == other.protocol or "-1" in (
+                rule.protocol,
+                other.protocol,
+            )
+            if same_protocol and network.overlaps(other_network):
+                overlaps.append((other, rule))
+        active.append((end, rule, network))
+    return overlaps
+
+
+def audit_security_groups(
+    security_groups: list[dict[str, Any]],
+    current_ip: str | None = None,
+    ports: list[int] | None = None,
+) -> AuditReport:
+    """Audit security group rules for world-open ports, stale IPs and overlaps.
+
+    Works entirely on already-described groups, so auditing costs no API
+    calls beyond the describe sweep.
+
+    Args:
+        security_groups: Security group dictionaries from describe_security_groups
+        current_ip: Current public IP. /32 rules added by remote.py for any
+            other address are reported as stale. None skips the stale check.
+        ports: Only report rules covering these ports (None audits every rule)
+
+    Returns:
+        The audit findings
+    """
+    report = AuditReport(group_count=len(security_groups))
+    current_cidr = f"{current_ip}/32" if current_ip else None
+
+    for sg in security_groups:
+        rules = list(
+            _cidr_rules(sg["GroupId"], sg.get("GroupName", "-"), sg.get("IpPermissions", []))
+        )
+        report.rule_count += len(rules)
+        if ports is not None:
+            index = PortIntervalIndex(rules)
+            wanted = {rule for port in ports for rule in index.covering(port)}
+            rules = [rule for rule in rules if rule in wanted]
+
+        for rule in rules:
+            if rule.cidr in (WORLD_CIDR, WORLD_CIDR_V6):
+                report.world_open.append(rule)
+            elif (
+                current_cidr
+                and rule.cidr.endswith("/32")
+                and rule.description == REMOTEPY_RULE_DESCRIPTION
+                and rule.cidr != current_cidr
+            ):
+                report.stale.append(rule)
+
+        report.overlaps.extend(_find_overlaps(rules))
+
+    return report
+
+
 def add_ip_to_security_group(
     security_group_id: str,
     ip_address: str,
     port: int = SSH_PORT,
-    description: str = "Added by remote.py",
+    description: str = REMOTEPY_RULE_DESCRIPTION,
 ) -> None:
     """Add an IP address to a security group's inbound rules.
 
@@ -217,6 +638,75 @@ def add_ip_to_security_group(
         )
 
 
+def _tcp_permission(
+    port: int, cidrs: list[str], description: str | None = None
+) -> "IpPermissionTypeDef":
+    """Build a single-port TCP IpPermissions entry for one or more CIDR blocks."""
+    ip_ranges: list[IpRangeTypeDef] = []
+    for cidr in cidrs:
+        ip_range: IpRangeTypeDef = {"CidrIp": cidr}
+        if description is not None:
+            ip_range["Description"] = description
+        ip_ranges.append(ip_range)
+    return {"IpProtocol": "tcp", "FromPort": port, "ToPort": port, "IpRanges": ip_ranges}
+
+
+def add_ip_to_security_group_ports(
+    security_group_id: str,
+    ip_address: str,
+    ports: list[int],
+    description: str = REMOTEPY_RULE_DESCRIPTION,
+) -> list[int]:
+    """Add an IP address to a security group on several ports in one API call.
+
+    All ports are authorized with a single authorize_security_group_ingress
+    request. AWS rejects the whole request if any rule already exists, so on
+    failure each port is retried on its own and existing rules are skipped.
+
+    Args:
+        security_group_id: The security group ID
+        ip_address: The IP address or CIDR block to add
+        ports: The ports to allow
+        description: Description for the rules
+
+    Returns:
+        The ports a rule was added for (ports that already had one are left out)
+
+    Raises:
+        AWSServiceError: If AWS API call fails for a reason other than a duplicate rule
+    """
+    if len(ports) == 1:
+        try:
+            add_ip_to_security_group(security_group_id, ip_address, ports[0], description)
+        except AWSServiceError as e:
+            if "InvalidPermission.Duplicate" in str(e):
+                return []
+            raise
+        return list(ports)
+
+    cidr = ip_address if "/" in ip_address else f"{ip_address}/32"
+    try:
+        with handle_aws_errors("EC2", "authorize_security_group_ingress"):
+            get_ec2_client().authorize_security_group_ingress(
+                GroupId=security_group_id,
+                IpPermissions=[_tcp_permission(port, [cidr], description) for port in ports],
+            )
+        return list(ports)
+    except AWSServiceError:
+        pass
+
+    # Fall back to one request per port so existing rules don't block the rest
+    added = []
+    for port in ports:
+        try:
+            add_ip_to_security_group(security_group_id, ip_address, port, description)
+            added.append(port)
+        except AWSServiceError as e:
+            if "InvalidPermission.Duplicate" not in str(e):
+                raise
+    return added
+
+
 def remove_ip_from_security_group(
     security_group_id: str,
     ip_address: str,
@@ -281,42 +771,85 @@ get_ssh_ip_rules = get_ip_rules_for_port
 
 
 def clear_port_rules(
-    security_group_id: str, port: int = SSH_PORT, exclude_ip: str | None = None
+    security_group_id: str,
+    port: int = SSH_PORT,
+    exclude_ip: str | None = None,
+    ports: list[int] | None = None,
 ) -> int:
     """Remove all IP rules for a given port from a security group.
 
+    Every CIDR in a TCP or all-traffic rule covering a port is revoked for
+    that port with one revoke_security_group_ingress call. Wider rules can't
+    be revoked port by port, so AWS reports them back as unknown and they are
+    not counted. If the call fails, rules are revoked one at a time and
+    failures are skipped, so one stale or already-removed rule doesn't block
+    the rest.
+
     Args:
         security_group_id: The security group ID
-        port: The port to clear rules for (default: 22 for SSH)
+        port: The port to clear rules for (default: 22 for SSH). Used when ports is None.
         exclude_ip: Optional IP to exclude from clearing (with or without /32 suffix)
+        ports: Optional list of ports to clear in the same request. Overrides port.
 
     Returns:
         Number of rules removed
     """
     rules = get_security_group_rules(security_group_id)
-    removed_count = 0
+    port_list = ports if ports else [port]
 
     # Normalize exclude_ip to CIDR format
     exclude_cidr = None
     if exclude_ip:
         exclude_cidr = exclude_ip if "/" in exclude_ip else f"{exclude_ip}/32"
 
+    cidrs_by_port: dict[int, list[str]] = {}
     for rule in rules:
-        from_port = rule.get("FromPort", 0)
-        to_port = rule.get("ToPort", 0)
-
-        if from_port <= port <= to_port and rule.get("IpProtocol") in ("tcp", "-1"):
+        protocol = rule.get("IpProtocol")
+        if protocol == "-1":
+            from_port, to_port = ALL_PORTS
+        elif protocol == "tcp":
+            from_port, to_port = rule.get("FromPort", 0), rule.get("ToPort", 0)
+        else:
+            continue
+        for rule_port in port_list:
+            if not from_port <= rule_port <= to_port:
+                continue
             for ip_range in rule.get("IpRanges", []):
                 cidr = ip_range.get("CidrIp", "")
-                if cidr and cidr != exclude_cidr:
-                    # Extract IP from CIDR
-                    ip = cidr.split("/")[0]
-                    try:
-                        remove_ip_from_security_group(security_group_id, ip, port)
-                        removed_count += 1
-                    except AWSServiceError:
-                        # Rule might have already been removed or have different structure
-                        pass
+                if not cidr or cidr == exclude_cidr:
+                    continue
+                cidrs = cidrs_by_port.setdefault(rule_port, [])
+                if cidr not in cidrs:
+                    cidrs.append(cidr)
+
+    requested = sum(len(cidrs) for cidrs in cidrs_by_port.values())
+    if not requested:
+        return 0
+
+    try:
+        with handle_aws_errors("EC2", "revoke_security_group_ingress"):
+            response = get_ec2_client().revoke_security_group_ingress(
+                GroupId=security_group_id,
+                IpPermissions=[_tcp_permission(p, cidrs) for p, cidrs in cidrs_by_port.items()],
+            )
+        # Rules that no longer existed are reported back rather than failing the call
+        unknown = sum(
+            len(permission.get("IpRanges", []))
+            for permission in response.get("UnknownIpPermissions", [])
+        )
+        return requested - unknown
+    except AWSServiceError:
+        pass
+
+    removed_count = 0
+    for p, cidrs in cidrs_by_port.items():
+        for cidr in cidrs:
+            try:
+                remove_ip_from_security_group(security_group_id, cidr.split("/")[0], p)
+                removed_count += 1
+            except AWSServiceError:
+                # Rule might have already been removed or have different structure
+                pass
 
     return removed_count
 
@@ -341,7 +874,8 @@ def whitelist_ip_for_instance(
     Args:
         instance_id: The EC2 instance ID
         instance_name: The instance name (used for managed SG naming)
-        ip_address: The IP to whitelist (defaults to current public IP)
+        ip_address: The IP to whitelist (defaults to current public IP, looked up
+            afresh when exclusive is set)
         exclusive: If True, remove all other IPs before adding
         port: The port to whitelist (default: 22 for SSH). Used when ports is None.
         ports: Optional list of ports to whitelist across. Overrides port parameter.
@@ -353,35 +887,28 @@ def whitelist_ip_for_instance(
         ValidationError: If IP retrieval fails
         AWSServiceError: If AWS API call fails
     """
-    # Get the IP to whitelist
+    # Get the IP to whitelist; --exclusive revokes every other IP, so it
+    # must not act on a cached address from before a network change
     if ip_address is None:
-        ip_address = get_public_ip()
+        ip_address = get_public_ip(refresh=exclusive)
 
     # Determine the port list
     port_list = ports if ports else [port]
 
     # Target the remotepy-managed SG
     sg_id = find_or_create_remotepy_sg(instance_name, instance_id)
-    modified = False
 
-    for p in port_list:
-        # Pre-check: does the rule already exist in ANY SG?
-        existing = check_existing_rule(instance_id, ip_address, p)
-        if existing:
-            continue  # Already whitelisted somewhere
+    # Pre-check: skip ports the IP already has access to in ANY SG
+    index = load_instance_rules(instance_id)
+    pending = [
+        p for p in port_list if not check_existing_rule(instance_id, ip_address, p, index=index)
+    ]
 
-        # If exclusive, clear existing rules in the target SG first
-        if exclusive:
-            clear_port_rules(sg_id, p, exclude_ip=ip_address)
+    # If exclusive, clear existing rules in the target SG first
+    if exclusive and pending:
+        clear_port_rules(sg_id, exclude_ip=ip_address, ports=pending)
 
-        # Add the IP
-        try:
-            add_ip_to_security_group(sg_id, ip_address, p)
-            modified = True
-        except AWSServiceError as e:
-            if "InvalidPermission.Duplicate" in str(e):
-                continue
-            raise
+    modified = bool(pending) and bool(add_ip_to_security_group_ports(sg_id, ip_address, pending))
 
     modified_groups = [sg_id] if modified else []
     return ip_address, modified_groups
@@ -573,25 +1100,57 @@ def find_or_create_remotepy_sg(instance_name: str, instance_id: str) -> str:
     return sg_id
 
 
-def check_existing_rule(instance_id: str, ip_address: str, port: int) -> dict[str, str] | None:
+def load_instance_rules(instance_id: str) -> SecurityGroupRuleIndex:
+    """Load the inbound rules of every SG attached to an instance.
+
+    Costs one describe_instances and one describe_security_groups call.
+    Load once per command and pass the index to check_existing_rule() for
+    each port.
+
+    Args:
+        instance_id: The EC2 instance ID
+
+    Returns:
+        An index of the attached groups' inbound CIDR rules (empty if none)
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    security_groups = get_instance_security_groups(instance_id)
+    if not security_groups:
+        return SecurityGroupRuleIndex()
+    return load_security_group_rules(security_groups)
+
+
+def check_existing_rule(
+    instance_id: str,
+    ip_address: str,
+    port: int,
+    index: SecurityGroupRuleIndex | None = None,
+) -> dict[str, str] | None:
     """Check all SGs on an instance for an existing matching rule (same IP+port).
 
+    The rules of every attached SG are looked up in a port/CIDR index. Pass
+    an index from load_instance_rules() when checking several ports, so the
+    rules are only loaded once.
+
     Args:
         instance_id: The EC2 instance ID
         ip_address: The IP address or CIDR to check
         port: The port to check
+        index: Prebuilt rule index for the instance; loaded if omitted
 
     Returns:
         Dict with 'GroupId' and 'GroupName' of the SG where the rule exists,
         or None if not found in any SG.
     """
     cidr = ip_address if "/" in ip_address else f"{ip_address}/32"
-    security_groups = get_instance_security_groups(instance_id)
+    if index is None:
+        index = load_instance_rules(instance_id)
 
-    for sg in security_groups:
-        existing_ips = get_ip_rules_for_port(sg["GroupId"], port)
-        if cidr in existing_ips:
-            return {"GroupId": sg["GroupId"], "GroupName": sg["GroupName"]}
+    rule = index.find(cidr, port)
+    if rule:
+        return {"GroupId": rule.group_id, "GroupName": rule.group_name}
 
     return None
 
@@ -660,6 +1219,12 @@ def add_ip(
         "-y",
         help="Skip confirmation prompt for --exclusive",
     ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        "-r",
+        help="Ignore the cached public IP and ask the IP echo services again",
+    ),
 ) -> None:
     """
     Add an IP address to an instance's security group.
@@ -674,7 +1239,9 @@ def add_ip(
     Before adding, all security groups are checked for existing matching
     rules to avoid duplicates.
 
-    If no IP is specified, your current public IP address is used.
+    If no IP is specified, your current public IP address is used. It is
+    reused from the last few minutes unless --refresh is given; --exclusive
+    always looks it up afresh, so a stale IP never replaces your real one.
     Use --exclusive to remove all other IPs from the target SG first.
 
     Examples:
@@ -684,6 +1251,7 @@ def add_ip(
         remote sg add --port 443 --ip 1.2.3.4                 # Allow HTTPS from specific IP
         remote sg add --port 22 --port 22000                   # Multiple ports
         remote sg add --sg sg-12345                            # Target specific SG
+        remote sg add --refresh                                # Re-detect your IP first
     """
     instance_name, instance_id = resolve_instance_or_exit(instance_name)
 
@@ -693,7 +1261,8 @@ def add_ip(
     # Get the IP to whitelist
     if ip_address is None:
         print_info("Retrieving your public IP address...")
-        ip_address = get_public_ip()
+        # --exclusive revokes every other IP, so never trust a cached address for it
+        ip_address = get_public_ip(refresh=refresh or exclusive)
         print_info(f"Your public IP: {ip_address}")
     else:
         # Validate and sanitize the provided IP
@@ -722,46 +1291,52 @@ def add_ip(
         target_sg_id = find_or_create_remotepy_sg(instance_name, instance_id)
         target_sg_name = f"remotepy-{instance_name}"
 
-    added_count = 0
+    # Pre-check: skip ports this IP can already reach through ANY SG
+    pending_ports = []
+    index = load_instance_rules(instance_id)
     for port in resolved_ports:
-        # Pre-check: does this rule already exist in ANY SG?
-        existing = check_existing_rule(instance_id, ip_address, port)
+        existing = check_existing_rule(instance_id, ip_address, port, index=index)
         if existing:
             print_info(
                 f"{ip_address} already has access to port {port} (via '{existing['GroupName']}')"
             )
-            continue
+        else:
+            pending_ports.append(port)
 
+    added_ports: list[int] = []
+    if pending_ports:
         if exclusive:
-            removed = clear_port_rules(target_sg_id, port, exclude_ip=ip_address)
+            removed = clear_port_rules(target_sg_id, exclude_ip=ip_address, ports=pending_ports)
             if removed > 0:
+                port_text = ", ".join(str(p) for p in pending_ports)
                 print_warning(
-                    f"Removed {removed} existing IP rule(s) from {target_sg_name} on port {port}"
+                    f"Removed {removed} existing IP rule(s) from {target_sg_name} "
+                    f"on port {port_text}"
                 )
 
-        try:
-            add_ip_to_security_group(target_sg_id, ip_address, port, "Added by remote.py")
+        # All pending ports are authorized in one request
+        added_ports = add_ip_to_security_group_ports(
+            target_sg_id, ip_address, pending_ports, REMOTEPY_RULE_DESCRIPTION
+        )
+
+    ip_cidr = ip_address if "/" in ip_address else f"{ip_address}/32"
+    for port in pending_ports:
+        if port in added_ports:
             print_success(f"Allowed {ip_address} on port {port}")
-            added_count += 1
-        except AWSServiceError as e:
-            if "InvalidPermission.Duplicate" in str(e):
-                print_info(
-                    f"{ip_address} already has access to port {port} (via '{target_sg_name}')"
-                )
-            else:
-                raise
+        else:
+            print_info(f"{ip_address} already has access to port {port} (via '{target_sg_name}')")
 
         # Stale rule nudge: check if other IPs exist on this port in the target SG
-        other_ips = get_ip_rules_for_port(target_sg_id, port)
-        ip_cidr = ip_address if "/" in ip_address else f"{ip_address}/32"
-        other_count = sum(1 for ip in other_ips if ip != ip_cidr)
-        if other_count > 0 and not exclusive:
-            print_info(
-                f"Note: {other_count} other IP(s) have access on port {port}. "
-                f"Use --exclusive to keep only yours."
-            )
+        if not exclusive:
+            other_ips = get_ip_rules_for_port(target_sg_id, port)
+            other_count = sum(1 for ip in other_ips if ip != ip_cidr)
+            if other_count > 0:
+                print_info(
+                    f"Note: {other_count} other IP(s) have access on port {port}. "
+                    f"Use --exclusive to keep only yours."
+                )
 
-    if added_count == 0:
+    if not added_ports:
         print_info("No changes needed")
 
 
@@ -793,6 +1368,12 @@ def remove_ip(
         "-y",
         help="Skip confirmation prompt",
     ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        "-r",
+        help="Ignore the cached public IP and ask the IP echo services again",
+    ),
 ) -> None:
     """
     Remove an IP address from an instance's security groups.
@@ -801,7 +1382,8 @@ def remove_ip(
     and removes them, reporting which SGs were affected. Use --sg to only
     remove from a specific security group.
 
-    If no IP is specified, your current public IP address is used.
+    If no IP is specified, your current public IP address is used (reused
+    from the last few minutes unless --refresh is given).
 
     Examples:
         remote sg remove my-instance                 # Remove your current IP from SSH
@@ -809,6 +1391,7 @@ def remove_ip(
         remote sg remove --port 443 --ip 1.2.3.4    # Remove HTTPS access
         remote sg remove --port 22 --port 22000       # Remove from multiple ports
         remote sg remove --sg sg-12345               # Only remove from specific SG
+        remote sg remove --refresh                   # Re-detect your IP first
     """
     instance_name, instance_id = resolve_instance_or_exit(instance_name)
 
@@ -818,7 +1401,7 @@ def remove_ip(
     # Get the IP to remove
     if ip_address is None:
         print_info("Retrieving your public IP address...")
-        ip_address = get_public_ip()
+        ip_address = get_public_ip(refresh=refresh)
         print_info(f"Your public IP: {ip_address}")
     else:
         ip_address = sanitize_input(ip_address)
@@ -933,39 +1516,25 @@ def list_ips(
         styled_column("Description"),
     ]
 
-    rows: list[list[str]] = []
-
-    for sg_info in security_groups:
-        sg_id = sg_info["GroupId"]
-        sg_name = sg_info["GroupName"]
-
-        rules = get_security_group_rules(sg_id)
-
-        for rule in rules:
-            from_port = rule.get("FromPort", 0)
-            to_port = rule.get("ToPort", 0)
-            protocol = rule.get("IpProtocol", "tcp")
-
-            # Filter by port if specified
-            if resolved_ports is not None:
-                match = False
-                for p in resolved_ports:
-                    if from_port <= p <= to_port and protocol in ("tcp", "-1"):
-                        match = True
-                        break
-                if not match:
-                    continue
-
-            for ip_range in rule.get("IpRanges", []):
-                cidr = ip_range.get("CidrIp", "")
-                description = ip_range.get("Description", "-")
-                if cidr:
-                    if from_port == to_port:
-                        port_display = str(from_port)
-                    else:
-                        port_display = f"{from_port}-{to_port}"
-
-                    rows.append([sg_name, sg_id, port_display, protocol, cidr, description])
+    # Rules of every group come from one describe call
+    index = load_security_group_rules(security_groups)
+    if resolved_ports is None:
+        matched = index.rules
+    else:
+        wanted = {rule for port in resolved_ports for rule in index.rules_for_port(port)}
+        matched = [rule for rule in index.rules if rule in wanted]
+
+    rows = [
+        [
+            rule.group_name,
+            rule.group_id,
+            rule.port_display,
+            rule.protocol,
+            rule.cidr,
+            rule.description,
+        ]
+        for rule in matched
+    ]
 
     if not rows:
         if resolved_ports:
@@ -1039,20 +1608,132 @@ def list_sgs(
     console.print(create_table(f"Security Groups for '{instance_name}'", columns, rows))
 
 
+@app.command("audit")
+@handle_cli_errors
+def audit(
+    ports: list[str] | None = typer.Option(
+        None,
+        "--port",
+        "-p",
+        help="Only audit rules covering these port(s). Repeatable.",
+    ),
+    ip_address: str | None = typer.Option(
+        None,
+        "--ip",
+        "-i",
+        help="Your current IP for the stale rule check (defaults to your public IP)",
+    ),
+    skip_stale: bool = typer.Option(
+        False,
+        "--skip-stale",
+        help="Skip the stale IP check (no public IP lookup)",
+    ),
+) -> None:
+    """
+    Audit every security group in the region.
+
+    Describes all security groups in one paginated sweep and reports:
+    rules open to the world (0.0.0.0/0 or ::/0), /32 rules added by remote.py for
+    IPs other than yours (stale home IPs), and rules in the same group whose
+    ports and CIDR blocks overlap.
+
+    Examples:
+        remote sg audit                     # Audit all rules
+        remote sg audit --port 22           # Only rules covering SSH
+        remote sg audit --ip 203.0.113.1    # Compare against a specific IP
+        remote sg audit --skip-stale        # Skip the public IP lookup
+    """
+    resolved_ports = [resolve_port(p) for p in ports] if ports else None
+
+    current_ip = None
+    if not skip_stale:
+        if ip_address is not None:
+            ip_address = sanitize_input(ip_address)
+            if not ip_address:
+                print_error("IP address cannot be empty")
+                raise typer.Exit(1)
+            current_ip = ip_address.split("/")[0]
+        else:
+            try:
+                current_ip = get_public_ip()
+            except ValidationError as e:
+                print_warning(f"Skipping stale IP check: {e}")
+
+    report = audit_security_groups(describe_all_security_groups(), current_ip, resolved_ports)
+
+    if report.world_open:
+        rows = [
+            [r.group_name, r.group_id, r.port_display, r.protocol, r.description]
+            for r in report.world_open
+        ]
+        columns = [
+            styled_column("Security Group", "name"),
+            styled_column("Group ID", "id"),
+            styled_column("Port", "numeric"),
+            styled_column("Protocol"),
+            styled_column("Description"),
+        ]
+        console.print(create_table("Open to the World (0.0.0.0/0, ::/0)", columns, rows))
+
+    if report.stale:
+        rows = [
+            [r.group_name, r.group_id, r.port_display, r.protocol, r.cidr] for r in report.stale
+        ]
+        columns = [
+            styled_column("Security Group", "name"),
+            styled_column("Group ID", "id"),
+            styled_column("Port", "numeric"),
+            styled_column("Protocol"),
+            styled_column("CIDR Block"),
+        ]
+        console.print(create_table(f"Stale IPs (current: {current_ip})", columns, rows))
+
+    if report.overlaps:
+        rows = [
+            [a.group_name, a.group_id, f"{a.port_display} {a.cidr}", f"{b.port_display} {b.cidr}"]
+            for a, b in report.overlaps
+        ]
+        columns = [
+            styled_column("Security Group", "name"),
+            styled_column("Group ID", "id"),
+            styled_column("Rule"),
+            styled_column("Overlaps"),
+        ]
+        console.print(create_table("Overlapping Rules", columns, rows))
+
+    summary = f"{report.group_count} security group(s), {report.rule_count} CIDR rule(s)"
+    if report.issue_count:
+        print_warning(
+            f"Found {len(report.world_open)} world-open, {len(report.stale)} stale and "
+            f"{len(report.overlaps)} overlapping rule(s) across {summary}"
+        )
+    else:
+        print_success(f"No issues found across {summary}")
+
+
 @app.command("my-ip")
 @handle_cli_errors
-def my_ip() -> None:
+def my_ip(
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        "-r",
+        help="Ignore the cached IP and ask the IP echo services again",
+    ),
+) -> None:
     """
     Display your current public IP address.
 
-    Uses AWS's checkip service to retrieve your public IP address.
+    Asks AWS's checkip service and fallback IP echo services concurrently,
+    reusing an IP discovered in the last few minutes unless --refresh is given.
     This is the IP that would be used when adding rules without specifying an IP.
 
     Examples:
         remote sg my-ip
+        remote sg my-ip --refresh
     """
     print_info("Retrieving your public IP address...")
-    ip = get_public_ip()
+    ip = get_public_ip(refresh=refresh)
     print_success(f"Your public IP: {ip}")
 
 
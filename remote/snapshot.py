@@ -1,5 +1,11 @@
+import re
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
 import typer
 
+from remote.exceptions import ValidationError
 from remote.instance_resolver import resolve_instance_or_exit
 from remote.utils import (
     confirm_action,
@@ -10,12 +16,16 @@ from remote.utils import (
     get_volume_ids,
     handle_aws_errors,
     handle_cli_errors,
+    parse_duration_to_minutes,
     print_success,
     print_warning,
     styled_column,
 )
 from remote.validation import validate_aws_response_structure, validate_volume_id
 
+if TYPE_CHECKING:
+    from mypy_boto3_ec2.type_defs import SnapshotTypeDef
+
 app = typer.Typer()
 
 
@@ -65,16 +75,91 @@ def create(
     print_success(f"Snapshot {snapshot['SnapshotId']} created")
 
 
+def _parse_since(since: str) -> datetime:
+    """Parse a --since bound into an aware UTC datetime.
+
+    Args:
+        since: An ISO date or timestamp ("2024-01-31", "2024-01-31T12:00"),
+            a number of days ("30d") or a duration ("12h", "1h30m")
+
+    Returns:
+        The earliest snapshot start time to include
+
+    Raises:
+        ValidationError: If the value is not in any of those formats
+    """
+    value = since.strip().lower()
+    days = re.fullmatch(r"(\d+)d", value)
+    if days:
+        return datetime.now(timezone.utc) - timedelta(days=int(days.group(1)))
+    try:
+        bound = datetime.fromisoformat(since.strip())
+    except ValueError:
+        try:
+            minutes = parse_duration_to_minutes(value)
+        except ValidationError:
+            raise ValidationError(
+                f"Invalid --since value: '{since}'. Use a date (2024-01-31), "
+                "days (30d) or a duration (12h, 1h30m)"
+            ) from None
+        return datetime.now(timezone.utc) - timedelta(minutes=minutes)
+    return bound if bound.tzinfo else bound.replace(tzinfo=timezone.utc)
+
+
+def iter_volume_snapshots(
+    volume_ids: list[str], since: datetime | None = None
+) -> Iterator["SnapshotTypeDef"]:
+    """Yield the snapshots of many volumes from one paginated describe_snapshots.
+
+    All volume IDs go into a single multi-value volume-id filter, so the
+    call count depends on the number of result pages, not volumes.
+
+    Args:
+        volume_ids: Volume IDs to list snapshots for
+        since: If given, skip snapshots started before this time. EC2 has no
+            range filter for snapshot start times, so this is applied per page.
+
+    Yields:
+        Snapshot dictionaries as returned by describe_snapshots
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    if not volume_ids:
+        return
+    with handle_aws_errors("EC2", "describe_snapshots"):
+        paginator = get_ec2_client().get_paginator("describe_snapshots")
+        for page in paginator.paginate(Filters=[{"Name": "volume-id", "Values": volume_ids}]):
+            validate_aws_response_structure(page, ["Snapshots"], "describe_snapshots")
+            for snapshot in page["Snapshots"]:
+                if since is None or snapshot["StartTime"] >= since:
+                    yield snapshot
+
+
 @app.command("ls")
 @app.command("list")
 @handle_cli_errors
-def list_snapshots(instance_name: str | None = typer.Argument(None, help="Instance name")) -> None:
+def list_snapshots(
+    instance_name: str | None = typer.Argument(None, help="Instance name"),
+    since: str | None = typer.Option(
+        None,
+        "--since",
+        "-s",
+        help="Only show snapshots started after a date (2024-01-31) or within a period (30d, 12h)",
+    ),
+) -> None:
     """
     List EBS snapshots for an instance.
 
     Shows snapshots for all volumes attached to the instance.
     Uses the default instance from config if no name is provided.
+
+    Examples:
+        remote snapshot list my-server
+        remote snapshot list my-server --since 30d
+        remote snapshot list --since 2024-01-01
     """
+    since_bound = _parse_since(since) if since else None
     instance_name, instance_id = resolve_instance_or_exit(instance_name)
 
     print_warning(f"Listing snapshots for instance {instance_name}")
@@ -88,25 +173,16 @@ def list_snapshots(instance_name: str | None = typer.Argument(None, help="Instan
         styled_column("Description"),
     ]
 
-    rows = []
-    for volume_id in volume_ids:
-        with handle_aws_errors("EC2", "describe_snapshots"):
-            snapshots = get_ec2_client().describe_snapshots(
-                Filters=[{"Name": "volume-id", "Values": [volume_id]}]
-            )
-            validate_aws_response_structure(snapshots, ["Snapshots"], "describe_snapshots")
-
-        for snapshot in snapshots["Snapshots"]:
+    def rows() -> Iterator[list[str]]:
+        for snapshot in iter_volume_snapshots(volume_ids, since_bound):
             state = snapshot["State"]
             state_style = get_status_style(state)
-            rows.append(
-                [
-                    snapshot["SnapshotId"],
-                    snapshot["VolumeId"],
-                    f"[{state_style}]{state}[/{state_style}]",
-                    str(snapshot["StartTime"]),
-                    snapshot.get("Description", ""),
-                ]
-            )
-
-    console.print(create_table("Snapshots", columns, rows))
+            yield [
+                snapshot["SnapshotId"],
+                snapshot["VolumeId"],
+                f"[{state_style}]{state}[/{state_style}]",
+                str(snapshot["StartTime"]),
+                snapshot.get("Description", ""),
+            ]
+
+    console.print(create_table("Snapshots", columns, rows()))
@@ -4,22 +4,41 @@ This module provides persistence for instance usage tracking, including:
 - Start/stop session recording
 - Cumulative uptime and cost calculation
 - Historical session data
+- Append-only event journal with periodic compaction into a snapshot
+- Advisory file locking so concurrent CLI processes never lose events
 """
 
 import json
 import logging
-from dataclasses import dataclass, field
+import os
+import sys
+import tempfile
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from remote.settings import SECONDS_PER_HOUR, Settings
+from remote.settings import SECONDS_PER_HOUR, TRACKING_JOURNAL_COMPACT_EVENTS, Settings
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+if TYPE_CHECKING:
+    from remote.tracking_sqlite import SQLiteTrackingManager
 
 logger = logging.getLogger(__name__)
 
 # Default tracking file path
 TRACKING_FILE_NAME = "tracking.json"
 
+# SQLite tracking database; when present it replaces the JSON backend
+TRACKING_DB_FILE_NAME = "tracking.db"
+
 
 def get_tracking_file_path() -> Path:
     """Get the path to the tracking JSON file.
@@ -31,6 +50,100 @@ def get_tracking_file_path() -> Path:
     return config_dir / TRACKING_FILE_NAME
 
 
+def get_tracking_db_path() -> Path:
+    """Get the path to the SQLite tracking database.
+
+    Returns:
+        Path to ~/.config/remote.py/tracking.db
+    """
+    return Settings.get_config_path().parent / TRACKING_DB_FILE_NAME
+
+
+def get_tracking_journal_path(tracking_file: Path) -> Path:
+    """Get the path to the event journal that accompanies a tracking file.
+
+    Args:
+        tracking_file: Path to the tracking snapshot file
+
+    Returns:
+        Path with the snapshot's suffix replaced by .journal
+    """
+    return tracking_file.with_suffix(".journal")
+
+
+def get_tracking_lock_path(tracking_file: Path) -> Path:
+    """Get the path to the lock file that serializes writers of a tracking file.
+
+    The lock lives in its own file because the snapshot and journal are
+    replaced by rename, which would silently drop a lock held on them.
+
+    Args:
+        tracking_file: Path to the tracking snapshot file
+
+    Returns:
+        Path with the snapshot's suffix replaced by .lock
+    """
+    return tracking_file.with_suffix(".lock")
+
+
+@contextmanager
+def _file_lock(lock_file: Path, exclusive: bool = True) -> Iterator[None]:
+    """Hold an advisory lock on lock_file for the duration of the block.
+
+    On POSIX this is flock(), shared or exclusive. Windows has no shared
+    mode, so msvcrt always takes an exclusive lock.
+
+    Args:
+        lock_file: Path to the lock file (created if missing)
+        exclusive: Whether to take an exclusive (writer) lock
+    """
+    with open(lock_file, "a+b") as f:
+        if sys.platform == "win32":
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10s; keep waiting like flock does
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _parse_journal_line(line: str) -> dict[str, Any]:
+    """Parse one journal line, returning an empty dict if it is malformed."""
+    try:
+        event = json.loads(line)
+    except json.JSONDecodeError:
+        return {}
+    return event if isinstance(event, dict) else {}
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    """Write a file via a temporary file and rename so readers never see partial data."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 @dataclass
 class UsageSession:
     """Represents a single usage session for an instance.
@@ -114,8 +227,21 @@ class InstanceTracking:
 class TrackingManager:
     """Manager for instance usage tracking persistence.
 
-    This class handles reading and writing the tracking.json file,
-    which stores cumulative usage data for EC2 instances.
+    Tracking data is stored as a snapshot (tracking.json) plus an append-only
+    journal of start/stop/clear events (tracking.journal). Each write appends
+    a single line to the journal, and loading replays the journal on top of
+    the snapshot. Once the journal grows past TRACKING_JOURNAL_COMPACT_EVENTS
+    it is compacted into a new snapshot.
+
+    The journal starts with a header naming the snapshot generation it
+    applies to, so a journal left over from an older snapshot (for example
+    after the snapshot was replaced externally) is ignored.
+
+    Writes are safe across processes: each mutation takes an exclusive lock
+    on tracking.lock, merges in any events other processes appended since
+    this manager last looked, applies its own event to the merged state and
+    appends it, all before releasing the lock. Loads take a shared lock so
+    they never see a snapshot and journal from different generations.
     """
 
     def __init__(self, tracking_file: Path | None = None) -> None:
@@ -126,7 +252,12 @@ class TrackingManager:
                 ~/.config/remote.py/tracking.json
         """
         self._tracking_file = tracking_file or get_tracking_file_path()
+        self._journal_file = get_tracking_journal_path(self._tracking_file)
+        self._lock_file = get_tracking_lock_path(self._tracking_file)
         self._data: dict[str, InstanceTracking] = {}
+        self._generation: str | None = None
+        self._journal_events = 0
+        self._journal_offset = 0
         self._loaded = False
 
     @property
@@ -134,6 +265,11 @@ class TrackingManager:
         """Get the tracking file path."""
         return self._tracking_file
 
+    @property
+    def journal_file(self) -> Path:
+        """Get the journal file path."""
+        return self._journal_file
+
     def _ensure_config_dir(self) -> None:
         """Ensure the config directory exists."""
         config_dir = self._tracking_file.parent
@@ -142,11 +278,55 @@ class TrackingManager:
             logger.debug(f"Created config directory: {config_dir}")
 
     def _load(self) -> None:
-        """Load tracking data from file."""
+        """Load the tracking snapshot and replay the journal on top of it."""
         if self._loaded:
             return
 
+        if self._lock_file.parent.exists():
+            with _file_lock(self._lock_file, exclusive=False):
+                self._read_from_disk()
+        else:
+            # Nothing has been written yet; don't create the directory just to read
+            self._read_from_disk()
+        self._loaded = True
+
+    @contextmanager
+    def _locked_update(self) -> Iterator[None]:
+        """Hold the writer lock with in-memory data merged from disk.
+
+        Everything done inside the block (applying an event, appending it,
+        compacting) is serialized against other processes, so a parallel
+        start/stop can never overwrite events it did not see.
+        """
+        self._ensure_config_dir()
+        with _file_lock(self._lock_file):
+            self._merge_from_disk()
+            yield
+
+    def _merge_from_disk(self) -> None:
+        """Bring in-memory data up to date with writes made by other processes.
+
+        When the journal still belongs to the loaded snapshot generation only
+        the bytes appended since the last read are replayed; otherwise
+        another process compacted in the meantime and everything is reloaded.
+        Must be called with the writer lock held.
+        """
+        if self._loaded and self._generation is not None:
+            events = self._read_journal_events()
+            if events is not None:
+                for event in events:
+                    self._apply_event(event)
+                    self._journal_events += 1
+                return
+        self._read_from_disk()
+        self._loaded = True
+
+    def _read_from_disk(self) -> None:
+        """Replace in-memory data with the snapshot plus its journal."""
         self._data = {}
+        self._generation = None
+        self._journal_events = 0
+        self._journal_offset = 0
         if self._tracking_file.exists():
             try:
                 with open(self._tracking_file) as f:
@@ -155,73 +335,158 @@ class TrackingManager:
                 instances_data = raw_data.get("instances", {})
                 for instance_id, instance_data in instances_data.items():
                     self._data[instance_id] = InstanceTracking.from_dict(instance_id, instance_data)
+                self._generation = raw_data.get("generation")
                 logger.debug(f"Loaded tracking data for {len(self._data)} instances")
-            except (json.JSONDecodeError, OSError) as e:
+            except (json.JSONDecodeError, OSError, AttributeError) as e:
                 logger.warning(f"Could not load tracking data: {e}")
                 self._data = {}
+                self._generation = None
 
-        self._loaded = True
+        self._replay_journal()
+
+    def _read_journal_events(self) -> list[dict[str, Any]] | None:
+        """Read journal events appended after the current journal offset.
+
+        Returns:
+            The new events (advancing the offset past them), or None if the
+            journal is missing, unreadable or belongs to another generation
+        """
+        try:
+            with open(self._journal_file, "rb") as f:
+                header = f.readline()
+                header_event = _parse_journal_line(header.decode("utf-8", errors="replace"))
+                if header_event.get("generation") != self._generation:
+                    return None
+                f.seek(max(self._journal_offset, len(header)))
+                content = f.read()
+                self._journal_offset = f.tell()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Could not read tracking journal: {e}")
+            return None
+
+        events = []
+        for line in content.decode("utf-8", errors="replace").splitlines():
+            event = _parse_journal_line(line)
+            if event:
+                events.append(event)
+            # else: skip a torn line left by an interrupted append
+        return events
+
+    def _replay_journal(self) -> None:
+        """Apply journal events written against the loaded snapshot generation."""
+        if self._generation is None:
+            return
+
+        events = self._read_journal_events()
+        if events is None:
+            logger.debug("Ignoring tracking journal from another snapshot generation")
+            return
+
+        for event in events:
+            self._apply_event(event)
+            self._journal_events += 1
+        logger.debug(f"Replayed {self._journal_events} tracking journal events")
 
     def _save(self) -> None:
-        """Save tracking data to file."""
+        """Compact all tracking data into a new snapshot and start a fresh journal.
+
+        The snapshot is written before the journal is reset, and both are
+        replaced atomically, so an interruption never loses recorded events:
+        a new snapshot with a stale journal simply ignores the stale journal.
+        Must be called with the writer lock held.
+        """
         self._ensure_config_dir()
 
+        generation = uuid.uuid4().hex
         data = {
+            "generation": generation,
             "instances": {
                 instance_id: tracking.to_dict() for instance_id, tracking in self._data.items()
-            }
+            },
         }
 
+        header = json.dumps({"generation": generation}) + "\n"
         try:
-            with open(self._tracking_file, "w") as f:
-                json.dump(data, f, indent=2)
+            _atomic_write(self._tracking_file, json.dumps(data, indent=2))
+            _atomic_write(self._journal_file, header)
+            self._generation = generation
+            self._journal_events = 0
+            self._journal_offset = len(header.encode())
             logger.debug(f"Saved tracking data for {len(self._data)} instances")
         except OSError as e:
             logger.warning(f"Could not save tracking data: {e}")
 
-    def reload(self) -> None:
-        """Force reload tracking data from file."""
-        self._loaded = False
-        self._load()
-
-    def get_instance_tracking(self, instance_id: str) -> InstanceTracking | None:
-        """Get tracking data for a specific instance.
+    def compact(self) -> None:
+        """Fold the journal into the snapshot."""
+        with self._locked_update():
+            self._save()
 
-        Args:
-            instance_id: The EC2 instance ID
+    def _append_event(self, event: dict[str, Any]) -> None:
+        """Persist one already-applied event by appending it to the journal.
 
-        Returns:
-            InstanceTracking data, or None if not tracked
+        Must be called with the writer lock held.
         """
-        self._load()
-        return self._data.get(instance_id)
+        self._append_events([event])
 
-    def get_all_tracking(self) -> dict[str, InstanceTracking]:
-        """Get tracking data for all instances.
+    def _append_events(self, events: list[dict[str, Any]]) -> None:
+        """Persist already-applied events with a single journal append.
 
-        Returns:
-            Dictionary mapping instance IDs to their tracking data
+        Must be called with the writer lock held.
         """
-        self._load()
-        return self._data.copy()
+        if not events:
+            return
+        if self._generation is None:
+            # No snapshot to anchor a journal to yet: write one (it includes these events)
+            self._save()
+            return
 
-    def record_start(self, instance_id: str, instance_name: str | None = None) -> UsageSession:
-        """Record an instance start event.
+        data = "".join(json.dumps(event) + "\n" for event in events).encode()
+        try:
+            with open(self._journal_file, "ab") as f:
+                f.write(data)
+            self._journal_events += len(events)
+            self._journal_offset += len(data)
+        except OSError as e:
+            logger.warning(f"Could not append to tracking journal: {e}")
+            return
 
-        If there's already an active session (no stop time), this will
-        complete that session first before starting a new one.
+        if self._journal_events >= TRACKING_JOURNAL_COMPACT_EVENTS:
+            self._save()
 
-        Args:
-            instance_id: The EC2 instance ID
-            instance_name: Optional instance name
+    def _apply_event(self, event: dict[str, Any]) -> UsageSession | None:
+        """Apply a journal event to the in-memory data.
+
+        Events with an unknown op or a missing instance ID or timestamp are
+        logged and skipped, so one bad line cannot break every later command.
 
         Returns:
-            The newly created UsageSession
+            The session started or stopped by the event, if any
         """
-        self._load()
+        op = event.get("op")
+        if op == "clear_all":
+            self._data = {}
+            return None
+
+        instance_id = event.get("instance_id")
+        at = event.get("at")
+        if op == "clear" and isinstance(instance_id, str):
+            self._data.pop(instance_id, None)
+            return None
+        if isinstance(instance_id, str) and isinstance(at, str):
+            if op == "start":
+                return self._apply_start(instance_id, event.get("name"), at)
+            if op == "stop":
+                return self._apply_stop(
+                    instance_id, event.get("hourly_price"), event.get("name"), at
+                )
+        logger.warning(f"Skipping malformed tracking journal event: {event}")
+        return None
 
-        now = datetime.now(timezone.utc)
-        now_iso = now.isoformat()
+    def _apply_start(self, instance_id: str, instance_name: str | None, at: str) -> UsageSession:
+        """Open a new session at the given time, closing any orphaned session."""
+        now = datetime.fromisoformat(at)
 
         # Get or create instance tracking
         if instance_id not in self._data:
@@ -243,46 +508,26 @@ class TrackingManager:
                 f"Closing orphaned active session for {instance_id} started at {active_session.start}"
             )
             # Close the orphaned session with current time
-            active_session.stop = now_iso
+            active_session.stop = at
             start_dt = datetime.fromisoformat(active_session.start)
             duration_seconds = (now - start_dt).total_seconds()
             active_session.hours = duration_seconds / SECONDS_PER_HOUR
 
         # Create new session
-        new_session = UsageSession(start=now_iso)
+        new_session = UsageSession(start=at)
         tracking.sessions.append(new_session)
-        tracking.last_updated = now_iso
+        tracking.last_updated = at
         tracking.recalculate_totals()
-
-        self._save()
-        logger.debug(f"Recorded start for instance {instance_id}")
-
         return new_session
 
-    def record_stop(
+    def _apply_stop(
         self,
         instance_id: str,
-        hourly_price: float | None = None,
-        instance_name: str | None = None,
+        hourly_price: float | None,
+        instance_name: str | None,
+        at: str,
     ) -> UsageSession | None:
-        """Record an instance stop event.
-
-        Completes the active session with stop time and calculates
-        duration and cost.
-
-        Args:
-            instance_id: The EC2 instance ID
-            hourly_price: Optional hourly price for cost calculation
-            instance_name: Optional instance name to update
-
-        Returns:
-            The completed UsageSession, or None if no active session
-        """
-        self._load()
-
-        now = datetime.now(timezone.utc)
-        now_iso = now.isoformat()
-
+        """Close the active session at the given time and compute its cost."""
         tracking = self._data.get(instance_id)
         if not tracking:
             logger.debug(f"No tracking data for instance {instance_id}")
@@ -299,9 +544,9 @@ class TrackingManager:
             return None
 
         # Complete the session
-        active_session.stop = now_iso
+        active_session.stop = at
         start_dt = datetime.fromisoformat(active_session.start)
-        duration_seconds = (now - start_dt).total_seconds()
+        duration_seconds = (datetime.fromisoformat(at) - start_dt).total_seconds()
         active_session.hours = duration_seconds / SECONDS_PER_HOUR
 
         # Calculate cost if price provided
@@ -309,13 +554,156 @@ class TrackingManager:
             active_session.cost = active_session.hours * hourly_price
 
         # Update tracking totals
-        tracking.last_updated = now_iso
+        tracking.last_updated = at
         tracking.recalculate_totals()
+        return active_session
 
-        self._save()
-        logger.debug(f"Recorded stop for instance {instance_id}: {active_session.hours:.2f} hours")
+    def reload(self) -> None:
+        """Force reload tracking data from file."""
+        self._loaded = False
+        self._load()
 
-        return active_session
+    def get_instance_tracking(
+        self, instance_id: str, recent_sessions: int | None = None
+    ) -> InstanceTracking | None:
+        """Get tracking data for a specific instance.
+
+        Args:
+            instance_id: The EC2 instance ID
+            recent_sessions: If set, include only this many most recent sessions
+
+        Returns:
+            InstanceTracking data, or None if not tracked
+        """
+        self._load()
+        tracking = self._data.get(instance_id)
+        if tracking is None or recent_sessions is None:
+            return tracking
+        recent = tracking.sessions[-recent_sessions:] if recent_sessions > 0 else []
+        return replace(tracking, sessions=recent)
+
+    def get_all_tracking(self) -> dict[str, InstanceTracking]:
+        """Get tracking data for all instances.
+
+        Returns:
+            Dictionary mapping instance IDs to their tracking data
+        """
+        self._load()
+        return self._data.copy()
+
+    def record_start(self, instance_id: str, instance_name: str | None = None) -> UsageSession:
+        """Record an instance start event.
+
+        If there's already an active session (no stop time), this will
+        complete that session first before starting a new one.
+
+        Args:
+            instance_id: The EC2 instance ID
+            instance_name: Optional instance name
+
+        Returns:
+            The newly created UsageSession
+        """
+        with self._locked_update():
+            at = datetime.now(timezone.utc).isoformat()
+            event = {"op": "start", "instance_id": instance_id, "name": instance_name, "at": at}
+            new_session = self._apply_start(instance_id, instance_name, at)
+            self._append_event(event)
+        logger.debug(f"Recorded start for instance {instance_id}")
+
+        return new_session
+
+    def record_stop(
+        self,
+        instance_id: str,
+        hourly_price: float | None = None,
+        instance_name: str | None = None,
+    ) -> UsageSession | None:
+        """Record an instance stop event.
+
+        Completes the active session with stop time and calculates
+        duration and cost.
+
+        Args:
+            instance_id: The EC2 instance ID
+            hourly_price: Optional hourly price for cost calculation
+            instance_name: Optional instance name to update
+
+        Returns:
+            The completed UsageSession, or None if no active session
+        """
+        with self._locked_update():
+            at = datetime.now(timezone.utc).isoformat()
+            event = {
+                "op": "stop",
+                "instance_id": instance_id,
+                "name": instance_name,
+                "hourly_price": hourly_price,
+                "at": at,
+            }
+            session = self._apply_stop(instance_id, hourly_price, instance_name, at)
+            if session is None:
+                return None
+
+            self._append_event(event)
+        logger.debug(f"Recorded stop for instance {instance_id}: {session.hours:.2f} hours")
+
+        return session
+
+    def record_starts(self, instances: Iterable[tuple[str, str | None]]) -> dict[str, UsageSession]:
+        """Record start events for many instances in one locked write.
+
+        Args:
+            instances: (instance_id, instance_name) pairs
+
+        Returns:
+            Mapping of instance ID to its newly created UsageSession
+        """
+        sessions: dict[str, UsageSession] = {}
+        with self._locked_update():
+            at = datetime.now(timezone.utc).isoformat()
+            events = []
+            for instance_id, instance_name in instances:
+                event = {"op": "start", "instance_id": instance_id, "name": instance_name, "at": at}
+                sessions[instance_id] = self._apply_start(instance_id, instance_name, at)
+                events.append(event)
+            self._append_events(events)
+        logger.debug(f"Recorded start for {len(sessions)} instances")
+        return sessions
+
+    def record_stops(
+        self, instances: Iterable[tuple[str, float | None, str | None]]
+    ) -> dict[str, UsageSession]:
+        """Record stop events for many instances in one locked write.
+
+        Args:
+            instances: (instance_id, hourly_price, instance_name) tuples
+
+        Returns:
+            Mapping of instance ID to its completed UsageSession, for the
+            instances that had an active session
+        """
+        sessions: dict[str, UsageSession] = {}
+        with self._locked_update():
+            at = datetime.now(timezone.utc).isoformat()
+            events = []
+            for instance_id, hourly_price, instance_name in instances:
+                session = self._apply_stop(instance_id, hourly_price, instance_name, at)
+                if session is None:
+                    continue
+                sessions[instance_id] = session
+                events.append(
+                    {
+                        "op": "stop",
+                        "instance_id": instance_id,
+                        "name": instance_name,
+                        "hourly_price": hourly_price,
+                        "at": at,
+                    }
+                )
+            self._append_events(events)
+        logger.debug(f"Recorded stop for {len(sessions)} instances")
+        return sessions
 
     def get_lifetime_stats(self, instance_id: str) -> tuple[float, float, int] | None:
         """Get lifetime statistics for an instance.
@@ -343,13 +731,13 @@ class TrackingManager:
         Returns:
             True if tracking was cleared, False if instance was not tracked
         """
-        self._load()
-
-        if instance_id not in self._data:
-            return False
+        with self._locked_update():
+            if instance_id not in self._data:
+                return False
 
-        del self._data[instance_id]
-        self._save()
+            event = {"op": "clear", "instance_id": instance_id}
+            self._apply_event(event)
+            self._append_event(event)
         logger.debug(f"Cleared tracking data for instance {instance_id}")
         return True
 
@@ -359,13 +747,30 @@ class TrackingManager:
         Returns:
             Number of instances cleared
         """
-        self._load()
-        count = len(self._data)
-        self._data = {}
-        self._save()
+        with self._locked_update():
+            count = len(self._data)
+            self._data = {}
+            self._save()
         logger.debug(f"Cleared tracking data for {count} instances")
         return count
 
 
+def create_tracking_manager() -> "TrackingManager | SQLiteTrackingManager":
+    """Create the tracking manager for the active storage backend.
+
+    The SQLite backend is used once tracking.db exists (created by
+    `remote instance tracking-migrate`); otherwise the JSON backend is used.
+
+    Returns:
+        A TrackingManager or SQLiteTrackingManager
+    """
+    db_file = get_tracking_db_path()
+    if db_file.exists():
+        from remote.tracking_sqlite import SQLiteTrackingManager
+
+        return SQLiteTrackingManager(db_file)
+    return TrackingManager()
+
+
 # Global tracking manager instance
-tracking_manager = TrackingManager()
+tracking_manager = create_tracking_manager()
@@ -0,0 +1,427 @@
+"""SQLite storage engine for instance usage tracking.
+
+This optional backend stores sessions in an indexed SQLite database and keeps
+per-instance running totals, so lifetime statistics are a single-row lookup
+regardless of how many sessions have been recorded. It is enabled by
+migrating the JSON tracking file with `remote instance tracking-migrate`,
+after which the presence of tracking.db selects this backend.
+"""
+
+import logging
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from remote.settings import SECONDS_PER_HOUR
+from remote.tracking import InstanceTracking, TrackingManager, UsageSession, get_tracking_db_path
+
+logger = logging.getLogger(__name__)
+
+# Bump (and add a migration step) when the schema changes
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS instances (
+    instance_id   TEXT PRIMARY KEY,
+    name          TEXT,
+    total_hours   REAL NOT NULL DEFAULT 0,
+    total_cost    REAL NOT NULL DEFAULT 0,
+    session_count INTEGER NOT NULL DEFAULT 0,
+    last_updated  TEXT
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    instance_id TEXT NOT NULL REFERENCES instances(instance_id) ON DELETE CASCADE,
+    start       TEXT NOT NULL,
+    stop        TEXT,
+    hours       REAL NOT NULL DEFAULT 0,
+    cost        REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_instance_start ON sessions(instance_id, start);
+CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions(start);
+CREATE INDEX IF NOT EXISTS idx_sessions_active ON sessions(instance_id) WHERE stop IS NULL;
+"""
+
+
+def _session_from_row(row: sqlite3.Row) -> UsageSession:
+    """Build a UsageSession from a sessions table row."""
+    return UsageSession(start=row["start"], stop=row["stop"], hours=row["hours"], cost=row["cost"])
+
+
+class SQLiteTrackingManager:
+    """Usage tracking backed by an indexed SQLite database.
+
+    Provides the same interface as TrackingManager. Totals are updated
+    incrementally inside the same transaction as each session change.
+    """
+
+    def __init__(self, db_file: Path | None = None) -> None:
+        """Initialize the SQLite tracking manager.
+
+        Args:
+            db_file: Path to the database. Defaults to ~/.config/remote.py/tracking.db
+        """
+        self._db_file = db_file or get_tracking_db_path()
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def tracking_file(self) -> Path:
+        """Get the tracking database path."""
+        return self._db_file
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and ensure the schema exists."""
+        if self._conn is None:
+            self._db_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._db_file, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def reload(self) -> None:
+        """Reload tracking data (a no-op: every query reads the database)."""
+
+    def _get_tracking(self, instance_id: str, session_limit: int | None) -> InstanceTracking | None:
+        """Build InstanceTracking for one instance, optionally with only recent sessions."""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT * FROM instances WHERE instance_id = ?", (instance_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        if session_limit is None:
+            session_rows = conn.execute(
+                "SELECT * FROM sessions WHERE instance_id = ? ORDER BY start, id",
+                (instance_id,),
+            ).fetchall()
+        else:
+            session_rows = conn.execute(
+                "SELECT * FROM (SELECT * FROM sessions WHERE instance_id = ? "
+                "ORDER BY start DESC, id DESC LIMIT ?) ORDER BY start, id",
+                (instance_id, session_limit),
+            ).fetchall()
+
+        return InstanceTracking(
+            instance_id=instance_id,
+            name=row["name"],
+            sessions=[_session_from_row(r) for r in session_rows],
+            total_hours=row["total_hours"],
+            total_cost=row["total_cost"],
+            last_updated=row["last_updated"],
+        )
+
+    def get_instance_tracking(
+        self, instance_id: str, recent_sessions: int | None = None
+    ) -> InstanceTracking | None:
+        """Get tracking data for a specific instance.
+
+        Args:
+            instance_id: The EC2 instance ID
+            recent_sessions: If set, include only this many most recent sessions
+
+        Returns:
+            InstanceTracking data, or None if not tracked
+        """
+        return self._get_tracking(instance_id, recent_sessions)
+
+    def get_all_tracking(self) -> dict[str, InstanceTracking]:
+        """Get tracking data for all instances.
+
+        Returns:
+            Dictionary mapping instance IDs to their tracking data
+        """
+        conn = self._connect()
+        result = {
+            row["instance_id"]: InstanceTracking(
+                instance_id=row["instance_id"],
+                name=row["name"],
+                total_hours=row["total_hours"],
+                total_cost=row["total_cost"],
+                last_updated=row["last_updated"],
+            )
+            for row in conn.execute("SELECT * FROM instances")
+        }
+        for row in conn.execute("SELECT * FROM sessions ORDER BY instance_id, start, id"):
+            tracking = result.get(row["instance_id"])
+            if tracking is not None:
+                tracking.sessions.append(_session_from_row(row))
+        return result
+
+    def _close_active_session(
+        self,
+        conn: sqlite3.Connection,
+        instance_id: str,
+        now: datetime,
+        hourly_price: float | None,
+    ) -> UsageSession | None:
+        """Close the instance's active session and add it to the running totals."""
+        row = conn.execute(
+            "SELECT * FROM sessions WHERE instance_id = ? AND stop IS NULL ORDER BY start LIMIT 1",
+            (instance_id,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        stop = now.isoformat()
+        hours = (now - datetime.fromisoformat(row["start"])).total_seconds() / SECONDS_PER_HOUR
+        cost = hours * hourly_price if hourly_price is not None and hourly_price > 0 else 0.0
+        conn.execute(
+            "UPDATE sessions SET stop = ?, hours = ?, cost = ? WHERE id = ?",
+            (stop, hours, cost, row["id"]),
+        )
+        conn.execute(
+            "UPDATE instances SET total_hours = total_hours + ?, total_cost = total_cost + ?, "
+            "last_updated = ? WHERE instance_id = ?",
+            (hours, cost, stop, instance_id),
+        )
+        return UsageSession(start=row["start"], stop=stop, hours=hours, cost=cost)
+
+    def record_start(self, instance_id: str, instance_name: str | None = None) -> UsageSession:
+        """Record an instance start event.
+
+        If there's already an active session (no stop time), this will
+        complete that session first before starting a new one.
+
+        Args:
+            instance_id: The EC2 instance ID
+            instance_name: Optional instance name
+
+        Returns:
+            The newly created UsageSession
+        """
+        return self.record_starts([(instance_id, instance_name)])[instance_id]
+
+    def _insert_start(
+        self, conn: sqlite3.Connection, instance_id: str, instance_name: str | None, now: datetime
+    ) -> UsageSession:
+        """Open a new session, closing any orphaned one. Runs inside a transaction."""
+        now_iso = now.isoformat()
+        conn.execute(
+            "INSERT INTO instances (instance_id, name) VALUES (?, ?) "
+            "ON CONFLICT(instance_id) DO UPDATE SET name = COALESCE(excluded.name, name)",
+            (instance_id, instance_name),
+        )
+        if self._close_active_session(conn, instance_id, now, None):
+            logger.debug(f"Closed orphaned active session for {instance_id}")
+        conn.execute(
+            "INSERT INTO sessions (instance_id, start) VALUES (?, ?)", (instance_id, now_iso)
+        )
+        conn.execute(
+            "UPDATE instances SET session_count = session_count + 1, last_updated = ? "
+            "WHERE instance_id = ?",
+            (now_iso, instance_id),
+        )
+        return UsageSession(start=now_iso)
+
+    def record_starts(self, instances: Iterable[tuple[str, str | None]]) -> dict[str, UsageSession]:
+        """Record start events for many instances in one transaction.
+
+        Args:
+            instances: (instance_id, instance_name) pairs
+
+        Returns:
+            Mapping of instance ID to its newly created UsageSession
+        """
+        conn = self._connect()
+        now = datetime.now(timezone.utc)
+        sessions: dict[str, UsageSession] = {}
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for instance_id, instance_name in instances:
+                sessions[instance_id] = self._insert_start(conn, instance_id, instance_name, now)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        logger.debug(f"Recorded start for {len(sessions)} instances")
+        return sessions
+
+    def record_stop(
+        self,
+        instance_id: str,
+        hourly_price: float | None = None,
+        instance_name: str | None = None,
+    ) -> UsageSession | None:
+        """Record an instance stop event.
+
+        Completes the active session with stop time and calculates
+        duration and cost.
+
+        Args:
+            instance_id: The EC2 instance ID
+            hourly_price: Optional hourly price for cost calculation
+            instance_name: Optional instance name to update
+
+        Returns:
+            The completed UsageSession, or None if no active session
+        """
+        session = self.record_stops([(instance_id, hourly_price, instance_name)]).get(instance_id)
+        if session is None:
+            logger.debug(f"No active session for instance {instance_id}")
+            return None
+        logger.debug(f"Recorded stop for instance {instance_id}: {session.hours:.2f} hours")
+        return session
+
+    def record_stops(
+        self, instances: Iterable[tuple[str, float | None, str | None]]
+    ) -> dict[str, UsageSession]:
+        """Record stop events for many instances in one transaction.
+
+        Args:
+            instances: (instance_id, hourly_price, instance_name) tuples
+
+        Returns:
+            Mapping of instance ID to its completed UsageSession, for the
+            instances that had an active session
+        """
+        conn = self._connect()
+        now = datetime.now(timezone.utc)
+        sessions: dict[str, UsageSession] = {}
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for instance_id, hourly_price, instance_name in instances:
+                if instance_name:
+                    conn.execute(
+                        "UPDATE instances SET name = ? WHERE instance_id = ?",
+                        (instance_name, instance_id),
+                    )
+                session = self._close_active_session(conn, instance_id, now, hourly_price)
+                if session is not None:
+                    sessions[instance_id] = session
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        logger.debug(f"Recorded stop for {len(sessions)} instances")
+        return sessions
+
+    def get_lifetime_stats(self, instance_id: str) -> tuple[float, float, int] | None:
+        """Get lifetime statistics for an instance from its running totals.
+
+        Args:
+            instance_id: The EC2 instance ID
+
+        Returns:
+            Tuple of (total_hours, total_cost, session_count) or None if not tracked
+        """
+        row = (
+            self._connect()
+            .execute(
+                "SELECT total_hours, total_cost, session_count FROM instances "
+                "WHERE instance_id = ?",
+                (instance_id,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return (row["total_hours"], row["total_cost"], row["session_count"])
+
+    def clear_instance_tracking(self, instance_id: str) -> bool:
+        """Clear all tracking data for an instance.
+
+        Args:
+            instance_id: The EC2 instance ID
+
+        Returns:
+            True if tracking was cleared, False if instance was not tracked
+        """
+        cursor = self._connect().execute(
+            "DELETE FROM instances WHERE instance_id = ?", (instance_id,)
+        )
+        return cursor.rowcount > 0
+
+    def clear_all_tracking(self) -> int:
+        """Clear all tracking data.
+
+        Returns:
+            Number of instances cleared
+        """
+        return self._connect().execute("DELETE FROM instances").rowcount
+
+    def import_tracking(self, data: dict[str, InstanceTracking]) -> int:
+        """Insert tracking data (e.g. loaded from the JSON backend) in one transaction.
+
+        Args:
+            data: Mapping of instance ID to tracking data
+
+        Returns:
+            Number of sessions imported
+        """
+        conn = self._connect()
+        session_count = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for instance_id, tracking in data.items():
+                conn.execute(
+                    "INSERT INTO instances (instance_id, name, total_hours, total_cost, "
+                    "session_count, last_updated) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        instance_id,
+                        tracking.name,
+                        sum(s.hours for s in tracking.sessions),
+                        sum(s.cost for s in tracking.sessions),
+                        len(tracking.sessions),
+                        tracking.last_updated,
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO sessions (instance_id, start, stop, hours, cost) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(instance_id, s.start, s.stop, s.hours, s.cost) for s in tracking.sessions],
+                )
+                session_count += len(tracking.sessions)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return session_count
+
+
+def migrate_json_to_sqlite(
+    json_file: Path | None = None, db_file: Path | None = None
+) -> tuple[int, int]:
+    """Copy JSON tracking data (snapshot and journal) into a new SQLite database.
+
+    The JSON files are left in place as a backup.
+
+    Args:
+        json_file: JSON tracking file. Defaults to ~/.config/remote.py/tracking.json
+        db_file: Database to create. Defaults to ~/.config/remote.py/tracking.db
+
+    Returns:
+        Tuple of (instances migrated, sessions migrated)
+
+    Raises:
+        FileExistsError: If the database already exists
+    """
+    db_file = db_file or get_tracking_db_path()
+    if db_file.exists():
+        raise FileExistsError(db_file)
+
+    data = TrackingManager(json_file).get_all_tracking()
+    manager = SQLiteTrackingManager(db_file)
+    try:
+        session_count = manager.import_tracking(data)
+    except BaseException:
+        manager.close()
+        db_file.unlink(missing_ok=True)
+        raise
+    manager.close()
+    return len(data), session_count
@@ -1,25 +1,41 @@
 import re
-from collections.abc import Callable
+import socket
+import time
+from collections.abc import Callable, Iterable
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from functools import lru_cache, wraps
-from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
 
-import boto3
 import typer
-from botocore.exceptions import ClientError, NoCredentialsError
+from botocore.exceptions import ClientError, NoCredentialsError, WaiterError
 from rich.console import Console
 from rich.table import Table
 
+# Re-exported: commands import the output helpers from remote.utils
+from .cli_output import handle_cli_errors as handle_cli_errors
+from .cli_output import print_error as print_error
+from .cli_output import print_info as print_info
+from .cli_output import print_success as print_success
+from .cli_output import print_warning as print_warning
 from .exceptions import (
     AWSServiceError,
     InstanceNotFoundError,
-    InvalidInputError,
     MultipleInstancesFoundError,
     ResourceNotFoundError,
     ValidationError,
 )
-from .settings import TABLE_COLUMN_STYLES
+from .settings import (
+    FLEET_WAIT_TIMEOUT_SECONDS,
+    MAX_STARTUP_WAIT_SECONDS,
+    SSH_PORT,
+    SSH_PROBE_CONNECT_TIMEOUT_SECONDS,
+    SSH_PROBE_INITIAL_DELAY_SECONDS,
+    SSH_PROBE_MAX_DELAY_SECONDS,
+    SSH_READY_TIMEOUT_SECONDS,
+    STARTUP_POLL_INTERVAL_SECONDS,
+    TABLE_COLUMN_STYLES,
+)
 from .validation import (
     ensure_non_empty_array,
     safe_get_array_item,
@@ -41,145 +57,9 @@ if TYPE_CHECKING:
     from mypy_boto3_scheduler.client import EventBridgeSchedulerClient
     from mypy_boto3_sts.client import STSClient
 
-# Type variables for the decorator
-P = ParamSpec("P")
-R = TypeVar("R")
-
 console = Console(force_terminal=True)
 
 
-def print_error(message: str) -> None:
-    """Print an error message in red.
-
-    Use this for error conditions that indicate something went wrong.
-    For AWS-specific errors, prefix with "AWS Error:" instead of "Error:".
-
-    Args:
-        message: The error message to display
-
-    Examples:
-        >>> print_error("Instance not found")
-        Error: Instance not found
-
-        >>> print_error("AWS Error: Access denied")
-        AWS Error: Access denied
-    """
-    typer.secho(message, fg=typer.colors.RED)
-
-
-def print_success(message: str) -> None:
-    """Print a success message in green.
-
-    Use this to confirm successful completion of operations.
-
-    Args:
-        message: The success message to display
-
-    Examples:
-        >>> print_success("Instance started")
-        Instance started
-
-        >>> print_success("Config saved to ~/.config/remote.py/config.ini")
-        Config saved to ~/.config/remote.py/config.ini
-    """
-    typer.secho(message, fg=typer.colors.GREEN)
-
-
-def print_warning(message: str) -> None:
-    """Print a warning message in yellow.
-
-    Use this for non-critical issues, cancellation notices, or informational
-    warnings that don't prevent operation completion.
-
-    Args:
-        message: The warning message to display
-
-    Examples:
-        >>> print_warning("Instance is already running")
-        Instance is already running
-
-        >>> print_warning("Cancelled.")
-        Cancelled.
-    """
-    typer.secho(message, fg=typer.colors.YELLOW)
-
-
-def print_info(message: str) -> None:
-    """Print an informational message in blue.
-
-    Use this for status updates, progress information, or neutral notifications.
-
-    Args:
-        message: The informational message to display
-
-    Examples:
-        >>> print_info("Using instance: my-server")
-        Using instance: my-server
-
-        >>> print_info("Waiting for SSH to be ready...")
-        Waiting for SSH to be ready...
-    """
-    typer.secho(message, fg=typer.colors.BLUE)
-
-
-def handle_cli_errors(func: Callable[P, R]) -> Callable[P, R]:
-    """Decorator to standardize CLI error handling.
-
-    Catches common RemotePy exceptions and converts them to user-friendly
-    error messages with consistent formatting, then exits with code 1.
-
-    This decorator consolidates the repeated try-except pattern:
-        try:
-            # command logic
-        except (InstanceNotFoundError, InvalidInputError, MultipleInstancesFoundError, ResourceNotFoundError) as e:
-            print_error(f"Error: {e}")
-            raise typer.Exit(1)
-        except AWSServiceError as e:
-            print_error(f"AWS Error: {e}")
-            raise typer.Exit(1)
-        except ValidationError as e:
-            print_error(f"Error: {e}")
-            raise typer.Exit(1)
-
-    Use this decorator on CLI command functions:
-        @app.command()
-        @handle_cli_errors
-        def my_command():
-            # command logic - exceptions are handled automatically
-
-    Args:
-        func: The CLI command function to wrap
-
-    Returns:
-        Wrapped function with standardized error handling
-
-    Note:
-        The decorator should be placed BELOW the @app.command() decorator
-        so it wraps the actual function, not the Typer command registration.
-    """
-
-    @wraps(func)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        try:
-            return func(*args, **kwargs)
-        except (
-            InstanceNotFoundError,
-            InvalidInputError,
-            MultipleInstancesFoundError,
-            ResourceNotFoundError,
-        ) as e:
-            print_error(f"Error: {e}")
-            raise typer.Exit(1) from e
-        except AWSServiceError as e:
-            print_error(f"AWS Error: {e}")
-            raise typer.Exit(1) from e
-        except ValidationError as e:
-            print_error(f"Error: {e}")
-            raise typer.Exit(1) from e
-
-    return wrapper
-
-
 def confirm_action(
     action: str,
     resource_type: str,
@@ -330,6 +210,8 @@ def get_ec2_client() -> "EC2Client":
     Returns:
         boto3 EC2 client instance
     """
+    import boto3
+
     return boto3.client("ec2")
 
 
@@ -342,6 +224,8 @@ def get_sts_client() -> "STSClient":
     Returns:
         boto3 STS client instance
     """
+    import boto3
+
     return boto3.client("sts")
 
 
@@ -354,6 +238,8 @@ def get_cloudwatch_client() -> "CloudWatchClient":
     Returns:
         boto3 CloudWatch client instance
     """
+    import boto3
+
     return boto3.client("cloudwatch")
 
 
@@ -366,6 +252,8 @@ def get_scheduler_client() -> "EventBridgeSchedulerClient":
     Returns:
         boto3 EventBridge Scheduler client instance
     """
+    import boto3
+
     return boto3.client("scheduler")
 
 
@@ -378,6 +266,8 @@ def get_iam_client() -> "IAMClient":
     Returns:
         boto3 IAM client instance
     """
+    import boto3
+
     return boto3.client("iam")
 
 
@@ -550,7 +440,7 @@ def styled_column(
 def create_table(
     title: str,
     columns: list[dict[str, Any]],
-    rows: list[list[str]],
+    rows: Iterable[list[str]],
 ) -> Table:
     """Build a Rich table with consistent styling.
 
@@ -564,7 +454,8 @@ def create_table(
             - style (str, optional): Rich style for the column (e.g., "cyan", "green")
             - justify (str, optional): Text alignment ("left", "right", "center")
             - no_wrap (bool, optional): If True, prevents text wrapping in this column
-        rows: List of row data, each row is a list of strings matching column order
+        rows: Row data, each row is a list of strings matching column order;
+            any iterable works, so rows can be streamed from a generator
 
     Returns:
         A configured Rich Table ready to be printed with console.print()
@@ -926,6 +817,184 @@ def is_instance_running(instance_id: str) -> bool:
         ) from e
 
 
+def wait_for_instance_running(instance_id: str, timeout: int = MAX_STARTUP_WAIT_SECONDS) -> bool:
+    """Block until the instance reaches the running state.
+
+    Uses the EC2 instance_running waiter, which checks immediately and then
+    every STARTUP_POLL_INTERVAL_SECONDS, and gives up early if the instance
+    moves to a state it cannot start from (e.g. terminated).
+
+    Args:
+        instance_id: The instance ID to wait for
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the instance is running, False if the waiter gave up
+
+    Raises:
+        AWSServiceError: If AWS credentials are missing
+    """
+    instance_id = validate_instance_id(instance_id)
+    waiter = get_ec2_client().get_waiter("instance_running")
+    try:
+        with handle_aws_errors("EC2", "describe_instances"):
+            waiter.wait(
+                InstanceIds=[instance_id],
+                WaiterConfig={
+                    "Delay": STARTUP_POLL_INTERVAL_SECONDS,
+                    "MaxAttempts": max(1, timeout // STARTUP_POLL_INTERVAL_SECONDS),
+                },
+            )
+    except WaiterError:
+        return False
+    return True
+
+
+def get_all_instance_statuses() -> dict[str, dict[str, Any]]:
+    """Get the status of every instance in the region with one paginated sweep.
+
+    Uses describe_instance_status with IncludeAllInstances=True, so stopped
+    instances are included (with "not-applicable" health checks).
+
+    Returns:
+        Mapping of instance ID to its InstanceStatuses entry
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    statuses: dict[str, dict[str, Any]] = {}
+    with handle_aws_errors("EC2", "describe_instance_status"):
+        paginator = get_ec2_client().get_paginator("describe_instance_status")
+        for page in paginator.paginate(IncludeAllInstances=True):
+            for entry in page.get("InstanceStatuses", []):
+                statuses[entry["InstanceId"]] = cast(dict[str, Any], entry)
+    return statuses
+
+
+def get_instance_states(instance_ids: list[str]) -> dict[str, str]:
+    """Get the current state of many instances with one describe call.
+
+    Args:
+        instance_ids: Instance IDs to look up
+
+    Returns:
+        Mapping of instance ID to state name (e.g. "running", "stopped")
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    states: dict[str, str] = {}
+    if not instance_ids:
+        return states
+    with handle_aws_errors("EC2", "describe_instances"):
+        paginator = get_ec2_client().get_paginator("describe_instances")
+        for page in paginator.paginate(InstanceIds=instance_ids):
+            for reservation in page.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    state = instance.get("State", {}).get("Name", "unknown")
+                    states[instance["InstanceId"]] = state
+    return states
+
+
+def wait_for_instance_states(
+    instance_ids: list[str],
+    target_state: str,
+    timeout: int = FLEET_WAIT_TIMEOUT_SECONDS,
+    on_poll: Callable[[dict[str, str]], None] | None = None,
+) -> dict[str, str]:
+    """Wait for many instances to reach a state, sharing one describe poll.
+
+    Every poll describes all still-pending instances in a single call, so
+    waiting on a fleet costs the same number of API calls as waiting on one
+    instance. Terminated instances stop being waited on.
+
+    Args:
+        instance_ids: Instance IDs to wait for
+        target_state: State to wait for (e.g. "running", "stopped")
+        timeout: Maximum time to wait in seconds
+        on_poll: Optional callback given the latest states after each poll
+
+    Returns:
+        Mapping of instance ID to its last observed state
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    deadline = time.monotonic() + timeout
+    states: dict[str, str] = {}
+    pending = list(instance_ids)
+    while pending:
+        states.update(get_instance_states(pending))
+        if on_poll:
+            on_poll(dict(states))
+        pending = [
+            instance_id
+            for instance_id in pending
+            if states.get(instance_id) not in (target_state, "terminated")
+        ]
+        if not pending or time.monotonic() >= deadline:
+            break
+        time.sleep(STARTUP_POLL_INTERVAL_SECONDS)
+    return states
+
+
+def is_ssh_port_open(host: str, port: int = SSH_PORT) -> bool:
+    """Check whether an SSH server is answering on a host.
+
+    A connection alone is not enough, since a port can accept before sshd is
+    ready; the server must also send its "SSH-" identification banner.
+
+    Args:
+        host: Hostname or IP address to probe
+        port: TCP port to probe
+
+    Returns:
+        True if an SSH banner was received, False otherwise
+    """
+    try:
+        with socket.create_connection(
+            (host, port), timeout=SSH_PROBE_CONNECT_TIMEOUT_SECONDS
+        ) as sock:
+            return sock.recv(4) == b"SSH-"
+    except OSError:
+        return False
+
+
+def wait_for_ssh_ready(
+    instance_id: str, timeout: int = SSH_READY_TIMEOUT_SECONDS, port: int = SSH_PORT
+) -> bool:
+    """Wait until a running instance has a public DNS name and sshd answers.
+
+    Probes with exponential backoff (SSH_PROBE_INITIAL_DELAY_SECONDS doubling
+    up to SSH_PROBE_MAX_DELAY_SECONDS), so an instance that is already
+    reachable returns on the first check.
+
+    Args:
+        instance_id: The instance ID to wait for
+        timeout: Maximum time to wait in seconds
+        port: TCP port sshd listens on
+
+    Returns:
+        True if sshd answered before the timeout, False otherwise
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    deadline = time.monotonic() + timeout
+    delay = SSH_PROBE_INITIAL_DELAY_SECONDS
+    dns = ""
+    while True:
+        if not dns:
+            dns = get_instance_dns(instance_id)
+        if dns and is_ssh_port_open(dns, port):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, SSH_PROBE_MAX_DELAY_SECONDS)
+
+
 def get_instance_type(instance_id: str) -> str:
     """Returns the instance type of the instance.
 
@@ -1272,5 +1341,7 @@ def get_current_region() -> str:
     Returns:
         The current AWS region code, defaults to us-east-1 if not configured
     """
+    import boto3
+
     session = boto3.session.Session()
     return session.region_name or "us-east-1"
@@ -202,6 +202,25 @@ def validate_instance_name(instance_name: str) -> str:
     return sanitized
 
 
+def parse_tag_filter(tag_filter: str) -> tuple[str, str]:
+    """Parse a KEY=VALUE tag filter from the command line.
+
+    Args:
+        tag_filter: Filter string such as "env=dev" or "team=ml-*"
+
+    Returns:
+        Tuple of (key, value)
+
+    Raises:
+        ValidationError: If the filter is not in KEY=VALUE form or the key is empty
+    """
+    key, sep, value = tag_filter.partition("=")
+    key = key.strip()
+    if not sep or not key:
+        raise ValidationError(f"Invalid tag filter '{tag_filter}': expected KEY=VALUE")
+    return key, value.strip()
+
+
 def validate_volume_id(volume_id: str) -> str:
     """Validate EBS volume ID format.
 
@@ -1,15 +1,15 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
 
-from remote.instance_resolver import resolve_instance_or_exit
+from remote.instance_resolver import get_instance_index, resolve_instance_or_exit
 from remote.utils import (
     confirm_action,
     console,
     create_table,
+    extract_tags_dict,
     get_ec2_client,
     get_status_style,
-    get_volume_name,
     handle_aws_errors,
     handle_cli_errors,
     print_warning,
@@ -17,34 +17,101 @@ from remote.utils import (
 )
 from remote.validation import validate_aws_response_structure, validate_volume_id
 
+if TYPE_CHECKING:
+    from mypy_boto3_ec2.type_defs import VolumeTypeDef
+
 app = typer.Typer()
 
 
+def _volume_row(volume: "VolumeTypeDef", instance_names: dict[str, str]) -> list[str]:
+    """Build a volume table row, taking names from tags already in the response.
+
+    Args:
+        volume: Volume dictionary from describe_volumes (including Tags)
+        instance_names: Instance ID to Name tag for attached instances
+
+    Returns:
+        Row values matching the volume list columns
+    """
+    instance_ids = [a["InstanceId"] for a in volume.get("Attachments", []) if "InstanceId" in a]
+    state = volume["State"]
+    state_style = get_status_style(state)
+    return [
+        ", ".join(instance_names.get(i, "") for i in instance_ids) if instance_ids else "-",
+        ", ".join(instance_ids) if instance_ids else "-",
+        extract_tags_dict(volume.get("Tags")).get("Name", ""),
+        volume["VolumeId"],
+        str(volume["Size"]),
+        f"[{state_style}]{state}[/{state_style}]",
+        volume["AvailabilityZone"],
+    ]
+
+
+def _describe_all_volumes() -> list["VolumeTypeDef"]:
+    """Describe every volume in the region with one paginated sweep.
+
+    Returns:
+        All volume dictionaries, attached or not
+
+    Raises:
+        AWSServiceError: If AWS API call fails
+    """
+    volumes: list[VolumeTypeDef] = []
+    with handle_aws_errors("EC2", "describe_volumes"):
+        for page in get_ec2_client().get_paginator("describe_volumes").paginate():
+            validate_aws_response_structure(page, ["Volumes"], "describe_volumes")
+            volumes.extend(page["Volumes"])
+    return volumes
+
+
 @app.command("ls")
 @app.command("list")
 @handle_cli_errors
-def list_volumes(instance_name: str | None = typer.Argument(None, help="Instance name")) -> None:
+def list_volumes(
+    instance_name: str | None = typer.Argument(None, help="Instance name"),
+    show_all: bool = typer.Option(
+        False, "--all", "-a", help="List every volume in the region, attached or not"
+    ),
+) -> None:
     """
     List EBS volumes attached to an instance.
 
     Shows volume ID, size, state, and availability zone.
     Uses the default instance from config if no name is provided.
+    Volume names are read from the tags in the same describe_volumes
+    response, so listing costs one API call however many volumes there are.
 
     Examples:
         remote volume ls                  # List volumes for default instance
         remote volume ls my-instance      # List volumes for specific instance
         remote volume list my-instance    # Verbose form
+        remote volume ls --all            # List every volume in the region
     """
-    instance_name, instance_id = resolve_instance_or_exit(instance_name)
+    if show_all:
+        if instance_name:
+            print_warning("Ignoring instance name with --all")
+        volumes = _describe_all_volumes()
+        # One inventory sweep names every attached instance
+        instance_names = {
+            entry.instance_id: name
+            for name, entries in get_instance_index().items()
+            for entry in entries
+        }
+        title = "All Volumes"
+    else:
+        instance_name, instance_id = resolve_instance_or_exit(instance_name)
 
-    print_warning(f"Listing volumes attached to instance {instance_name}")
+        print_warning(f"Listing volumes attached to instance {instance_name}")
 
-    # Use server-side filtering to only fetch volumes attached to this instance
-    with handle_aws_errors("EC2", "describe_volumes"):
-        volumes = get_ec2_client().describe_volumes(
-            Filters=[{"Name": "attachment.instance-id", "Values": [instance_id]}]
-        )
-        validate_aws_response_structure(volumes, ["Volumes"], "describe_volumes")
+        # Use server-side filtering to only fetch volumes attached to this instance
+        with handle_aws_errors("EC2", "describe_volumes"):
+            response = get_ec2_client().describe_volumes(
+                Filters=[{"Name": "attachment.instance-id", "Values": [instance_id]}]
+            )
+            validate_aws_response_structure(response, ["Volumes"], "describe_volumes")
+        volumes = response["Volumes"]
+        instance_names = {instance_id: instance_name or ""}
+        title = "Volumes"
 
     columns: list[dict[str, Any]] = [
         styled_column("Instance Name", "name", no_wrap=True),
@@ -56,23 +123,8 @@ def list_volumes(instance_name: str | None = typer.Argument(None, help="Instance
         styled_column("AvailabilityZone"),
     ]
 
-    rows = []
-    for volume in volumes["Volumes"]:
-        state = volume["State"]
-        state_style = get_status_style(state)
-        rows.append(
-            [
-                instance_name or "",
-                instance_id,
-                get_volume_name(volume["VolumeId"]),
-                volume["VolumeId"],
-                str(volume["Size"]),
-                f"[{state_style}]{state}[/{state_style}]",
-                volume["AvailabilityZone"],
-            ]
-        )
-
-    console.print(create_table("Volumes", columns, rows))
+    rows = [_volume_row(volume, instance_names) for volume in volumes]
+    console.print(create_table(title, columns, rows))
 
 
 # Root device patterns - devices that are typically the root/boot volume
@@ -20,7 +20,7 @@ from remote.settings import Settings
 
 
 @pytest.fixture(autouse=True)
-def test_config():
+def test_config(tmp_path):
     """Automatically use test configuration for all tests.
 
     This fixture ensures that tests don't depend on the user's local configuration
@@ -29,8 +29,12 @@ def test_config():
     # Reset the SSH config cache before each test to prevent stale cached values
     # from affecting tests that mock the config manager with different values
     from remote.instance import reset_ssh_config_cache
+    from remote.instance_resolver import reset_instance_index
+    from remote.scheduler import reset_schedule_details_cache
 
     reset_ssh_config_cache()
+    reset_instance_index()
+    reset_schedule_details_cache()
 
     test_settings = Settings(testing_mode=True, mock_aws_calls=True)
 
@@ -48,11 +52,20 @@ def test_config():
             "default_launch_template": None,
             "connection_method": None,  # Default to None so SSH is used
             "ssm_profile": None,
+            "inventory_cache_ttl": "0",  # Disable inventory cache so tests hit mocked EC2
+            "ssh_control_persist": "0",  # Disable SSH multiplexing so ssh args are predictable
         }
         return config_defaults.get(key)
 
     mock_config_manager.get_value.side_effect = mock_get_value
 
+    # Keep inventory, price catalog and public IP cache files out of the user's config directory
+    from remote.inventory import InventoryCache
+    from remote.pricing import PriceCatalog
+
+    test_inventory_cache = InventoryCache(tmp_path / "inventory.json")
+    test_price_catalog = PriceCatalog(tmp_path / "prices.json")
+
     # Mock the global settings object and config manager
     # We need to patch config_manager in both config and instance_resolver modules
     # because instance_resolver imports config_manager at module level
@@ -61,10 +74,19 @@ def test_config():
         with patch("remote.config.config_manager", mock_config_manager):
             with patch("remote.instance_resolver.config_manager", mock_config_manager):
                 with patch("remote.connection.config_manager", mock_config_manager):
-                    yield test_settings
+                    with (
+                        patch("remote.instance_resolver.inventory_cache", test_inventory_cache),
+                        patch("remote.pricing.price_catalog", test_price_catalog),
+                        patch(
+                            "remote.sg.get_public_ip_cache_path",
+                            return_value=tmp_path / "public_ip.json",
+                        ),
+                    ):
+                        yield test_settings
 
     # Also reset after the test to ensure clean state
     reset_ssh_config_cache()
+    reset_instance_index()
 
 
 @pytest.fixture
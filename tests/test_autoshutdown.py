@@ -482,9 +482,8 @@ class TestCloudWatchClientIntegration:
         # Clear any existing cache
         clear_cloudwatch_client_cache()
 
-        mock_boto3 = mocker.patch("remote.utils.boto3")
         mock_client = MagicMock()
-        mock_boto3.client.return_value = mock_client
+        mock_boto3_client = mocker.patch("boto3.client", return_value=mock_client)
 
         # First call should create client
         client1 = get_cloudwatch_client()
@@ -492,7 +491,7 @@ class TestCloudWatchClientIntegration:
         client2 = get_cloudwatch_client()
 
         assert client1 is client2
-        mock_boto3.client.assert_called_once_with("cloudwatch")
+        mock_boto3_client.assert_called_once_with("cloudwatch")
 
         # Clean up
         clear_cloudwatch_client_cache()
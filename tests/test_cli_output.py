@@ -0,0 +1,41 @@
+import pytest
+import typer
+
+from remote import utils
+from remote.cli_output import handle_cli_errors, print_error
+from remote.exceptions import AWSServiceError, InstanceNotFoundError, ValidationError
+
+
+def test_utils_reexports_output_helpers():
+    """Commands keep importing the helpers from remote.utils."""
+    assert utils.handle_cli_errors is handle_cli_errors
+    assert utils.print_error is print_error
+
+
+@pytest.mark.parametrize(
+    "error,prefix",
+    [
+        (InstanceNotFoundError("web"), "Error:"),
+        (ValidationError("bad value"), "Error:"),
+        (AWSServiceError("EC2", "describe_instances", "Throttling", "slow down"), "AWS Error:"),
+    ],
+    ids=["not_found", "validation", "aws"],
+)
+def test_handle_cli_errors_exits_with_message(capsys, error, prefix):
+    @handle_cli_errors
+    def command() -> None:
+        raise error
+
+    with pytest.raises(typer.Exit) as exc_info:
+        command()
+
+    assert exc_info.value.exit_code == 1
+    assert capsys.readouterr().out.startswith(prefix)
+
+
+def test_handle_cli_errors_passes_through_return_value():
+    @handle_cli_errors
+    def command(value: int) -> int:
+        return value * 2
+
+    assert command(21) == 42
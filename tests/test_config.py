@@ -687,6 +687,25 @@ class TestRemoteConfigPydanticModel:
         expected = os.path.expanduser("~/.ssh/my-key.pem")
         assert cfg.ssh_key_path == expected
 
+    def test_seconds_settings_share_one_validator(self):
+        """Should parse duration keys as seconds and default them when empty."""
+        from pydantic import ValidationError
+
+        from remote.config import RemoteConfig
+        from remote.settings import SSH_CONTROL_PERSIST_SECONDS
+
+        cfg = RemoteConfig(inventory_cache_ttl="120", ssh_control_persist="")
+        assert cfg.inventory_cache_ttl == 120
+        assert cfg.ssh_control_persist == SSH_CONTROL_PERSIST_SECONDS
+
+        with pytest.raises(ValidationError) as exc_info:
+            RemoteConfig(ssh_control_persist="-5")
+        assert "Invalid ssh_control_persist '-5'" in str(exc_info.value)
+
+        with pytest.raises(ValidationError) as exc_info:
+            RemoteConfig(inventory_cache_ttl="soon")
+        assert "Invalid inventory_cache_ttl 'soon'" in str(exc_info.value)
+
     def test_valid_aws_region(self):
         """Should accept valid AWS regions."""
         from remote.config import RemoteConfig
@@ -99,7 +99,7 @@ class TestExecCommandConnectionOption:
 
     def test_should_use_ssh_by_default(self, mocker):
         """Should use SSH for exec when no --connection option provided."""
-        mocker.patch("remote.instance.get_instance_id", return_value="i-123")
+        mocker.patch("remote.instance.get_cached_instance_id", return_value="i-123")
         mocker.patch("remote.instance.get_instance_name", return_value="test")
         mocker.patch("remote.instance._ensure_instance_running")
         mocker.patch("remote.instance.get_instance_dns", return_value="test.example.com")
@@ -119,7 +119,7 @@ class TestExecCommandConnectionOption:
 
     def test_should_use_ssm_with_option(self, mocker):
         """Should use SSM for exec when --connection ssm is provided."""
-        mocker.patch("remote.instance.get_instance_id", return_value="i-123")
+        mocker.patch("remote.instance.get_cached_instance_id", return_value="i-123")
         mocker.patch("remote.instance.get_instance_name", return_value="test")
         mocker.patch("remote.instance._ensure_instance_running")
         mocker.patch("remote.instance.get_instance_dns", return_value="")
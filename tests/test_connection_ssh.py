@@ -1,7 +1,10 @@
 """Tests for the SSH connection provider."""
 
+import socket
 import subprocess
 
+import pytest
+
 
 class TestSSHConnectionProvider:
     """Test the SSH connection provider."""
@@ -274,3 +277,98 @@ class TestSSHPortForward:
 
         call_args = mock_run.call_args[0][0]
         assert "-N" in call_args
+
+
+class TestSSHMultiplexing:
+    """Test ControlMaster connection reuse."""
+
+    @pytest.fixture
+    def control_dir(self, tmp_path, mocker):
+        mocker.patch("remote.connection_ssh.get_ssh_control_persist", return_value=600)
+        mocker.patch("remote.connection_ssh.get_ssh_control_dir", return_value=tmp_path)
+        return tmp_path
+
+    def test_disabled_by_zero_persist(self):
+        """Should not multiplex when ssh_control_persist is 0."""
+        from remote.connection_ssh import get_control_path
+
+        assert get_control_path("i-123", "ubuntu") is None
+
+    def test_control_path_keyed_by_user_and_instance(self, control_dir):
+        from remote.connection_ssh import get_control_path
+
+        assert get_control_path("i-123", "ubuntu") == control_dir / "ubuntu@i-123"
+
+    def test_execute_starts_master_then_reuses_it(self, control_dir, mocker):
+        """First command starts a detached master; later commands only check it."""
+        from remote.connection_ssh import SSHConnectionProvider
+
+        mock_run = mocker.patch("remote.connection_ssh.subprocess.run")
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        provider = SSHConnectionProvider()
+
+        provider.execute_command("i-123", "example.com", ["uptime"], "ubuntu")
+
+        master_cmd, exec_cmd = (c.args[0] for c in mock_run.call_args_list)
+        assert master_cmd[:4] == ["ssh", "-M", "-N", "-f"]
+        assert "ControlPersist=600" in master_cmd
+        assert mock_run.call_args_list[0].kwargs["stderr"] is subprocess.DEVNULL
+        assert "ControlMaster=no" in exec_cmd
+        assert f"ControlPath={control_dir / 'ubuntu@i-123'}" in exec_cmd
+        assert exec_cmd[-2:] == ["ubuntu@example.com", "uptime"]
+
+        # The master now exists, so the next command only runs `ssh -O check`
+        (control_dir / "ubuntu@i-123").touch()
+        mock_run.reset_mock()
+        provider.execute_command("i-123", "example.com", ["uptime"], "ubuntu")
+
+        check_cmd, exec_cmd = (c.args[0] for c in mock_run.call_args_list)
+        assert check_cmd[check_cmd.index("-O") + 1] == "check"
+        assert "ControlMaster=no" in exec_cmd
+
+    def test_master_failure_falls_back_to_direct_connection(self, control_dir, mocker):
+        from remote.connection_ssh import SSHConnectionProvider
+
+        mock_run = mocker.patch("remote.connection_ssh.subprocess.run")
+        mock_run.side_effect = [
+            subprocess.CompletedProcess(args=[], returncode=255),
+            subprocess.CompletedProcess(args=[], returncode=255, stdout="", stderr="refused"),
+        ]
+
+        exit_code, _, stderr = SSHConnectionProvider().execute_command(
+            "i-123", "example.com", ["uptime"], "ubuntu"
+        )
+
+        exec_cmd = mock_run.call_args.args[0]
+        assert not any(arg.startswith("Control") for arg in exec_cmd)
+        assert (exit_code, stderr) == (255, "refused")
+
+    def test_list_and_close_masters(self, control_dir, mocker):
+        from remote.connection_ssh import close_control_master, list_control_masters
+
+        for name in ("ubuntu@i-live", "ubuntu@i-stale"):
+            sock = socket.socket(socket.AF_UNIX)
+            sock.bind(str(control_dir / name))
+            sock.close()
+        (control_dir / "not-a-socket").touch()
+
+        def fake_run(cmd, **kwargs):
+            return subprocess.CompletedProcess(
+                args=cmd, returncode=0 if "i-live" in cmd[2] else 255
+            )
+
+        mock_run = mocker.patch("remote.connection_ssh.subprocess.run", side_effect=fake_run)
+
+        live, stale = list_control_masters()
+
+        assert (live.instance_id, live.user, live.active) == ("i-live", "ubuntu", True)
+        assert (stale.instance_id, stale.active) == ("i-stale", False)
+
+        mock_run.reset_mock()
+        assert close_control_master(live) is True
+        assert close_control_master(stale) is False
+        assert mock_run.call_args.args[0][-2] == "exit"
+        assert mock_run.call_count == 1  # stale sockets are just removed
+        assert not stale.path.exists()
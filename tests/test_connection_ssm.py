@@ -4,6 +4,7 @@ import json
 import subprocess
 
 import pytest
+from botocore.exceptions import ClientError, NoCredentialsError
 
 from remote.exceptions import SSMError
 
@@ -114,32 +115,33 @@ class TestSSMConnectInteractive:
         assert "AWS CLI not found" in str(exc_info.value)
 
 
+def _client_error(code: str, operation: str = "GetCommandInvocation") -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
+
+
 class TestSSMExecuteCommand:
     """Test SSM command execution."""
 
-    def test_should_call_send_command_with_correct_args(self, mocker):
-        """Should call aws ssm send-command with correct arguments."""
+    @pytest.fixture
+    def mock_client(self, mocker):
+        client = mocker.MagicMock()
+        client.send_command.return_value = {"Command": {"CommandId": "cmd-123456"}}
+        mocker.patch("remote.connection_ssm.get_ssm_client", return_value=client)
+        return client
+
+    @pytest.fixture
+    def mock_sleep(self, mocker):
+        return mocker.patch("remote.connection_ssm.time.sleep")
+
+    def test_should_call_send_command_with_correct_args(self, mock_client, mock_sleep):
+        """Should send AWS-RunShellScript through the boto3 client."""
         from remote.connection_ssm import SSMConnectionProvider
 
-        # Mock send-command response
-        mock_run = mocker.patch("remote.connection_ssm.subprocess.run")
-        send_response = {"Command": {"CommandId": "cmd-123456"}}
-        get_response = {
+        mock_client.get_command_invocation.return_value = {
             "Status": "Success",
             "StandardOutputContent": "output",
             "StandardErrorContent": "",
         }
-        mock_run.side_effect = [
-            subprocess.CompletedProcess(
-                args=[], returncode=0, stdout=json.dumps(send_response), stderr=""
-            ),
-            subprocess.CompletedProcess(
-                args=[], returncode=0, stdout=json.dumps(get_response), stderr=""
-            ),
-        ]
-
-        # Mock time.sleep to speed up test
-        mocker.patch("remote.connection_ssm.time.sleep")
 
         provider = SSMConnectionProvider()
         exit_code, stdout, stderr = provider.execute_command(
@@ -147,42 +149,47 @@ class TestSSMExecuteCommand:
             dns="example.com",
             command=["whoami"],
             user="ubuntu",
+            timeout=10,
         )
 
         assert exit_code == 0
         assert stdout == "output"
         assert stderr == ""
 
-        # Verify send-command was called
-        first_call = mock_run.call_args_list[0][0][0]
-        assert first_call[0] == "aws"
-        assert first_call[1] == "ssm"
-        assert first_call[2] == "send-command"
-        assert "--document-name" in first_call
-        assert "AWS-RunShellScript" in first_call
+        mock_client.send_command.assert_called_once_with(
+            InstanceIds=["i-123456789"],
+            DocumentName="AWS-RunShellScript",
+            Parameters={"commands": ["whoami"], "executionTimeout": ["10"]},
+            TimeoutSeconds=30,
+        )
+        mock_client.get_command_invocation.assert_called_once_with(
+            CommandId="cmd-123456", InstanceId="i-123456789"
+        )
+
+    def test_should_not_start_subprocesses(self, mocker, mock_client, mock_sleep):
+        """Should not shell out to the AWS CLI for send or poll."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        mock_run = mocker.patch("remote.connection_ssm.subprocess.run")
+        mock_client.get_command_invocation.return_value = {"Status": "Success"}
 
-    def test_should_return_nonzero_exit_code_on_failure(self, mocker):
+        SSMConnectionProvider().execute_command(
+            instance_id="i-123456789", dns="", command=["true"], user="ubuntu"
+        )
+
+        mock_run.assert_not_called()
+
+    def test_should_return_nonzero_exit_code_on_failure(self, mock_client, mock_sleep):
         """Should return non-zero exit code when command fails."""
         from remote.connection_ssm import SSMConnectionProvider
 
-        mock_run = mocker.patch("remote.connection_ssm.subprocess.run")
-        send_response = {"Command": {"CommandId": "cmd-123456"}}
-        get_response = {
+        mock_client.get_command_invocation.return_value = {
             "Status": "Failed",
             "StatusDetails": "Command failed",
             "StandardOutputContent": "",
             "StandardErrorContent": "error message",
+            "ResponseCode": -1,
         }
-        mock_run.side_effect = [
-            subprocess.CompletedProcess(
-                args=[], returncode=0, stdout=json.dumps(send_response), stderr=""
-            ),
-            subprocess.CompletedProcess(
-                args=[], returncode=0, stdout=json.dumps(get_response), stderr=""
-            ),
-        ]
-
-        mocker.patch("remote.connection_ssm.time.sleep")
 
         provider = SSMConnectionProvider()
         exit_code, stdout, stderr = provider.execute_command(
@@ -195,12 +202,97 @@ class TestSSMExecuteCommand:
         assert exit_code == 1
         assert stderr == "error message"
 
-    def test_should_raise_ssm_error_when_aws_cli_not_found(self, mocker):
-        """Should raise SSMError when AWS CLI is not installed."""
+    def test_should_return_remote_exit_code(self, mock_client, mock_sleep):
+        """Should pass the script's exit status through as the exit code."""
         from remote.connection_ssm import SSMConnectionProvider
 
-        mock_run = mocker.patch("remote.connection_ssm.subprocess.run")
-        mock_run.side_effect = FileNotFoundError("aws not found")
+        mock_client.get_command_invocation.return_value = {
+            "Status": "Failed",
+            "StatusDetails": "Failed",
+            "StandardOutputContent": "",
+            "StandardErrorContent": "",
+            "ResponseCode": 3,
+        }
+
+        exit_code, _, stderr = SSMConnectionProvider().execute_command(
+            instance_id="i-123456789", dns="", command=["exit", "3"], user="ubuntu"
+        )
+
+        assert exit_code == 3
+        assert stderr == "Command failed with status: Failed"
+
+    def test_should_back_off_between_polls(self, mock_client, mock_sleep):
+        """Poll delay should double from the initial delay up to the cap."""
+        from remote.connection_ssm import SSMConnectionProvider
+        from remote.settings import SSM_POLL_INITIAL_DELAY_SECONDS, SSM_POLL_MAX_DELAY_SECONDS
+
+        pending = {"Status": "InProgress"}
+        mock_client.get_command_invocation.side_effect = [pending] * 6 + [
+            {"Status": "Success", "StandardOutputContent": "done"}
+        ]
+
+        exit_code, stdout, _ = SSMConnectionProvider().execute_command(
+            instance_id="i-123456789", dns="", command=["sleep", "5"], user="ubuntu"
+        )
+
+        assert (exit_code, stdout) == (0, "done")
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays[0] == SSM_POLL_INITIAL_DELAY_SECONDS
+        assert delays == sorted(delays)
+        assert delays[1] == 2 * delays[0]
+        assert max(delays) == SSM_POLL_MAX_DELAY_SECONDS
+
+    def test_should_retry_when_invocation_does_not_exist_yet(self, mock_client, mock_sleep):
+        """InvocationDoesNotExist right after send-command should be retried."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        mock_client.get_command_invocation.side_effect = [
+            _client_error("InvocationDoesNotExist"),
+            {"Status": "Success", "StandardOutputContent": "ok"},
+        ]
+
+        exit_code, stdout, _ = SSMConnectionProvider().execute_command(
+            instance_id="i-123456789", dns="", command=["true"], user="ubuntu"
+        )
+
+        assert (exit_code, stdout) == (0, "ok")
+        assert mock_client.get_command_invocation.call_count == 2
+
+    def test_should_time_out(self, mocker, mock_client, mock_sleep):
+        """Should give up once the deadline passes."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        mocker.patch("remote.connection_ssm.time.monotonic", side_effect=[0.0, 5.0, 11.0])
+        mock_client.get_command_invocation.return_value = {"Status": "InProgress"}
+
+        exit_code, _, stderr = SSMConnectionProvider().execute_command(
+            instance_id="i-123456789", dns="", command=["sleep", "60"], user="ubuntu", timeout=10
+        )
+
+        assert exit_code == 1
+        assert stderr == "Command timed out after 10 seconds"
+        assert mock_client.get_command_invocation.call_count == 2
+
+    def test_should_return_error_when_send_command_fails(self, mock_client, mock_sleep):
+        """API errors from send-command should be returned as a failed result."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        mock_client.send_command.side_effect = _client_error("InvalidInstanceId", "SendCommand")
+
+        exit_code, stdout, stderr = SSMConnectionProvider().execute_command(
+            instance_id="i-123456789", dns="", command=["whoami"], user="ubuntu"
+        )
+
+        assert exit_code == 1
+        assert stdout == ""
+        assert "InvalidInstanceId" in stderr
+        mock_client.get_command_invocation.assert_not_called()
+
+    def test_should_raise_ssm_error_when_credentials_missing(self, mock_client):
+        """Should raise SSMError when no AWS credentials are configured."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        mock_client.send_command.side_effect = NoCredentialsError()
 
         provider = SSMConnectionProvider()
 
@@ -212,7 +304,263 @@ class TestSSMExecuteCommand:
                 user="ubuntu",
             )
 
-        assert "AWS CLI not found" in str(exc_info.value)
+        assert "credentials not found" in str(exc_info.value)
+
+
+def _invocation(instance_id, status="Success", output="", response_code=0):
+    return {
+        "InstanceId": instance_id,
+        "Status": status,
+        "StatusDetails": status,
+        "CommandPlugins": [{"Output": output, "ResponseCode": response_code}],
+    }
+
+
+class TestSSMExecuteCommandBatch:
+    """Test batched SSM command execution across many instances."""
+
+    @pytest.fixture
+    def mock_client(self, mocker):
+        client = mocker.MagicMock()
+        client.send_command.side_effect = lambda **kw: {
+            "Command": {"CommandId": f"cmd-{kw['InstanceIds'][0]}"}
+        }
+        mocker.patch("remote.connection_ssm.get_ssm_client", return_value=client)
+        mocker.patch("remote.connection_ssm.time.sleep")
+        return client
+
+    def _set_pages(self, client, pages_by_command):
+        """Make the paginator return pages for each command ID."""
+        paginator = client.get_paginator.return_value
+        paginator.paginate.side_effect = lambda CommandId, Details: pages_by_command[CommandId]
+        return paginator
+
+    def test_should_send_one_command_per_fifty_instances(self, mock_client):
+        """Instance IDs should be sent in chunks of at most 50."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        ids = [f"i-{n:03d}" for n in range(120)]
+        pages = {
+            f"cmd-{ids[start]}": [
+                {"CommandInvocations": [_invocation(i) for i in ids[start : start + 50]]}
+            ]
+            for start in (0, 50, 100)
+        }
+        self._set_pages(mock_client, pages)
+
+        results = dict(SSMConnectionProvider().execute_command_batch(ids, ["uptime"]))
+
+        sizes = [len(c.kwargs["InstanceIds"]) for c in mock_client.send_command.call_args_list]
+        assert sizes == [50, 50, 20]
+        assert set(results) == set(ids)
+        assert all(code == 0 for code, _, _ in results.values())
+        mock_client.get_command_invocation.assert_not_called()
+
+    def test_should_collect_results_across_pages_and_polls(self, mock_client):
+        """Per-instance exit codes and output should come from paginated invocations."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        paginator = mock_client.get_paginator.return_value
+        paginator.paginate.side_effect = [
+            # First poll: one finished, one still running
+            [
+                {"CommandInvocations": [_invocation("i-1", output="hello\n")]},
+                {"CommandInvocations": [_invocation("i-2", status="InProgress")]},
+            ],
+            # Second poll: both listed again, only i-2 is new
+            [
+                {"CommandInvocations": [_invocation("i-1", output="hello\n")]},
+                {
+                    "CommandInvocations": [
+                        _invocation(
+                            "i-2",
+                            status="Failed",
+                            output="partial\n----------ERROR-------\nboom",
+                            response_code=2,
+                        )
+                    ]
+                },
+            ],
+        ]
+
+        results = list(SSMConnectionProvider().execute_command_batch(["i-1", "i-2"], ["run"]))
+
+        assert results == [("i-1", (0, "hello\n", "")), ("i-2", (2, "partial", "boom"))]
+        mock_client.get_paginator.assert_called_with("list_command_invocations")
+        paginator.paginate.assert_called_with(CommandId="cmd-i-1", Details=True)
+
+    def test_should_time_out_unfinished_instances(self, mocker, mock_client):
+        """Instances still running at the deadline should be reported as timed out."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        mocker.patch("remote.connection_ssm.time.monotonic", side_effect=[0.0, 11.0])
+        self._set_pages(
+            mock_client,
+            {
+                "cmd-i-1": [
+                    {
+                        "CommandInvocations": [
+                            _invocation("i-1"),
+                            _invocation("i-2", status="InProgress"),
+                        ]
+                    }
+                ]
+            },
+        )
+
+        results = dict(
+            SSMConnectionProvider().execute_command_batch(["i-1", "i-2"], ["sleep"], timeout=10)
+        )
+
+        assert results["i-1"][0] == 0
+        assert results["i-2"] == (1, "", "Command timed out after 10 seconds")
+
+    def test_should_report_send_failure_for_every_instance_in_chunk(self, mock_client):
+        """A rejected send-command should fail each of its instances."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        mock_client.send_command.side_effect = _client_error("InvalidInstanceId", "SendCommand")
+
+        results = dict(SSMConnectionProvider().execute_command_batch(["i-1", "i-2"], ["uptime"]))
+
+        assert set(results) == {"i-1", "i-2"}
+        assert all("InvalidInstanceId" in err for _, _, err in results.values())
+        mock_client.get_paginator.return_value.paginate.assert_not_called()
+
+    def test_should_raise_ssm_error_when_credentials_missing(self, mock_client):
+        """Should raise SSMError when no AWS credentials are configured."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        mock_client.send_command.side_effect = NoCredentialsError()
+
+        with pytest.raises(SSMError):
+            list(SSMConnectionProvider().execute_command_batch(["i-1"], ["uptime"]))
+
+
+class TestSSMClient:
+    """Test the cached SSM client."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from remote.connection_ssm import clear_ssm_client_cache
+
+        clear_ssm_client_cache()
+        yield
+        clear_ssm_client_cache()
+
+    def test_should_reuse_client(self, mocker):
+        """Repeated lookups should return the same client."""
+        from remote.connection_ssm import get_ssm_client
+
+        mock_boto = mocker.patch("remote.connection_ssm.boto3")
+
+        assert get_ssm_client() is get_ssm_client()
+        mock_boto.client.assert_called_once_with("ssm")
+
+    def test_should_cache_client_per_profile(self, mocker):
+        """Each profile should get its own session-backed client."""
+        from remote.connection_ssm import get_ssm_client
+
+        mock_boto = mocker.patch("remote.connection_ssm.boto3")
+
+        get_ssm_client("dev")
+        get_ssm_client("dev")
+        get_ssm_client("prod")
+
+        assert mock_boto.session.Session.call_count == 2
+        mock_boto.session.Session.assert_any_call(profile_name="dev")
+        mock_boto.session.Session.assert_any_call(profile_name="prod")
+        mock_boto.client.assert_not_called()
+
+    def test_provider_should_use_profile_client(self, mocker):
+        """execute_command should request the client for its profile."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        client = mocker.MagicMock()
+        client.send_command.return_value = {"Command": {"CommandId": "cmd-1"}}
+        client.get_command_invocation.return_value = {"Status": "Success"}
+        mock_get = mocker.patch("remote.connection_ssm.get_ssm_client", return_value=client)
+        mocker.patch("remote.connection_ssm.time.sleep")
+
+        SSMConnectionProvider(ssm_profile="dev").execute_command(
+            instance_id="i-1", dns="", command=["true"], user="ubuntu"
+        )
+
+        mock_get.assert_called_once_with("dev")
+
+
+class TestSSMAgentReadiness:
+    """Test waiting for the SSM agent after an instance starts."""
+
+    @staticmethod
+    def _info(*statuses):
+        return {"InstanceInformationList": [{"PingStatus": status} for status in statuses]}
+
+    def test_returns_immediately_when_online(self, mocker):
+        from remote.connection_ssm import wait_for_ssm_ready
+
+        client = mocker.MagicMock()
+        client.describe_instance_information.return_value = self._info("Online")
+        mock_get = mocker.patch("remote.connection_ssm.get_ssm_client", return_value=client)
+        mock_sleep = mocker.patch("remote.connection_ssm.time.sleep")
+
+        assert wait_for_ssm_ready("i-1", "dev") is True
+        mock_get.assert_called_with("dev")
+        client.describe_instance_information.assert_called_once_with(
+            Filters=[{"Key": "InstanceIds", "Values": ["i-1"]}]
+        )
+        mock_sleep.assert_not_called()
+
+    def test_backs_off_until_agent_registers(self, mocker):
+        from remote.connection_ssm import wait_for_ssm_ready
+
+        client = mocker.MagicMock()
+        client.describe_instance_information.side_effect = [
+            self._info(),
+            self._info("ConnectionLost"),
+            self._info("Online"),
+        ]
+        mocker.patch("remote.connection_ssm.get_ssm_client", return_value=client)
+        mock_sleep = mocker.patch("remote.connection_ssm.time.sleep")
+
+        assert wait_for_ssm_ready("i-1") is True
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    def test_times_out(self, mocker):
+        from remote.connection_ssm import wait_for_ssm_ready
+
+        client = mocker.MagicMock()
+        client.describe_instance_information.return_value = self._info()
+        mocker.patch("remote.connection_ssm.get_ssm_client", return_value=client)
+        mocker.patch("remote.connection_ssm.time.sleep")
+        mocker.patch("remote.connection_ssm.time.monotonic", side_effect=[0, 4, 11])
+
+        assert wait_for_ssm_ready("i-1", timeout=10) is False
+        assert client.describe_instance_information.call_count == 2
+
+    def test_gives_up_when_status_cannot_be_read(self, mocker):
+        from remote.connection_ssm import wait_for_ssm_ready
+
+        client = mocker.MagicMock()
+        client.describe_instance_information.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+            "DescribeInstanceInformation",
+        )
+        mocker.patch("remote.connection_ssm.get_ssm_client", return_value=client)
+        mock_sleep = mocker.patch("remote.connection_ssm.time.sleep")
+
+        assert wait_for_ssm_ready("i-1") is False
+        mock_sleep.assert_not_called()
+
+    def test_raises_without_credentials(self, mocker):
+        from remote.connection_ssm import wait_for_ssm_ready
+
+        client = mocker.MagicMock()
+        client.describe_instance_information.side_effect = NoCredentialsError()
+        mocker.patch("remote.connection_ssm.get_ssm_client", return_value=client)
+
+        with pytest.raises(SSMError):
+            wait_for_ssm_ready("i-1")
 
 
 class TestSSMPortForward:
@@ -7,11 +7,15 @@ from typer.testing import CliRunner
 
 from remote.ecs import (
     app,
+    describe_services,
     get_all_clusters,
     get_all_services,
+    is_service_stable,
     prompt_for_cluster_name,
     prompt_for_services_name,
     scale_service,
+    scale_services,
+    wait_for_services_stable,
 )
 from remote.exceptions import AWSServiceError
 
@@ -182,6 +186,7 @@ def test_list_services_command_with_cluster_name(mocker):
     mock_get_all_services = mocker.patch(
         "remote.ecs.get_all_services", return_value=["test-service-1", "test-service-2"]
     )
+    mocker.patch("remote.ecs.describe_services", return_value={})
 
     result = runner.invoke(app, ["list-services", "test-cluster"])
 
@@ -196,6 +201,7 @@ def test_list_services_command_without_cluster_name(mocker):
         "remote.ecs.prompt_for_cluster_name", return_value="selected-cluster"
     )
     mock_get_all_services = mocker.patch("remote.ecs.get_all_services", return_value=["service-1"])
+    mocker.patch("remote.ecs.describe_services", return_value={})
 
     result = runner.invoke(app, ["list-services"])
 
@@ -224,6 +230,7 @@ def test_services_command_aliases(mocker, command):
     mock_get_all_services = mocker.patch(
         "remote.ecs.get_all_services", return_value=["test-service-1"]
     )
+    mocker.patch("remote.ecs.describe_services", return_value={})
 
     result = runner.invoke(app, [command, "test-cluster"])
 
@@ -442,3 +449,187 @@ def test_list_services_command_no_services_found(mocker):
     assert result.exit_code == 0
     mock_get_all_services.assert_called_once_with("test-cluster")
     assert "No services found" in result.stdout
+
+
+def _service(name, desired=2, running=2, pending=0, deployments=1, status="ACTIVE"):
+    return {
+        "serviceName": name,
+        "serviceArn": f"arn:aws:ecs:us-east-1:123456789012:service/test-cluster/{name}",
+        "status": status,
+        "desiredCount": desired,
+        "runningCount": running,
+        "pendingCount": pending,
+        "deployments": [{"id": f"ecs-svc/{i}"} for i in range(deployments)],
+    }
+
+
+class TestServiceOverview:
+    """Tests for batched describe_services and the list-services overview."""
+
+    def test_describe_services_batches_of_ten(self, mocker):
+        mock_ecs_client = mocker.patch("remote.ecs.get_ecs_client")
+        names = [f"svc-{i}" for i in range(23)]
+        mock_ecs_client.return_value.describe_services.side_effect = lambda cluster, services: {
+            "services": [_service(name) for name in services],
+            "failures": [],
+        }
+
+        result = describe_services("test-cluster", names)
+
+        calls = mock_ecs_client.return_value.describe_services.call_args_list
+        assert [len(call.kwargs["services"]) for call in calls] == [10, 10, 3]
+        assert all(call.kwargs["cluster"] == "test-cluster" for call in calls)
+        assert list(result) == names
+
+    def test_describe_services_skips_call_without_services(self, mocker):
+        mock_ecs_client = mocker.patch("remote.ecs.get_ecs_client")
+
+        assert describe_services("test-cluster", []) == {}
+        mock_ecs_client.return_value.describe_services.assert_not_called()
+
+    def test_describe_services_aws_error(self, mocker):
+        mock_ecs_client = mocker.patch("remote.ecs.get_ecs_client")
+        mock_ecs_client.return_value.describe_services.side_effect = ClientError(
+            {"Error": {"Code": "ClusterNotFoundException", "Message": "Error"}},
+            "describe_services",
+        )
+
+        with pytest.raises(AWSServiceError) as exc_info:
+            describe_services("test-cluster", ["svc"])
+
+        assert exc_info.value.operation == "describe_services"
+
+    @pytest.mark.parametrize(
+        "service,expected",
+        [
+            (_service("svc"), True),
+            (_service("svc", running=1), False),
+            (_service("svc", pending=1), False),
+            (_service("svc", deployments=2), False),
+        ],
+        ids=["stable", "short", "pending", "rolling"],
+    )
+    def test_is_service_stable(self, service, expected):
+        assert is_service_stable(service) is expected
+
+    def test_list_services_shows_counts(self, mocker):
+        arns = [
+            "arn:aws:ecs:us-east-1:123456789012:service/test-cluster/web",
+            "arn:aws:ecs:us-east-1:123456789012:service/test-cluster/gone",
+        ]
+        mocker.patch("remote.ecs.get_all_services", return_value=arns)
+        mock_describe = mocker.patch(
+            "remote.ecs.describe_services",
+            return_value={"web": _service("web", desired=3, running=2, pending=1)},
+        )
+
+        result = runner.invoke(app, ["list-services", "test-cluster"])
+
+        assert result.exit_code == 0
+        mock_describe.assert_called_once_with("test-cluster", arns)
+        assert "Desired" in result.stdout
+        assert "MISSING" in result.stdout
+        web_row = next(line for line in result.stdout.splitlines() if "web" in line)
+        assert "3" in web_row and "2" in web_row and "1" in web_row
+
+
+class TestParallelScaling:
+    """Tests for concurrent scaling and the shared wait-until-stable poll."""
+
+    def test_scale_services_collects_errors(self, mocker):
+        error = AWSServiceError("ECS", "update_service", "ServiceNotFoundException", "gone")
+
+        def fake_scale(cluster, service, count):
+            if service == "bad":
+                raise error
+
+        mock_scale = mocker.patch("remote.ecs.scale_service", side_effect=fake_scale)
+
+        result = scale_services("test-cluster", ["a", "bad", "b"], 3)
+
+        assert result == {"a": None, "bad": error, "b": None}
+        assert mock_scale.call_count == 3
+
+    def test_scale_services_empty(self, mocker):
+        mock_scale = mocker.patch("remote.ecs.scale_service")
+
+        assert scale_services("test-cluster", [], 3) == {}
+        mock_scale.assert_not_called()
+
+    def test_wait_shares_one_describe_per_poll(self, mocker):
+        mocker.patch("remote.ecs.time.sleep")
+        polls = [
+            {"a": _service("a", running=1), "b": _service("b")},
+            {"a": _service("a")},
+        ]
+        mock_describe = mocker.patch("remote.ecs.describe_services", side_effect=polls)
+
+        result = wait_for_services_stable("test-cluster", ["a", "b"])
+
+        assert mock_describe.call_args_list[0].args == ("test-cluster", ["a", "b"])
+        assert mock_describe.call_args_list[1].args == ("test-cluster", ["a"])
+        assert is_service_stable(result["a"]) and is_service_stable(result["b"])
+
+    def test_wait_stops_on_missing_and_inactive(self, mocker):
+        mock_describe = mocker.patch(
+            "remote.ecs.describe_services",
+            return_value={"old": _service("old", running=0, status="INACTIVE")},
+        )
+
+        wait_for_services_stable("test-cluster", ["old", "gone"])
+
+        mock_describe.assert_called_once()
+
+    def test_wait_times_out(self, mocker):
+        mocker.patch("remote.ecs.time.sleep")
+        mocker.patch("remote.ecs.time.monotonic", side_effect=[0, 5, 11])
+        mock_describe = mocker.patch(
+            "remote.ecs.describe_services", return_value={"a": _service("a", running=0)}
+        )
+
+        result = wait_for_services_stable("test-cluster", ["a"], timeout=10)
+
+        assert mock_describe.call_count == 2
+        assert not is_service_stable(result["a"])
+
+    def test_scale_command_waits_for_scaled_services(self, mocker):
+        mocker.patch("remote.ecs.scale_service")
+        mock_wait = mocker.patch(
+            "remote.ecs.wait_for_services_stable",
+            return_value={"web": _service("web")},
+        )
+
+        result = runner.invoke(
+            app, ["scale", "test-cluster", "web", "--count", "2", "--yes", "--wait"]
+        )
+
+        assert result.exit_code == 0
+        assert mock_wait.call_args.args == ("test-cluster", ["web"])
+        assert "All 1 service(s) stable" in result.stdout
+
+    def test_scale_command_wait_reports_unstable(self, mocker):
+        mocker.patch("remote.ecs.scale_service")
+        mocker.patch(
+            "remote.ecs.wait_for_services_stable",
+            return_value={"web": _service("web", running=1)},
+        )
+
+        result = runner.invoke(app, ["scale", "test-cluster", "web", "-n", "2", "-y", "-w"])
+
+        assert result.exit_code == 1
+        assert "Not stable yet: web" in result.stdout
+
+    def test_scale_command_reports_failed_services(self, mocker):
+        mocker.patch("remote.ecs.prompt_for_services_name", return_value=["service-1", "service-2"])
+
+        def fake_scale(cluster, service, count):
+            if service == "service-2":
+                raise AWSServiceError("ECS", "update_service", "ServiceNotFoundException", "gone")
+
+        mocker.patch("remote.ecs.scale_service", side_effect=fake_scale)
+
+        result = runner.invoke(app, ["scale", "test-cluster", "--count", "2", "--yes"])
+
+        assert result.exit_code == 1
+        assert "Scaled service-1 to 2 tasks" in result.stdout
+        assert "Failed to scale service-2" in result.stdout
@@ -95,7 +95,7 @@ class TestInstanceListCommand:
         mock_paginator.paginate.return_value = [mock_ec2_instances]
         mock_ec2_client.return_value.get_paginator.return_value = mock_paginator
 
-        mock_get_price = mocker.patch("remote.instance.get_instance_price_with_fallback")
+        mock_get_price = mocker.patch("remote.pricing.get_instance_price_with_fallback")
 
         result = runner.invoke(app, ["list"])
 
@@ -454,6 +454,24 @@ class TestBuildStatusTable:
         # Should still return a Panel with basic info (just no health section)
         assert isinstance(result, Panel)
 
+    def test_should_skip_health_call_when_not_expected_running(self, mocker):
+        """A stopped instance should cost one describe call when not expected running."""
+        from remote.instance import _fetch_status_fields
+
+        mock_status = mocker.patch("remote.instance.get_instance_status")
+        mock_ec2_client = mocker.patch("remote.instance.get_ec2_client")
+        mock_ec2_client.return_value.describe_instances.return_value = {
+            "Reservations": [
+                {"Instances": [{"InstanceId": "i-0123456789abcdef0", "State": {"Name": "stopped"}}]}
+            ]
+        }
+
+        fields = _fetch_status_fields("test-instance", "i-0123456789abcdef0", expect_running=False)
+
+        assert fields["state"] == "stopped"
+        assert fields["reachability"] == "-"
+        mock_status.assert_not_called()
+
     def test_should_raise_exception_for_not_found_instance(self, mocker):
         """Should raise InstanceNotFoundError when instance is not found."""
         import pytest
@@ -487,9 +505,7 @@ class TestWatchStatusFunction:
         # Mock time.sleep to raise KeyboardInterrupt
         mocker.patch("remote.instance.time.sleep", side_effect=KeyboardInterrupt)
 
-        # Mock _build_status_table to return a Panel (new behavior)
-        mock_panel = Panel("test content", title="Test")
-        mocker.patch("remote.instance._build_status_table", return_value=mock_panel)
+        mocker.patch("remote.instance._fetch_status_fields", return_value=_status_fields())
 
         # Mock console (imported from utils) and Live
         mocker.patch("remote.instance.console")
@@ -502,6 +518,285 @@ class TestWatchStatusFunction:
 
         # Verify the function tried to update at least once
         mock_live.return_value.update.assert_called()
+        assert isinstance(mock_live.return_value.update.call_args.args[0], Panel)
+
+    @pytest.fixture
+    def mock_live(self, mocker):
+        mocker.patch("remote.instance.console")
+        mock_live = mocker.patch("remote.instance.Live")
+        mock_live.return_value.__enter__ = mocker.Mock(return_value=mock_live.return_value)
+        mock_live.return_value.__exit__ = mocker.Mock(return_value=False)
+        return mock_live.return_value
+
+    def test_should_only_redraw_when_fields_change(self, mocker, mock_live):
+        """Unchanged polls should not redraw; changed fields are highlighted."""
+        from remote.instance import _watch_status
+
+        mocker.patch(
+            "remote.instance._fetch_status_fields",
+            side_effect=[
+                _status_fields(),
+                _status_fields(),
+                _status_fields(reachability="failed"),
+            ],
+        )
+        mock_render = mocker.patch("remote.instance._render_status_panel")
+        mocker.patch("remote.instance.time.sleep", side_effect=[None, None, KeyboardInterrupt])
+
+        _watch_status("test-instance", "i-0123456789abcdef0", 2)
+
+        assert mock_live.update.call_count == 2
+        assert [c.args[1] for c in mock_render.call_args_list] == [
+            frozenset(),
+            frozenset({"reachability"}),
+        ]
+
+    def test_should_clear_highlight_on_next_unchanged_poll(self, mocker, mock_live):
+        """A change is highlighted for one poll, then redrawn plain once."""
+        from remote.instance import _watch_status
+
+        failed = _status_fields(reachability="failed")
+        mocker.patch(
+            "remote.instance._fetch_status_fields",
+            side_effect=[_status_fields(), failed, failed, failed],
+        )
+        mock_render = mocker.patch("remote.instance._render_status_panel")
+        mock_sleep = mocker.patch(
+            "remote.instance.time.sleep", side_effect=[None, None, None, KeyboardInterrupt]
+        )
+
+        _watch_status("test-instance", "i-0123456789abcdef0", 2)
+
+        assert [c.args[1] for c in mock_render.call_args_list] == [
+            frozenset(),
+            frozenset({"reachability"}),
+            frozenset(),
+        ]
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 2, 4, 8]
+
+    def test_should_back_off_while_state_is_stable(self, mocker, mock_live):
+        """Poll delay should double while nothing changes and reset on change."""
+        from remote.instance import _watch_status
+
+        stable = [_status_fields()] * 6
+        mocker.patch(
+            "remote.instance._fetch_status_fields",
+            side_effect=[*stable, _status_fields(state="stopping")],
+        )
+        mock_sleep = mocker.patch(
+            "remote.instance.time.sleep", side_effect=[None] * 6 + [KeyboardInterrupt]
+        )
+
+        _watch_status("test-instance", "i-0123456789abcdef0", 2)
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [2, 4, 8, 16, 30, 30, 2]
+
+    def test_should_skip_health_call_for_stopped_instance(self, mocker, mock_live):
+        """Once an instance is seen stopped, polls should not request health."""
+        from remote.instance import _watch_status
+
+        mock_fetch = mocker.patch(
+            "remote.instance._fetch_status_fields",
+            return_value=_status_fields(state="stopped"),
+        )
+        mocker.patch("remote.instance.time.sleep", side_effect=[None, KeyboardInterrupt])
+
+        _watch_status("test-instance", "i-0123456789abcdef0", 2)
+
+        assert [c.args[2] for c in mock_fetch.call_args_list] == [True, False]
+
+
+def _status_fields(**overrides):
+    """Status fields as returned by _fetch_status_fields()."""
+    fields = {
+        "instance_id": "i-0123456789abcdef0",
+        "name": "test-instance",
+        "state": "running",
+        "type": "t3.micro",
+        "az": "us-east-1a",
+        "public_ip": "1.2.3.4",
+        "private_ip": "10.0.0.1",
+        "public_dns": "ec2-1-2-3-4.compute-1.amazonaws.com",
+        "key_name": "my-key",
+        "security_groups": "default",
+        "launch_time": "-",
+        "system_status": "ok",
+        "instance_status": "ok",
+        "reachability": "passed",
+        "tags": (),
+    }
+    fields.update(overrides)
+    return fields
+
+
+def _dashboard_instance(instance_id, name, state="running", **extra):
+    """A describe_instances instance entry for dashboard tests."""
+    instance = {
+        "InstanceId": instance_id,
+        "State": {"Name": state},
+        "InstanceType": "t3.micro",
+        "Tags": [{"Key": "Name", "Value": name}] if name else [],
+    }
+    instance.update(extra)
+    return instance
+
+
+class TestStatusDashboard:
+    """Tests for the multi-instance status dashboard."""
+
+    def test_should_build_rows_from_two_sweeps(self, mocker):
+        """Rows combine a live instance selection and one describe_instance_status sweep."""
+        from remote.instance import _fetch_dashboard_rows
+        from remote.instance_resolver import IndexedInstance
+
+        mock_select = mocker.patch(
+            "remote.instance.select_instances",
+            return_value=[
+                IndexedInstance("web-1", "i-1", "running", "", "t3.micro", public_ip="1.2.3.4"),
+                IndexedInstance("web-2", "i-2", "stopped", "", "t3.micro"),
+            ],
+        )
+        mock_statuses = mocker.patch(
+            "remote.instance.get_all_instance_statuses",
+            return_value={
+                "i-1": {
+                    "SystemStatus": {"Status": "ok"},
+                    "InstanceStatus": {"Status": "ok", "Details": [{"Status": "passed"}]},
+                },
+                "i-2": {
+                    "SystemStatus": {"Status": "not-applicable"},
+                    "InstanceStatus": {"Status": "not-applicable"},
+                },
+            },
+        )
+
+        rows = _fetch_dashboard_rows(["web-*"], {"team": "ml"})
+
+        mock_select.assert_called_once_with(["web-*"], {"team": "ml"}, refresh=True, store=False)
+        mock_statuses.assert_called_once_with()
+        assert rows == {
+            "i-1": ("web-1", "i-1", "running", "t3.micro", "1.2.3.4", "ok", "ok", "passed"),
+            "i-2": ("web-2", "i-2", "stopped", "t3.micro", "-", "-", "-", "-"),
+        }
+
+    def test_should_match_tags_like_exec_and_start(self, mocker):
+        """--tag values are matched client-side with globs, as select_instances does."""
+        from remote.instance import _fetch_dashboard_rows
+
+        mock_ec2 = mocker.patch("remote.utils.get_ec2_client")
+        mock_ec2.return_value.get_paginator.return_value.paginate.return_value = [
+            {
+                "Reservations": [
+                    {
+                        "Instances": [
+                            _dashboard_instance(
+                                "i-1",
+                                "web-1",
+                                Tags=[
+                                    {"Key": "Name", "Value": "web-1"},
+                                    {"Key": "team", "Value": "ml-research"},
+                                ],
+                            ),
+                            _dashboard_instance("i-2", "web-2"),
+                            _dashboard_instance("i-3", "web-3", state="terminated"),
+                        ]
+                    }
+                ]
+            }
+        ]
+        mocker.patch("remote.instance.get_all_instance_statuses", return_value={})
+
+        rows = _fetch_dashboard_rows([], {"team": "ml-*"})
+
+        assert list(rows) == ["i-1"]
+        call = mock_ec2.return_value.get_paginator.return_value.paginate.call_args
+        assert "tag:team" not in str(call)
+
+    def test_should_update_only_changed_rows(self):
+        """Diffing replaces changed rows, drops removed ones and reports changed columns."""
+        from remote.instance import _diff_dashboard_rows
+
+        table = {
+            "i-1": ("web-1", "i-1", "running"),
+            "i-2": ("web-2", "i-2", "running"),
+            "i-3": ("web-3", "i-3", "running"),
+        }
+        unchanged = table["i-1"]
+
+        changed = _diff_dashboard_rows(
+            table,
+            {
+                "i-1": ("web-1", "i-1", "running"),
+                "i-2": ("web-2", "i-2", "stopping"),
+                "i-4": ("web-4", "i-4", "pending"),
+            },
+        )
+
+        assert changed == {
+            "i-2": frozenset({2}),
+            "i-3": frozenset(),
+            "i-4": frozenset({0, 1, 2}),
+        }
+        assert table["i-1"] is unchanged
+        assert set(table) == {"i-1", "i-2", "i-4"}
+
+    def test_watch_should_redraw_only_on_change(self, mocker):
+        """The dashboard is redrawn on the first poll and when a row changes."""
+        from remote.instance import _watch_dashboard
+
+        running = {"i-1": ("web-1", "i-1", "running", "t3.micro", "-", "ok", "ok", "passed")}
+        stopping = {"i-1": ("web-1", "i-1", "stopping", "t3.micro", "-", "-", "-", "-")}
+        mock_fetch = mocker.patch(
+            "remote.instance._fetch_dashboard_rows",
+            side_effect=[running, running, stopping, stopping],
+        )
+        mock_render = mocker.patch("remote.instance._render_dashboard")
+        mocker.patch("remote.instance.console")
+        mock_live = mocker.patch("remote.instance.Live")
+        mock_live.return_value.__enter__ = mocker.Mock(return_value=mock_live.return_value)
+        mock_live.return_value.__exit__ = mocker.Mock(return_value=False)
+        mock_sleep = mocker.patch(
+            "remote.instance.time.sleep", side_effect=[None, None, None, KeyboardInterrupt]
+        )
+
+        _watch_dashboard([], {"team": "ml"}, 2)
+
+        mock_fetch.assert_called_with([], {"team": "ml"})
+        # The last, unchanged poll redraws once to clear the highlight
+        assert mock_live.return_value.update.call_count == 3
+        assert mock_render.call_args_list[0].args[1] is None
+        assert mock_render.call_args_list[1].args[1] == {"i-1": frozenset({2, 5, 6, 7})}
+        assert mock_render.call_args_list[2].args[1] == {}
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 4, 2, 2]
+
+    def test_status_all_should_print_dashboard(self, mocker):
+        """status --all prints one table without resolving a single instance."""
+        mock_resolve = mocker.patch("remote.instance.resolve_instance_or_exit")
+        mocker.patch(
+            "remote.instance._fetch_dashboard_rows",
+            return_value={
+                "i-1": ("web-1", "i-1", "running", "t3.micro", "-", "ok", "ok", "passed")
+            },
+        )
+
+        result = runner.invoke(app, ["status", "--all"])
+
+        assert result.exit_code == 0
+        assert "web-1" in result.stdout
+        assert "Instances (1)" in result.stdout
+        mock_resolve.assert_not_called()
+
+    def test_status_tag_should_filter_dashboard(self, mocker):
+        """status --tag passes parsed tag filters and name globs to the dashboard."""
+        mock_watch = mocker.patch("remote.instance._watch_dashboard")
+
+        result = runner.invoke(
+            app, ["status", "-T", "web-*", "--tag", "team=ml", "--watch", "-i", "5"]
+        )
+
+        assert result.exit_code == 0
+        mock_watch.assert_called_once_with(["web-*"], {"team": "ml"}, 5)
 
 
 def test_start_instance_already_running(mocker):
@@ -510,7 +805,7 @@ def test_start_instance_already_running(mocker):
         return_value=("test-instance", "i-0123456789abcdef0"),
     )
     mock_get_instance_id = mocker.patch(
-        "remote.instance.get_instance_id", return_value="i-0123456789abcdef0"
+        "remote.instance.get_cached_instance_id", return_value="i-0123456789abcdef0"
     )
     mock_is_instance_running = mocker.patch(
         "remote.instance.is_instance_running", return_value=True
@@ -532,7 +827,7 @@ def test_start_instance_success(mocker):
         return_value=("test-instance", "i-0123456789abcdef0"),
     )
     mock_get_instance_id = mocker.patch(
-        "remote.instance.get_instance_id", return_value="i-0123456789abcdef0"
+        "remote.instance.get_cached_instance_id", return_value="i-0123456789abcdef0"
     )
     mock_is_instance_running = mocker.patch(
         "remote.instance.is_instance_running", return_value=False
@@ -556,7 +851,7 @@ def test_start_instance_exception(mocker):
         "remote.instance.resolve_instance_or_exit",
         return_value=("test-instance", "i-0123456789abcdef0"),
     )
-    mocker.patch("remote.instance.get_instance_id", return_value="i-0123456789abcdef0")
+    mocker.patch("remote.instance.get_cached_instance_id", return_value="i-0123456789abcdef0")
     mocker.patch("remote.instance.is_instance_running", return_value=False)
 
     from botocore.exceptions import ClientError
@@ -598,8 +893,8 @@ def test_stop_instance_confirmed(mocker):
     )
     mocker.patch("remote.instance.is_instance_running", return_value=True)
     mocker.patch("remote.instance.get_instance_type", return_value="t3.micro")
-    mocker.patch("remote.instance.get_instance_price_with_fallback", return_value=(0.0104, False))
-    mocker.patch("remote.instance.tracking_manager")
+    mocker.patch("remote.pricing.get_instance_price_with_fallback", return_value=(0.0104, False))
+    mocker.patch("remote.tracking.tracking_manager")
 
     result = runner.invoke(app, ["stop", "test-instance"], input="y\n")
 
@@ -633,8 +928,8 @@ def test_stop_instance_exception(mocker):
     )
     mocker.patch("remote.instance.is_instance_running", return_value=True)
     mocker.patch("remote.instance.get_instance_type", return_value="t3.micro")
-    mocker.patch("remote.instance.get_instance_price_with_fallback", return_value=(0.0104, False))
-    mocker.patch("remote.instance.tracking_manager")
+    mocker.patch("remote.pricing.get_instance_price_with_fallback", return_value=(0.0104, False))
+    mocker.patch("remote.tracking.tracking_manager")
 
     from botocore.exceptions import ClientError
 
@@ -828,7 +1123,7 @@ def test_terminate_instance_confirmed(mocker):
         return_value=("test-instance", "i-0123456789abcdef0"),
     )
     mocker.patch("remote.instance.delete_auto_shutdown_alarm", return_value=False)
-    mocker.patch("remote.instance.delete_all_schedules_for_instance")
+    mocker.patch("remote.scheduler.delete_all_schedules_for_instance")
 
     mock_ec2_client.return_value.describe_instances.return_value = {
         "Reservations": [{"Instances": [{"Tags": []}]}]
@@ -850,7 +1145,7 @@ def test_terminate_terraform_managed_instance(mocker):
         return_value=("test-instance", "i-0123456789abcdef0"),
     )
     mocker.patch("remote.instance.delete_auto_shutdown_alarm", return_value=False)
-    mocker.patch("remote.instance.delete_all_schedules_for_instance")
+    mocker.patch("remote.scheduler.delete_all_schedules_for_instance")
 
     mock_ec2_client.return_value.describe_instances.return_value = {
         "Reservations": [
@@ -874,7 +1169,7 @@ def test_terminate_should_cleanup_autoshutdown_alarm(mocker):
     mock_delete_alarm = mocker.patch(
         "remote.instance.delete_auto_shutdown_alarm", return_value=True
     )
-    mocker.patch("remote.instance.delete_all_schedules_for_instance")
+    mocker.patch("remote.scheduler.delete_all_schedules_for_instance")
 
     mock_ec2_client.return_value.describe_instances.return_value = {
         "Reservations": [{"Instances": [{"Tags": []}]}]
@@ -896,7 +1191,7 @@ def test_terminate_should_succeed_even_if_no_autoshutdown_alarm(mocker):
     mock_delete_alarm = mocker.patch(
         "remote.instance.delete_auto_shutdown_alarm", return_value=False
     )
-    mocker.patch("remote.instance.delete_all_schedules_for_instance")
+    mocker.patch("remote.scheduler.delete_all_schedules_for_instance")
 
     mock_ec2_client.return_value.describe_instances.return_value = {
         "Reservations": [{"Instances": [{"Tags": []}]}]
@@ -1458,7 +1753,7 @@ class TestStartWithStopIn:
             "remote.instance.resolve_instance_or_exit",
             return_value=("test-instance", "i-0123456789abcdef0"),
         )
-        mocker.patch("remote.instance.get_instance_id", return_value="i-0123456789abcdef0")
+        mocker.patch("remote.instance.get_cached_instance_id", return_value="i-0123456789abcdef0")
 
         result = runner.invoke(app, ["start", "test-instance", "--stop-in", "bad"])
 
@@ -1790,7 +2085,7 @@ class TestInstanceListCostFlag:
 
         # Mock pricing
         mocker.patch(
-            "remote.instance.get_instance_price_with_fallback", return_value=(0.0104, False)
+            "remote.pricing.get_instance_price_with_fallback", return_value=(0.0104, False)
         )
 
         result = runner.invoke(app, ["list", flag])
@@ -1846,7 +2141,7 @@ class TestInstanceListCostFlag:
         mock_ec2_client.return_value.get_paginator.return_value = mock_paginator
 
         # Mock $0.01/hr pricing
-        mocker.patch("remote.instance.get_instance_price_with_fallback", return_value=(0.01, False))
+        mocker.patch("remote.pricing.get_instance_price_with_fallback", return_value=(0.01, False))
 
         result = runner.invoke(app, ["list", "--cost"])
 
@@ -1919,7 +2214,7 @@ class TestInstanceListCostFlag:
         mock_ec2_client.return_value.get_paginator.return_value = mock_paginator
 
         # Mock pricing to return None
-        mocker.patch("remote.instance.get_instance_price_with_fallback", return_value=(None, False))
+        mocker.patch("remote.pricing.get_instance_price_with_fallback", return_value=(None, False))
 
         result = runner.invoke(app, ["list", "--cost"])
 
@@ -1927,6 +2222,73 @@ class TestInstanceListCostFlag:
         # Should show "-" for unavailable pricing
         assert "-" in result.stdout
 
+    @pytest.mark.parametrize("type_count,expect_catalog", [(2, False), (5, True)])
+    def test_list_cost_loads_price_catalog_for_many_types(self, mocker, type_count, expect_catalog):
+        """Test that a region catalog sweep replaces per-type lookups for many types."""
+        mock_ec2_client = mocker.patch("remote.utils.get_ec2_client")
+        mock_paginator = mocker.MagicMock()
+        mock_paginator.paginate.return_value = [
+            {
+                "Reservations": [
+                    {
+                        "Instances": [
+                            {
+                                "InstanceId": f"i-{i:017x}",
+                                "InstanceType": f"t3.size{i}",
+                                "State": {"Name": "stopped", "Code": 80},
+                                "Tags": [{"Key": "Name", "Value": f"server-{i}"}],
+                            }
+                        ]
+                    }
+                    for i in range(type_count)
+                ]
+            }
+        ]
+        mock_ec2_client.return_value.get_paginator.return_value = mock_paginator
+        mock_load = mocker.patch("remote.pricing.load_region_prices")
+        mocker.patch("remote.pricing.get_instance_price_with_fallback", return_value=(0.1, False))
+
+        result = runner.invoke(app, ["list", "--cost"])
+
+        assert result.exit_code == 0
+        assert mock_load.called is expect_catalog
+
+    def test_list_cost_prices_each_distinct_type_once(self, mocker):
+        """Test that --cost prefetches one price per distinct type, with timing when verbose."""
+        mock_ec2_client = mocker.patch("remote.utils.get_ec2_client")
+        mock_paginator = mocker.MagicMock()
+        mock_paginator.paginate.return_value = [
+            {
+                "Reservations": [
+                    {
+                        "Instances": [
+                            {
+                                "InstanceId": f"i-{i:017x}",
+                                "InstanceType": "t3.large" if i % 2 else "t3.micro",
+                                "State": {"Name": "stopped", "Code": 80},
+                                "Tags": [{"Key": "Name", "Value": f"server-{i}"}],
+                            }
+                        ]
+                    }
+                    for i in range(4)
+                ]
+            }
+        ]
+        mock_ec2_client.return_value.get_paginator.return_value = mock_paginator
+        mocker.patch("remote.instance.get_current_region", return_value="us-east-1")
+        mock_price = mocker.patch(
+            "remote.pricing.get_instance_price_with_fallback", return_value=(0.1, False)
+        )
+
+        result = runner.invoke(app, ["list", "--cost", "--verbose"])
+
+        assert result.exit_code == 0
+        assert sorted(c.args for c in mock_price.call_args_list) == [
+            ("t3.large", "us-east-1"),
+            ("t3.micro", "us-east-1"),
+        ]
+        assert "Priced 2 instance type(s)" in result.stdout
+
     def test_list_cost_does_not_call_pricing_without_flag(self, mocker):
         """Test that pricing API is not called without --cost flag."""
         mock_ec2_client = mocker.patch("remote.utils.get_ec2_client")
@@ -1934,7 +2296,7 @@ class TestInstanceListCostFlag:
         mock_paginator.paginate.return_value = [{"Reservations": []}]
         mock_ec2_client.return_value.get_paginator.return_value = mock_paginator
 
-        mock_get_price = mocker.patch("remote.instance.get_instance_price_with_fallback")
+        mock_get_price = mocker.patch("remote.pricing.get_instance_price_with_fallback")
 
         result = runner.invoke(app, ["list"])
 
@@ -1971,9 +2333,7 @@ class TestInstanceListCostFlag:
         mock_ec2_client.return_value.get_paginator.return_value = mock_paginator
 
         # Mock pricing to return fallback (used_fallback=True)
-        mocker.patch(
-            "remote.instance.get_instance_price_with_fallback", return_value=(0.0116, True)
-        )
+        mocker.patch("remote.pricing.get_instance_price_with_fallback", return_value=(0.0116, True))
 
         result = runner.invoke(app, ["list", "--cost"])
 
@@ -2015,7 +2375,7 @@ class TestInstanceListCostFlag:
 
         # Mock pricing to return without fallback (used_fallback=False)
         mocker.patch(
-            "remote.instance.get_instance_price_with_fallback", return_value=(0.0116, False)
+            "remote.pricing.get_instance_price_with_fallback", return_value=(0.0116, False)
         )
 
         result = runner.invoke(app, ["list", "--cost"])
@@ -2156,6 +2516,7 @@ class TestConnectStoppedInstanceBehavior:
         mocker.patch("remote.instance.get_ec2_client", mock_ec2)
         mock_subprocess = mocker.patch("remote.instance.subprocess.run")
         mocker.patch("remote.instance.time.sleep")
+        mocker.patch("remote.instance.wait_for_ssh_ready", return_value=True)
 
         # Mock instance lookup
         mock_ec2.return_value.describe_instances.return_value = {
@@ -2386,7 +2747,7 @@ class TestExecCommand:
     def test_exec_fails_when_no_command_provided(self, mocker):
         """Test that exec fails when no command is provided."""
         mocker.patch("remote.instance.get_instance_name", return_value="test-instance")
-        mocker.patch("remote.instance.get_instance_id", return_value="i-0123456789abcdef0")
+        mocker.patch("remote.instance.get_cached_instance_id", return_value="i-0123456789abcdef0")
         mocker.patch("remote.instance.is_instance_running", return_value=True)
 
         result = runner.invoke(app, ["exec", "test-instance"])
@@ -2591,8 +2952,8 @@ class TestExecCommand:
             "InstanceStatuses": [{"InstanceState": {"Name": "running"}}]
         }
 
-        mock_config.get_value.side_effect = (
-            lambda k: "/home/user/.ssh/config-key.pem" if k == "ssh_key_path" else None
+        mock_config.get_value.side_effect = lambda k: (
+            "/home/user/.ssh/config-key.pem" if k == "ssh_key_path" else None
         )
 
         mock_result = mocker.MagicMock()
@@ -2859,6 +3220,7 @@ class TestExecCommand:
         mocker.patch("remote.instance.get_ec2_client", mock_ec2)
         mock_subprocess = mocker.patch("remote.instance.subprocess.run")
         mocker.patch("remote.instance.time.sleep")
+        mocker.patch("remote.instance.wait_for_ssh_ready", return_value=True)
 
         mock_ec2.return_value.describe_instances.return_value = {
             "Reservations": [
@@ -2897,6 +3259,205 @@ class TestExecCommand:
         mock_ec2.return_value.start_instances.assert_called()
 
 
+class TestExecFanOut:
+    """Tests for 'remote instance exec' across many instances."""
+
+    @pytest.fixture
+    def instances(self):
+        from remote.instance_resolver import IndexedInstance
+
+        return [
+            IndexedInstance("dev-1", "i-1", "running", "dev-1.example.com", "t3.micro"),
+            IndexedInstance("dev-2", "i-2", "running", "dev-2.example.com", "t3.micro"),
+            IndexedInstance("dev-3", "i-3", "stopped", "", "t3.micro"),
+        ]
+
+    @pytest.fixture
+    def provider(self, mocker):
+        provider = mocker.MagicMock()
+        mocker.patch("remote.connection.get_connection_provider", return_value=provider)
+        return provider
+
+    def test_runs_on_every_running_target(self, mocker, instances, provider):
+        mock_select = mocker.patch("remote.instance.select_instances", return_value=instances)
+        provider.execute_command.side_effect = lambda **kw: (0, f"up on {kw['dns']}\n", "")
+
+        result = runner.invoke(app, ["exec", "-T", "dev-*", "--tag", "team=ml", "uptime"])
+
+        assert result.exit_code == 0, result.output
+        mock_select.assert_called_once_with(["dev-*"], {"team": "ml"})
+        assert provider.execute_command.call_count == 2
+        assert provider.execute_command.call_args.kwargs["command"] == ["uptime"]
+        assert "[dev-1] up on dev-1.example.com" in result.stdout
+        assert "[dev-2] up on dev-2.example.com" in result.stdout
+        assert "skipped (stopped)" in result.stdout
+        assert "2/2 succeeded, 1 skipped" in result.stdout
+
+    def test_reports_failed_hosts_and_exits_nonzero(self, mocker, instances, provider):
+        import subprocess
+
+        mocker.patch("remote.instance.select_instances", return_value=instances[:2])
+        provider.execute_command.side_effect = [
+            (0, "", ""),
+            subprocess.TimeoutExpired(cmd="ssh", timeout=30),
+        ]
+
+        result = runner.invoke(app, ["exec", "-T", "dev-*", "true"])
+
+        assert result.exit_code == 1
+        assert "timed out after 30s" in result.output
+        assert "1/2 succeeded" in result.output
+
+    def test_unexpected_error_on_one_host_keeps_other_results(self, mocker, instances, provider):
+        from botocore.exceptions import EndpointConnectionError
+
+        mocker.patch("remote.instance.select_instances", return_value=instances[:2])
+
+        def execute(**kw):
+            if kw["instance_id"] == "i-1":
+                raise EndpointConnectionError(endpoint_url="https://ssm.example.com")
+            return (0, "two\n", "")
+
+        provider.execute_command.side_effect = execute
+
+        result = runner.invoke(app, ["exec", "-T", "dev-*", "uptime"])
+
+        assert result.exit_code == 1
+        assert "[dev-2] two" in result.stdout
+        assert "Could not connect to the endpoint URL" in result.output
+        assert "1/2 succeeded" in result.output
+
+    def test_no_matching_instances(self, mocker, provider):
+        mocker.patch("remote.instance.select_instances", return_value=[])
+
+        result = runner.invoke(app, ["exec", "--tag", "team=none", "uptime"])
+
+        assert result.exit_code == 1
+        assert "No instances match" in result.output
+        provider.execute_command.assert_not_called()
+
+    def test_ssm_uses_batched_send_command(self, mocker, instances):
+        from remote.connection_ssm import SSMConnectionProvider
+
+        mocker.patch("remote.instance.select_instances", return_value=instances)
+        mock_batch = mocker.patch.object(
+            SSMConnectionProvider,
+            "execute_command_batch",
+            return_value=iter([("i-2", (0, "two\n", "")), ("i-1", (3, "", "bad"))]),
+        )
+        mock_single = mocker.patch.object(SSMConnectionProvider, "execute_command")
+
+        result = runner.invoke(app, ["exec", "-C", "ssm", "-T", "dev-*", "uptime"])
+
+        assert result.exit_code == 1
+        mock_batch.assert_called_once_with(["i-1", "i-2"], ["uptime"], verbose=False, timeout=30)
+        mock_single.assert_not_called()
+        assert "[dev-2] two" in result.stdout
+        assert "[dev-1] bad" in result.output
+        assert "skipped (stopped)" in result.stdout
+        assert "1/2 succeeded, 1 skipped" in result.output
+
+
+class TestFleetStartStop:
+    """Tests for 'remote instance start/stop' across many instances."""
+
+    @pytest.fixture
+    def instances(self):
+        from remote.instance_resolver import IndexedInstance
+
+        return [
+            IndexedInstance("ci-1", "i-1", "stopped", "", "t3.micro"),
+            IndexedInstance("ci-2", "i-2", "stopped", "", "t3.large"),
+            IndexedInstance("ci-3", "i-3", "running", "ci-3.example.com", "t3.micro"),
+        ]
+
+    @pytest.fixture
+    def mock_ec2(self, mocker):
+        return mocker.patch("remote.instance.get_ec2_client").return_value
+
+    @pytest.fixture
+    def mock_tracking(self, mocker):
+        return mocker.patch("remote.tracking.tracking_manager")
+
+    def test_start_sends_one_batched_call(self, mocker, instances, mock_ec2, mock_tracking):
+        mock_select = mocker.patch("remote.instance.select_instances", return_value=instances)
+        mock_ec2.start_instances.return_value = {
+            "StartingInstances": [
+                {"InstanceId": "i-1", "PreviousState": {"Name": "stopped"}},
+                # Started concurrently by someone else; already tracked
+                {"InstanceId": "i-2", "PreviousState": {"Name": "pending"}},
+            ]
+        }
+
+        result = runner.invoke(app, ["start", "--tag", "cluster=ci"])
+
+        assert result.exit_code == 0, result.output
+        mock_select.assert_called_once_with([], {"cluster": "ci"}, refresh=True)
+        mock_ec2.start_instances.assert_called_once_with(InstanceIds=["i-1", "i-2"])
+        mock_tracking.record_starts.assert_called_once()
+        assert list(mock_tracking.record_starts.call_args.args[0]) == [("i-1", "ci-1")]
+        assert "Skipping ci-3: instance is running" in result.stdout
+        assert "Starting 2 instance(s): ci-1, ci-2" in result.stdout
+
+    def test_start_wait_polls_all_instances_together(
+        self, mocker, instances, mock_ec2, mock_tracking
+    ):
+        mocker.patch("remote.instance.select_instances", return_value=instances[:2])
+        mock_ec2.start_instances.return_value = {"StartingInstances": []}
+        mock_wait = mocker.patch(
+            "remote.instance.wait_for_instance_states",
+            return_value={"i-1": "running", "i-2": "pending"},
+        )
+
+        result = runner.invoke(app, ["start", "-T", "ci-*", "--wait"])
+
+        assert result.exit_code == 1
+        assert mock_wait.call_args.args[:2] == (["i-1", "i-2"], "running")
+        assert "Not running yet: ci-2" in result.output
+
+    def test_start_rejects_stop_in_with_targets(self, mocker, mock_ec2):
+        result = runner.invoke(app, ["start", "-T", "ci-*", "--stop-in", "1h"])
+
+        assert result.exit_code == 1
+        assert "--stop-in cannot be combined" in result.stdout
+        mock_ec2.start_instances.assert_not_called()
+
+    def test_stop_batches_call_prices_and_tracking(
+        self, mocker, instances, mock_ec2, mock_tracking
+    ):
+        from dataclasses import replace
+
+        running = [replace(instance, state="running") for instance in instances]
+        mocker.patch("remote.instance.select_instances", return_value=running)
+        mocker.patch("remote.instance.get_current_region", return_value="us-east-1")
+        mock_prices = mocker.patch(
+            "remote.instance._prefetch_instance_prices",
+            return_value={"t3.micro": (0.01, False), "t3.large": (0.08, False)},
+        )
+
+        result = runner.invoke(app, ["stop", "-T", "ci-*", "--yes"])
+
+        assert result.exit_code == 0, result.output
+        assert sorted(mock_prices.call_args.args[0]) == ["t3.large", "t3.micro", "t3.micro"]
+        mock_ec2.stop_instances.assert_called_once_with(InstanceIds=["i-1", "i-2", "i-3"])
+        assert list(mock_tracking.record_stops.call_args.args[0]) == [
+            ("i-1", 0.01, "ci-1"),
+            ("i-2", 0.08, "ci-2"),
+            ("i-3", 0.01, "ci-3"),
+        ]
+        assert "Stopping 3 instance(s)" in result.stdout
+
+    def test_stop_confirms_once(self, mocker, instances, mock_ec2, mock_tracking):
+        mocker.patch("remote.instance.select_instances", return_value=instances)
+
+        result = runner.invoke(app, ["stop", "--tag", "cluster=ci"], input="n\n")
+
+        assert result.exit_code == 0
+        assert "stop 1 instances 'ci-3'" in result.stdout
+        mock_ec2.stop_instances.assert_not_called()
+        mock_tracking.record_stops.assert_not_called()
+
+
 # ============================================================================
 # Launch Command Tests
 # ============================================================================
@@ -3260,6 +3821,7 @@ class TestResolveInstanceWithoutName:
 
         mock_config = mocker.patch("remote.instance_resolver.config_manager")
         mock_config.get_instance_name.return_value = "default-instance"
+        mock_config.get_value.return_value = "0"  # Inventory cache disabled
 
         mock_ec2_client = mocker.patch("remote.utils.get_ec2_client")
         mock_ec2_client.return_value.describe_instances.return_value = {
@@ -3419,8 +3981,8 @@ class TestGetSshConfig:
         reset_ssh_config_cache()
 
         mock_config = mocker.patch("remote.instance.config_manager")
-        mock_config.get_value.side_effect = (
-            lambda k: "ec2-user" if k == "ssh_user" else "/path/to/key.pem"
+        mock_config.get_value.side_effect = lambda k: (
+            "ec2-user" if k == "ssh_user" else "/path/to/key.pem"
         )
 
         result = get_ssh_config()
@@ -3898,11 +4460,13 @@ class TestWatchStatusEdgeCases:
         from remote.exceptions import AWSServiceError
         from remote.instance import _watch_status
 
-        # Mock _build_status_table to raise an error after one successful call
-        mock_panel = mocker.MagicMock()
+        # Mock _fetch_status_fields to raise an error after one successful call
         mocker.patch(
-            "remote.instance._build_status_table",
-            side_effect=[mock_panel, AWSServiceError("EC2", "describe", "TestError", "Test error")],
+            "remote.instance._fetch_status_fields",
+            side_effect=[
+                _status_fields(),
+                AWSServiceError("EC2", "describe", "TestError", "Test error"),
+            ],
         )
 
         mocker.patch("remote.instance.console")
@@ -3929,7 +4493,7 @@ class TestWatchStatusEdgeCases:
         from remote.instance import _watch_status
 
         mocker.patch(
-            "remote.instance._build_status_table",
+            "remote.instance._fetch_status_fields",
             side_effect=InstanceNotFoundError("test-instance"),
         )
 
@@ -3975,13 +4539,99 @@ class TestEnsureInstanceRunning:
         # First call returns False (not running), subsequent calls return True
         mocker.patch("remote.instance.is_instance_running", side_effect=[False, False, True])
         mock_start = mocker.patch("remote.instance._start_instance")
-        mocker.patch("remote.instance.time.sleep")
+        mock_running = mocker.patch("remote.instance.wait_for_instance_running", return_value=True)
+        mock_ssh = mocker.patch("remote.instance.wait_for_ssh_ready", return_value=True)
+        mock_sleep = mocker.patch("remote.instance.time.sleep")
 
         _ensure_instance_running(
             "test-instance", "i-123", auto_start=True, no_start=False, quiet=True
         )
 
         mock_start.assert_called()
+        mock_running.assert_called_once_with("i-123")
+        mock_ssh.assert_called_once_with("i-123")
+        mock_sleep.assert_not_called()
+
+    def test_should_wait_for_ssm_agent_when_not_using_ssh(self, mocker):
+        """SSM connections should wait for the agent instead of probing sshd."""
+        from remote.instance import _ensure_instance_running
+
+        mocker.patch("remote.instance.is_instance_running", side_effect=[False, False, True])
+        mocker.patch("remote.instance._start_instance")
+        mock_running = mocker.patch("remote.instance.wait_for_instance_running", return_value=True)
+        mock_ssh = mocker.patch("remote.instance.wait_for_ssh_ready")
+        mock_ssm = mocker.patch("remote.connection_ssm.wait_for_ssm_ready", return_value=True)
+
+        _ensure_instance_running(
+            "test-instance",
+            "i-123",
+            auto_start=True,
+            no_start=False,
+            quiet=True,
+            wait_for_ssh=False,
+            ssm_profile="dev",
+        )
+
+        mock_running.assert_called_once_with("i-123")
+        mock_ssh.assert_not_called()
+        mock_ssm.assert_called_once_with("i-123", "dev")
+
+    def test_should_warn_when_ssm_agent_not_ready(self, mocker):
+        """Should warn but continue when the SSM agent does not come online in time."""
+        from remote.instance import _ensure_instance_running
+
+        mocker.patch("remote.instance.is_instance_running", side_effect=[False, False, True])
+        mocker.patch("remote.instance._start_instance")
+        mocker.patch("remote.instance.wait_for_instance_running", return_value=True)
+        mocker.patch("remote.connection_ssm.wait_for_ssm_ready", return_value=False)
+        mock_warning = mocker.patch("remote.instance.print_warning")
+
+        _ensure_instance_running(
+            "test-instance", "i-123", auto_start=True, no_start=False, wait_for_ssh=False
+        )
+
+        assert any("not online yet" in c.args[0] for c in mock_warning.call_args_list)
+
+    def test_exec_ssm_start_waits_for_agent_before_send_command(self, mocker):
+        """exec --connection ssm --start should only send the command once the agent is online."""
+        from remote.connection_ssm import SSMConnectionProvider
+
+        calls = []
+        mocker.patch("remote.instance.get_cached_instance_id", return_value="i-0123456789abcdef0")
+        mocker.patch("remote.instance.is_instance_running", side_effect=[False, False, True])
+        mocker.patch("remote.instance._start_instance")
+        mocker.patch("remote.instance.get_instance_dns", return_value="")
+        mocker.patch("remote.instance.wait_for_instance_running", return_value=True)
+        mocker.patch(
+            "remote.connection_ssm.wait_for_ssm_ready",
+            side_effect=lambda *a: calls.append("ready") or True,
+        )
+        mocker.patch.object(
+            SSMConnectionProvider,
+            "execute_command",
+            side_effect=lambda **kw: calls.append("send") or (0, "ok\n", ""),
+        )
+
+        result = runner.invoke(
+            app, ["exec", "--connection", "ssm", "--start", "test-instance", "uptime"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert calls == ["ready", "send"]
+
+    def test_should_warn_when_ssh_not_ready(self, mocker):
+        """Should warn but continue when sshd does not answer in time."""
+        from remote.instance import _ensure_instance_running
+
+        mocker.patch("remote.instance.is_instance_running", side_effect=[False, False, True])
+        mocker.patch("remote.instance._start_instance")
+        mocker.patch("remote.instance.wait_for_instance_running", return_value=True)
+        mocker.patch("remote.instance.wait_for_ssh_ready", return_value=False)
+        mock_warning = mocker.patch("remote.instance.print_warning")
+
+        _ensure_instance_running("test-instance", "i-123", auto_start=True, no_start=False)
+
+        assert any("not answering yet" in c.args[0] for c in mock_warning.call_args_list)
 
     def test_should_exit_if_non_interactive_without_flags(self, mocker):
         """Should exit when non-interactive and neither start nor no-start flag set."""
@@ -4016,7 +4666,7 @@ class TestEnsureInstanceRunning:
         # Always return False (instance never starts)
         mocker.patch("remote.instance.is_instance_running", return_value=False)
         mocker.patch("remote.instance._start_instance")
-        mocker.patch("remote.instance.time.sleep")
+        mocker.patch("remote.instance.wait_for_instance_running", return_value=False)
 
         with pytest.raises(typer.Exit) as exc_info:
             _ensure_instance_running("test-instance", "i-123", auto_start=True, no_start=False)
@@ -4470,7 +5120,7 @@ class TestListInstancesTimezoneHandling:
 
         # Mock pricing to avoid external calls
         mocker.patch(
-            "remote.instance.get_instance_price_with_fallback",
+            "remote.pricing.get_instance_price_with_fallback",
             return_value=(0.05, False),
         )
 
@@ -4652,6 +5302,64 @@ class TestBuildRsyncCommand:
         assert cmd[exclude_indices[0] + 1] == "*.pyc"
         assert cmd[exclude_indices[1] + 1] == "__pycache__"
 
+    def test_should_reuse_ssh_master_when_control_path_given(self, tmp_path):
+        """Should route rsync's ssh through the instance's master socket."""
+        from remote.instance import _build_rsync_command
+
+        control_path = tmp_path / "ubuntu@i-123"
+        cmd = _build_rsync_command(
+            source="./local/",
+            destination="user@host:/remote/",
+            ssh_key=None,
+            ssh_user="ubuntu",
+            control_path=control_path,
+        )
+
+        ssh_cmd = cmd[cmd.index("-e") + 1]
+        assert "ControlMaster=no" in ssh_cmd
+        assert f"ControlPath={control_path}" in ssh_cmd
+
+
+class TestSshMastersCommand:
+    """Test the ssh-masters command."""
+
+    @pytest.fixture
+    def masters(self, tmp_path):
+        from remote.connection_ssh import ControlMaster
+
+        return [
+            ControlMaster(tmp_path / "ubuntu@i-web", "ubuntu", "i-web", True),
+            ControlMaster(tmp_path / "ubuntu@i-db", "ubuntu", "i-db", False),
+        ]
+
+    def test_lists_masters(self, mocker, masters):
+        mocker.patch("remote.instance.list_control_masters", return_value=masters)
+
+        result = runner.invoke(app, ["ssh-masters"])
+
+        assert result.exit_code == 0
+        assert "i-web" in result.stdout
+        assert "stale" in result.stdout
+
+    def test_closes_masters_for_one_instance(self, mocker, masters):
+        mocker.patch("remote.instance.list_control_masters", return_value=masters)
+        mocker.patch("remote.instance.get_cached_instance_id", return_value="i-web")
+        mock_close = mocker.patch("remote.instance.close_control_master", return_value=True)
+
+        result = runner.invoke(app, ["ssh-masters", "web", "--close"])
+
+        assert result.exit_code == 0
+        mock_close.assert_called_once_with(masters[0])
+        assert "Closed 1 SSH master connection(s)" in result.stdout
+
+    def test_no_masters(self, mocker):
+        mocker.patch("remote.instance.list_control_masters", return_value=[])
+
+        result = runner.invoke(app, ["ssh-masters", "--close"])
+
+        assert result.exit_code == 0
+        assert "No SSH master connections open" in result.stdout
+
 
 class TestResolveTransferPaths:
     """Test _resolve_transfer_paths helper function."""
@@ -4709,7 +5417,7 @@ class TestCopyCommand:
     def test_should_copy_local_to_remote(self, mocker):
         """Should execute rsync to copy local files to remote instance."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -4744,7 +5452,7 @@ class TestCopyCommand:
     def test_should_copy_remote_to_local(self, mocker):
         """Should execute rsync to copy remote files to local."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -4777,7 +5485,7 @@ class TestCopyCommand:
     def test_should_use_dry_run_flag(self, mocker):
         """Should perform dry run when --dry-run flag is used."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -4797,12 +5505,15 @@ class TestCopyCommand:
             return_value=mocker.MagicMock(returncode=0),
         )
 
+        mock_master = mocker.patch("remote.instance.start_control_master")
+
         result = runner.invoke(app, ["copy", "--dry-run", "./local/", "test-instance:/remote/"])
 
         assert result.exit_code == 0
         assert "Would copy" in result.stdout
         rsync_cmd = mock_subprocess.call_args[0][0]
         assert "--dry-run" in rsync_cmd
+        mock_master.assert_not_called()
 
     def test_should_fail_with_two_local_paths(self, mocker):
         """Should exit with error when both paths are local."""
@@ -4814,7 +5525,7 @@ class TestCopyCommand:
     def test_should_fail_when_instance_not_running(self, mocker):
         """Should exit with error when instance is not running and --no-start is used."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -4830,7 +5541,7 @@ class TestCopyCommand:
     def test_should_fail_when_no_dns(self, mocker):
         """Should exit with error when instance has no public DNS."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -4858,7 +5569,7 @@ class TestSyncCommand:
     def test_should_sync_without_delete(self, mocker):
         """Should execute rsync without --delete when not specified."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -4888,7 +5599,7 @@ class TestSyncCommand:
     def test_should_sync_with_delete_and_yes_flag(self, mocker):
         """Should execute rsync with --delete when specified with --yes."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -4920,7 +5631,7 @@ class TestSyncCommand:
     def test_should_prompt_for_delete_confirmation(self, mocker):
         """Should prompt for confirmation when --delete is used without --yes."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -4940,7 +5651,7 @@ class TestSyncCommand:
     def test_should_skip_confirmation_for_dry_run_delete(self, mocker):
         """Should not prompt when --delete and --dry-run are used together."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -4960,6 +5671,7 @@ class TestSyncCommand:
             return_value=mocker.MagicMock(returncode=0),
         )
         mock_confirm = mocker.patch("remote.instance.confirm_action")
+        mock_master = mocker.patch("remote.instance.start_control_master")
 
         result = runner.invoke(
             app, ["sync", "--delete", "--dry-run", "./local/", "test-instance:/remote/"]
@@ -4968,11 +5680,12 @@ class TestSyncCommand:
         assert result.exit_code == 0
         assert "Would sync" in result.stdout
         mock_confirm.assert_not_called()
+        mock_master.assert_not_called()
 
     def test_should_use_exclude_patterns(self, mocker):
         """Should pass exclude patterns to rsync."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -5005,7 +5718,7 @@ class TestSyncCommand:
     def test_should_handle_rsync_failure(self, mocker):
         """Should exit with rsync's exit code on failure."""
         mocker.patch(
-            "remote.instance.get_instance_id",
+            "remote.instance.get_cached_instance_id",
             return_value="i-0123456789abcdef0",
         )
         mocker.patch(
@@ -0,0 +1,342 @@
+"""Tests for the on-disk EC2 inventory cache."""
+
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from remote.exceptions import InstanceNotFoundError, MultipleInstancesFoundError
+from remote.inventory import (
+    INVENTORY_CACHE_VERSION,
+    InventoryCache,
+    filter_reservations_by_state,
+    get_inventory_file_path,
+)
+
+
+def _reservation(instance_id: str, name: str, state: str = "running") -> dict:
+    return {
+        "Instances": [
+            {
+                "InstanceId": instance_id,
+                "State": {"Name": state},
+                "Tags": [{"Key": "Name", "Value": name}],
+                "LaunchTime": datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+            }
+        ]
+    }
+
+
+class TestInventoryCache:
+    """Tests for InventoryCache persistence."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return InventoryCache(tmp_path / "inventory.json")
+
+    def test_init_default_path(self):
+        assert InventoryCache().cache_file == get_inventory_file_path()
+
+    def test_get_missing_file(self, cache):
+        assert cache.get("default:us-east-1", 60) is None
+
+    def test_store_and_get_round_trips_datetimes(self, cache):
+        reservations = [_reservation("i-abc123", "web")]
+        cache.store("default:us-east-1", reservations)
+
+        result = cache.get("default:us-east-1", 60)
+
+        assert result == reservations
+        assert isinstance(result[0]["Instances"][0]["LaunchTime"], datetime)
+
+    def test_get_other_scope_misses(self, cache):
+        cache.store("default:us-east-1", [_reservation("i-abc123", "web")])
+        assert cache.get("prod:eu-west-1", 60) is None
+
+    def test_get_expired_misses(self, cache, mocker):
+        cache.store("default:us-east-1", [_reservation("i-abc123", "web")])
+        mocker.patch("remote.inventory.time.time", return_value=time.time() + 120)
+        assert cache.get("default:us-east-1", 60) is None
+
+    def test_zero_ttl_always_misses(self, cache):
+        cache.store("default:us-east-1", [_reservation("i-abc123", "web")])
+        assert cache.get("default:us-east-1", 0) is None
+
+    def test_get_ignores_other_version(self, cache):
+        cache.cache_file.write_text(
+            json.dumps(
+                {
+                    "version": INVENTORY_CACHE_VERSION + 1,
+                    "scope": "default:us-east-1",
+                    "fetched_at": time.time(),
+                    "reservations": [],
+                }
+            )
+        )
+        assert cache.get("default:us-east-1", 60) is None
+
+    def test_get_corrupt_file_misses(self, cache):
+        cache.cache_file.write_text("{not json")
+        assert cache.get("default:us-east-1", 60) is None
+
+    def test_store_leaves_no_temp_files(self, cache):
+        cache.store("default:us-east-1", [_reservation("i-abc123", "web")])
+        assert [p.name for p in cache.cache_file.parent.iterdir()] == ["inventory.json"]
+
+    def test_invalidate(self, cache):
+        cache.store("default:us-east-1", [_reservation("i-abc123", "web")])
+        cache.invalidate()
+        assert not cache.cache_file.exists()
+        cache.invalidate()  # Missing file is not an error
+
+
+def test_filter_reservations_by_state_drops_empty_reservations():
+    reservations = [
+        _reservation("i-1", "web", "running"),
+        _reservation("i-2", "old", "terminated"),
+    ]
+    result = filter_reservations_by_state(reservations, ["running"])
+    assert [r["Instances"][0]["InstanceId"] for r in result] == ["i-1"]
+
+
+class TestCachedResolver:
+    """Tests for the cache-backed lookups in instance_resolver."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, mocker):
+        mocker.patch("remote.instance_resolver.get_inventory_cache_ttl", return_value=60)
+        mocker.patch("remote.instance_resolver._inventory_scope", return_value="default:us-east-1")
+
+    @pytest.fixture
+    def mock_get_instances(self, mocker):
+        return mocker.patch(
+            "remote.instance_resolver.get_instances",
+            return_value=[
+                _reservation("i-web", "web"),
+                _reservation("i-db", "db", "stopped"),
+                _reservation("i-gone", "gone", "terminated"),
+            ],
+        )
+
+    def test_repeated_lookups_reuse_one_sweep(self, mock_get_instances, mocker):
+        from remote.instance_resolver import get_cached_instance_id, get_cached_instances
+
+        mock_live = mocker.patch("remote.instance_resolver.get_instance_id")
+
+        assert get_cached_instance_id("web") == "i-web"
+        assert get_cached_instance_id("db") == "i-db"
+        assert len(get_cached_instances()) == 3
+
+        mock_get_instances.assert_called_once_with()
+        mock_live.assert_not_called()
+
+    def test_exclude_terminated_filters_client_side(self, mock_get_instances):
+        from remote.instance_resolver import get_cached_instances
+
+        result = get_cached_instances(exclude_terminated=True)
+
+        ids = [r["Instances"][0]["InstanceId"] for r in result]
+        assert ids == ["i-web", "i-db"]
+
+    def test_refresh_bypasses_cache(self, mock_get_instances):
+        from remote.instance_resolver import get_cached_instances
+
+        get_cached_instances()
+        get_cached_instances(refresh=True)
+
+        assert mock_get_instances.call_count == 2
+
+    def test_terminated_instance_not_resolved_from_fresh_sweep(self, mock_get_instances):
+        from remote.instance_resolver import get_cached_instance_id
+
+        with pytest.raises(InstanceNotFoundError):
+            get_cached_instance_id("gone")
+
+    def test_name_missing_from_cache_falls_back_to_live_lookup(self, mock_get_instances, mocker):
+        from remote.instance_resolver import get_cached_instance_id
+
+        get_cached_instance_id("web")
+        mock_live = mocker.patch("remote.instance_resolver.get_instance_id", return_value="i-new")
+
+        assert get_cached_instance_id("new") == "i-new"
+        mock_live.assert_called_once_with("new")
+
+    def test_duplicate_names_raise(self, mocker):
+        from remote.instance_resolver import get_cached_instance_id
+
+        mocker.patch(
+            "remote.instance_resolver.get_instances",
+            return_value=[_reservation("i-1", "web"), _reservation("i-2", "web")],
+        )
+
+        with pytest.raises(MultipleInstancesFoundError):
+            get_cached_instance_id("web")
+
+    def test_invalidate_forces_new_sweep(self, mock_get_instances):
+        from remote.instance_resolver import get_cached_instance_id, invalidate_inventory_cache
+
+        get_cached_instance_id("web")
+        invalidate_inventory_cache()
+        get_cached_instance_id("web")
+
+        assert mock_get_instances.call_count == 2
+
+    def test_disabled_cache_uses_live_lookups(self, mocker):
+        from remote.instance_resolver import get_cached_instance_id, get_cached_instances
+
+        mocker.patch("remote.instance_resolver.get_inventory_cache_ttl", return_value=0)
+        mock_live = mocker.patch("remote.instance_resolver.get_instance_id", return_value="i-web")
+        mock_sweep = mocker.patch("remote.instance_resolver.get_instances", return_value=[])
+
+        assert get_cached_instance_id("web") == "i-web"
+        get_cached_instances(exclude_terminated=True)
+
+        mock_live.assert_called_once_with("web")
+        mock_sweep.assert_called_once_with(exclude_terminated=True)
+
+
+def test_get_inventory_cache_ttl_reads_config(mocker):
+    from remote.instance_resolver import get_inventory_cache_ttl
+    from remote.settings import INVENTORY_CACHE_TTL_SECONDS
+
+    mock_config = mocker.patch("remote.config.config_manager")
+
+    mock_config.get_value.return_value = "300"
+    assert get_inventory_cache_ttl() == 300
+
+    mock_config.get_value.return_value = None
+    assert get_inventory_cache_ttl() == INVENTORY_CACHE_TTL_SECONDS
+
+
+def test_stop_invalidates_inventory_cache(mocker):
+    from typer.testing import CliRunner
+
+    from remote.instance import app
+
+    mocker.patch("remote.instance.resolve_instance_or_exit", return_value=("web", "i-web"))
+    mocker.patch("remote.instance.is_instance_running", return_value=True)
+    mocker.patch("remote.instance.get_instance_type", return_value="t3.micro")
+    mocker.patch("remote.pricing.get_instance_price_with_fallback", return_value=(None, False))
+    mocker.patch("remote.tracking.tracking_manager")
+    mocker.patch("remote.instance.get_ec2_client")
+    mock_invalidate = mocker.patch("remote.instance.invalidate_inventory_cache")
+
+    result = CliRunner().invoke(app, ["stop", "web", "--yes"])
+
+    assert result.exit_code == 0, result.output
+    mock_invalidate.assert_called_once()
+
+    def test_unstored_refresh_leaves_inventory_file_alone(self, mock_get_instances):
+        from remote.instance_resolver import get_instance_index, inventory_cache, select_instances
+
+        selected = select_instances(["web"], refresh=True, store=False)
+
+        assert [entry.instance_id for entry in selected] == ["i-web"]
+        assert inventory_cache.get("default:us-east-1", 60) is None
+        assert "web" in get_instance_index()  # served from memory, no second sweep
+        mock_get_instances.assert_called_once()
+
+
+class TestInstanceIndex:
+    """Tests for the per-process name index and bulk resolution."""
+
+    @pytest.fixture
+    def mock_get_instances(self, mocker):
+        reservations = [
+            _reservation("i-web", "web"),
+            _reservation("i-db", "db", "stopped"),
+            _reservation("i-old", "db", "terminated"),
+        ]
+        reservations[0]["Instances"][0].update(
+            {"PublicDnsName": "ec2-1-2-3-4.compute.amazonaws.com", "InstanceType": "t3.micro"}
+        )
+        return mocker.patch("remote.instance_resolver.get_instances", return_value=reservations)
+
+    def test_index_holds_id_state_dns_and_type(self, mock_get_instances):
+        from remote.instance_resolver import IndexedInstance, get_instance_index
+
+        index = get_instance_index()
+
+        assert index["web"] == (
+            IndexedInstance(
+                name="web",
+                instance_id="i-web",
+                state="running",
+                public_dns="ec2-1-2-3-4.compute.amazonaws.com",
+                instance_type="t3.micro",
+            ),
+        )
+        assert [entry.state for entry in index["db"]] == ["stopped", "terminated"]
+
+    def test_cached_instance_id_is_served_from_the_index(self, mock_get_instances, mocker):
+        from remote.instance_resolver import get_cached_instance_id, get_instance_index
+
+        mock_live = mocker.patch("remote.instance_resolver.get_instance_id")
+
+        get_instance_index()
+
+        assert get_cached_instance_id("web") == "i-web"
+        assert get_cached_instance_id("db") == "i-db"  # terminated duplicate ignored
+        mock_get_instances.assert_called_once()
+        mock_live.assert_not_called()
+
+    def test_invalidate_resets_index(self, mock_get_instances):
+        from remote.instance_resolver import get_instance_index, invalidate_inventory_cache
+
+        get_instance_index()
+        invalidate_inventory_cache()
+        get_instance_index()
+
+        assert mock_get_instances.call_count == 2
+
+
+class TestSelectInstances:
+    """Tests for selecting many instances by name, glob and tag."""
+
+    @pytest.fixture
+    def mock_get_instances(self, mocker):
+        reservations = [
+            _reservation("i-dev1", "dev-1"),
+            _reservation("i-dev2", "dev-2", "stopped"),
+            _reservation("i-gone", "dev-3", "terminated"),
+            _reservation("i-prod", "prod-1"),
+        ]
+        for reservation, team in zip(reservations, ["ml", "ml", "ml", "web"], strict=True):
+            reservation["Instances"][0]["Tags"].append({"Key": "team", "Value": team})
+        return mocker.patch("remote.instance_resolver.get_instances", return_value=reservations)
+
+    def test_glob_selects_in_one_sweep(self, mock_get_instances):
+        from remote.instance_resolver import select_instances
+
+        selected = select_instances(["dev-*"])
+
+        assert [entry.instance_id for entry in selected] == ["i-dev1", "i-dev2"]
+        mock_get_instances.assert_called_once()
+
+    def test_tag_filters_and_names_combine(self, mock_get_instances):
+        from remote.instance_resolver import select_instances
+
+        assert [e.name for e in select_instances(tags={"team": "ml"})] == ["dev-1", "dev-2"]
+        assert [e.name for e in select_instances(["prod-1", "dev-1"], {"team": "w*"})] == ["prod-1"]
+        assert select_instances(tags={"missing": "*"}) == []
+
+    def test_unknown_exact_name_raises_after_one_refresh(self, mock_get_instances):
+        from remote.instance_resolver import select_instances
+
+        with pytest.raises(InstanceNotFoundError):
+            select_instances(["dev-*", "nope"])
+
+        assert mock_get_instances.call_count == 2
+
+    def test_refresh_selects_from_live_sweep(self, mock_get_instances):
+        from remote.instance_resolver import select_instances
+
+        select_instances(["dev-*"])
+        select_instances(["dev-*"], refresh=True)
+        assert mock_get_instances.call_count == 2
+
+        # A live sweep is not repeated when an exact name is missing
+        with pytest.raises(InstanceNotFoundError):
+            select_instances(["nope"], refresh=True)
+        assert mock_get_instances.call_count == 3
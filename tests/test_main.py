@@ -1,7 +1,10 @@
+import subprocess
+import sys
+
 import pytest
 from typer.testing import CliRunner
 
-from remote.__main__ import app
+from remote.__main__ import LAZY_SUBCOMMANDS, app
 
 runner = CliRunner()
 
@@ -36,16 +39,116 @@ def test_version_command_has_error_handling_decorator(mocker):
 
 
 def test_main_app_imports():
-    """Test that all sub-apps are properly imported and added to main app."""
+    """Test that all sub-apps are registered with the main app."""
     # Test that the main app structure exists
     from remote.__main__ import app as main_app
 
     # The main app has only service subcommands registered (no root-level instance commands)
     assert main_app is not None
 
-    # Test that the app has commands and groups registered
+    # Commands are registered eagerly, service sub-apps lazily
     assert len(app.registered_commands) > 0
-    assert len(app.registered_groups) > 0
+    assert set(LAZY_SUBCOMMANDS) == {
+        "instance",
+        "ami",
+        "config",
+        "snapshot",
+        "volume",
+        "ecs",
+        "sg",
+        "schedule",
+        "pricing",
+    }
+
+
+@pytest.mark.parametrize("name", ["instance", "ami", "config", "ecs", "sg", "schedule", "pricing"])
+def test_load_subcommand_builds_group(name):
+    """Test that each lazy sub-app converts to a Click group with its registered name."""
+    from remote.__main__ import load_subcommand
+
+    group = load_subcommand(name)
+
+    assert group.name == name
+    assert len(group.commands) > 0
+
+
+def _modules_loaded_after(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the names of loaded modules."""
+    script = f'{code}\nimport sys\nprint("\\n".join(sys.modules))'
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_startup_does_not_import_sub_apps_or_aws_sdk():
+    """Regression guard for CLI startup time: importing the entry point stays light."""
+    loaded = _modules_loaded_after("import remote.__main__")
+
+    assert "boto3" not in loaded
+    assert "pydantic_settings" not in loaded
+    for module_path, _ in LAZY_SUBCOMMANDS.values():
+        assert module_path not in loaded
+
+
+def test_version_command_does_not_import_aws_sdk():
+    """Test that `remote version` runs without loading boto3."""
+    loaded = _modules_loaded_after(
+        "from typer.testing import CliRunner\n"
+        "from remote.__main__ import app\n"
+        "assert CliRunner().invoke(app, ['version']).exit_code == 0"
+    )
+
+    assert "remote.cli_output" in loaded
+    assert "boto3" not in loaded
+    assert "remote.utils" not in loaded
+
+
+def test_instance_help_does_not_import_aws_sdk():
+    """Test that `remote instance --help` loads neither boto3 nor the cost modules."""
+    loaded = _modules_loaded_after(
+        "from typer.testing import CliRunner\n"
+        "from remote.__main__ import app\n"
+        "assert CliRunner().invoke(app, ['instance', '--help']).exit_code == 0"
+    )
+
+    assert "remote.instance" in loaded
+    for name in ("boto3", "remote.pricing", "remote.scheduler", "remote.tracking"):
+        assert name not in loaded
+
+
+def test_invoking_subcommand_imports_only_that_sub_app():
+    """Test that resolving one subcommand does not import the others."""
+    loaded = _modules_loaded_after(
+        "from remote.__main__ import load_subcommand\nload_subcommand('snapshot')"
+    )
+
+    assert "remote.snapshot" in loaded
+    for name in ("remote.ami", "remote.ecs", "remote.sg", "remote.schedule"):
+        assert name not in loaded
+
+
+def test_startup_import_time_budget():
+    """Benchmark: importing the entry point should be well under the full sub-app import."""
+    lazy = _import_time_us("remote.__main__")
+    eager = _import_time_us("remote.instance")
+
+    assert lazy < eager
+
+
+def _import_time_us(module: str) -> int:
+    """Return the cumulative import time in microseconds reported by -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"No importtime entry for {module}")
 
 
 def test_main_app_structure():
@@ -1,21 +1,31 @@
 """Tests for the pricing module."""
 
 import json
+import time
 from unittest.mock import MagicMock
 
+import pytest
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from remote.exceptions import ValidationError
 from remote.pricing import (
+    PRICE_CATALOG_VERSION,
+    PRICE_SNAPSHOT_VERSION,
     REGION_TO_LOCATION,
+    PriceCatalog,
     clear_price_cache,
     clear_region_location_cache,
+    export_price_snapshot,
     format_price,
     get_current_region,
     get_instance_price,
     get_instance_price_with_fallback,
+    get_price_catalog_path,
     get_pricing_client,
     get_region_location,
     get_ssm_client,
+    import_price_snapshot,
+    load_region_prices,
 )
 
 
@@ -581,3 +591,211 @@ class TestRegionToLocationMapping:
         for _region, location in REGION_TO_LOCATION.items():
             assert "(" in location
             assert ")" in location
+
+
+def _product(instance_type: str, usd: str) -> str:
+    return json.dumps(
+        {
+            "product": {"attributes": {"instanceType": instance_type}},
+            "terms": {
+                "OnDemand": {"term1": {"priceDimensions": {"dim1": {"pricePerUnit": {"USD": usd}}}}}
+            },
+        }
+    )
+
+
+class TestPriceCatalog:
+    """Test the on-disk PriceCatalog."""
+
+    def test_init_default_path(self):
+        assert PriceCatalog().catalog_file == get_price_catalog_path()
+
+    def test_store_and_get_region_prices(self, tmp_path):
+        catalog = PriceCatalog(tmp_path / "prices.json")
+        catalog.store_region_prices("us-east-1", {"t3.micro": 0.0104})
+
+        # A fresh instance reads the persisted file
+        reloaded = PriceCatalog(tmp_path / "prices.json")
+        assert reloaded.get_region_prices("us-east-1") == {"t3.micro": 0.0104}
+        assert reloaded.get_region_prices("eu-west-1") is None
+
+    def test_file_is_compact_and_versioned(self, tmp_path):
+        catalog = PriceCatalog(tmp_path / "prices.json")
+        catalog.store_region_prices("us-east-1", {"t3.micro": 0.0104})
+
+        raw = (tmp_path / "prices.json").read_text()
+        assert "\n" not in raw
+        assert json.loads(raw)["version"] == PRICE_CATALOG_VERSION
+
+    def test_expired_region_misses(self, tmp_path, mocker):
+        catalog = PriceCatalog(tmp_path / "prices.json")
+        catalog.store_region_prices("us-east-1", {"t3.micro": 0.0104})
+        mocker.patch("remote.pricing.time.time", return_value=time.time() + 10_000)
+
+        assert catalog.get_region_prices("us-east-1", ttl_seconds=3600) is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        (tmp_path / "prices.json").write_text("{broken")
+        assert PriceCatalog(tmp_path / "prices.json").get_region_prices("us-east-1") is None
+
+
+class TestLoadRegionPrices:
+    """Test the one-sweep regional catalog fetch."""
+
+    def setup_method(self):
+        clear_price_cache()
+
+    @pytest.fixture
+    def mock_client(self, mocker):
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.return_value = [
+            {"PriceList": [_product("t3.micro", "0.0104"), _product("m5.large", "0.096")]},
+            {"PriceList": [_product("c5.xlarge", "0.17")]},
+        ]
+        mocker.patch("remote.pricing.get_pricing_client", return_value=client)
+        return client
+
+    def test_should_fetch_all_pages_once(self, mock_client):
+        prices = load_region_prices("us-east-1")
+
+        assert prices == {"t3.micro": 0.0104, "m5.large": 0.096, "c5.xlarge": 0.17}
+        mock_client.get_paginator.assert_called_once_with("get_products")
+        filters = mock_client.get_paginator.return_value.paginate.call_args.kwargs["Filters"]
+        assert {"Type": "TERM_MATCH", "Field": "location", "Value": "US East (N. Virginia)"} in (
+            filters
+        )
+        assert not any(f["Field"] == "instanceType" for f in filters)
+
+    def test_later_lookups_are_local(self, mock_client):
+        load_region_prices("us-east-1")
+        load_region_prices("us-east-1")
+
+        assert get_instance_price("m5.large", "us-east-1") == 0.096
+        mock_client.get_paginator.assert_called_once()
+        mock_client.get_products.assert_not_called()
+
+    def test_refresh_refetches(self, mock_client):
+        load_region_prices("us-east-1")
+        load_region_prices("us-east-1", refresh=True)
+
+        assert mock_client.get_paginator.call_count == 2
+
+    def test_type_missing_from_catalog_uses_per_type_lookup(self, mock_client):
+        mock_client.get_products.return_value = {"PriceList": [_product("x9.huge", "9.99")]}
+        load_region_prices("us-east-1")
+
+        assert get_instance_price("x9.huge", "us-east-1") == 9.99
+        mock_client.get_products.assert_called_once()
+
+    def test_should_return_none_on_client_error(self, mocker):
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "Denied"}}, "GetProducts"
+        )
+        mocker.patch("remote.pricing.get_pricing_client", return_value=client)
+
+        assert load_region_prices("us-east-1") is None
+
+
+class TestPriceSnapshot:
+    """Test offline price snapshot export and import."""
+
+    def setup_method(self):
+        clear_price_cache()
+
+    @pytest.mark.parametrize("file_name", ["prices.json", "prices.json.gz"])
+    def test_round_trip(self, tmp_path, mocker, file_name):
+        from remote import pricing
+
+        pricing.price_catalog.store_region_prices("eu-west-1", {"t3.micro": 0.0114})
+        path = tmp_path / file_name
+
+        assert export_price_snapshot(path) == {"eu-west-1": 1}
+
+        mocker.patch("remote.pricing.price_catalog", PriceCatalog(tmp_path / "other.json"))
+        assert import_price_snapshot(path) == {"eu-west-1": 1}
+
+    def test_imported_prices_need_no_network_and_never_expire(self, tmp_path, mocker):
+        from remote import pricing
+
+        path = tmp_path / "prices.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "format": "remotepy-prices",
+                    "version": PRICE_SNAPSHOT_VERSION,
+                    "regions": {"xx-test-1": {"fetched_at": 0, "prices": {"t3.micro": "0.02"}}},
+                }
+            )
+        )
+        import_price_snapshot(path)
+        mock_client = mocker.patch("remote.pricing.get_pricing_client")
+        mock_ssm = mocker.patch("remote.pricing.get_ssm_client")
+
+        assert get_instance_price_with_fallback("t3.micro", "xx-test-1") == (0.02, False)
+        assert pricing.price_catalog.get_region_prices("xx-test-1") == {"t3.micro": 0.02}
+        mock_client.assert_not_called()
+        mock_ssm.assert_not_called()
+
+    def test_export_filters_regions(self, tmp_path):
+        from remote import pricing
+
+        pricing.price_catalog.store_region_prices("eu-west-1", {"t3.micro": 0.0114})
+        pricing.price_catalog.store_region_prices("us-east-1", {"t3.micro": 0.0104})
+
+        assert export_price_snapshot(tmp_path / "p.json", ["us-east-1"]) == {"us-east-1": 1}
+
+    def test_export_empty_catalog_raises(self, tmp_path):
+        with pytest.raises(ValidationError, match="No cached prices"):
+            export_price_snapshot(tmp_path / "p.json")
+
+    def test_import_rejects_newer_version(self, tmp_path):
+        path = tmp_path / "p.json"
+        path.write_text(
+            json.dumps(
+                {"format": "remotepy-prices", "version": PRICE_SNAPSHOT_VERSION + 1, "regions": {}}
+            )
+        )
+        with pytest.raises(ValidationError, match="Unsupported price snapshot version"):
+            import_price_snapshot(path)
+
+    def test_import_rejects_other_files(self, tmp_path):
+        path = tmp_path / "p.json"
+        path.write_text(json.dumps({"hello": "world"}))
+        with pytest.raises(ValidationError, match="Not a price snapshot"):
+            import_price_snapshot(path)
+
+    def test_import_missing_file(self, tmp_path):
+        with pytest.raises(ValidationError, match="Could not read"):
+            import_price_snapshot(tmp_path / "missing.json")
+
+    def test_cli_export_and_import(self, tmp_path, mocker):
+        from typer.testing import CliRunner
+
+        from remote import pricing
+        from remote.pricing import app
+
+        runner = CliRunner()
+        pricing.price_catalog.store_region_prices("us-east-1", {"t3.micro": 0.0104})
+        path = tmp_path / "prices.json.gz"
+
+        result = runner.invoke(app, ["export", str(path)])
+        assert result.exit_code == 0, result.output
+        assert "Wrote price snapshot" in result.output
+
+        mocker.patch("remote.pricing.price_catalog", PriceCatalog(tmp_path / "other.json"))
+        result = runner.invoke(app, ["import", str(path)])
+        assert result.exit_code == 0, result.output
+        assert "Imported 1 prices for 1 region(s)" in result.output
+
+    def test_cli_import_invalid_file_exits(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from remote.pricing import app
+
+        path = tmp_path / "bad.json"
+        path.write_text("nope")
+
+        result = CliRunner().invoke(app, ["import", str(path)])
+
+        assert result.exit_code == 1
@@ -428,35 +428,90 @@ class TestListSchedules:
     """Tests for list_schedules function."""
 
     def test_should_list_all_remotepy_schedules(self, mocker):
-        """Should list all schedules with remotepy- prefix."""
+        """Should list all schedules with remotepy- prefix across every page."""
         from remote.scheduler import list_schedules
 
         mock_scheduler = mocker.patch("remote.scheduler.get_scheduler_client")
-        mock_scheduler.return_value.list_schedules.return_value = {
-            "Schedules": [
-                {"Name": "remotepy-wake-i-123", "State": "ENABLED"},
-                {"Name": "remotepy-sleep-i-123", "State": "ENABLED"},
-                {"Name": "remotepy-wake-i-456", "State": "DISABLED"},
-            ]
-        }
+        mock_paginator = mock_scheduler.return_value.get_paginator.return_value
+        mock_paginator.paginate.return_value = [
+            {
+                "Schedules": [
+                    {"Name": "remotepy-wake-i-123", "State": "ENABLED"},
+                    {"Name": "remotepy-sleep-i-123", "State": "ENABLED"},
+                ]
+            },
+            {"Schedules": [{"Name": "remotepy-wake-i-456", "State": "DISABLED"}]},
+        ]
 
         result = list_schedules()
 
         assert len(result) == 3
-        mock_scheduler.return_value.list_schedules.assert_called_once_with(NamePrefix="remotepy-")
+        mock_scheduler.return_value.get_paginator.assert_called_once_with("list_schedules")
+        mock_paginator.paginate.assert_called_once_with(NamePrefix="remotepy-")
 
     def test_should_return_empty_list_if_none_exist(self, mocker):
         """Should return empty list when no schedules exist."""
         from remote.scheduler import list_schedules
 
         mock_scheduler = mocker.patch("remote.scheduler.get_scheduler_client")
-        mock_scheduler.return_value.list_schedules.return_value = {"Schedules": []}
+        mock_scheduler.return_value.get_paginator.return_value.paginate.return_value = [
+            {"Schedules": []}
+        ]
 
         result = list_schedules()
 
         assert result == []
 
 
+class TestGetScheduleDetails:
+    """Tests for get_schedule_details function."""
+
+    def test_should_fetch_each_schedule_once_and_cache(self, mocker):
+        """Details are fetched per unique name and reused for the process."""
+        from remote.scheduler import get_schedule_details
+
+        mock_get = mocker.patch(
+            "remote.scheduler._get_schedule_by_name",
+            side_effect=lambda name: None if name.endswith("i-456") else {"Name": name},
+        )
+
+        names = ["remotepy-wake-i-123", "remotepy-sleep-i-123", "remotepy-wake-i-456"]
+        first = get_schedule_details([*names, "remotepy-wake-i-123"], max_workers=2)
+        second = get_schedule_details(names)
+
+        assert first == second
+        assert first["remotepy-wake-i-123"] == {"Name": "remotepy-wake-i-123"}
+        assert first["remotepy-wake-i-456"] is None
+        assert sorted(c.args[0] for c in mock_get.call_args_list) == sorted(names)
+
+    def test_should_refetch_after_schedule_is_deleted(self, mocker):
+        """Deleting a schedule drops its cached details."""
+        from remote.scheduler import delete_schedule, get_schedule_details
+
+        mocker.patch("remote.scheduler.get_scheduler_client")
+        mock_get = mocker.patch(
+            "remote.scheduler._get_schedule_by_name", return_value={"Name": "x"}
+        )
+
+        get_schedule_details(["remotepy-wake-i-123"])
+        delete_schedule("i-123", "wake")
+        get_schedule_details(["remotepy-wake-i-123"])
+
+        assert mock_get.call_count == 2
+
+    def test_should_propagate_aws_errors(self, mocker):
+        """AWS errors from a detail fetch surface to the caller."""
+        from remote.scheduler import get_schedule_details
+
+        mocker.patch(
+            "remote.scheduler._get_schedule_by_name",
+            side_effect=AWSServiceError("EventBridge Scheduler", "get_schedule", "Throttling", "x"),
+        )
+
+        with pytest.raises(AWSServiceError):
+            get_schedule_details(["remotepy-wake-i-123"])
+
+
 class TestDeleteAllSchedulesForInstance:
     """Tests for delete_all_schedules_for_instance function."""
 
@@ -5,8 +5,9 @@ from unittest.mock import MagicMock
 import pytest
 from typer.testing import CliRunner
 
-from remote.exceptions import ValidationError
+from remote.exceptions import AWSServiceError, ValidationError
 from remote.sg import (
+    SecurityGroupRuleIndex,
     add_ip_to_security_group,
     app,
     attach_security_group_to_instance,
@@ -24,6 +25,7 @@ from remote.sg import (
     get_security_group_details,
     get_security_group_rules,
     get_ssh_ip_rules,
+    load_instance_rules,
     remove_ip_from_security_group,
     resolve_port,
     validate_sg_for_instance,
@@ -105,6 +107,148 @@ class TestGetPublicIp:
             get_public_ip()
         assert "Failed to retrieve public IP" in str(exc_info.value)
 
+    def test_first_valid_answer_wins(self, mocker):
+        """A failing or invalid endpoint should not stop another from answering."""
+        import urllib.error
+
+        def fake_urlopen(url, timeout):
+            if "checkip" in url:
+                raise urllib.error.URLError("unreachable")
+            response = MagicMock()
+            body = b"198.51.100.4\n" if "ipify" in url else b"<html>\n"
+            response.read.return_value = body
+            response.__enter__ = MagicMock(return_value=response)
+            response.__exit__ = MagicMock(return_value=False)
+            return response
+
+        mocker.patch("urllib.request.urlopen", side_effect=fake_urlopen)
+
+        assert get_public_ip() == "198.51.100.4"
+
+    def test_returns_without_waiting_for_slow_service(self, mocker):
+        """A hung echo service should neither delay the answer nor block exit."""
+        import threading
+        import time
+
+        from remote.sg import _race_public_ip
+
+        release = threading.Event()
+
+        def fake_fetch(url):
+            if url == "https://slow.example":
+                release.wait(5)
+                return "192.0.2.1"
+            return "198.51.100.4"
+
+        mocker.patch("remote.sg._fetch_public_ip", side_effect=fake_fetch)
+
+        started = time.monotonic()
+        try:
+            assert _race_public_ip(("https://slow.example", "https://fast.example")) == (
+                "198.51.100.4"
+            )
+            assert time.monotonic() - started < 1
+            slow = [t for t in threading.enumerate() if t.name == "public-ip" and t.is_alive()]
+            assert slow and all(t.daemon for t in slow)
+        finally:
+            release.set()
+
+    def test_process_exits_without_joining_slow_service(self):
+        """Interpreter exit must not wait for the losing requests."""
+        import subprocess
+        import sys
+        import time
+
+        script = (
+            "import time\n"
+            "import remote.sg as sg\n"
+            "def fetch(url):\n"
+            "    if 'slow' in url:\n"
+            "        time.sleep(4)\n"
+            "    return '198.51.100.4'\n"
+            "sg._fetch_public_ip = fetch\n"
+            "print(sg._race_public_ip(('https://slow.example', 'https://fast.example')))\n"
+        )
+        started = time.monotonic()
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "198.51.100.4"
+        assert time.monotonic() - started < 3.5
+
+    def test_times_out_when_every_service_hangs(self, mocker):
+        """If no service answers in time, a ValidationError is raised."""
+        import threading
+
+        from remote.sg import _race_public_ip
+
+        release = threading.Event()
+        mocker.patch("remote.sg.PUBLIC_IP_TIMEOUT_SECONDS", 0.1)
+        mocker.patch("remote.sg._fetch_public_ip", side_effect=lambda url: release.wait(5))
+
+        try:
+            with pytest.raises(ValidationError, match="Timeout"):
+                _race_public_ip(("https://a.example", "https://b.example"))
+        finally:
+            release.set()
+
+    def test_reuses_cached_ip_within_ttl(self, mocker):
+        """A second lookup within the TTL should be served from disk."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"203.0.113.1\n"
+        mock_response.__enter__ = MagicMock(return_value=mock_response)
+        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen = mocker.patch("urllib.request.urlopen", return_value=mock_response)
+
+        assert get_public_ip() == "203.0.113.1"
+        calls_after_first = mock_urlopen.call_count
+        assert get_public_ip() == "203.0.113.1"
+
+        assert mock_urlopen.call_count == calls_after_first
+
+    def test_refresh_and_expired_cache_query_again(self, mocker):
+        """refresh=True and an expired cache entry should both hit the services."""
+        import json
+
+        import remote.sg
+
+        remote.sg.get_public_ip_cache_path().write_text(
+            json.dumps({"ip": "192.0.2.1", "fetched_at": 0})
+        )
+        mock_race = mocker.patch("remote.sg._race_public_ip", return_value="203.0.113.1")
+
+        assert get_public_ip() == "203.0.113.1"
+        assert get_public_ip(refresh=True) == "203.0.113.1"
+        assert mock_race.call_count == 2
+        assert json.loads(remote.sg.get_public_ip_cache_path().read_text())["ip"] == "203.0.113.1"
+
+    def test_cache_ttl_from_config_zero_disables_cache(self, mocker):
+        """public_ip_cache_ttl = 0 should skip reading and writing the cache file."""
+        import remote.sg
+
+        mocker.patch("remote.sg.get_public_ip_cache_ttl", return_value=0)
+        mock_race = mocker.patch("remote.sg._race_public_ip", return_value="203.0.113.1")
+
+        assert get_public_ip() == "203.0.113.1"
+        assert get_public_ip() == "203.0.113.1"
+        assert mock_race.call_count == 2
+        assert not remote.sg.get_public_ip_cache_path().exists()
+
+    def test_cache_ttl_is_read_from_config(self, mocker):
+        """The TTL comes from the public_ip_cache_ttl key, falling back to the default."""
+        from remote.settings import PUBLIC_IP_CACHE_TTL_SECONDS
+        from remote.sg import get_public_ip_cache_ttl
+
+        mock_config = mocker.patch("remote.config.config_manager")
+
+        mock_config.get_value.return_value = "42"
+        assert get_public_ip_cache_ttl() == 42
+        mock_config.get_value.assert_called_with("public_ip_cache_ttl")
+
+        mock_config.get_value.return_value = None
+        assert get_public_ip_cache_ttl() == PUBLIC_IP_CACHE_TTL_SECONDS
+
 
 class TestGetInstanceSecurityGroups:
     """Tests for get_instance_security_groups function."""
@@ -355,12 +499,25 @@ class TestClearPortRules:
                 }
             ],
         )
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+        mock_ec2.return_value.revoke_security_group_ingress.return_value = {"Return": True}
         mock_remove = mocker.patch("remote.sg.remove_ip_from_security_group")
 
         result = clear_port_rules("sg-12345", 22)
 
         assert result == 2
-        assert mock_remove.call_count == 2
+        mock_ec2.return_value.revoke_security_group_ingress.assert_called_once_with(
+            GroupId="sg-12345",
+            IpPermissions=[
+                {
+                    "IpProtocol": "tcp",
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "IpRanges": [{"CidrIp": "10.0.0.1/32"}, {"CidrIp": "10.0.0.2/32"}],
+                }
+            ],
+        )
+        mock_remove.assert_not_called()
 
     def test_excludes_specified_ip(self, mocker):
         """Test that specified IP is excluded from clearing."""
@@ -378,12 +535,169 @@ class TestClearPortRules:
                 }
             ],
         )
-        mock_remove = mocker.patch("remote.sg.remove_ip_from_security_group")
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+        mock_ec2.return_value.revoke_security_group_ingress.return_value = {"Return": True}
 
         result = clear_port_rules("sg-12345", 22, exclude_ip="10.0.0.1")
 
         assert result == 1
-        mock_remove.assert_called_once_with("sg-12345", "10.0.0.2", 22)
+        permissions = mock_ec2.return_value.revoke_security_group_ingress.call_args.kwargs[
+            "IpPermissions"
+        ]
+        assert permissions[0]["IpRanges"] == [{"CidrIp": "10.0.0.2/32"}]
+
+    def test_falls_back_to_per_rule_revokes_on_failure(self, mocker):
+        """A failed batched revoke should be retried one rule at a time."""
+        from botocore.exceptions import ClientError
+
+        mocker.patch(
+            "remote.sg.get_security_group_rules",
+            return_value=[
+                {
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "IpProtocol": "tcp",
+                    "IpRanges": [
+                        {"CidrIp": "10.0.0.1/32"},
+                        {"CidrIp": "10.0.0.2/32"},
+                        {"CidrIp": "10.0.0.3/32"},
+                    ],
+                }
+            ],
+        )
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+        mock_ec2.return_value.revoke_security_group_ingress.side_effect = ClientError(
+            {"Error": {"Code": "InvalidPermission.NotFound", "Message": "not found"}},
+            "revoke_security_group_ingress",
+        )
+        mock_remove = mocker.patch(
+            "remote.sg.remove_ip_from_security_group",
+            side_effect=[None, AWSServiceError("EC2", "revoke", "NotFound", "gone"), None],
+        )
+
+        result = clear_port_rules("sg-12345", 22)
+
+        assert result == 2
+        assert [c.args[1] for c in mock_remove.call_args_list] == [
+            "10.0.0.1",
+            "10.0.0.2",
+            "10.0.0.3",
+        ]
+
+    def test_batches_multiple_ports_and_counts_unknown_rules(self, mocker):
+        """All ports go into one revoke; rules AWS reports as unknown aren't counted."""
+        mocker.patch(
+            "remote.sg.get_security_group_rules",
+            return_value=[
+                {
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "IpProtocol": "tcp",
+                    "IpRanges": [{"CidrIp": "10.0.0.1/32"}, {"CidrIp": "10.0.0.2/32"}],
+                },
+                {
+                    "FromPort": 443,
+                    "ToPort": 443,
+                    "IpProtocol": "tcp",
+                    "IpRanges": [{"CidrIp": "10.0.0.1/32"}],
+                },
+                {
+                    "FromPort": 0,
+                    "ToPort": 65535,
+                    "IpProtocol": "tcp",
+                    "IpRanges": [{"CidrIp": "10.9.9.9/32"}],
+                },
+            ],
+        )
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+        mock_ec2.return_value.revoke_security_group_ingress.return_value = {
+            "Return": True,
+            "UnknownIpPermissions": [
+                {
+                    "IpProtocol": "tcp",
+                    "FromPort": 443,
+                    "ToPort": 443,
+                    "IpRanges": [{"CidrIp": "10.0.0.1/32"}],
+                }
+            ],
+        }
+
+        result = clear_port_rules("sg-12345", ports=[22, 443])
+
+        assert result == 4
+        mock_ec2.return_value.revoke_security_group_ingress.assert_called_once()
+        permissions = mock_ec2.return_value.revoke_security_group_ingress.call_args.kwargs[
+            "IpPermissions"
+        ]
+        assert [(p["FromPort"], len(p["IpRanges"])) for p in permissions] == [(22, 3), (443, 2)]
+
+    def test_matches_port_ranges_and_all_traffic_rules(self, mocker):
+        """Covering TCP ranges and all-traffic rules match; other protocols don't."""
+        mocker.patch(
+            "remote.sg.get_security_group_rules",
+            return_value=[
+                {
+                    "FromPort": 20,
+                    "ToPort": 30,
+                    "IpProtocol": "tcp",
+                    "IpRanges": [{"CidrIp": "10.0.0.1/32"}],
+                },
+                {"IpProtocol": "-1", "IpRanges": [{"CidrIp": "10.0.0.2/32"}]},
+                {
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "IpProtocol": "udp",
+                    "IpRanges": [{"CidrIp": "10.0.0.3/32"}],
+                },
+                {
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "IpProtocol": "tcp",
+                    "IpRanges": [{"CidrIp": "10.0.0.2/32"}],
+                },
+                {
+                    "FromPort": 80,
+                    "ToPort": 90,
+                    "IpProtocol": "tcp",
+                    "IpRanges": [{"CidrIp": "10.0.0.4/32"}],
+                },
+            ],
+        )
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+        mock_ec2.return_value.revoke_security_group_ingress.return_value = {
+            "Return": True,
+            "UnknownIpPermissions": [
+                {
+                    "IpProtocol": "tcp",
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "IpRanges": [{"CidrIp": "10.0.0.1/32"}],
+                }
+            ],
+        }
+
+        result = clear_port_rules("sg-12345", 22)
+
+        assert result == 1
+        mock_ec2.return_value.revoke_security_group_ingress.assert_called_once_with(
+            GroupId="sg-12345",
+            IpPermissions=[
+                {
+                    "IpProtocol": "tcp",
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "IpRanges": [{"CidrIp": "10.0.0.1/32"}, {"CidrIp": "10.0.0.2/32"}],
+                }
+            ],
+        )
+
+    def test_no_matching_rules_makes_no_revoke_call(self, mocker):
+        """Nothing to clear should not call the API."""
+        mocker.patch("remote.sg.get_security_group_rules", return_value=[])
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+
+        assert clear_port_rules("sg-12345", 22) == 0
+        mock_ec2.return_value.revoke_security_group_ingress.assert_not_called()
 
     def test_alias_clear_ssh_rules(self):
         """Test that clear_ssh_rules is an alias for clear_port_rules."""
@@ -442,9 +756,12 @@ class TestCheckExistingRule:
                 {"GroupId": "sg-67890", "GroupName": "other-sg"},
             ],
         )
-        mocker.patch(
-            "remote.sg.get_ip_rules_for_port",
-            side_effect=[[], ["203.0.113.1/32"]],
+        mock_details = mocker.patch(
+            "remote.sg.get_security_group_details",
+            return_value=[
+                {"GroupId": "sg-67890", "IpPermissions": [_tcp_rule(22, "203.0.113.1/32")]},
+                {"GroupId": "sg-12345", "IpPermissions": [_tcp_rule(443, "203.0.113.1/32")]},
+            ],
         )
 
         result = check_existing_rule("i-12345", "203.0.113.1", 22)
@@ -452,6 +769,7 @@ class TestCheckExistingRule:
         assert result is not None
         assert result["GroupId"] == "sg-67890"
         assert result["GroupName"] == "other-sg"
+        mock_details.assert_called_once_with(["sg-12345", "sg-67890"])
 
     def test_returns_none_when_not_found(self, mocker):
         """Test that None is returned when no matching rule exists."""
@@ -459,7 +777,10 @@ class TestCheckExistingRule:
             "remote.sg.get_instance_security_groups",
             return_value=[{"GroupId": "sg-12345", "GroupName": "default-sg"}],
         )
-        mocker.patch("remote.sg.get_ip_rules_for_port", return_value=[])
+        mocker.patch(
+            "remote.sg.get_security_group_details",
+            side_effect=_sg_details_for([_tcp_rule(22, "203.0.113.2/32")]),
+        )
 
         result = check_existing_rule("i-12345", "203.0.113.1", 22)
         assert result is None
@@ -470,12 +791,107 @@ class TestCheckExistingRule:
             "remote.sg.get_instance_security_groups",
             return_value=[{"GroupId": "sg-12345", "GroupName": "default-sg"}],
         )
-        mocker.patch("remote.sg.get_ip_rules_for_port", return_value=["10.0.0.0/16"])
+        mocker.patch(
+            "remote.sg.get_security_group_details",
+            side_effect=_sg_details_for([_tcp_rule(22, "10.0.0.0/16")]),
+        )
 
         result = check_existing_rule("i-12345", "10.0.0.0/16", 22)
         assert result is not None
         assert result["GroupId"] == "sg-12345"
 
+    def test_matches_port_range_rule(self, mocker):
+        """A rule covering a port range should count as existing access."""
+        mocker.patch(
+            "remote.sg.get_instance_security_groups",
+            return_value=[{"GroupId": "sg-12345", "GroupName": "default-sg"}],
+        )
+        mocker.patch(
+            "remote.sg.get_security_group_details",
+            side_effect=_sg_details_for(
+                [
+                    {
+                        "FromPort": 8000,
+                        "ToPort": 9000,
+                        "IpProtocol": "tcp",
+                        "IpRanges": [{"CidrIp": "203.0.113.1/32"}],
+                    }
+                ]
+            ),
+        )
+
+        assert check_existing_rule("i-12345", "203.0.113.1", 8384) is not None
+        assert check_existing_rule("i-12345", "203.0.113.1", 22) is None
+
+    def test_uses_prebuilt_index_without_api_calls(self, mocker):
+        """A prebuilt index answers every port without describing the instance again."""
+        mocker.patch(
+            "remote.sg.get_instance_security_groups",
+            return_value=[{"GroupId": "sg-12345", "GroupName": "default-sg"}],
+        )
+        mock_details = mocker.patch(
+            "remote.sg.get_security_group_details",
+            side_effect=_sg_details_for([_tcp_rule(443, "203.0.113.1/32")]),
+        )
+        index = load_instance_rules("i-12345")
+        mock_groups = mocker.patch("remote.sg.get_instance_security_groups")
+
+        assert check_existing_rule("i-12345", "203.0.113.1", 22, index=index) is None
+        assert check_existing_rule("i-12345", "203.0.113.1", 443, index=index) is not None
+        mock_groups.assert_not_called()
+        mock_details.assert_called_once()
+
+    def test_load_instance_rules_without_groups_skips_describe(self, mocker):
+        """An instance with no SGs must not describe every group in the account."""
+        mocker.patch("remote.sg.get_instance_security_groups", return_value=[])
+        mock_details = mocker.patch("remote.sg.get_security_group_details")
+
+        assert load_instance_rules("i-12345").rules == []
+        mock_details.assert_not_called()
+
+
+class TestMultiPortRuleCheck:
+    """Multi-port sg add / whitelisting loads the instance's rules once."""
+
+    @pytest.fixture
+    def rule_lookups(self, mocker):
+        mock_groups = mocker.patch(
+            "remote.sg.get_instance_security_groups",
+            return_value=[{"GroupId": "sg-12345", "GroupName": "default-sg"}],
+        )
+        mock_details = mocker.patch(
+            "remote.sg.get_security_group_details",
+            side_effect=_sg_details_for([_tcp_rule(443, "203.0.113.1/32")]),
+        )
+        mocker.patch("remote.sg.find_or_create_remotepy_sg", return_value="sg-rpy")
+        return mock_groups, mock_details
+
+    def test_sg_add_loads_rules_once(self, mocker, test_config, rule_lookups):
+        mocker.patch(
+            "remote.sg.resolve_instance_or_exit", return_value=("test-instance", "i-12345")
+        )
+        mock_add = mocker.patch("remote.sg.add_ip_to_security_group_ports", return_value=[22, 8384])
+        mocker.patch("remote.sg.get_ip_rules_for_port", return_value=[])
+
+        result = runner.invoke(
+            app, ["add", "--ip", "203.0.113.1", "-p", "22", "-p", "443", "-p", "8384"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert all(mock.call_count == 1 for mock in rule_lookups)
+        assert mock_add.call_args.args[2] == [22, 8384]
+        assert "already has access to port 443" in result.stdout
+
+    def test_whitelist_loads_rules_once(self, mocker, rule_lookups):
+        mock_add = mocker.patch("remote.sg.add_ip_to_security_group_ports", return_value=[22, 8384])
+
+        whitelist_ip_for_instance(
+            "i-12345", "test-instance", ip_address="203.0.113.1", ports=[22, 443, 8384]
+        )
+
+        assert all(mock.call_count == 1 for mock in rule_lookups)
+        assert mock_add.call_args.args[2] == [22, 8384]
+
 
 class TestValidateSgForInstance:
     """Tests for validate_sg_for_instance function."""
@@ -514,6 +930,11 @@ class TestValidateSgForInstance:
 class TestWhitelistIpForInstance:
     """Tests for whitelist_ip_for_instance function."""
 
+    @pytest.fixture(autouse=True)
+    def no_rule_index(self, mocker):
+        """Rule existence is decided by the check_existing_rule mock in each test."""
+        return mocker.patch("remote.sg.load_instance_rules", return_value=SecurityGroupRuleIndex())
+
     def test_whitelists_current_ip(self, mocker):
         """Test that current IP is whitelisted via remotepy SG."""
         mocker.patch("remote.sg.get_public_ip", return_value="203.0.113.1")
@@ -572,7 +993,7 @@ class TestWhitelistIpForInstance:
             "i-12345", "test-instance", ip_address="203.0.113.1", exclusive=True
         )
 
-        mock_clear.assert_called_once_with("sg-rpy", 22, exclude_ip="203.0.113.1")
+        mock_clear.assert_called_once_with("sg-rpy", exclude_ip="203.0.113.1", ports=[22])
         mock_add.assert_called_once()
 
     def test_multi_port_whitelisting(self, mocker):
@@ -581,15 +1002,21 @@ class TestWhitelistIpForInstance:
         mocker.patch("remote.sg.check_existing_rule", return_value=None)
         mock_add = mocker.patch("remote.sg.add_ip_to_security_group")
 
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+
         ip, modified = whitelist_ip_for_instance(
             "i-12345", "test-instance", ip_address="203.0.113.1", ports=[22, 22000, 8384]
         )
 
         assert ip == "203.0.113.1"
         assert modified == ["sg-rpy"]
-        assert mock_add.call_count == 3
-        call_ports = [call.args[2] for call in mock_add.call_args_list]
-        assert sorted(call_ports) == [22, 8384, 22000]
+        # All ports are authorized in one request
+        mock_add.assert_not_called()
+        mock_ec2.return_value.authorize_security_group_ingress.assert_called_once()
+        permissions = mock_ec2.return_value.authorize_security_group_ingress.call_args.kwargs[
+            "IpPermissions"
+        ]
+        assert [p["FromPort"] for p in permissions] == [22, 22000, 8384]
 
 
 # ============================================================================
@@ -767,6 +1194,11 @@ class TestDetachSecurityGroup:
 class TestAddIpCommand:
     """Tests for the sg add CLI command."""
 
+    @pytest.fixture(autouse=True)
+    def no_rule_index(self, mocker):
+        """Rule existence is decided by the check_existing_rule mock in each test."""
+        return mocker.patch("remote.sg.load_instance_rules", return_value=SecurityGroupRuleIndex())
+
     def test_adds_ip_to_remotepy_sg(self, mocker, test_config):
         """Test that add-ip targets the remotepy-managed SG."""
         mocker.patch(
@@ -846,13 +1278,63 @@ class TestAddIpCommand:
         mock_add = mocker.patch("remote.sg.add_ip_to_security_group")
         mocker.patch("remote.sg.get_ip_rules_for_port", return_value=["10.0.0.1/32"])
 
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+
         result = runner.invoke(
             app,
             ["add", "test-instance", "--ip", "10.0.0.1", "--port", "22", "--port", "22000"],
         )
 
+        assert result.exit_code == 0
+        mock_add.assert_not_called()
+        mock_ec2.return_value.authorize_security_group_ingress.assert_called_once_with(
+            GroupId="sg-rpy",
+            IpPermissions=[
+                {
+                    "IpProtocol": "tcp",
+                    "FromPort": port,
+                    "ToPort": port,
+                    "IpRanges": [{"CidrIp": "10.0.0.1/32", "Description": "Added by remote.py"}],
+                }
+                for port in (22, 22000)
+            ],
+        )
+        assert "Allowed 10.0.0.1 on port 22" in result.stdout
+        assert "Allowed 10.0.0.1 on port 22000" in result.stdout
+
+    def test_multiple_ports_fall_back_when_one_already_exists(self, mocker, test_config):
+        """A duplicate rule fails the batch; ports are then added one at a time."""
+        from botocore.exceptions import ClientError
+
+        mocker.patch(
+            "remote.sg.resolve_instance_or_exit",
+            return_value=("test-instance", "i-12345"),
+        )
+        mocker.patch("remote.sg.find_or_create_remotepy_sg", return_value="sg-rpy")
+        mocker.patch("remote.sg.check_existing_rule", return_value=None)
+        mocker.patch("remote.sg.get_ip_rules_for_port", return_value=["10.0.0.1/32"])
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+        mock_ec2.return_value.authorize_security_group_ingress.side_effect = ClientError(
+            {"Error": {"Code": "InvalidPermission.Duplicate", "Message": "exists"}},
+            "authorize_security_group_ingress",
+        )
+        mock_add = mocker.patch(
+            "remote.sg.add_ip_to_security_group",
+            side_effect=[
+                AWSServiceError("EC2", "authorize", "InvalidPermission.Duplicate", "exists"),
+                None,
+            ],
+        )
+
+        result = runner.invoke(
+            app,
+            ["add", "test-instance", "--ip", "10.0.0.1", "--port", "22", "--port", "443"],
+        )
+
         assert result.exit_code == 0
         assert mock_add.call_count == 2
+        assert "10.0.0.1 already has access to port 22" in result.stdout
+        assert "Allowed 10.0.0.1 on port 443" in result.stdout
 
     def test_pre_check_skips_existing_rule(self, mocker, test_config):
         """Test that pre-check finds existing rule and skips adding."""
@@ -938,6 +1420,50 @@ class TestAddIpCommand:
         assert "other IP(s) have access" not in result.stdout
 
 
+class TestPublicIpFreshness:
+    """--exclusive and --refresh must not act on a cached public IP."""
+
+    @pytest.fixture
+    def mock_get_ip(self, mocker):
+        mocker.patch(
+            "remote.sg.resolve_instance_or_exit", return_value=("test-instance", "i-12345")
+        )
+        mocker.patch("remote.sg.find_or_create_remotepy_sg", return_value="sg-rpy")
+        mocker.patch("remote.sg.load_instance_rules", return_value=SecurityGroupRuleIndex())
+        mocker.patch("remote.sg.add_ip_to_security_group_ports", return_value=[22])
+        mocker.patch("remote.sg.clear_port_rules", return_value=0)
+        mocker.patch("remote.sg.get_ip_rules_for_port", return_value=["203.0.113.1/32"])
+        mocker.patch(
+            "remote.sg.get_instance_security_groups",
+            return_value=[{"GroupId": "sg-rpy", "GroupName": "remotepy-test-instance"}],
+        )
+        mocker.patch("remote.sg.remove_ip_from_security_group")
+        return mocker.patch("remote.sg.get_public_ip", return_value="203.0.113.1")
+
+    @pytest.mark.parametrize(
+        "args,refresh",
+        [
+            (["add"], False),
+            (["add", "--refresh"], True),
+            (["add", "--exclusive", "--yes"], True),
+            (["remove", "--yes"], False),
+            (["remove", "-r", "--yes"], True),
+        ],
+        ids=["add", "add_refresh", "add_exclusive", "remove", "remove_refresh"],
+    )
+    def test_commands_refresh_ip_when_needed(self, test_config, mock_get_ip, args, refresh):
+        result = runner.invoke(app, args)
+
+        assert result.exit_code == 0, result.output
+        mock_get_ip.assert_called_once_with(refresh=refresh)
+
+    @pytest.mark.parametrize("exclusive", [False, True])
+    def test_whitelist_refreshes_ip_when_exclusive(self, mock_get_ip, exclusive):
+        whitelist_ip_for_instance("i-12345", "test-instance", exclusive=exclusive)
+
+        mock_get_ip.assert_called_once_with(refresh=exclusive)
+
+
 class TestRemoveIpCommand:
     """Tests for the sg remove CLI command."""
 
@@ -1040,21 +1566,23 @@ class TestListIpsCommand:
             return_value=[{"GroupId": "sg-12345", "GroupName": "my-sg"}],
         )
         mocker.patch(
-            "remote.sg.get_security_group_rules",
-            return_value=[
-                {
-                    "FromPort": 22,
-                    "ToPort": 22,
-                    "IpProtocol": "tcp",
-                    "IpRanges": [{"CidrIp": "10.0.0.1/32", "Description": "SSH"}],
-                },
-                {
-                    "FromPort": 443,
-                    "ToPort": 443,
-                    "IpProtocol": "tcp",
-                    "IpRanges": [{"CidrIp": "0.0.0.0/0", "Description": "HTTPS"}],
-                },
-            ],
+            "remote.sg.get_security_group_details",
+            side_effect=_sg_details_for(
+                [
+                    {
+                        "FromPort": 22,
+                        "ToPort": 22,
+                        "IpProtocol": "tcp",
+                        "IpRanges": [{"CidrIp": "10.0.0.1/32", "Description": "SSH"}],
+                    },
+                    {
+                        "FromPort": 443,
+                        "ToPort": 443,
+                        "IpProtocol": "tcp",
+                        "IpRanges": [{"CidrIp": "0.0.0.0/0", "Description": "HTTPS"}],
+                    },
+                ]
+            ),
         )
 
         result = runner.invoke(app, ["list", "test-instance"])
@@ -1075,21 +1603,23 @@ class TestListIpsCommand:
             return_value=[{"GroupId": "sg-12345", "GroupName": "my-sg"}],
         )
         mocker.patch(
-            "remote.sg.get_security_group_rules",
-            return_value=[
-                {
-                    "FromPort": 22,
-                    "ToPort": 22,
-                    "IpProtocol": "tcp",
-                    "IpRanges": [{"CidrIp": "10.0.0.1/32", "Description": "SSH"}],
-                },
-                {
-                    "FromPort": 443,
-                    "ToPort": 443,
-                    "IpProtocol": "tcp",
-                    "IpRanges": [{"CidrIp": "0.0.0.0/0", "Description": "HTTPS"}],
-                },
-            ],
+            "remote.sg.get_security_group_details",
+            side_effect=_sg_details_for(
+                [
+                    {
+                        "FromPort": 22,
+                        "ToPort": 22,
+                        "IpProtocol": "tcp",
+                        "IpRanges": [{"CidrIp": "10.0.0.1/32", "Description": "SSH"}],
+                    },
+                    {
+                        "FromPort": 443,
+                        "ToPort": 443,
+                        "IpProtocol": "tcp",
+                        "IpRanges": [{"CidrIp": "0.0.0.0/0", "Description": "HTTPS"}],
+                    },
+                ]
+            ),
         )
 
         result = runner.invoke(app, ["list", "test-instance", "--port", "22"])
@@ -1110,7 +1640,7 @@ class TestListIpsCommand:
             "remote.sg.get_instance_security_groups",
             return_value=[{"GroupId": "sg-12345", "GroupName": "my-sg"}],
         )
-        mocker.patch("remote.sg.get_security_group_rules", return_value=[])
+        mocker.patch("remote.sg.get_security_group_details", side_effect=_sg_details_for([]))
 
         result = runner.invoke(app, ["list", "test-instance"])
 
@@ -1128,15 +1658,17 @@ class TestListIpsCommand:
             return_value=[{"GroupId": "sg-12345", "GroupName": "my-sg"}],
         )
         mocker.patch(
-            "remote.sg.get_security_group_rules",
-            return_value=[
-                {
-                    "FromPort": 443,
-                    "ToPort": 443,
-                    "IpProtocol": "tcp",
-                    "IpRanges": [{"CidrIp": "0.0.0.0/0", "Description": "HTTPS"}],
-                },
-            ],
+            "remote.sg.get_security_group_details",
+            side_effect=_sg_details_for(
+                [
+                    {
+                        "FromPort": 443,
+                        "ToPort": 443,
+                        "IpProtocol": "tcp",
+                        "IpRanges": [{"CidrIp": "0.0.0.0/0", "Description": "HTTPS"}],
+                    },
+                ]
+            ),
         )
 
         result = runner.invoke(app, ["list", "test-instance", "--port", "443"])
@@ -1155,15 +1687,17 @@ class TestListIpsCommand:
             return_value={"GroupId": "sg-specific", "GroupName": "specific-sg"},
         )
         mocker.patch(
-            "remote.sg.get_security_group_rules",
-            return_value=[
-                {
-                    "FromPort": 22,
-                    "ToPort": 22,
-                    "IpProtocol": "tcp",
-                    "IpRanges": [{"CidrIp": "10.0.0.1/32", "Description": "SSH"}],
-                },
-            ],
+            "remote.sg.get_security_group_details",
+            side_effect=_sg_details_for(
+                [
+                    {
+                        "FromPort": 22,
+                        "ToPort": 22,
+                        "IpProtocol": "tcp",
+                        "IpRanges": [{"CidrIp": "10.0.0.1/32", "Description": "SSH"}],
+                    },
+                ]
+            ),
         )
 
         result = runner.invoke(app, ["list", "test-instance", "--sg", "sg-specific"])
@@ -1183,29 +1717,74 @@ class TestListIpsCommand:
             return_value=[{"GroupId": "sg-12345", "GroupName": "my-sg"}],
         )
         mocker.patch(
-            "remote.sg.get_security_group_rules",
+            "remote.sg.get_security_group_details",
+            side_effect=_sg_details_for(
+                [
+                    {
+                        "FromPort": 22,
+                        "ToPort": 22,
+                        "IpProtocol": "tcp",
+                        "IpRanges": [{"CidrIp": "10.0.0.1/32", "Description": "SSH"}],
+                    },
+                    {
+                        "FromPort": 8888,
+                        "ToPort": 8888,
+                        "IpProtocol": "tcp",
+                        "IpRanges": [{"CidrIp": "10.0.0.2/32", "Description": "Jupyter"}],
+                    },
+                ]
+            ),
+        )
+
+        result = runner.invoke(app, ["list", "test-instance"])
+
+        assert result.exit_code == 0
+        assert "10.0.0.1/32" in result.stdout
+        assert "10.0.0.2/32" in result.stdout
+        assert "All Inbound IP Rules" in result.stdout
+
+    def test_lists_rules_of_all_groups_with_one_describe(self, mocker, test_config):
+        """All attached groups are described in one call and filtered by port."""
+        mocker.patch(
+            "remote.sg.resolve_instance_or_exit",
+            return_value=("test-instance", "i-12345"),
+        )
+        mocker.patch(
+            "remote.sg.get_instance_security_groups",
             return_value=[
+                {"GroupId": "sg-1", "GroupName": "first-sg"},
+                {"GroupId": "sg-2", "GroupName": "second-sg"},
+            ],
+        )
+        mock_details = mocker.patch(
+            "remote.sg.get_security_group_details",
+            return_value=[
+                {"GroupId": "sg-1", "IpPermissions": [_tcp_rule(22, "10.0.0.1/32")]},
                 {
-                    "FromPort": 22,
-                    "ToPort": 22,
-                    "IpProtocol": "tcp",
-                    "IpRanges": [{"CidrIp": "10.0.0.1/32", "Description": "SSH"}],
-                },
-                {
-                    "FromPort": 8888,
-                    "ToPort": 8888,
-                    "IpProtocol": "tcp",
-                    "IpRanges": [{"CidrIp": "10.0.0.2/32", "Description": "Jupyter"}],
+                    "GroupId": "sg-2",
+                    "IpPermissions": [
+                        _tcp_rule(443, "10.0.0.9/32"),
+                        {
+                            "FromPort": 20,
+                            "ToPort": 30,
+                            "IpProtocol": "tcp",
+                            "IpRanges": [{"CidrIp": "10.0.0.2/32"}],
+                        },
+                    ],
                 },
             ],
         )
+        mock_rules = mocker.patch("remote.sg.get_security_group_rules")
 
-        result = runner.invoke(app, ["list", "test-instance"])
+        result = runner.invoke(app, ["list", "test-instance", "--port", "22"])
 
         assert result.exit_code == 0
+        mock_details.assert_called_once_with(["sg-1", "sg-2"])
+        mock_rules.assert_not_called()
         assert "10.0.0.1/32" in result.stdout
         assert "10.0.0.2/32" in result.stdout
-        assert "All Inbound IP Rules" in result.stdout
+        assert "20-30" in result.stdout
+        assert "10.0.0.9/32" not in result.stdout
 
 
 class TestDetachSgCommand:
@@ -1394,6 +1973,15 @@ class TestMyIpCommand:
         assert result.exit_code == 0
         assert "203.0.113.1" in result.stdout
 
+    def test_refresh_bypasses_cache(self, mocker, test_config):
+        """--refresh should ask for a fresh IP."""
+        mock_get_ip = mocker.patch("remote.sg.get_public_ip", return_value="203.0.113.1")
+
+        result = runner.invoke(app, ["my-ip", "--refresh"])
+
+        assert result.exit_code == 0
+        mock_get_ip.assert_called_once_with(refresh=True)
+
 
 class TestGetSecurityGroupDetails:
     """Tests for get_security_group_details function."""
@@ -1535,3 +2123,238 @@ class TestListSgsCommand:
         assert "my-sg" in result.stdout
         assert "sg-12345" in result.stdout
         assert "0" in result.stdout  # Zero inbound rules
+
+
+class TestSecurityGroupAudit:
+    """Tests for the account-wide security group audit."""
+
+    @staticmethod
+    def _group(group_id, permissions, name=None):
+        return {"GroupId": group_id, "GroupName": name or group_id, "IpPermissions": permissions}
+
+    def test_interval_index_finds_covering_rules(self):
+        """Port queries should return single-port, range and all-traffic rules covering it."""
+        from remote.sg import CidrRule, PortIntervalIndex
+
+        def rule(protocol, from_port, to_port, cidr):
+            return CidrRule("sg-1", "g", protocol, from_port, to_port, cidr, "-")
+
+        ssh = rule("tcp", 22, 22, "10.0.0.1/32")
+        wide = rule("tcp", 1000, 9000, "10.0.0.2/32")
+        https = rule("tcp", 443, 443, "10.0.0.3/32")
+        everything = rule("-1", 0, 0, "10.0.0.4/32")
+        index = PortIntervalIndex([ssh, wide, https, everything])
+
+        assert set(index.covering(22)) == {ssh, everything}
+        assert set(index.covering(8384)) == {wide, everything}
+        assert set(index.covering(9001)) == {everything}
+
+    def test_rules_written_by_remotepy_are_detected_as_stale(self, mocker):
+        """Rules added by sg add carry the description the audit looks for."""
+        from remote.sg import add_ip_to_security_group_ports, audit_security_groups
+
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+
+        add_ip_to_security_group_ports("sg-1", "198.51.100.7", [22, 443])
+
+        permissions = mock_ec2.return_value.authorize_security_group_ingress.call_args.kwargs[
+            "IpPermissions"
+        ]
+        report = audit_security_groups([self._group("sg-1", permissions)], "203.0.113.1")
+        assert {rule.from_port for rule in report.stale} == {22, 443}
+
+    def test_reports_world_open_stale_and_overlaps(self):
+        """Each kind of finding should be reported from the described groups alone."""
+        from remote.sg import audit_security_groups
+
+        groups = [
+            self._group(
+                "sg-1",
+                [
+                    {
+                        "IpProtocol": "tcp",
+                        "FromPort": 22,
+                        "ToPort": 22,
+                        "IpRanges": [
+                            {"CidrIp": "203.0.113.1/32", "Description": "Added by remote.py"},
+                            {"CidrIp": "198.51.100.7/32", "Description": "Added by remote.py"},
+                            {"CidrIp": "192.0.2.1/32", "Description": "office"},
+                        ],
+                    },
+                    {
+                        "IpProtocol": "tcp",
+                        "FromPort": 0,
+                        "ToPort": 1024,
+                        "IpRanges": [{"CidrIp": "192.0.2.0/24"}],
+                    },
+                ],
+            ),
+            self._group(
+                "sg-2",
+                [
+                    {
+                        "IpProtocol": "tcp",
+                        "FromPort": 443,
+                        "ToPort": 443,
+                        "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+                    },
+                    {
+                        "IpProtocol": "udp",
+                        "FromPort": 443,
+                        "ToPort": 443,
+                        "IpRanges": [{"CidrIp": "10.0.0.0/8"}],
+                    },
+                ],
+            ),
+        ]
+
+        report = audit_security_groups(groups, current_ip="203.0.113.1")
+
+        assert report.group_count == 2
+        assert report.rule_count == 6
+        assert [r.group_id for r in report.world_open] == ["sg-2"]
+        assert [r.cidr for r in report.stale] == ["198.51.100.7/32"]
+        # Only the office /32 sits inside the /24 range rule; udp vs tcp never overlaps
+        assert [(a.cidr, b.cidr) for a, b in report.overlaps] == [("192.0.2.0/24", "192.0.2.1/32")]
+
+    def test_port_filter_and_no_ip_skip_checks(self):
+        """A port filter limits findings; no current IP skips the stale check."""
+        from remote.sg import audit_security_groups
+
+        groups = [
+            self._group(
+                "sg-1",
+                [
+                    {
+                        "IpProtocol": "tcp",
+                        "FromPort": 22,
+                        "ToPort": 22,
+                        "IpRanges": [
+                            {"CidrIp": "0.0.0.0/0"},
+                            {"CidrIp": "198.51.100.7/32", "Description": "Added by remote.py"},
+                        ],
+                    },
+                    {"IpProtocol": "-1", "IpRanges": [{"CidrIp": "0.0.0.0/0"}]},
+                ],
+            )
+        ]
+
+        report = audit_security_groups(groups, ports=[443])
+
+        assert [r.protocol for r in report.world_open] == ["-1"]
+        assert report.stale == []
+
+    def test_ipv6_ranges_and_portless_rules_are_audited(self):
+        """::/0 is world-open, and all-traffic rules cover every port."""
+        from remote.sg import PortIntervalIndex, _cidr_rules, audit_security_groups
+
+        permissions = [
+            {
+                "IpProtocol": "tcp",
+                "FromPort": 22,
+                "ToPort": 22,
+                "IpRanges": [],
+                "Ipv6Ranges": [{"CidrIpv6": "::/0", "Description": "ssh v6"}],
+            },
+            {"IpProtocol": "-1", "IpRanges": [{"CidrIp": "10.0.0.0/8"}]},
+        ]
+
+        rules = list(_cidr_rules("sg-1", "g", permissions))
+        assert [(r.cidr, r.from_port, r.to_port) for r in rules] == [
+            ("::/0", 22, 22),
+            ("10.0.0.0/8", 0, 65535),
+        ]
+        assert set(PortIntervalIndex(rules).covering(22)) == set(rules)
+        assert rules[1].port_display == "all"
+
+        report = audit_security_groups([self._group("sg-1", permissions)], ports=[22])
+
+        assert [r.cidr for r in report.world_open] == ["::/0"]
+        assert report.overlaps == []  # IPv4 and IPv6 blocks never overlap
+
+    def test_audit_command_rejects_blank_ip(self, mocker, test_config):
+        mock_describe = mocker.patch("remote.sg.describe_all_security_groups")
+
+        result = runner.invoke(app, ["audit", "--ip", "  "])
+
+        assert result.exit_code == 1
+        assert "IP address cannot be empty" in result.stdout
+        mock_describe.assert_not_called()
+
+    def test_audit_command_uses_one_paginated_sweep(self, mocker, test_config):
+        """sg audit should describe all groups through the paginator and nothing else."""
+        mock_ec2 = mocker.patch("remote.sg.get_ec2_client")
+        mock_paginator = mock_ec2.return_value.get_paginator.return_value
+        mock_paginator.paginate.return_value = [
+            {
+                "SecurityGroups": [
+                    self._group(
+                        f"sg-{i}",
+                        [
+                            {
+                                "IpProtocol": "tcp",
+                                "FromPort": 22,
+                                "ToPort": 22,
+                                "IpRanges": [{"CidrIp": f"10.0.{i}.1/32"}],
+                            }
+                        ],
+                    )
+                    for i in range(page * 1000, (page + 1) * 1000)
+                ]
+            }
+            for page in range(2)
+        ]
+        mock_ip = mocker.patch("remote.sg.get_public_ip")
+
+        result = runner.invoke(app, ["audit", "--ip", "203.0.113.1"])
+
+        assert result.exit_code == 0
+        mock_ec2.return_value.get_paginator.assert_called_once_with("describe_security_groups")
+        mock_ec2.return_value.describe_security_groups.assert_not_called()
+        mock_ip.assert_not_called()
+        assert "No issues found across 2000 security group(s)" in result.stdout
+
+    def test_audit_command_prints_findings(self, mocker, test_config):
+        """Findings should be shown in tables with a summary."""
+        mocker.patch(
+            "remote.sg.describe_all_security_groups",
+            return_value=[
+                self._group(
+                    "sg-1",
+                    [
+                        {
+                            "IpProtocol": "tcp",
+                            "FromPort": 22,
+                            "ToPort": 22,
+                            "IpRanges": [{"CidrIp": "0.0.0.0/0", "Description": "ssh"}],
+                        }
+                    ],
+                    name="web-sg",
+                )
+            ],
+        )
+
+        result = runner.invoke(app, ["audit", "--skip-stale"])
+
+        assert result.exit_code == 0
+        assert "Open to the World" in result.stdout
+        assert "web-sg" in result.stdout
+        assert "Found 1 world-open, 0 stale and 0 overlapping" in result.stdout
+
+    def test_audit_command_rejects_invalid_port(self, test_config):
+        result = runner.invoke(app, ["audit", "--port", "ssh"])
+
+        assert result.exit_code == 1
+        assert "Invalid port" in result.stdout
+
+
+def _tcp_rule(port, cidr):
+    """A single-port TCP IpPermissions entry."""
+    return {"FromPort": port, "ToPort": port, "IpProtocol": "tcp", "IpRanges": [{"CidrIp": cidr}]}
+
+
+def _sg_details_for(permissions):
+    """describe_security_groups side effect giving every group the same rules."""
+    return lambda group_ids: [
+        {"GroupId": group_id, "IpPermissions": permissions} for group_id in group_ids
+    ]
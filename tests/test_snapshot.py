@@ -193,15 +193,17 @@ def test_list_snapshots_with_instance_name(mocker, mock_snapshot_response, comma
         "remote.snapshot.get_volume_ids", return_value=["vol-0123456789abcdef0"]
     )
 
-    mock_ec2_client.describe_snapshots.return_value = mock_snapshot_response
+    mock_paginator = mock_ec2_client.get_paginator.return_value
+    mock_paginator.paginate.return_value = [mock_snapshot_response]
 
     result = runner.invoke(app, [command, "test-instance"])
 
     assert result.exit_code == 0
     mock_resolve_instance.assert_called_once_with("test-instance")
     mock_get_volume_ids.assert_called_once_with("i-0123456789abcdef0")
-    mock_ec2_client.describe_snapshots.assert_called_once_with(
-        Filters=[{"Name": "volume-id", "Values": ["vol-0123456789abcdef0"]}]
+    mock_ec2_client.get_paginator.assert_called_once_with("describe_snapshots")
+    mock_paginator.paginate.assert_called_once_with(
+        Filters=[{"Name": "volume-id", "Values": ["vol-0123456789abcdef0"]}],
     )
 
     assert "snap-0123456789abcdef0" in result.stdout
@@ -222,7 +224,7 @@ def test_list_snapshots_without_instance_name(mocker, mock_snapshot_response):
         "remote.snapshot.get_volume_ids", return_value=["vol-0123456789abcdef0"]
     )
 
-    mock_ec2_client.describe_snapshots.return_value = mock_snapshot_response
+    mock_ec2_client.get_paginator.return_value.paginate.return_value = [mock_snapshot_response]
 
     result = runner.invoke(app, ["list"])
 
@@ -243,44 +245,45 @@ def test_list_snapshots_multiple_volumes(mocker):
         return_value=["vol-0123456789abcdef0", "vol-0123456789abcdef1"],
     )
 
-    # Mock different responses for different volume IDs
-    def mock_describe_snapshots(Filters):
-        volume_id = Filters[0]["Values"][0]
-        if volume_id == "vol-0123456789abcdef0":
-            return {
-                "Snapshots": [
-                    {
-                        "SnapshotId": "snap-vol1",
-                        "VolumeId": "vol-0123456789abcdef0",
-                        "State": "completed",
-                        "StartTime": datetime.datetime(
-                            2023, 7, 15, 0, 0, 0, tzinfo=datetime.timezone.utc
-                        ),
-                        "Description": "Snapshot for vol1",
-                    }
-                ]
-            }
-        else:
-            return {
-                "Snapshots": [
-                    {
-                        "SnapshotId": "snap-vol2",
-                        "VolumeId": "vol-0123456789abcdef1",
-                        "State": "pending",
-                        "StartTime": datetime.datetime(
-                            2023, 7, 16, 0, 0, 0, tzinfo=datetime.timezone.utc
-                        ),
-                        "Description": "Snapshot for vol2",
-                    }
-                ]
-            }
-
-    mock_ec2_client.describe_snapshots.side_effect = mock_describe_snapshots
+    # Snapshots of both volumes arrive from one filtered, paginated call
+    mock_paginator = mock_ec2_client.get_paginator.return_value
+    mock_paginator.paginate.return_value = [
+        {
+            "Snapshots": [
+                {
+                    "SnapshotId": "snap-vol1",
+                    "VolumeId": "vol-0123456789abcdef0",
+                    "State": "completed",
+                    "StartTime": datetime.datetime(
+                        2023, 7, 15, 0, 0, 0, tzinfo=datetime.timezone.utc
+                    ),
+                    "Description": "Snapshot for vol1",
+                }
+            ]
+        },
+        {
+            "Snapshots": [
+                {
+                    "SnapshotId": "snap-vol2",
+                    "VolumeId": "vol-0123456789abcdef1",
+                    "State": "pending",
+                    "StartTime": datetime.datetime(
+                        2023, 7, 16, 0, 0, 0, tzinfo=datetime.timezone.utc
+                    ),
+                    "Description": "Snapshot for vol2",
+                }
+            ]
+        },
+    ]
 
     result = runner.invoke(app, ["list", "test-instance"])
 
     assert result.exit_code == 0
-    assert mock_ec2_client.describe_snapshots.call_count == 2
+    mock_paginator.paginate.assert_called_once_with(
+        Filters=[
+            {"Name": "volume-id", "Values": ["vol-0123456789abcdef0", "vol-0123456789abcdef1"]}
+        ],
+    )
 
     assert "snap-vol1" in result.stdout
     assert "snap-vol2" in result.stdout
@@ -297,7 +300,7 @@ def test_list_snapshots_no_snapshots(mocker):
     )
     mocker.patch("remote.snapshot.get_volume_ids", return_value=["vol-0123456789abcdef0"])
 
-    mock_ec2_client.describe_snapshots.return_value = {"Snapshots": []}
+    mock_ec2_client.get_paginator.return_value.paginate.return_value = [{"Snapshots": []}]
 
     result = runner.invoke(app, ["list", "test-instance"])
 
@@ -307,3 +310,70 @@ def test_list_snapshots_no_snapshots(mocker):
     assert "SnapshotId" in result.stdout
     assert "VolumeId" in result.stdout
     assert "State" in result.stdout
+
+
+def test_list_snapshots_since_skips_older_snapshots(mocker, mock_snapshot_response):
+    """--since should drop snapshots started before the bound."""
+    mock_ec2 = mocker.patch("remote.snapshot.get_ec2_client")
+    mocker.patch(
+        "remote.snapshot.resolve_instance_or_exit",
+        return_value=("test-instance", "i-0123456789abcdef0"),
+    )
+    mocker.patch("remote.snapshot.get_volume_ids", return_value=["vol-0123456789abcdef0"])
+    mock_ec2.return_value.get_paginator.return_value.paginate.return_value = [
+        mock_snapshot_response
+    ]
+
+    result = runner.invoke(app, ["list", "test-instance", "--since", "2023-07-16"])
+
+    assert result.exit_code == 0
+    assert "snap-0123456789abcdef1" in result.stdout
+    assert "snap-0123456789abcdef0" not in result.stdout
+
+
+def test_list_snapshots_no_volumes_skips_describe(mocker):
+    """An instance without volumes should not call describe_snapshots."""
+    mock_ec2 = mocker.patch("remote.snapshot.get_ec2_client")
+    mocker.patch(
+        "remote.snapshot.resolve_instance_or_exit",
+        return_value=("test-instance", "i-0123456789abcdef0"),
+    )
+    mocker.patch("remote.snapshot.get_volume_ids", return_value=[])
+
+    result = runner.invoke(app, ["list", "test-instance"])
+
+    assert result.exit_code == 0
+    mock_ec2.return_value.get_paginator.assert_not_called()
+
+
+def test_list_snapshots_invalid_since():
+    """An unparseable --since value should fail before any AWS call."""
+    result = runner.invoke(app, ["list", "test-instance", "--since", "last-week"])
+
+    assert result.exit_code == 1
+    assert "Invalid --since value" in result.stdout
+
+
+@pytest.mark.parametrize(
+    "since,expected_age",
+    [
+        ("30d", datetime.timedelta(days=30)),
+        ("12h", datetime.timedelta(hours=12)),
+        ("1h30m", datetime.timedelta(minutes=90)),
+    ],
+)
+def test_parse_since_relative(since, expected_age):
+    from remote.snapshot import _parse_since
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    age = now - _parse_since(since)
+
+    assert abs(age - expected_age) < datetime.timedelta(seconds=5)
+
+
+def test_parse_since_date_is_utc():
+    from remote.snapshot import _parse_since
+
+    assert _parse_since("2024-01-31") == datetime.datetime(
+        2024, 1, 31, tzinfo=datetime.timezone.utc
+    )
@@ -1,6 +1,10 @@
 """Tests for the tracking module."""
 
 import json
+import logging
+import subprocess
+import sys
+import textwrap
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
@@ -375,6 +379,210 @@ class TestTrackingManager:
         assert result == {}
 
 
+class TestTrackingJournal:
+    """Tests for the append-only journal behind TrackingManager."""
+
+    @pytest.fixture
+    def tracking_file(self, tmp_path):
+        return tmp_path / "tracking.json"
+
+    def test_events_append_to_journal_without_rewriting_snapshot(self, tracking_file):
+        manager = TrackingManager(tracking_file)
+        manager.record_start("i-abc123", "my-server")
+        snapshot = tracking_file.read_text()
+
+        manager.record_stop("i-abc123", hourly_price=0.10)
+        manager.record_start("i-abc123")
+
+        assert tracking_file.read_text() == snapshot
+        assert len(manager.journal_file.read_text().splitlines()) == 3  # header + 2 events
+
+    def test_batch_records_append_once(self, tracking_file):
+        manager = TrackingManager(tracking_file)
+        manager.record_start("i-seed")
+
+        with patch.object(manager, "_append_events", wraps=manager._append_events) as append:
+            started = manager.record_starts([("i-1", "node-1"), ("i-2", "node-2"), ("i-3", None)])
+            stopped = manager.record_stops(
+                [("i-1", 0.10, None), ("i-2", None, None), ("i-unknown", 0.10, None)]
+            )
+
+        assert set(started) == {"i-1", "i-2", "i-3"}
+        assert set(stopped) == {"i-1", "i-2"}
+        assert append.call_count == 2
+        # header + 3 starts + 2 stops (the seed start went into the first snapshot)
+        assert len(manager.journal_file.read_text().splitlines()) == 6
+
+        reloaded = TrackingManager(tracking_file)
+        assert reloaded.get_instance_tracking("i-2").name == "node-2"
+        assert reloaded.get_instance_tracking("i-3").get_active_session() is not None
+        assert reloaded.get_instance_tracking("i-1").get_active_session() is None
+
+    def test_new_manager_replays_journal(self, tracking_file):
+        manager = TrackingManager(tracking_file)
+        manager.record_start("i-abc123", "my-server")
+        manager.record_stop("i-abc123", hourly_price=0.10)
+        manager.record_start("i-def456", "other-server")
+        manager.clear_instance_tracking("i-def456")
+
+        reloaded = TrackingManager(tracking_file)
+
+        assert reloaded.get_lifetime_stats("i-abc123") == manager.get_lifetime_stats("i-abc123")
+        assert reloaded.get_instance_tracking("i-def456") is None
+
+    def test_compacts_after_threshold(self, tracking_file):
+        manager = TrackingManager(tracking_file)
+        manager.record_start("i-abc123")
+
+        with patch("remote.tracking.TRACKING_JOURNAL_COMPACT_EVENTS", 4):
+            for _ in range(2):
+                manager.record_stop("i-abc123")
+                manager.record_start("i-abc123")
+
+        # Journal was folded into the snapshot and restarted
+        assert len(manager.journal_file.read_text().splitlines()) == 1
+        snapshot = json.loads(tracking_file.read_text())
+        assert len(snapshot["instances"]["i-abc123"]["sessions"]) == 3
+
+    def test_legacy_snapshot_is_upgraded_on_first_write(self, tracking_file):
+        tracking_file.write_text(
+            json.dumps({"instances": {"i-abc123": {"name": "old", "sessions": []}}})
+        )
+        manager = TrackingManager(tracking_file)
+
+        manager.record_start("i-abc123")
+
+        snapshot = json.loads(tracking_file.read_text())
+        assert snapshot["generation"]
+        assert len(TrackingManager(tracking_file).get_instance_tracking("i-abc123").sessions) == 1
+
+    def test_journal_from_other_generation_is_ignored(self, tracking_file):
+        manager = TrackingManager(tracking_file)
+        manager.record_start("i-abc123")
+        manager.record_stop("i-abc123")
+        journal = manager.journal_file.read_text()
+
+        manager.compact()
+        manager.journal_file.write_text(journal)
+
+        stats = TrackingManager(tracking_file).get_lifetime_stats("i-abc123")
+        assert stats is not None
+        assert stats[2] == 1  # stop event not replayed twice
+
+    def test_torn_journal_line_is_skipped(self, tracking_file):
+        manager = TrackingManager(tracking_file)
+        manager.record_start("i-abc123")
+        manager.record_stop("i-abc123")
+        with open(manager.journal_file, "a") as f:
+            f.write('{"op": "start", "instance_')
+
+        tracking = TrackingManager(tracking_file).get_instance_tracking("i-abc123")
+
+        assert len(tracking.sessions) == 1
+        assert tracking.sessions[0].stop is not None
+
+    def test_malformed_journal_events_are_skipped(self, tracking_file, caplog):
+        manager = TrackingManager(tracking_file)
+        manager.record_start("i-abc123")
+        manager.record_stop("i-abc123")
+        with open(manager.journal_file, "a") as f:
+            f.write('{"op": "start", "instance_id": "i-abc123"}\n')
+            f.write('{"op": "stop", "instance_id": 42, "at": "2026-01-01T00:00:00+00:00"}\n')
+            f.write('{"op": "reboot", "instance_id": "i-abc123", "at": "2026-01-01T00:00:00"}\n')
+            f.write('{"op": "start", "instance_id": "i-def456", "at": "2026-01-01T00:00:00"}\n')
+
+        with caplog.at_level(logging.WARNING, logger="remote.tracking"):
+            reloaded = TrackingManager(tracking_file)
+            tracking = reloaded.get_instance_tracking("i-abc123")
+
+        assert len(tracking.sessions) == 1
+        assert tracking.sessions[0].stop is not None
+        assert reloaded.get_instance_tracking("i-def456") is not None
+        assert caplog.text.count("Skipping malformed tracking journal event") == 3
+
+
+_STRESS_WORKER = textwrap.dedent(
+    """
+    import sys
+    from pathlib import Path
+
+    from remote.tracking import TrackingManager
+
+    tracking_file, worker, rounds = Path(sys.argv[1]), sys.argv[2], int(sys.argv[3])
+    for _ in range(rounds):
+        manager = TrackingManager(tracking_file)
+        manager.record_start(f"i-{worker}", worker)
+        manager.record_start("i-shared")
+        manager.record_stop(f"i-{worker}", hourly_price=1.0)
+    """
+)
+
+
+class TestConcurrentTracking:
+    """Tests for locking and merging writes from several managers or processes."""
+
+    @pytest.fixture
+    def tracking_file(self, tmp_path):
+        return tmp_path / "tracking.json"
+
+    def test_stale_manager_merges_other_writers_events(self, tracking_file):
+        first = TrackingManager(tracking_file)
+        second = TrackingManager(tracking_file)
+        first.get_all_tracking()
+        second.get_all_tracking()
+
+        first.record_start("i-abc123")
+        second.record_start("i-def456")
+        first.record_stop("i-abc123")
+
+        result = TrackingManager(tracking_file).get_all_tracking()
+        assert set(result) == {"i-abc123", "i-def456"}
+        assert result["i-abc123"].sessions[0].stop is not None
+
+    def test_stop_sees_start_recorded_by_other_manager(self, tracking_file):
+        stopper = TrackingManager(tracking_file)
+        stopper.get_all_tracking()
+
+        TrackingManager(tracking_file).record_start("i-abc123")
+
+        assert stopper.record_stop("i-abc123") is not None
+
+    def test_merge_reloads_after_other_manager_compacts(self, tracking_file):
+        first = TrackingManager(tracking_file)
+        first.record_start("i-abc123")
+        second = TrackingManager(tracking_file)
+        second.record_start("i-def456")
+        second.compact()
+
+        first.record_stop("i-abc123")
+
+        result = TrackingManager(tracking_file).get_all_tracking()
+        assert set(result) == {"i-abc123", "i-def456"}
+        assert result["i-abc123"].sessions[0].stop is not None
+
+    def test_parallel_processes_lose_no_events(self, tracking_file):
+        """Stress test: many processes writing at once, crossing compactions."""
+        workers, rounds = 8, 15
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-c", _STRESS_WORKER, str(tracking_file), f"w{n}", str(rounds)]
+            )
+            for n in range(workers)
+        ]
+        for process in processes:
+            assert process.wait(timeout=120) == 0
+
+        result = TrackingManager(tracking_file).get_all_tracking()
+
+        # 360 events is enough to cross the compaction threshold
+        assert len(result["i-shared"].sessions) == workers * rounds
+        for n in range(workers):
+            sessions = result[f"i-w{n}"].sessions
+            assert len(sessions) == rounds
+            assert all(session.stop is not None for session in sessions)
+        assert [p.name for p in tracking_file.parent.glob("*.tmp")] == []
+
+
 class TestGetTrackingFilePath:
     """Tests for get_tracking_file_path function."""
 
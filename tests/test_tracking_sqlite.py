@@ -0,0 +1,160 @@
+"""Tests for the SQLite usage tracking backend."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from remote.tracking import TrackingManager, create_tracking_manager
+from remote.tracking_sqlite import SQLiteTrackingManager, migrate_json_to_sqlite
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    return tmp_path / "tracking.db"
+
+
+@pytest.fixture
+def manager(db_file):
+    manager = SQLiteTrackingManager(db_file)
+    yield manager
+    manager.close()
+
+
+class TestSQLiteTrackingManager:
+    """Tests for SQLiteTrackingManager."""
+
+    def test_schema_has_indexes(self, manager, db_file):
+        manager.get_all_tracking()
+
+        conn = sqlite3.connect(db_file)
+        indexes = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+        conn.close()
+
+        assert {"idx_sessions_instance_start", "idx_sessions_start"} <= indexes
+
+    def test_record_start_and_stop_with_cost(self, manager):
+        start_time = datetime.now(timezone.utc)
+        with patch("remote.tracking_sqlite.datetime") as mock_datetime:
+            mock_datetime.now.return_value = start_time
+            mock_datetime.fromisoformat = datetime.fromisoformat
+            manager.record_start("i-abc123", "my-server")
+
+            mock_datetime.now.return_value = start_time + timedelta(hours=2)
+            session = manager.record_stop("i-abc123", hourly_price=0.10)
+
+        assert session.hours == pytest.approx(2.0)
+        assert session.cost == pytest.approx(0.20)
+        assert manager.get_lifetime_stats("i-abc123") == (
+            pytest.approx(2.0),
+            pytest.approx(0.20),
+            1,
+        )
+        assert manager.get_instance_tracking("i-abc123").name == "my-server"
+
+    def test_batch_start_and_stop(self, manager):
+        started = manager.record_starts([("i-1", "node-1"), ("i-2", "node-2")])
+        stopped = manager.record_stops([("i-1", 0.10, None), ("i-missing", 0.10, "ghost")])
+
+        assert set(started) == {"i-1", "i-2"}
+        assert set(stopped) == {"i-1"}
+        assert manager.get_instance_tracking("i-1").get_active_session() is None
+        assert manager.get_instance_tracking("i-2").get_active_session() is not None
+        assert manager.get_instance_tracking("i-missing") is None
+
+    def test_record_start_closes_orphan_session(self, manager):
+        manager.record_start("i-abc123")
+        manager.record_start("i-abc123")
+
+        tracking = manager.get_instance_tracking("i-abc123")
+        assert len(tracking.sessions) == 2
+        assert tracking.sessions[0].stop is not None
+        assert tracking.sessions[1].stop is None
+
+    def test_record_stop_without_active_session(self, manager):
+        assert manager.record_stop("i-unknown") is None
+        manager.record_start("i-abc123")
+        manager.record_stop("i-abc123")
+        assert manager.record_stop("i-abc123") is None
+
+    def test_running_totals_match_sessions(self, manager):
+        for _ in range(3):
+            manager.record_start("i-abc123")
+            manager.record_stop("i-abc123", hourly_price=1.0)
+
+        tracking = manager.get_instance_tracking("i-abc123")
+        hours, cost, count = manager.get_lifetime_stats("i-abc123")
+
+        assert count == 3
+        assert hours == pytest.approx(sum(s.hours for s in tracking.sessions))
+        assert cost == pytest.approx(sum(s.cost for s in tracking.sessions))
+
+    def test_recent_sessions_limit(self, manager):
+        for _ in range(4):
+            manager.record_start("i-abc123")
+
+        tracking = manager.get_instance_tracking("i-abc123", recent_sessions=2)
+
+        assert len(tracking.sessions) == 2
+        assert tracking.sessions[-1].stop is None  # newest last
+
+    def test_clear(self, manager):
+        manager.record_start("i-abc123")
+        manager.record_start("i-def456")
+
+        assert manager.clear_instance_tracking("i-abc123") is True
+        assert manager.clear_instance_tracking("i-abc123") is False
+        assert list(manager.get_all_tracking()) == ["i-def456"]
+        assert manager.clear_all_tracking() == 1
+
+
+class TestMigration:
+    """Tests for migrating JSON tracking data to SQLite."""
+
+    def test_migrates_snapshot_and_journal(self, tmp_path, db_file):
+        json_manager = TrackingManager(tmp_path / "tracking.json")
+        json_manager.record_start("i-abc123", "my-server")
+        json_manager.record_stop("i-abc123", hourly_price=0.5)
+        json_manager.record_start("i-def456", "other")
+
+        assert migrate_json_to_sqlite(tmp_path / "tracking.json", db_file) == (2, 2)
+
+        migrated = SQLiteTrackingManager(db_file)
+        assert migrated.get_lifetime_stats("i-abc123") == pytest.approx(
+            json_manager.get_lifetime_stats("i-abc123")
+        )
+        assert migrated.get_instance_tracking("i-def456").sessions[0].stop is None
+        migrated.close()
+
+    def test_refuses_existing_database(self, tmp_path, db_file):
+        db_file.touch()
+        with pytest.raises(FileExistsError):
+            migrate_json_to_sqlite(tmp_path / "tracking.json", db_file)
+
+    def test_database_presence_selects_backend(self, db_file, mocker):
+        mocker.patch("remote.tracking.get_tracking_db_path", return_value=db_file)
+        assert isinstance(create_tracking_manager(), TrackingManager)
+
+        db_file.touch()
+        assert isinstance(create_tracking_manager(), SQLiteTrackingManager)
+
+    def test_cli_migrate(self, tmp_path, db_file, mocker):
+        from remote.instance import app
+
+        TrackingManager(tmp_path / "tracking.json").record_start("i-abc123")
+        mocker.patch(
+            "remote.tracking.get_tracking_file_path", return_value=tmp_path / "tracking.json"
+        )
+        mocker.patch("remote.tracking_sqlite.get_tracking_db_path", return_value=db_file)
+
+        result = CliRunner().invoke(app, ["tracking-migrate"])
+        assert result.exit_code == 0
+        assert "Migrated 1 session(s) for 1 instance(s)" in result.stdout
+
+        result = CliRunner().invoke(app, ["tracking-migrate"])
+        assert result.exit_code == 0
+        assert "already exists" in result.stdout
@@ -1,7 +1,7 @@
 import datetime
 
 import pytest
-from botocore.exceptions import ClientError, NoCredentialsError
+from botocore.exceptions import ClientError, NoCredentialsError, WaiterError
 from click.exceptions import Exit
 
 from remote.exceptions import (
@@ -32,14 +32,18 @@ from remote.utils import (
     get_volume_name,
     handle_cli_errors,
     is_instance_running,
+    is_ssh_port_open,
     parse_duration_to_minutes,
+    wait_for_instance_running,
+    wait_for_instance_states,
+    wait_for_ssh_ready,
 )
 
 # Remove duplicate fixtures - use centralized ones from conftest.py
 
 
 def test_get_account_id(mocker):
-    mock_boto3_client = mocker.patch("remote.utils.boto3.client")
+    mock_boto3_client = mocker.patch("boto3.client")
     mock_sts_client = mock_boto3_client.return_value
     mock_sts_client.get_caller_identity.return_value = {"Account": "123456789012"}
 
@@ -886,6 +890,25 @@ class TestPaginationEdgeCases:
 
         assert result == []
 
+    def test_get_all_instance_statuses_pages(self, mocker):
+        """get_all_instance_statuses should key every page's entries by instance ID."""
+        from remote.utils import get_all_instance_statuses
+
+        mock_ec2_client = mocker.patch("remote.utils.get_ec2_client")
+        mock_paginator = mock_ec2_client.return_value.get_paginator.return_value
+        mock_paginator.paginate.return_value = [
+            {"InstanceStatuses": [{"InstanceId": "i-1", "SystemStatus": {"Status": "ok"}}]},
+            {"InstanceStatuses": [{"InstanceId": "i-2", "SystemStatus": {"Status": "ok"}}]},
+        ]
+
+        statuses = get_all_instance_statuses()
+
+        mock_ec2_client.return_value.get_paginator.assert_called_once_with(
+            "describe_instance_status"
+        )
+        mock_paginator.paginate.assert_called_once_with(IncludeAllInstances=True)
+        assert set(statuses) == {"i-1", "i-2"}
+
     def test_get_instances_pages_with_mixed_content(self, mocker):
         """Test get_instances with mix of empty and populated pages."""
         mock_ec2_client = mocker.patch("remote.utils.get_ec2_client")
@@ -947,7 +970,7 @@ class TestClientCaching:
         # Clear the cache before testing
         get_ec2_client.cache_clear()
 
-        mock_boto3_client = mocker.patch("remote.utils.boto3.client")
+        mock_boto3_client = mocker.patch("boto3.client")
         mock_client_instance = mocker.MagicMock()
         mock_boto3_client.return_value = mock_client_instance
 
@@ -977,7 +1000,7 @@ class TestClientCaching:
         # Clear the cache before testing
         get_sts_client.cache_clear()
 
-        mock_boto3_client = mocker.patch("remote.utils.boto3.client")
+        mock_boto3_client = mocker.patch("boto3.client")
         mock_client_instance = mocker.MagicMock()
         mock_boto3_client.return_value = mock_client_instance
 
@@ -1003,7 +1026,7 @@ class TestClientCaching:
         # Clear the cache before testing
         get_ec2_client.cache_clear()
 
-        mock_boto3_client = mocker.patch("remote.utils.boto3.client")
+        mock_boto3_client = mocker.patch("boto3.client")
         mock_client_1 = mocker.MagicMock()
         mock_client_2 = mocker.MagicMock()
         mock_boto3_client.side_effect = [mock_client_1, mock_client_2]
@@ -1949,6 +1972,120 @@ class TestIsInstanceRunningReraise:
             is_instance_running("invalid-id")  # Invalid format
 
 
+class TestInstanceReadiness:
+    """Test the running waiter and SSH readiness probe used after starting."""
+
+    INSTANCE_ID = "i-1234567890abcdef0"
+
+    def test_wait_for_instance_running_uses_ec2_waiter(self, mocker):
+        mock_ec2_client = mocker.patch("remote.utils.get_ec2_client")
+        waiter = mock_ec2_client.return_value.get_waiter.return_value
+
+        assert wait_for_instance_running(self.INSTANCE_ID, timeout=60) is True
+
+        mock_ec2_client.return_value.get_waiter.assert_called_once_with("instance_running")
+        waiter.wait.assert_called_once_with(
+            InstanceIds=[self.INSTANCE_ID], WaiterConfig={"Delay": 5, "MaxAttempts": 12}
+        )
+
+    def test_wait_for_instance_running_returns_false_when_waiter_gives_up(self, mocker):
+        mock_ec2_client = mocker.patch("remote.utils.get_ec2_client")
+        waiter = mock_ec2_client.return_value.get_waiter.return_value
+        waiter.wait.side_effect = WaiterError("InstanceRunning", "Max attempts exceeded", {})
+
+        assert wait_for_instance_running(self.INSTANCE_ID) is False
+
+    def test_wait_for_instance_states_polls_pending_instances_together(self, mocker):
+        mock_ec2_client = mocker.patch("remote.utils.get_ec2_client")
+        paginator = mock_ec2_client.return_value.get_paginator.return_value
+
+        def page(states):
+            return [
+                {
+                    "Reservations": [
+                        {
+                            "Instances": [
+                                {"InstanceId": iid, "State": {"Name": state}}
+                                for iid, state in states.items()
+                            ]
+                        }
+                    ]
+                }
+            ]
+
+        paginator.paginate.side_effect = [
+            page({"i-1": "pending", "i-2": "running", "i-3": "pending"}),
+            page({"i-1": "running", "i-3": "terminated"}),
+        ]
+        mock_sleep = mocker.patch("remote.utils.time.sleep")
+        polls = []
+
+        states = wait_for_instance_states(["i-1", "i-2", "i-3"], "running", on_poll=polls.append)
+
+        assert states == {"i-1": "running", "i-2": "running", "i-3": "terminated"}
+        assert [c.kwargs["InstanceIds"] for c in paginator.paginate.call_args_list] == [
+            ["i-1", "i-2", "i-3"],
+            ["i-1", "i-3"],
+        ]
+        assert mock_sleep.call_count == 1
+        assert len(polls) == 2
+
+    def test_wait_for_instance_states_times_out(self, mocker):
+        mocker.patch("remote.utils.get_instance_states", return_value={"i-1": "stopping"})
+        mocker.patch("remote.utils.time.monotonic", side_effect=[0.0, 5.0, 11.0])
+        mocker.patch("remote.utils.time.sleep")
+
+        assert wait_for_instance_states(["i-1"], "stopped", timeout=10) == {"i-1": "stopping"}
+
+    def test_is_ssh_port_open_requires_ssh_banner(self, mocker):
+        mock_connect = mocker.patch("remote.utils.socket.create_connection")
+        sock = mock_connect.return_value.__enter__.return_value
+
+        sock.recv.return_value = b"SSH-"
+        assert is_ssh_port_open("host.example.com") is True
+        mock_connect.assert_called_with(("host.example.com", 22), timeout=3)
+
+        sock.recv.return_value = b"HTTP"
+        assert is_ssh_port_open("host.example.com") is False
+
+    def test_is_ssh_port_open_handles_connection_errors(self, mocker):
+        mocker.patch("remote.utils.socket.create_connection", side_effect=ConnectionRefusedError())
+
+        assert is_ssh_port_open("host.example.com") is False
+
+    def test_wait_for_ssh_ready_returns_immediately_when_reachable(self, mocker):
+        mocker.patch("remote.utils.get_instance_dns", return_value="host.example.com")
+        mock_probe = mocker.patch("remote.utils.is_ssh_port_open", return_value=True)
+        mock_sleep = mocker.patch("remote.utils.time.sleep")
+
+        assert wait_for_ssh_ready(self.INSTANCE_ID) is True
+
+        mock_probe.assert_called_once_with("host.example.com", 22)
+        mock_sleep.assert_not_called()
+
+    def test_wait_for_ssh_ready_backs_off_until_dns_and_sshd(self, mocker):
+        mock_dns = mocker.patch(
+            "remote.utils.get_instance_dns", side_effect=["", "host.example.com"]
+        )
+        mocker.patch("remote.utils.is_ssh_port_open", side_effect=[False, False, True])
+        mock_sleep = mocker.patch("remote.utils.time.sleep")
+
+        assert wait_for_ssh_ready(self.INSTANCE_ID) is True
+
+        # DNS is only looked up until it is known
+        assert mock_dns.call_count == 2
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0, 2.0]
+
+    def test_wait_for_ssh_ready_times_out(self, mocker):
+        mocker.patch("remote.utils.get_instance_dns", return_value="host.example.com")
+        mocker.patch("remote.utils.is_ssh_port_open", return_value=False)
+        mocker.patch("remote.utils.time.monotonic", side_effect=[0.0, 5.0, 11.0])
+        mock_sleep = mocker.patch("remote.utils.time.sleep")
+
+        assert wait_for_ssh_ready(self.INSTANCE_ID, timeout=10) is False
+        assert mock_sleep.call_count == 1
+
+
 class TestGetLaunchTemplatesWithFilter:
     """Test get_launch_templates with name filter (lines 956-967)."""
 
@@ -2045,7 +2182,7 @@ class TestSchedulerClientCaching:
         # Clear the cache before testing
         clear_scheduler_client_cache()
 
-        mock_boto3_client = mocker.patch("remote.utils.boto3.client")
+        mock_boto3_client = mocker.patch("boto3.client")
         mock_client_instance = mocker.MagicMock()
         mock_boto3_client.return_value = mock_client_instance
 
@@ -2075,7 +2212,7 @@ class TestSchedulerClientCaching:
         # Clear the cache before testing
         clear_scheduler_client_cache()
 
-        mock_boto3_client = mocker.patch("remote.utils.boto3.client")
+        mock_boto3_client = mocker.patch("boto3.client")
         mock_client_1 = mocker.MagicMock()
         mock_client_2 = mocker.MagicMock()
         mock_boto3_client.side_effect = [mock_client_1, mock_client_2]
@@ -2108,7 +2245,7 @@ class TestIAMClientCaching:
         # Clear the cache before testing
         clear_iam_client_cache()
 
-        mock_boto3_client = mocker.patch("remote.utils.boto3.client")
+        mock_boto3_client = mocker.patch("boto3.client")
         mock_client_instance = mocker.MagicMock()
         mock_boto3_client.return_value = mock_client_instance
 
@@ -2138,7 +2275,7 @@ class TestIAMClientCaching:
         # Clear the cache before testing
         clear_iam_client_cache()
 
-        mock_boto3_client = mocker.patch("remote.utils.boto3.client")
+        mock_boto3_client = mocker.patch("boto3.client")
         mock_client_1 = mocker.MagicMock()
         mock_client_2 = mocker.MagicMock()
         mock_boto3_client.side_effect = [mock_client_1, mock_client_2]
@@ -2178,7 +2315,7 @@ class TestClearAWSClientCaches:
         # Clear all caches first
         clear_aws_client_caches()
 
-        mock_boto3_client = mocker.patch("remote.utils.boto3.client")
+        mock_boto3_client = mocker.patch("boto3.client")
         mock_clients = [mocker.MagicMock() for _ in range(10)]
         mock_boto3_client.side_effect = mock_clients
 
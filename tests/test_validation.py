@@ -9,6 +9,7 @@ from remote.exceptions import InvalidInputError, ValidationError
 from remote.validation import (
     USERNAME_MAX_LENGTH,
     USERNAME_PATTERN_DESC,
+    parse_tag_filter,
     safe_get_array_item,
     safe_get_nested_value,
     sanitize_input,
@@ -80,6 +81,20 @@ class TestValidatePort:
             validate_port(port)
 
 
+class TestParseTagFilter:
+    """Test KEY=VALUE tag filter parsing."""
+
+    def test_parses_key_and_value(self):
+        assert parse_tag_filter("env=dev") == ("env", "dev")
+        assert parse_tag_filter(" team = ml-* ") == ("team", "ml-*")
+        assert parse_tag_filter("note=a=b") == ("note", "a=b")
+
+    @pytest.mark.parametrize("value", ["env", "=dev", ""])
+    def test_rejects_malformed_filters(self, value):
+        with pytest.raises(ValidationError, match="expected KEY=VALUE"):
+            parse_tag_filter(value)
+
+
 class TestSanitizeInput:
     """Test the sanitize_input utility function."""
 
@@ -63,8 +63,6 @@ def test_list_volumes_with_instance_name(mocker, mock_volume_response, command):
         "remote.volume.resolve_instance_or_exit",
         return_value=("test-instance", "i-0123456789abcdef0"),
     )
-    mock_get_volume_name = mocker.patch("remote.volume.get_volume_name", return_value="test-volume")
-
     mock_ec2_client.describe_volumes.return_value = mock_volume_response
 
     result = runner.invoke(app, [command, "test-instance"])
@@ -74,8 +72,6 @@ def test_list_volumes_with_instance_name(mocker, mock_volume_response, command):
     mock_ec2_client.describe_volumes.assert_called_once_with(
         Filters=[{"Name": "attachment.instance-id", "Values": ["i-0123456789abcdef0"]}]
     )
-    mock_get_volume_name.assert_called_once_with("vol-0123456789abcdef0")
-
     assert "test-instance" in result.stdout
     assert "vol-0123456789abcdef0" in result.stdout
     assert "test-volume" in result.stdout
@@ -88,8 +84,6 @@ def test_list_volumes_without_instance_name(mocker, mock_volume_response):
         "remote.volume.resolve_instance_or_exit",
         return_value=("default-instance", "i-0123456789abcdef0"),
     )
-    mocker.patch("remote.volume.get_volume_name", return_value="test-volume")
-
     mock_ec2_client.describe_volumes.return_value = mock_volume_response
 
     result = runner.invoke(app, ["list"])
@@ -132,8 +126,6 @@ def test_list_volumes_multiple_attachments(mocker):
         "remote.volume.resolve_instance_or_exit",
         return_value=("test-instance", "i-0123456789abcdef0"),
     )
-    mocker.patch("remote.volume.get_volume_name", side_effect=["vol1-name", "vol2-name"])
-
     # Multiple volumes attached to the same instance (returned by server-side filter)
     mock_ec2_client.describe_volumes.return_value = {
         "Volumes": [
@@ -149,7 +141,7 @@ def test_list_volumes_multiple_attachments(mocker):
                         "State": "attached",
                     }
                 ],
-                "Tags": [],
+                "Tags": [{"Key": "Name", "Value": "vol1-name"}],
             },
             {
                 "VolumeId": "vol-0123456789abcdef1",
@@ -163,7 +155,7 @@ def test_list_volumes_multiple_attachments(mocker):
                         "State": "attached",
                     }
                 ],
-                "Tags": [],
+                "Tags": [{"Key": "Env", "Value": "dev"}, {"Key": "Name", "Value": "vol2-name"}],
             },
         ]
     }
@@ -178,3 +170,62 @@ def test_list_volumes_multiple_attachments(mocker):
     assert "vol-0123456789abcdef1" in result.stdout
     assert "vol1-name" in result.stdout
     assert "vol2-name" in result.stdout
+
+
+def test_list_volumes_names_come_from_bulk_response(mocker, mock_volume_response):
+    """Volume names should be read from Tags without extra describe_volumes calls."""
+    mock_ec2 = mocker.patch("remote.volume.get_ec2_client")
+    mocker.patch(
+        "remote.volume.resolve_instance_or_exit",
+        return_value=("test-instance", "i-0123456789abcdef0"),
+    )
+    mock_get_volume_name = mocker.patch("remote.utils.get_volume_name")
+    mock_ec2.return_value.describe_volumes.return_value = mock_volume_response
+
+    result = runner.invoke(app, ["list", "test-instance"])
+
+    assert result.exit_code == 0
+    assert "test-volume" in result.stdout
+    assert mock_ec2.return_value.describe_volumes.call_count == 1
+    mock_get_volume_name.assert_not_called()
+
+
+def test_list_volumes_all_pages_every_volume(mocker, mock_volume_response):
+    """--all should page through every volume and name attached instances from the index."""
+    from remote.instance_resolver import IndexedInstance
+
+    mock_ec2 = mocker.patch("remote.volume.get_ec2_client")
+    mock_resolve_instance = mocker.patch("remote.volume.resolve_instance_or_exit")
+    mocker.patch(
+        "remote.volume.get_instance_index",
+        return_value={
+            "web-1": (IndexedInstance("web-1", "i-0123456789abcdef0", "running", "", "t3.micro"),)
+        },
+    )
+    mock_paginator = mock_ec2.return_value.get_paginator.return_value
+    mock_paginator.paginate.return_value = [
+        mock_volume_response,
+        {
+            "Volumes": [
+                {
+                    "VolumeId": "vol-0123456789abcdef9",
+                    "Size": 20,
+                    "State": "available",
+                    "AvailabilityZone": "us-east-1b",
+                    "Attachments": [],
+                    "Tags": [{"Key": "Name", "Value": "spare-volume"}],
+                }
+            ]
+        },
+    ]
+
+    result = runner.invoke(app, ["ls", "--all"])
+
+    assert result.exit_code == 0
+    mock_ec2.return_value.get_paginator.assert_called_once_with("describe_volumes")
+    mock_paginator.paginate.assert_called_once_with()
+    mock_resolve_instance.assert_not_called()
+    assert "web-1" in result.stdout
+    assert "test-volume" in result.stdout
+    assert "spare-volume" in result.stdout
+    assert "available" in result.stdout